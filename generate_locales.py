@@ -0,0 +1,490 @@
+import argparse
+import os
+import shutil
+import sys
+import time
+from contextlib import closing
+from functools import partial
+
+from locale_build import cache, jsonio, patches
+from locale_build.profiling import PROFILE_DIR, profile, stage
+from locale_build.budgets import BUDGETS_FILE, check_budgets, check_chunk_budgets, heaviest_keys, load_budgets
+from locale_build.catalog import LOCALES_DIR, build_catalog, write_catalog
+from locale_build.check import compare, describe, expected_locale_files, generated_files
+from locale_build.compile import COMPILED_DIR, COMPILED_NAMESPACES, render_compiled_modules, write_compiled_modules
+from locale_build.manifest import (
+    MANIFEST_NAME,
+    PATCHES_DIR,
+    STATE_DIR,
+    build_manifest,
+    catalog_hashes,
+    chunk_hashes,
+    load_deployed,
+    load_deployed_manifest,
+    load_snapshot,
+    manifest_hashes,
+    patch_path,
+    save_snapshot,
+    write_template_report,
+    write_json,
+)
+from locale_build.glyphs import FONTS_DIR, font_stylesheets, write_locale_fonts
+from locale_build.languages import TABLE_TS, render_language_table, write_language_table
+from locale_build.modules import MODULES_DIR, remove_catalog_modules, write_catalog_modules
+from locale_build.pack import pack_entries, write_pack
+from locale_build.precache import app_namespaces, write_precache_manifest
+from locale_build.pseudo import PSEUDO_LOCALES, build_pseudo_catalog
+from locale_build.routes import (
+    ROUTE_TABLE_TS,
+    build_route_chunks,
+    render_route_table,
+    route_entries,
+    route_paths,
+    scan_routes,
+    write_route_chunks,
+    write_route_table,
+)
+from locale_build.sampling import (
+    SAMPLED_NAMESPACE,
+    add_variations_namespace,
+    build_sampled_chunks,
+    sampled_entries,
+    sampled_routes,
+    write_sampled_chunks,
+)
+from locale_build.schema import summarize_warnings, validate_catalog
+from locale_build.store import connect as connect_store, record_build, stream_namespace, sync as sync_store
+from locale_build.telemetry import load_hot_keys
+from locale_build.templates import collapse_templates, expand_templates
+
+
+def default_baseline():
+    if os.environ.get('LOCALE_BASELINE_URL'):
+        return os.environ['LOCALE_BASELINE_URL']
+    domain = os.environ.get('RAILWAY_PUBLIC_DOMAIN')
+    return f'https://{domain}' if domain else None
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Build the i18next locale catalogs under public/locales.')
+    parser.add_argument('--locales-dir', default=LOCALES_DIR, help='catalog root (default: %(default)s)')
+    parser.add_argument('--state-dir',
+                        help=f'where the previous build is kept (default: <cache-dir>/{cache.STATE_SUBDIR} '
+                             f'with --cache-dir, else {STATE_DIR})')
+    parser.add_argument('--font-source', action='append', default=[], metavar='LOCALE=PATH',
+                        help='subset PATH to the glyphs LOCALE uses (repeatable, needs fonttools)')
+    parser.add_argument('--modules', action='store_true',
+                        help=f'also write the catalogs as ES modules under {MODULES_DIR} for Vite code-splitting')
+    parser.add_argument('--budgets', default=BUDGETS_FILE, help='byte budgets per catalog (default: %(default)s)')
+    parser.add_argument('--validate-only', action='store_true',
+                        help='check the schema and byte budgets without writing anything')
+    parser.add_argument('--check', action='store_true',
+                        help='build in memory and fail if any committed output differs from disk (for CI)')
+    parser.add_argument('--cache-dir', default=os.environ.get('LOCALE_BUILD_CACHE'),
+                        help='content-addressed cache of build outputs, e.g. for CI (default: $LOCALE_BUILD_CACHE)')
+    parser.add_argument('--baseline', metavar='URL', default=default_baseline(),
+                        help='deployed site to take the previous build from when the state dir has none, '
+                             'or always with --cache-dir (default: $LOCALE_BASELINE_URL, '
+                             'else https://$RAILWAY_PUBLIC_DOMAIN)')
+    parser.add_argument('--pack', metavar='ARCHIVE',
+                        help='also write every catalog into one indexed archive, e.g. public/locales.pack')
+    parser.add_argument('--usage', metavar='REPORT',
+                        help='key-usage report from locale_telemetry.py: compile only the hot keys, list the cold ones')
+    parser.add_argument('--sample', type=int, metavar='K',
+                        help='sampling profile: also write route chunks with K variations per landing key, per shard')
+    parser.add_argument('--shards', type=int, default=8, metavar='N',
+                        help='cohort shards of the --sample profile (default: %(default)s)')
+    parser.add_argument('--pseudo', metavar='DIR',
+                        help=f"also write the pseudo-locales {', '.join(PSEUDO_LOCALES)} from en to DIR/<locale>/")
+    parser.add_argument('--fonts-dir', default=FONTS_DIR, help='subset font output (default: %(default)s)')
+    parser.add_argument('--profile-cpu', action='store_true',
+                        help=f'profile every stage and locale with cProfile into <state-dir>/{PROFILE_DIR}')
+    parser.add_argument('--profile-mem', action='store_true',
+                        help=f'trace allocations per stage and locale with tracemalloc into <state-dir>/{PROFILE_DIR}')
+    parser.add_argument('--profile-locale', action='append', default=[], metavar='LOCALE',
+                        help='also report allocation sites for LOCALE with --profile-mem (repeatable, slow)')
+    args = parser.parse_args(argv)
+    if args.state_dir is None:
+        # Inside the cache, the snapshot survives wherever the cache does (CI).
+        args.state_dir = os.path.join(args.cache_dir, cache.STATE_SUBDIR) if args.cache_dir else STATE_DIR
+    return args
+
+
+def parse_font_sources(values):
+    sources = {}
+    for value in values:
+        locale, sep, path = value.partition('=')
+        if not sep or not path:
+            raise SystemExit(f'❌ --font-source expects LOCALE=PATH, got {value!r}')
+        sources[locale] = path
+    return sources
+
+
+def emit_patches(catalog, hashes, previous, changed, locales_dir):
+    """Write N-1 -> N patches for every changed catalog the previous build had.
+
+    Returns ``{(locale, ns): from_hash}`` for the manifest.
+    """
+    patches_root = os.path.join(locales_dir, PATCHES_DIR)
+    shutil.rmtree(patches_root, ignore_errors=True)
+    if previous is None:
+        return {}
+
+    previous_hashes = catalog_hashes(previous)
+    emitted = {}
+    for locale, namespace in changed:
+        if (locale, namespace) not in previous_hashes:
+            continue
+        from_hash = previous_hashes[(locale, namespace)][0]
+        to_hash = hashes[(locale, namespace)][0]
+        ops = patches.diff(previous[locale][namespace], catalog[locale][namespace])
+        write_json(os.path.join(locales_dir, patch_path(locale, namespace, from_hash, to_hash)), ops)
+        emitted[(locale, namespace)] = from_hash
+    return emitted
+
+
+def check_schema(catalog, out):
+    """Fail the build on structural errors; report keys that fall back to en."""
+    errors, warnings, seconds = validate_catalog(catalog)
+    for namespace, path, message, locales in summarize_warnings(warnings):
+        shown = ', '.join(locales[:5]) + (f' +{len(locales) - 5}' if len(locales) > 5 else '')
+        print(f"⚠️  {namespace}:{path or '*'} {message} in {len(locales)} locales ({shown})", file=out)
+    for locale, namespace, path, message in errors:
+        print(f"❌ {locale}/{namespace}.json {path or '<root>'}: {message}", file=out)
+    print(f"🔎 Validated {len(catalog)} locales against en in {seconds * 1000:.1f}ms: "
+          f"{len(errors)} errors, {len(warnings)} warnings", file=out)
+    if errors:
+        raise SystemExit(f'❌ {len(errors)} schema errors, nothing written')
+
+
+def uncompiled_namespaces(args):
+    """Namespaces the compiled modules leave out: a sampling profile ships its own subset."""
+    return (SAMPLED_NAMESPACE,) if args.sample else ()
+
+
+def compiled_namespaces(args):
+    """Namespaces the compiled modules carry in full, which route chunks leave to them."""
+    if args.usage:
+        return ()  # only the hot keys are compiled
+    return tuple(namespace for namespace in COMPILED_NAMESPACES if namespace not in uncompiled_namespaces(args))
+
+
+def build_chunk_entries(catalog, args):
+    """``{key: payload}`` of the route chunks (and sampled chunks) a build of ``catalog`` writes."""
+    route_chunks = build_route_chunks(catalog, scan_routes(), compiled_namespaces(args))
+    entries = route_entries(route_chunks)
+    if args.sample:
+        entries.update(sampled_entries(build_sampled_chunks(route_chunks, args.sample, args.shards)))
+    return entries
+
+
+def check_sizes(catalog, budgets_path, out, chunks=None):
+    """Fail the build when a catalog or a route chunk (``{key: payload}``) is over its byte budget."""
+    budgets = load_budgets(budgets_path)
+    if not budgets:
+        return
+    violations, checked, skipped = check_budgets(catalog, budgets)
+    chunk_violations, chunks_checked, chunks_skipped = check_chunk_budgets(chunks or {}, budgets)
+    for metric in sorted({*skipped, *chunks_skipped}):
+        print(f"💡 {metric} budgets skipped: pip install {metric}", file=out)
+    if not violations and not chunk_violations:
+        print(f"📏 {checked} catalogs" + (f" and {chunks_checked} route chunks" if chunks_checked else '')
+              + f" within the budgets in {budgets_path}", file=out)
+        return
+
+    for locale, namespace, metric, size, limit in violations:
+        print(f"❌ {locale}/{namespace}.json {metric}: {size:,} bytes, budget {limit:,} (+{size - limit:,})", file=out)
+    for key, metric, size, limit in chunk_violations:
+        print(f"❌ {key}.json {metric}: {size:,} bytes, budget {limit:,} (+{size - limit:,})", file=out)
+    for locale, namespace in dict.fromkeys((locale, namespace) for locale, namespace, *_ in violations):
+        data = catalog[locale][namespace]
+        total = sum(weight for _, weight in heaviest_keys(data, limit=None))
+        print(f"\n   Heaviest keys in {locale}/{namespace}.json", file=out)
+        for rank, (key_path, weight) in enumerate(heaviest_keys(data), 1):
+            print(f"   {rank:>2}. {weight:>6,} B {weight / total:>6.1%}  {key_path}", file=out)
+    raise SystemExit(f'❌ {len(violations) + len(chunk_violations)} budget violations, nothing written')
+
+
+def write_pseudo_locales(pseudo, pseudo_dir, out):
+    """Write the pseudo-locale catalog of ``build_pseudo_catalog`` into ``pseudo_dir``."""
+    written = write_catalog(pseudo, pseudo_dir)
+    if written:
+        print(f"🎭 Wrote {len(written)} pseudo-locale catalogs for {', '.join(pseudo)} to {pseudo_dir}", file=out)
+
+
+def run_validate(args):
+    with stage('load'):
+        catalog = expand_templates(build_catalog(args.locales_dir))
+    with stage('schema'):
+        check_schema(catalog, args.out)
+    with stage('templates'):
+        collapse_templates(catalog)
+    with stage('routes'):
+        chunks = build_chunk_entries(catalog, args)
+    with stage('budgets'):
+        check_sizes(catalog, args.budgets, args.out, chunks)
+    return 0
+
+
+def run_check(args):
+    """Fail when the committed outputs are not what a build would write."""
+    start = time.perf_counter()
+    with stage('load'):
+        catalog = expand_templates(build_catalog(args.locales_dir))
+    with stage('schema'):
+        check_schema(catalog, args.out)
+    if args.sample:
+        with stage('derive'):
+            add_variations_namespace(catalog)
+    with stage('compile'):
+        hot_keys = load_hot_keys(args.usage)[0] if args.usage else None
+        expected = {
+            os.path.join(COMPILED_DIR, f'{locale}.ts'): module.encode('utf-8')
+            for locale, module in render_compiled_modules(catalog, hot_keys, uncompiled_namespaces(args))
+        }
+    with stage('templates'):
+        collapse_templates(catalog)
+    with stage('routes'):
+        routes = scan_routes()
+        route_chunks = build_route_chunks(catalog, routes, compiled_namespaces(args))
+        entries = pack_entries(catalog, route_chunks)
+        if args.sample:
+            entries.update(sampled_entries(build_sampled_chunks(route_chunks, args.sample, args.shards)))
+        expected.update(expected_locale_files(entries, args.locales_dir))
+        table = render_route_table(routes, route_paths(), sampled_routes(routes), args.shards if args.sample else 0,
+                                   compiled_namespaces(args))
+        expected[ROUTE_TABLE_TS] = table.encode('utf-8')
+    with stage('languages'):
+        expected[TABLE_TS] = render_language_table(catalog).encode('utf-8')
+    with stage('check'):
+        problems = compare(expected, generated_files(args.locales_dir, COMPILED_DIR))
+
+    seconds = time.perf_counter() - start
+    if not problems:
+        print(f"✅ {len(expected)} generated files up to date ({seconds:.2f}s)", file=args.out)
+        return 0
+    for path, status, actual in problems:
+        detail = describe(path, expected[path], actual) if status == 'changed' else ''
+        print(f"❌ {status:<8} {path}" + (f"  {detail}" if detail else ''), file=args.out)
+    raise SystemExit(f'❌ {len(problems)} of {len(expected)} generated files are out of date ({seconds:.2f}s), '
+                     f'run python3 generate_locales.py and commit the result')
+
+
+def run_build(args):
+    # Derived namespaces and compiled modules are built from the expanded
+    # messages; the written catalogs carry the collapsed templates.
+    with stage('load'):
+        catalog = expand_templates(build_catalog(args.locales_dir))
+    with stage('schema'):
+        check_schema(catalog, args.out)
+    if args.sample:
+        with stage('derive'):
+            add_variations_namespace(catalog)
+    pseudo = None
+    if args.pseudo:
+        with stage('pseudo'):
+            pseudo = build_pseudo_catalog(catalog['en'])
+    with stage('compile'):
+        hot_keys = None
+        if args.usage:
+            hot_keys, cold_keys = load_hot_keys(args.usage)
+            print(f"🔥 Compiling {sum(map(len, hot_keys.values()))} hot keys from {args.usage}", file=args.out)
+            if cold_keys:
+                print(f"🧊 {len(cold_keys)} keys never seen, candidates to prune: {', '.join(cold_keys[:10])}"
+                      + (f' +{len(cold_keys) - 10}' if len(cold_keys) > 10 else ''), file=args.out)
+        modules = dict(render_compiled_modules(catalog, hot_keys, uncompiled_namespaces(args)))
+    with stage('templates'):
+        template_report = collapse_templates(catalog)
+    with stage('routes'):
+        routes = scan_routes()
+        route_chunks = build_route_chunks(catalog, routes, compiled_namespaces(args))
+        sampled = build_sampled_chunks(route_chunks, args.sample, args.shards) if args.sample else {}
+    # Everything above stays in memory: a budget violation leaves every file as it was.
+    with stage('budgets'):
+        check_sizes(catalog, args.budgets, args.out, {**route_entries(route_chunks), **sampled_entries(sampled)})
+    with stage('write'):
+        if pseudo is not None:
+            write_pseudo_locales(pseudo, args.pseudo, args.out)
+        for locale in write_compiled_modules(modules):
+            print(f"✅ Wrote {os.path.join(COMPILED_DIR, locale)}.ts", file=args.out)
+        write_template_report(template_report, args.state_dir)
+        with closing(connect_store(args.state_dir)) as conn:
+            changed_strings, removed_strings = sync_store(conn, catalog)
+            if changed_strings or removed_strings:
+                print(f"🗃️  Store: {changed_strings} strings changed, {removed_strings} removed", file=args.out)
+            # Changed catalogs are emitted straight from the store's cursors.
+            for locale, namespace in write_catalog(catalog, args.locales_dir, partial(stream_namespace, conn)):
+                print(f"✅ Wrote {locale}/{namespace}.json", file=args.out)
+        written_chunks = write_route_chunks(route_chunks, args.locales_dir)
+        if written_chunks:
+            print(f"✅ Wrote {len(written_chunks)} route chunks for {', '.join(routes)}", file=args.out)
+        written_sampled = write_sampled_chunks(sampled, args.locales_dir)
+        if written_sampled:
+            print(f"🎲 Wrote {len(written_sampled)} sampled chunks ({args.sample} variations, {args.shards} shards)",
+                  file=args.out)
+        shards = args.shards if args.sample else 0
+        if write_route_table(routes, sampled=sampled_routes(routes), shards=shards, compiled=compiled_namespaces(args)):
+            print(f"✅ Wrote {ROUTE_TABLE_TS}", file=args.out)
+    with stage('modules'):
+        if args.modules:
+            written_modules = write_catalog_modules(catalog, route_chunks)
+            if written_modules:
+                print(f"✅ Wrote {written_modules} catalog modules to {MODULES_DIR}", file=args.out)
+        elif remove_catalog_modules():
+            print(f"🧹 Removed {MODULES_DIR} (run with --modules to keep it)", file=args.out)
+
+    fonts = {}
+    font_sources = parse_font_sources(args.font_source)
+    if font_sources:
+        with stage('fonts'):
+            written_fonts = write_locale_fonts(catalog, font_sources, args.fonts_dir)
+            for locale, glyphs, covered, source_size, subset_size in written_fonts:
+                print(f"🔤 {locale}: {covered}/{glyphs} glyphs, {source_size:,} → {subset_size:,} bytes",
+                      file=args.out)
+            fonts = font_stylesheets(written_fonts)
+
+    with stage('manifest'):
+        hashes = catalog_hashes(catalog)
+        chunks = chunk_hashes({**route_entries(route_chunks), **sampled_entries(sampled)})
+        previous_version, previous = load_snapshot(args.state_dir)
+        previous_hashes = catalog_hashes(previous) if previous is not None else {}
+        changed = [key for key, (digest, _) in hashes.items() if previous_hashes.get(key, (None,))[0] != digest]
+
+        manifest_path = os.path.join(args.locales_dir, MANIFEST_NAME)
+        manifest = None
+        if previous is not None and not changed and os.path.exists(manifest_path):
+            manifest = jsonio.load_file(manifest_path)
+            if manifest_hashes(manifest) != {key: digest for key, (digest, _) in hashes.items()} \
+                    or manifest.get('chunks') != chunks or manifest.get('fonts') != fonts:
+                manifest = None
+
+        if manifest is not None:
+            version = previous_version
+            print(f"\n✨ Catalog unchanged at version {previous_version}", file=args.out)
+        else:
+            version = previous_version + 1 if changed or previous is None else previous_version
+            emitted = emit_patches(catalog, hashes, previous, changed, args.locales_dir) if changed else {}
+            manifest = build_manifest(version, hashes, emitted, fonts, chunks)
+            write_json(manifest_path, manifest)
+            save_snapshot(version, catalog, args.state_dir)
+            print(f"\n🎉 Built version {version}: {len(hashes)} catalogs, {len(changed)} changed, {len(emitted)} patches",
+                  file=args.out)
+
+        namespaces = app_namespaces(routes, bool(args.sample), compiled_namespaces(args))
+        write_precache_manifest(manifest, namespaces, shards, args.locales_dir)
+    if args.pack:
+        with stage('pack'):
+            entries = pack_entries(catalog, route_chunks)
+            entries.update(sampled_entries(sampled))
+            written, size = write_pack(args.pack, entries, version)
+            if written:
+                print(f"📦 Packed {len(entries)} catalogs and route chunks into {args.pack} ({size:,} bytes)",
+                      file=args.out)
+    with stage('store'):
+        with closing(connect_store(args.state_dir)) as conn:
+            record_build(conn, version)
+    for locale, families in sorted(template_report.items()):
+        for family in families:
+            print(f"🧩 {locale}/{family['namespace']}: {family['template']} <- {', '.join(family['keys'])}",
+                  file=args.out)
+    with stage('languages'):
+        if write_language_table(catalog):
+            print(f"✅ Wrote {TABLE_TS}", file=args.out)
+    return 0
+
+
+def cached_build(args):
+    """Restore the outputs of an identical earlier run, or build and record them."""
+    font_sources = parse_font_sources(args.font_source)
+    mode = {
+        'modules': args.modules,
+        'fonts': {locale: cache.file_digest(path) for locale, path in sorted(font_sources.items())},
+        'fonts_dir': args.fonts_dir if font_sources else None,
+        # Budgets gate the build without changing its outputs.
+        'budgets': cache.file_digest(args.budgets) if os.path.exists(args.budgets) else None,
+        'pack': args.pack,
+        'pseudo': args.pseudo,
+        'sample': [args.sample, args.shards] if args.sample else None,
+        'usage': cache.file_digest(args.usage) if args.usage and os.path.exists(args.usage) else None,
+    }
+    with stage('cache'):
+        # The build continues from the deployed one; only its manifest is
+        # fetched unless the run misses.
+        deployed = load_deployed_manifest(args.baseline) if args.baseline else None
+        mode['baseline'] = cache.baseline_identity(deployed)
+        key = cache.cache_key(args.locales_dir, mode)
+        prune_roots = [COMPILED_DIR, MODULES_DIR, os.path.join(args.locales_dir, PATCHES_DIR)]
+        counts = cache.restore(args.cache_dir, key, prune_roots)
+    if counts is not None:
+        if not args.modules:
+            remove_catalog_modules()
+        print(f"⚡ Restored build {key[:12]} from {args.cache_dir}: "
+              f"{counts['copied']} restored, {counts['current']} already current", file=args.out)
+        return 0
+
+    seed_snapshot(args, deployed)
+    status = run_build(args)
+    extra_dirs = ([args.fonts_dir] if font_sources else []) + ([args.pseudo] if args.pseudo else [])
+    extra_files = [args.pack] if args.pack else []
+    with stage('cache'):
+        added = cache.store(
+            args.cache_dir, key, cache.output_files(args.locales_dir, args.state_dir, extra_dirs, extra_files)
+        )
+    print(f"📦 Cached build {key[:12]} in {args.cache_dir} ({added} new objects)", file=args.out)
+    return status
+
+
+def seed_snapshot(args, deployed=None):
+    """Take the deployed build as the previous one when there is no snapshot.
+
+    A cached build passes the ``deployed`` manifest its key covers; a snapshot
+    of any other build is then replaced, so the outputs follow the key.
+    """
+    if not args.baseline:
+        return
+    snapshot_version, snapshot = load_snapshot(args.state_dir)
+    if snapshot is not None:
+        if deployed is None or (
+            snapshot_version == deployed['version']
+            and {key: digest for key, (digest, _) in catalog_hashes(snapshot).items()} == manifest_hashes(deployed)
+        ):
+            return
+    version, catalog = load_deployed(args.baseline, manifest=deployed)
+    if catalog is None:
+        print(f"⚠️  No deployed manifest at {args.baseline}; building version 1", file=args.out)
+        return
+    save_snapshot(version, catalog, args.state_dir)
+    print(f"🛰️  Baseline: version {version} from {args.baseline} ({sum(map(len, catalog.values()))} catalogs)",
+          file=args.out)
+
+
+def run(args):
+    if args.validate_only:
+        return run_validate(args)
+    if args.check:
+        return run_check(args)
+    if args.cache_dir:
+        return cached_build(args)
+    seed_snapshot(args)
+    return run_build(args)
+
+
+def main(argv=None, out=None):
+    """Run the generator; progress goes to ``out`` (default: stdout)."""
+    args = parse_args(argv)
+    args.out = out if out is not None else sys.stdout
+    if args.profile_locale and not args.profile_mem:
+        raise SystemExit('❌ --profile-locale needs --profile-mem')
+    if args.sample is not None and (args.sample < 1 or args.shards < 1):
+        raise SystemExit('❌ --sample and --shards must be at least 1')
+    if args.pseudo and os.path.abspath(args.pseudo) == os.path.abspath(args.locales_dir):
+        raise SystemExit('❌ --pseudo needs its own directory; pseudo-locales must not become source catalogs')
+    if not (args.profile_cpu or args.profile_mem):
+        return run(args)
+    out_dir = os.path.join(args.state_dir, PROFILE_DIR)
+    with profile(out_dir, cpu=args.profile_cpu, mem=args.profile_mem, detail_locales=args.profile_locale, out=args.out):
+        return run(args)
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,8 @@
+"""Build pipeline for the i18next catalogs served from public/locales.
+
+The phase scripts own the hand-written landing.json translations; everything
+else lives as JSON on disk. ``generate_locales.py`` merges both into one
+in-memory catalog and derives the deployable artifacts from it.
+"""
+
+GENERATOR_VERSION = '1'
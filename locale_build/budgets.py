@@ -0,0 +1,132 @@
+"""Byte budgets per (locale, namespace).
+
+locale-budgets.json maps ``*``, a namespace, or ``<locale>/<namespace>`` to
+limits in bytes for any of ``raw`` (the file as written), ``min`` (compact
+JSON), ``gzip`` and ``brotli`` (of the file as written). The most specific
+entry wins per metric. Brotli needs the ``brotli`` package; without it those
+limits are skipped with a note.
+
+Route chunks are budgeted as ``_routes/<route>`` or ``_sampled/<route>``
+(every shard), optionally prefixed with ``<locale>/``; ``*`` only covers
+catalogs. A ``_sampled`` budget below the size of the full chunk fails a
+sampling profile that would not save any bytes.
+
+A catalog over budget fails the build, and its heaviest keys are ranked so
+the bloat is easy to find.
+"""
+import gzip
+import os
+
+from . import jsonio
+from .catalog import iter_catalog, serialize, serialize_namespace
+from .store import flatten
+
+BUDGETS_FILE = 'locale-budgets.json'
+METRICS = ('raw', 'min', 'gzip', 'brotli')
+
+
+def load_budgets(path=BUDGETS_FILE):
+    if not os.path.exists(path):
+        return {}
+    budgets = jsonio.load_file(path).get('budgets', {})
+    for scope, limits in budgets.items():
+        unknown = set(limits) - set(METRICS)
+        if unknown:
+            raise SystemExit(f"❌ {path}: unknown metric {', '.join(sorted(unknown))} for {scope!r}")
+    return budgets
+
+
+def budget_for(budgets, locale, namespace):
+    limits = {}
+    for scope in ('*', namespace, f'{locale}/{namespace}'):
+        limits.update(budgets.get(scope, {}))
+    return limits
+
+
+def _brotli():
+    try:
+        import brotli
+    except ImportError:
+        return None
+    return brotli
+
+
+def measure(namespace, data, metrics):
+    """Sizes of the written catalog for the requested ``metrics``."""
+    sizes = measure_payload(serialize_namespace(namespace, data), [metric for metric in metrics if metric != 'min'])
+    if 'min' in metrics:
+        sizes['min'] = len(serialize(data, compact=True))
+    return sizes
+
+
+def measure_payload(payload, metrics):
+    """Sizes of ``payload`` as written; it is compact already, so ``min`` is ``raw``."""
+    sizes = {}
+    for metric in metrics:
+        if metric in ('raw', 'min'):
+            sizes[metric] = len(payload)
+        elif metric == 'gzip':
+            sizes[metric] = len(gzip.compress(payload, compresslevel=9, mtime=0))
+        elif metric == 'brotli' and (brotli := _brotli()) is not None:
+            sizes[metric] = len(brotli.compress(payload, quality=11))
+    return sizes
+
+
+def check_budgets(catalog, budgets):
+    """Return ``(violations, checked, skipped)``.
+
+    ``violations`` are ``(locale, namespace, metric, size, limit)`` tuples and
+    ``skipped`` the metrics that could not be measured here.
+    """
+    violations = []
+    checked = 0
+    skipped = set()
+    for locale, namespace, data in iter_catalog(catalog):
+        limits = budget_for(budgets, locale, namespace)
+        if not limits:
+            continue
+        checked += 1
+        sizes = measure(namespace, data, limits)
+        skipped.update(metric for metric in limits if metric not in sizes)
+        for metric, limit in limits.items():
+            if metric in sizes and sizes[metric] > limit:
+                violations.append((locale, namespace, metric, sizes[metric], limit))
+    return violations, checked, sorted(skipped)
+
+
+def chunk_scope(key):
+    """``(locale, scope)`` of a chunk key: ``en/_sampled/3/Landing`` is ``_sampled/Landing``."""
+    locale, directory, *path = key.split('/')
+    return locale, f'{directory}/{path[-1]}'
+
+
+def check_chunk_budgets(entries, budgets):
+    """:func:`check_budgets` for route chunks, ``{key: payload}`` as in ``pack_entries``.
+
+    Violations are ``(key, metric, size, limit)`` tuples.
+    """
+    violations = []
+    checked = 0
+    skipped = set()
+    for key, payload in sorted(entries.items()):
+        locale, scope = chunk_scope(key)
+        limits = {**budgets.get(scope, {}), **budgets.get(f'{locale}/{scope}', {})}
+        if not limits:
+            continue
+        checked += 1
+        sizes = measure_payload(payload, limits)
+        skipped.update(metric for metric in limits if metric not in sizes)
+        for metric, limit in limits.items():
+            if metric in sizes and sizes[metric] > limit:
+                violations.append((key, metric, sizes[metric], limit))
+    return violations, checked, sorted(skipped)
+
+
+def heaviest_keys(data, limit=10):
+    """Rank leaf key paths by their share of the compact JSON, heaviest first."""
+    weights = [
+        (key_path, len(serialize({key_path.rsplit('.', 1)[-1]: value}, compact=True)) - 2)
+        for key_path, value in flatten(data)
+    ]
+    weights.sort(key=lambda item: (-item[1], item[0]))
+    return weights[:limit]
@@ -0,0 +1,188 @@
+"""Content-addressed cache of whole generator runs.
+
+A run is keyed by the hash of everything it reads: the source catalogs, the
+phase scripts, the src/ modules scanned for languages and routes, the
+generator's own code and ``GENERATOR_VERSION``, and the output mode
+(``--modules``, font sources, the deployed baseline). On a hit the recorded
+outputs are restored and the build is skipped, so a cold CI run with an
+unchanged catalog costs one hashing pass.
+
+The previous-build snapshot is not part of the key: every build rewrites it,
+so keying on it would miss on every other run. The build it continues from is
+identified by the deployed manifest instead (``--baseline``), and a missed
+run diffs against that deployment. The snapshot is restored with the outputs
+it was written with.
+
+Layout::
+
+    <cache>/objects/<sha256>     file contents, shared across entries
+    <cache>/entries/<key>.json   {relative path: sha256} of one run's outputs
+    <cache>/state/               the generator state dir (snapshot, store) by default
+
+Keeping the state next to the objects means a CI cache that is restored
+brings the previous-build snapshot with it, so manifest versions and
+patches continue from the last deploy.
+
+Restores copy objects into place through a temporary file. Outputs are
+rewritten in place by the next build, so a hardlink would let that build
+edit the cached object as well. Objects are verified before use.
+"""
+import hashlib
+import json
+import os
+import shutil
+
+from . import GENERATOR_VERSION
+from .catalog import DERIVED_NAMESPACES, PHASE_SOURCES, is_locale_dir
+from .compile import COMPILED_DIR
+from .languages import TABLE_TS
+from .manifest import SNAPSHOT_NAME, TEMPLATE_REPORT_NAME, manifest_hashes
+from .modules import MODULES_DIR
+from .routes import ROUTE_TABLE_TS, SRC_DIR
+
+STATE_SUBDIR = 'state'
+GENERATOR_DIR = os.path.dirname(os.path.abspath(__file__))
+GENERATOR_SCRIPT = 'generate_locales.py'
+# Files under src/ the generator writes; they are outputs, not inputs.
+GENERATED_SOURCES = (COMPILED_DIR, MODULES_DIR, TABLE_TS, ROUTE_TABLE_TS)
+
+
+def file_digest(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 16), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _walk(root):
+    for directory, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        for filename in sorted(filenames):
+            yield os.path.join(directory, filename)
+
+
+def input_files(locales_dir):
+    """Every file a build reads, in a stable order (the snapshot aside)."""
+    for locale in sorted(os.listdir(locales_dir)):
+        if not is_locale_dir(locales_dir, locale):
+            continue
+        for filename in sorted(os.listdir(os.path.join(locales_dir, locale))):
+            if filename.endswith('.json') and filename[:-len('.json')] not in DERIVED_NAMESPACES:
+                yield os.path.join(locales_dir, locale, filename)
+    for module_name, _ in PHASE_SOURCES:
+        yield f'{module_name}.py'
+    for path in _walk(SRC_DIR):
+        if path.endswith(('.ts', '.tsx')) and not path.startswith(GENERATED_SOURCES):
+            yield path
+    yield GENERATOR_SCRIPT
+    for path in _walk(GENERATOR_DIR):
+        if path.endswith('.py'):
+            yield path
+
+
+def baseline_identity(manifest):
+    """What the key records of a deployed build: its version and catalog hashes, or None."""
+    if manifest is None:
+        return None
+    hashes = manifest_hashes(manifest)
+    return {'version': manifest['version'], 'files': {f'{locale}/{ns}': hashes[(locale, ns)] for locale, ns in sorted(hashes)}}
+
+
+def cache_key(locales_dir, mode):
+    """Hash of the generator version, the output ``mode`` dict and all inputs."""
+    digest = hashlib.sha256()
+    digest.update(json.dumps({'generator': GENERATOR_VERSION, 'mode': mode}, sort_keys=True).encode('utf-8'))
+    for path in input_files(locales_dir):
+        name = os.path.relpath(path, GENERATOR_DIR) if path.startswith(GENERATOR_DIR) else path
+        digest.update(f'\0{name}\0{file_digest(path)}'.encode('utf-8'))
+    return digest.hexdigest()
+
+
+def output_files(locales_dir, state_dir, extra_dirs=(), extra_files=()):
+    """Every file a build writes (and the unchanged sources next to them)."""
+    for root in (locales_dir, COMPILED_DIR, MODULES_DIR, *extra_dirs):
+        if os.path.isdir(root):
+            yield from _walk(root)
+    yield from extra_files
+    yield TABLE_TS
+    yield ROUTE_TABLE_TS
+    for name in (SNAPSHOT_NAME, TEMPLATE_REPORT_NAME):
+        path = os.path.join(state_dir, name)
+        if os.path.exists(path):
+            yield path
+
+
+def _entry_path(cache_dir, key):
+    return os.path.join(cache_dir, 'entries', f'{key}.json')
+
+
+def _object_path(cache_dir, digest):
+    return os.path.join(cache_dir, 'objects', digest[:2], digest)
+
+
+def store(cache_dir, key, paths):
+    """Record ``paths`` under ``key``; returns the number of new objects."""
+    files = {}
+    added = 0
+    for path in paths:
+        digest = file_digest(path)
+        files[path] = digest
+        target = _object_path(cache_dir, digest)
+        if not os.path.exists(target):
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            shutil.copyfile(path, f'{target}.tmp')
+            os.replace(f'{target}.tmp', target)
+            added += 1
+    entry = _entry_path(cache_dir, key)
+    os.makedirs(os.path.dirname(entry), exist_ok=True)
+    with open(f'{entry}.tmp', 'w', encoding='utf-8') as f:
+        json.dump({'generator': GENERATOR_VERSION, 'files': files}, f, indent=2, sort_keys=True)
+    os.replace(f'{entry}.tmp', entry)
+    return added
+
+
+def _place(source, target):
+    """Copy ``source`` to ``target`` through a temporary file, never sharing its inode."""
+    os.makedirs(os.path.dirname(target) or '.', exist_ok=True)
+    shutil.copyfile(source, f'{target}.tmp')
+    os.replace(f'{target}.tmp', target)
+
+
+def restore(cache_dir, key, prune_roots=()):
+    """Restore the outputs recorded under ``key``.
+
+    Files under ``prune_roots`` (purely generated directories) that the entry
+    does not list are removed. Returns ``{'copied': n, 'current': n}``, or
+    None on a miss (including an entry whose objects went missing or were
+    modified).
+    """
+    entry = _entry_path(cache_dir, key)
+    if not os.path.exists(entry):
+        return None
+    with open(entry, encoding='utf-8') as f:
+        files = json.load(f)['files']
+
+    for digest in set(files.values()):
+        source = _object_path(cache_dir, digest)
+        if not os.path.exists(source) or file_digest(source) != digest:
+            if os.path.exists(source):
+                os.remove(source)
+            os.remove(entry)
+            return None
+
+    counts = {'copied': 0, 'current': 0}
+    for path, digest in sorted(files.items()):
+        if os.path.exists(path) and os.path.getsize(path) == os.path.getsize(_object_path(cache_dir, digest)) \
+                and file_digest(path) == digest:
+            counts['current'] += 1
+            continue
+        _place(_object_path(cache_dir, digest), path)
+        counts['copied'] += 1
+
+    for root in prune_roots:
+        if os.path.isdir(root):
+            for path in list(_walk(root)):
+                if path not in files:
+                    os.remove(path)
+    return counts
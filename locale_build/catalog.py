@@ -0,0 +1,134 @@
+"""Load, merge and write the (locale, namespace) catalogs."""
+import importlib
+import os
+
+from . import jsonio
+from .profiling import locale_scope
+
+LOCALES_DIR = os.path.join('public', 'locales')
+
+# Phase scripts and the dict each one defines. Their translations are merged
+# over the landing.json files already on disk.
+PHASE_SOURCES = (
+    ('phase1_translations', 'phase1_translations'),
+    ('phase2_translations', 'phase2_translations'),
+    ('phase3_translations', 'phase3_translations'),
+)
+PHASE_NAMESPACE = 'landing'
+
+# Namespaces the generator derives from the others. They are written next to
+# the source catalogs but never read back as sources.
+DERIVED_NAMESPACES = ('landingVariations',)
+
+
+def serialize(data, compact=False):
+    """Serialize a catalog exactly the way the phase scripts write it."""
+    return jsonio.dumps(data, compact=compact)
+
+
+def serialize_namespace(namespace, data):
+    """Derived namespaces are machine-read only, so they are written compact."""
+    return serialize(data, compact=namespace in DERIVED_NAMESPACES)
+
+
+def is_locale_dir(locales_dir, name):
+    """Generated folders (``_patches`` etc.) are prefixed with an underscore."""
+    return not name.startswith(('_', '.')) and os.path.isdir(os.path.join(locales_dir, name))
+
+
+def read_tree(locales_dir=LOCALES_DIR):
+    """Read every ``<locale>/<namespace>.json`` into ``{locale: {ns: data}}``."""
+    catalog = {}
+    for locale in sorted(os.listdir(locales_dir)):
+        if not is_locale_dir(locales_dir, locale):
+            continue
+        namespaces = {}
+        locale_dir = os.path.join(locales_dir, locale)
+        for filename in sorted(os.listdir(locale_dir)):
+            if not filename.endswith('.json') or filename[:-len('.json')] in DERIVED_NAMESPACES:
+                continue
+            namespaces[filename[:-len('.json')]] = jsonio.load_file(os.path.join(locale_dir, filename))
+        catalog[locale] = namespaces
+    return catalog
+
+
+_phase_mtimes = {}
+
+
+def load_phase_translations():
+    """Return ``{locale: landing}`` from all phase scripts, in phase order.
+
+    A script edited since it was imported is reloaded, so a long-running
+    process (the build daemon) always sees the current dicts.
+    """
+    translations = {}
+    for module_name, attr in PHASE_SOURCES:
+        module = importlib.import_module(module_name)
+        mtime = os.stat(module.__file__).st_mtime_ns
+        if _phase_mtimes.setdefault(module_name, mtime) != mtime:
+            module = importlib.reload(module)
+            _phase_mtimes[module_name] = mtime
+        translations.update(getattr(module, attr))
+    return translations
+
+
+def deep_merge(base, overlay):
+    """Merge ``overlay`` into ``base`` keeping base key order and extra keys."""
+    if not isinstance(base, dict) or not isinstance(overlay, dict):
+        return overlay
+    merged = dict(base)
+    for key, value in overlay.items():
+        merged[key] = deep_merge(base[key], value) if key in base else value
+    return merged
+
+
+def build_catalog(locales_dir=LOCALES_DIR):
+    """Build the full in-memory catalog from disk plus the phase scripts."""
+    catalog = read_tree(locales_dir)
+    for locale, landing in load_phase_translations().items():
+        namespaces = catalog.setdefault(locale, {})
+        namespaces[PHASE_NAMESPACE] = deep_merge(namespaces.get(PHASE_NAMESPACE, {}), landing)
+    for locale, namespace, data in iter_catalog(catalog):
+        for path in jsonio.non_portable(data):
+            raise SystemExit(f'❌ {locale}/{namespace}: {path} is a float or out-of-range integer; '
+                             'catalogs hold strings, booleans and 64-bit integers only')
+    return catalog
+
+
+def iter_catalog(catalog):
+    """Yield ``(locale, namespace, data)`` in a stable order."""
+    for locale in sorted(catalog):
+        with locale_scope(locale):
+            for namespace in sorted(catalog[locale]):
+                yield locale, namespace, catalog[locale][namespace]
+
+
+def catalog_path(locales_dir, locale, namespace):
+    return os.path.join(locales_dir, locale, f'{namespace}.json')
+
+
+def write_catalog(catalog, locales_dir=LOCALES_DIR, stream=None):
+    """Write catalogs whose serialized bytes differ from disk.
+
+    ``stream(locale, namespace)``, when given, yields the text of a source
+    namespace chunk by chunk (the store's ``stream_namespace``) and is written
+    in place of the serialized bytes it matches.
+    Returns the list of ``(locale, namespace)`` pairs that were rewritten.
+    """
+    written = []
+    for locale, namespace, data in iter_catalog(catalog):
+        path = catalog_path(locales_dir, locale, namespace)
+        payload = serialize_namespace(namespace, data)
+        if os.path.exists(path):
+            with open(path, 'rb') as f:
+                if f.read() == payload:
+                    continue
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as f:
+            if stream is None or namespace in DERIVED_NAMESPACES:
+                f.write(payload)
+            else:
+                for chunk in stream(locale, namespace):
+                    f.write(chunk.encode('utf-8'))
+        written.append((locale, namespace))
+    return written
@@ -0,0 +1,98 @@
+"""Compare what a build would write with the committed files, writing nothing.
+
+``generate_locales.py --check`` renders every committed output in memory
+(catalogs and route chunks under public/locales, the compiled modules, the
+language and route tables), then hashes the expected bytes and the files on
+disk across a thread pool; hashlib releases the GIL, so the reads and
+digests overlap. Files that differ get a short summary of what changed.
+The manifest, patches and precache list are versioned per build and not
+committed, so they are not compared.
+"""
+import difflib
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from .catalog import is_locale_dir
+from .manifest import content_hash
+from .store import flatten
+
+SHOWN_KEYS = 5
+
+
+def expected_locale_files(entries, locales_dir):
+    """``{path: bytes}`` of ``pack_entries`` output, as written under ``locales_dir``."""
+    return {os.path.join(locales_dir, *key.split('/')) + '.json': payload for key, payload in entries.items()}
+
+
+def generated_files(locales_dir, compiled_dir):
+    """Paths of generated files on disk that a build owns."""
+    paths = []
+    for locale in os.listdir(locales_dir):
+        if not is_locale_dir(locales_dir, locale):
+            continue
+        for root, _, filenames in os.walk(os.path.join(locales_dir, locale)):
+            paths.extend(os.path.join(root, name) for name in filenames if name.endswith('.json'))
+    if os.path.isdir(compiled_dir):
+        paths.extend(os.path.join(compiled_dir, name) for name in os.listdir(compiled_dir) if name.endswith('.ts'))
+    return paths
+
+
+def _read(path):
+    try:
+        with open(path, 'rb') as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+
+def _compare_one(path, payload):
+    actual = _read(path)
+    if actual is None:
+        return path, 'missing', None
+    if content_hash(actual) != content_hash(payload):
+        return path, 'changed', actual
+    return path, None, None
+
+
+def compare(expected, on_disk, workers=None):
+    """``[(path, status, bytes on disk)]`` for every file that is not current.
+
+    ``status`` is ``missing``, ``changed`` or ``stale`` (on disk, but a build
+    would delete it).
+    """
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = pool.map(lambda item: _compare_one(*item), sorted(expected.items()))
+        problems = [(path, status, actual) for path, status, actual in results if status]
+    problems.extend((path, 'stale', None) for path in sorted(set(on_disk) - set(expected)))
+    return problems
+
+
+def _shown(keys):
+    keys = sorted(keys)
+    more = f' +{len(keys) - SHOWN_KEYS}' if len(keys) > SHOWN_KEYS else ''
+    return ', '.join(keys[:SHOWN_KEYS]) + more
+
+
+def describe(path, expected, actual):
+    """One line on how ``actual`` (on disk) differs from ``expected``."""
+    if path.endswith('.json'):
+        try:
+            old = dict(flatten(json.loads(actual)))
+        except ValueError:
+            return 'not valid JSON'
+        new = dict(flatten(json.loads(expected)))
+        added, removed = new.keys() - old.keys(), old.keys() - new.keys()
+        changed = {key for key in new.keys() & old.keys() if new[key] != old[key]}
+        parts = [
+            f'{label} {len(keys)} ({_shown(keys)})'
+            for label, keys in (('+', added), ('-', removed), ('~', changed))
+            if keys
+        ]
+        return '; '.join(parts) or 'formatting only'
+    diff = difflib.unified_diff(
+        actual.decode('utf-8', 'replace').splitlines(), expected.decode('utf-8').splitlines(), lineterm='', n=0
+    )
+    lines = [line for line in diff if line[:1] in '+-' and line[:3] not in ('+++', '---')]
+    added = sum(line.startswith('+') for line in lines)
+    return f'{added} lines added, {len(lines) - added} removed'
@@ -0,0 +1,140 @@
+"""Precompile catalog strings into per-locale ES modules.
+
+Every string in the hot-path namespaces is parsed once here. Strings without
+placeholders are emitted as literals; strings with ``{name}`` or i18next
+``{{name}}`` placeholders become small concatenating functions (a missing
+param renders as an empty string), so
+src/i18n/compiledMessages.ts renders them without regex scanning or
+interpolation parsing. Modules are written to src/i18n/compiled/<locale>.ts and
+code-split per locale by Vite.
+
+With a key-usage report (see telemetry.py) only the hot keys are compiled;
+the rest render through i18next, which the helpers fall back to anyway. A
+sampling profile (sampling.py) leaves the sampled namespace out: its route
+chunks ship one shard's variations, and a compiled copy of every variation
+in the bundle would undo that.
+"""
+import json
+import os
+import re
+
+from .profiling import locale_scope
+from .routes import pick
+
+COMPILED_DIR = os.path.join('src', 'i18n', 'compiled')
+COMPILED_NAMESPACES = ('landing', 'messages')
+
+PLACEHOLDER = re.compile(r'\{\{\s*(\w+)\s*\}\}|\{(\w+)\}')
+IDENTIFIER = re.compile(r'^[A-Za-z_$][\w$]*$')
+
+
+def split_message(text):
+    """Return the alternating literal/placeholder segments of ``text``.
+
+    Even indexes are literals, odd indexes are placeholder names; a string
+    without placeholders is a single literal.
+    """
+    segments = []
+    position = 0
+    for match in PLACEHOLDER.finditer(text):
+        segments.append(text[position:match.start()])
+        segments.append(match.group(1) or match.group(2))
+        position = match.end()
+    segments.append(text[position:])
+    return segments
+
+
+def _literal(text):
+    return json.dumps(text, ensure_ascii=False)
+
+
+def compile_message(text):
+    """Return the TypeScript expression for one catalog string."""
+    segments = split_message(text)
+    if len(segments) == 1:
+        return _literal(text)
+    parts = []
+    for i, segment in enumerate(segments):
+        if i % 2:
+            param = f'p.{segment}' if IDENTIFIER.match(segment) else f'p[{_literal(segment)}]'
+            parts.append(f"({param} ?? '')")
+        elif segment:
+            parts.append(_literal(segment))
+    return f"(p) => {' + '.join(parts)}"
+
+
+def _key(key):
+    return key if IDENTIFIER.match(key) else _literal(key)
+
+
+def render_value(value, indent):
+    pad = '  ' * indent
+    inner = '  ' * (indent + 1)
+    if isinstance(value, str):
+        return compile_message(value)
+    if isinstance(value, list):
+        if not value:
+            return '[]'
+        items = [f'{inner}{render_value(item, indent + 1)},' for item in value]
+        return '[\n' + '\n'.join(items) + f'\n{pad}]'
+    if isinstance(value, dict):
+        if not value:
+            return '{}'
+        items = [f'{inner}{_key(key)}: {render_value(item, indent + 1)},' for key, item in value.items()]
+        return '{\n' + '\n'.join(items) + f'\n{pad}}}'
+    return json.dumps(value)
+
+
+def render_locale_module(locale, namespaces, hot_keys=None, skip=()):
+    compiled = {ns: namespaces[ns] for ns in COMPILED_NAMESPACES if ns in namespaces and ns not in skip}
+    if hot_keys is not None:
+        compiled = {ns: pick(data, sorted(hot_keys.get(ns, ()))) for ns, data in compiled.items()}
+    body = render_value(compiled, 0)
+    return (
+        f'// Generated by generate_locales.py from public/locales/{locale}. Do not edit by hand.\n'
+        "import type { CompiledCatalog } from '../compiledMessages';\n"
+        '\n'
+        f'const catalog: CompiledCatalog = {body};\n'
+        '\n'
+        'export default catalog;\n'
+        '\n'
+        '// Regenerated while the dev server runs: accept the update instead of\n'
+        '// reloading the page (liveCatalogs.ts pushes the new strings).\n'
+        'if (import.meta.hot) {\n'
+        '  import.meta.hot.accept();\n'
+        '}\n'
+    )
+
+
+def render_compiled_modules(catalog, hot_keys=None, skip=()):
+    """Yield ``(locale, module source)`` for every locale, without the ``skip`` namespaces."""
+    for locale in sorted(catalog):
+        with locale_scope(locale):
+            module = render_locale_module(locale, catalog[locale], hot_keys, skip)
+        yield locale, module
+
+
+def write_compiled_modules(modules, compiled_dir=COMPILED_DIR):
+    """Write one module per locale and drop modules of removed locales.
+
+    ``modules`` is ``{locale: source}`` from ``render_compiled_modules``, which
+    needs the expanded messages (no template references); rendering first
+    lets the build check its budgets before anything is written.
+    Returns the locales whose module changed.
+    """
+    os.makedirs(compiled_dir, exist_ok=True)
+    written = []
+    for locale, module in modules.items():
+        path = os.path.join(compiled_dir, f'{locale}.ts')
+        if os.path.exists(path):
+            with open(path, encoding='utf-8') as f:
+                if f.read() == module:
+                    continue
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(module)
+        written.append(locale)
+
+    for name in os.listdir(compiled_dir):
+        if name.endswith('.ts') and name[:-3] not in modules:
+            os.remove(os.path.join(compiled_dir, name))
+    return written
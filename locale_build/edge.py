@@ -0,0 +1,204 @@
+"""Locale negotiation and catalog preload hints for an edge in front of the app.
+
+The browser only learns its language after the JS bundle runs the i18next
+detector (and, in App.tsx, up to three serial geolocation lookups), so the
+catalog fetches start late. An edge that sees the document request can
+resolve the locale itself and answer with ``Link: rel=preload`` headers, as
+``103 Early Hints`` and on the final response, for exactly the files the
+client is about to fetch.
+
+Resolution reads the generated src/i18n/languageTable.ts (and preloads follow
+src/i18n/routeTable.ts), so a tag maps to the
+same locale as ``resolveLanguage`` in languageResolution.ts, and follows the
+detector order of src/i18n/config.ts: the ``i18next`` cookie (cached
+alongside localStorage, which the edge cannot see), then ``Accept-Language``
+(navigator.languages), then ``?lng=``. htmlTag reads the ``lang`` the edge
+injects. A country header such as ``CF-IPCountry`` stands in for the
+geolocation step and only decides when nothing else did.
+
+Preloaded URLs carry the content hash from public/locales/manifest.json as
+``?v=``, the same URLs the client requests once it has the manifest
+(catalogPatches.ts), so the browser reuses the preloaded responses.
+"""
+import json
+import re
+
+from .languages import FALLBACK_LOCALE, TABLE_TS
+from .routes import DEFAULT_NAMESPACE, ROUTE_TABLE_TS, ROUTES_DIR
+from .sampling import COHORT_COOKIE, COHORTS, SAMPLED_DIR
+
+COOKIE_NAME = 'i18next'  # lookupCookie in src/i18n/config.ts
+QUERY_PARAM = 'lng'  # lookupQuerystring
+# Set on <html> so languageDetection.ts can skip its geolocation lookups.
+EDGE_ATTRIBUTE = 'data-edge-locale'
+RTL_BASES = ('ar', 'he', 'fa', 'ur')  # RTL_LANGUAGES in src/i18n/config.ts
+HTML_TAG = re.compile(r'<html\b((?:"[^"]*"|\'[^\']*\'|[^\'">])*)>', re.IGNORECASE)
+ATTRIBUTE = re.compile(r'\s*([^\s=>/]+)(?:\s*=\s*(?:"[^"]*"|\'[^\']*\'|[^\s>]+))?')
+# Set by inject_locale; any other <html> attribute is kept.
+LOCALE_ATTRIBUTES = ('lang', 'dir', EDGE_ATTRIBUTE)
+
+
+def read_language_table(path=TABLE_TS):
+    """The ``LANGUAGE_TABLE`` object of the generated module."""
+    with open(path, encoding='utf-8') as f:
+        source = f.read()
+    start = source.index('= ') + 2
+    return json.loads(source[start:source.rindex(';')])
+
+
+def resolve_language(table, tag):
+    """``resolveLanguage`` of languageResolution.ts."""
+    subtags = tag.strip().lower().replace('_', '-').split('-')
+    for end in range(len(subtags), 0, -1):
+        locale = table['tags'].get('-'.join(subtags[:end]))
+        if locale:
+            return locale
+    return table['bases'].get(subtags[0]) or table['fallback']
+
+
+def parse_accept_language(header):
+    """Language tags of an ``Accept-Language`` header, most preferred first."""
+    weighted = []
+    for position, part in enumerate(header.split(',')):
+        tag, *params = (piece.strip() for piece in part.split(';'))
+        if not tag or tag == '*':
+            continue
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition('=')
+            if name.strip().lower() == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if quality > 0:
+            weighted.append((-quality, position, tag))
+    return [tag for _, _, tag in sorted(weighted)]
+
+
+def parse_cookies(header):
+    cookies = {}
+    for part in header.split(';'):
+        name, sep, value = part.strip().partition('=')
+        if sep:
+            cookies.setdefault(name, value.strip('"'))
+    return cookies
+
+
+def preferred_language(table, tags):
+    """``detectLanguageFromBrowser`` of languageDetection.ts, or None.
+
+    The first tag that resolves to a locale wins; a tag that only reaches the
+    fallback lets the next preference win.
+    """
+    for tag in tags:
+        locale = resolve_language(table, tag)
+        if locale != table['fallback'] or tag.lower().split('-')[0] == table['fallback']:
+            return locale
+    return None
+
+
+def negotiate(table, accept_language='', cookie='', query_lng=None, country=None):
+    """``(locale, source)`` for one document request.
+
+    ``source`` names what decided: cookie, accept-language, query, country or
+    fallback, tried in that order. Every locale returned has catalogs.
+    """
+    stored = parse_cookies(cookie).get(COOKIE_NAME) if cookie else None
+    if stored:
+        return resolve_language(table, stored), 'cookie'
+    preferred = preferred_language(table, parse_accept_language(accept_language)) if accept_language else None
+    if preferred:
+        return preferred, 'accept-language'
+    if query_lng:
+        return resolve_language(table, query_lng), 'query'
+    if country and country.upper() in table['countries']:
+        return table['countries'][country.upper()], 'country'
+    return table['fallback'], 'fallback'
+
+
+def read_route_table(path=ROUTE_TABLE_TS):
+    """The ``ROUTE_CATALOGS`` object of the generated module."""
+    with open(path, encoding='utf-8') as f:
+        source = f.read()
+    start = source.index('= ') + 2
+    return json.loads(source[start:source.index(' as const;')])
+
+
+def route_entry(route_table, path):
+    """Route table entry preloadRouteCatalog loads for ``path``, or None."""
+    for entry in route_table.values():
+        if path in entry['paths']:
+            return entry
+    return None
+
+
+def cohort_of(cookie):
+    """The ``i18nCohort`` cookie as routeCatalogs.ts reads it, or None."""
+    value = parse_cookies(cookie).get(COHORT_COOKIE, '') if cookie else ''
+    return int(value) % COHORTS if value.isdigit() else None
+
+
+def versioned_url(path, digest):
+    """``path`` with ``?v=<digest>`` when known, like catalogUrl in catalogPatches.ts."""
+    return f'{path}?v={digest}' if digest else path
+
+
+def preload_urls(locale, route, fallback=FALLBACK_LOCALE, cohort=None, manifest=None):
+    """Catalog URLs the client fetches first for ``locale``.
+
+    The same files as the ``ns`` option of src/i18n/config.ts and main.tsx's
+    preloadRouteCatalog (``route``, a route table entry), for the locale and
+    the fallback language. A route with ``shards`` loads the sampled chunk of
+    the visitor's cohort. With the build ``manifest`` the URLs carry the
+    content hashes the client adds.
+    """
+    files = manifest.get('files', {}) if manifest else {}
+    chunks = manifest.get('chunks', {}) if manifest else {}
+    urls = []
+    for language in dict.fromkeys((locale, fallback)):
+        entry = files.get(language, {}).get(DEFAULT_NAMESPACE)
+        urls.append(versioned_url(f'/locales/{language}/{DEFAULT_NAMESPACE}.json', entry and entry['hash']))
+        if route is None or not route['namespaces']:
+            continue  # no chunk: the route reads the compiled module only
+        if route.get('shards') and cohort is not None:
+            path = f"{SAMPLED_DIR}/{cohort % route['shards']}/{route['file']}"
+        else:
+            path = f"{ROUTES_DIR}/{route['file']}"
+        urls.append(versioned_url(f'/locales/{language}/{path}.json', chunks.get(language, {}).get(path)))
+    return urls
+
+
+def link_header(urls):
+    """One ``Link`` value preloading ``urls`` the way ``fetch()`` requests them."""
+    return ', '.join(f'<{url}>; rel=preload; as=fetch; crossorigin' for url in urls)
+
+
+def is_rtl(locale):
+    return locale.split('-')[0].lower() in RTL_BASES
+
+
+def inject_locale(html, locale):
+    """Set ``lang``/``dir`` and the edge marker on the document's <html> tag.
+
+    Other attributes of the tag (``class``, ``data-theme``, ...) are kept.
+    """
+    match = HTML_TAG.search(html)
+    if match is None:
+        return html
+    kept = ''.join(
+        f' {attribute.group().strip()}'
+        for attribute in ATTRIBUTE.finditer(match.group(1))
+        if attribute.group(1).lower() not in LOCALE_ATTRIBUTES
+    )
+    attributes = f'lang="{locale}" dir="{"rtl" if is_rtl(locale) else "ltr"}" {EDGE_ATTRIBUTE}="{locale}"'
+    return f'{html[:match.start()]}<html {attributes}{kept}>{html[match.end():]}'
+
+
+def catalog_key(url_path):
+    """Archive key of a ``/locales/...json`` URL, or None."""
+    if not url_path.startswith('/locales/') or not url_path.endswith('.json'):
+        return None
+    key = url_path[len('/locales/'):-len('.json')]
+    return None if '..' in key.split('/') or key.startswith('/') else key
+
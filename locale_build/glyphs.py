@@ -0,0 +1,122 @@
+"""Per-locale glyph usage and subset web fonts.
+
+Collects the exact codepoints each locale's catalogs render (emoji in the
+``variations`` included) and, when a source font is configured for the
+locale, writes a WOFF2 subset plus an ``@font-face`` rule restricted to the
+covered ``unicode-range``. The stylesheets written are listed under ``fonts``
+in the build manifest, which src/i18n/localeFonts.ts reads, so the client
+only requests fonts that exist. Subsetting needs the optional ``fonttools``
+and ``brotli`` packages.
+"""
+import hashlib
+import io
+import os
+import re
+
+FONT_FAMILY = 'Locale Sans'
+FONTS_DIR = os.path.join('public', 'fonts')
+FONTS_PUBLIC_PATH = '/fonts'
+
+# Markup and placeholders are never drawn, and ASCII stays with the page's
+# own Latin fonts.
+MARKUP = re.compile(r'<[^>]*>|\{\{?\w+\}?\}')
+FIRST_NON_ASCII = 0x80
+
+
+def iter_strings(value):
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from iter_strings(item)
+    elif isinstance(value, list):
+        for item in value:
+            yield from iter_strings(item)
+
+
+def collect_codepoints(catalog):
+    """Return ``{locale: set(codepoints)}`` over all of a locale's namespaces."""
+    usage = {}
+    for locale, namespaces in catalog.items():
+        codepoints = set()
+        for text in iter_strings(namespaces):
+            codepoints.update(ord(char) for char in MARKUP.sub('', text))
+        usage[locale] = {cp for cp in codepoints if cp >= FIRST_NON_ASCII}
+    return usage
+
+
+def unicode_range(codepoints):
+    """Compress codepoints into a CSS ``unicode-range`` value."""
+    ranges = []
+    for cp in sorted(codepoints):
+        if ranges and cp == ranges[-1][1] + 1:
+            ranges[-1][1] = cp
+        else:
+            ranges.append([cp, cp])
+    return ', '.join(f'U+{start:X}' if start == end else f'U+{start:X}-{end:X}' for start, end in ranges)
+
+
+def subset_font(source, codepoints):
+    """Return ``(woff2_bytes, covered_codepoints)`` for ``source``."""
+    try:
+        from fontTools import subset
+        from fontTools.ttLib import TTFont
+    except ImportError:
+        raise SystemExit('❌ Font subsetting needs fonttools and brotli: pip install fonttools brotli')
+
+    font = TTFont(source)
+    covered = codepoints & set(font.getBestCmap())
+    options = subset.Options()
+    options.flavor = 'woff2'
+    subsetter = subset.Subsetter(options)
+    subsetter.populate(unicodes=covered)
+    subsetter.subset(font)
+
+    buffer = io.BytesIO()
+    font.flavor = 'woff2'
+    font.save(buffer)
+    return buffer.getvalue(), covered
+
+
+def font_face_css(url, covered):
+    return (
+        '@font-face {\n'
+        f"  font-family: '{FONT_FAMILY}';\n"
+        f"  src: url('{url}') format('woff2');\n"
+        '  font-display: swap;\n'
+        f'  unicode-range: {unicode_range(covered)};\n'
+        '}\n'
+    )
+
+
+def font_stylesheets(results):
+    """``{locale: stylesheet URL}`` for the manifest, from ``write_locale_fonts`` results."""
+    return {locale: f'{FONTS_PUBLIC_PATH}/{locale}.css' for locale, *_ in results}
+
+
+def write_locale_fonts(catalog, font_sources, fonts_dir=FONTS_DIR):
+    """Write ``<locale>.<hash>.woff2`` and ``<locale>.css`` per configured locale.
+
+    ``font_sources`` maps a locale to the path of its full source font.
+    Returns ``[(locale, glyph_count, covered_count, source_bytes, subset_bytes)]``.
+    """
+    usage = collect_codepoints(catalog)
+    os.makedirs(fonts_dir, exist_ok=True)
+    results = []
+    for locale, source in sorted(font_sources.items()):
+        if locale not in usage:
+            raise SystemExit(f'❌ No catalogs for font locale {locale}')
+        woff2, covered = subset_font(source, usage[locale])
+        digest = hashlib.sha256(woff2).hexdigest()[:12]
+        font_name = f'{locale}.{digest}.woff2'
+
+        for stale in os.listdir(fonts_dir):
+            if stale.startswith(f'{locale}.') and stale.endswith('.woff2') and stale != font_name:
+                os.remove(os.path.join(fonts_dir, stale))
+        with open(os.path.join(fonts_dir, font_name), 'wb') as f:
+            f.write(woff2)
+        with open(os.path.join(fonts_dir, f'{locale}.css'), 'w', encoding='utf-8') as f:
+            f.write(font_face_css(f'{FONTS_PUBLIC_PATH}/{font_name}', covered))
+
+        results.append((locale, len(usage[locale]), len(covered), os.path.getsize(source), len(woff2)))
+    return results
@@ -0,0 +1,124 @@
+"""JSON backend for the generator: orjson when installed, stdlib otherwise.
+
+Both backends produce byte-identical output: UTF-8 without ``\\u`` escapes,
+either two-space indented (the phase scripts' format) or compact. That holds
+for strings, booleans, null and 64-bit integers; floats are formatted
+differently (``1e+16`` against ``1e16``), so catalogs must not contain any
+(see ``non_portable``). Set ``LOCALE_BUILD_JSON=stdlib`` to force the fallback.
+
+``python3 -m locale_build.jsonio`` benchmarks the available backends on the
+public/locales tree and checks that their output matches.
+"""
+import json
+import os
+import time
+
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
+
+if os.environ.get('LOCALE_BUILD_JSON') == 'stdlib':
+    orjson = None
+
+
+class StdlibBackend:
+    name = 'json'
+
+    @staticmethod
+    def loads(payload):
+        return json.loads(payload)
+
+    @staticmethod
+    def dumps(data, compact=False):
+        if compact:
+            return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+
+
+class OrjsonBackend:
+    name = 'orjson'
+
+    @staticmethod
+    def loads(payload):
+        return orjson.loads(payload)
+
+    @staticmethod
+    def dumps(data, compact=False):
+        return orjson.dumps(data) if compact else orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
+
+BACKEND = OrjsonBackend if orjson is not None else StdlibBackend
+loads = BACKEND.loads
+dumps = BACKEND.dumps
+
+
+def non_portable(data, path=''):
+    """Yield the paths of values the two backends would not write identically.
+
+    Those are floats and integers outside orjson's 64-bit range.
+    """
+    if isinstance(data, dict):
+        for key, value in data.items():
+            yield from non_portable(value, f'{path}/{key}')
+    elif isinstance(data, list):
+        for index, value in enumerate(data):
+            yield from non_portable(value, f'{path}/{index}')
+    elif isinstance(data, float) or (isinstance(data, int) and not -2 ** 63 <= data < 2 ** 64):
+        yield path or '/'
+
+
+def load_file(path):
+    with open(path, 'rb') as f:
+        return loads(f.read())
+
+
+def benchmark(locales_dir, rounds=5):
+    """Time load and dump of every catalog file with each available backend."""
+    payloads = []
+    for root, _, filenames in os.walk(locales_dir):
+        for name in sorted(filenames):
+            if name.endswith('.json'):
+                with open(os.path.join(root, name), 'rb') as f:
+                    payloads.append(f.read())
+    documents = [StdlibBackend.loads(payload) for payload in payloads]
+    backends = [StdlibBackend] + ([OrjsonBackend] if orjson is not None else [])
+
+    results = {}
+    for backend in backends:
+        timings = {}
+        for label, run in (
+            ('load', lambda: [backend.loads(p) for p in payloads]),
+            ('dump', lambda: [backend.dumps(d) for d in documents]),
+            ('dump compact', lambda: [backend.dumps(d, compact=True) for d in documents]),
+        ):
+            best = float('inf')
+            for _ in range(rounds):
+                start = time.perf_counter()
+                run()
+                best = min(best, time.perf_counter() - start)
+            timings[label] = best
+        results[backend.name] = timings
+
+    for compact in (False, True):
+        outputs = {backend.name: [backend.dumps(d, compact=compact) for d in documents] for backend in backends}
+        reference = outputs[StdlibBackend.name]
+        for name, output in outputs.items():
+            if output != reference:
+                raise SystemExit(f'❌ {name} output differs from json (compact={compact})')
+    return len(payloads), sum(map(len, payloads)), results
+
+
+if __name__ == '__main__':
+    from .catalog import LOCALES_DIR
+
+    files, size, results = benchmark(LOCALES_DIR)
+    print(f'{files} files, {size:,} bytes, output identical across backends')
+    baseline = results[StdlibBackend.name]
+    for name, timings in results.items():
+        cells = ', '.join(
+            f'{label} {seconds * 1000:.1f}ms ({baseline[label] / seconds:.1f}x)' for label, seconds in timings.items()
+        )
+        print(f'{name:>7}: {cells}')
+    if orjson is None:
+        print('💡 pip install orjson for the fast backend')
@@ -0,0 +1,154 @@
+"""Language resolution table generated from the catalogs that exist on disk.
+
+Reads ``SUPPORTED_LANGUAGES`` from src/i18n/config.ts and
+``COUNTRY_TO_LANGUAGE`` from src/i18n/languageDetection.ts, and resolves every
+tag, base language and country to a locale that has catalogs. Detection then
+never lands on a locale that 404s. The table also carries a diacritic-folded
+token index of language names for LanguageSwitcher's prefix search. It is
+written as src/i18n/languageTable.ts so it ships in the bundle.
+"""
+import json
+import os
+import re
+import unicodedata
+
+CONFIG_TS = os.path.join('src', 'i18n', 'config.ts')
+DETECTION_TS = os.path.join('src', 'i18n', 'languageDetection.ts')
+TABLE_TS = os.path.join('src', 'i18n', 'languageTable.ts')
+
+FALLBACK_LOCALE = 'en'
+
+SUPPORTED_ENTRY = re.compile(r"\{ code: '([^']+)', name: '([^']+)', nativeName: '([^']+)' \}")
+COUNTRY_BLOCK = re.compile(r'COUNTRY_TO_LANGUAGE[^{]*\{(.*?)\n\};', re.S)
+COUNTRY_ENTRY = re.compile(r"\b([A-Z]{2}): '([^']+)'")
+
+# Tags whose base-language fallback would pick the wrong variant.
+TAG_OVERRIDES = {
+    'zh-hk': 'zh-TW',
+    'zh-mo': 'zh-TW',
+    'zh-hant': 'zh-TW',
+    'zh-hans': 'zh-CN',
+    'es-419': 'es-MX',
+    'es-co': 'es-MX',
+}
+# Preferred locale per base language when several variants have catalogs.
+BASE_PREFERENCES = {
+    'en': 'en',
+    'es': 'es-ES',
+    'pt': 'pt-BR',
+    'fr': 'fr-FR',
+    'zh': 'zh-CN',
+    'ar': 'ar',
+    'no': 'nb-NO',
+    'nn': 'nb-NO',
+}
+# Browser tags that are common but appear nowhere in our tables, including
+# the TAG_OVERRIDES keys the tables lack, so the generated table carries them.
+EXTRA_TAGS = ('en-US', 'en-CA', 'en-NZ', 'en-IE', 'zh-SG', 'zh-MO', 'zh-Hant', 'zh-Hans', 'no', 'nn-NO', 'fil-PH')
+
+
+def read_supported_languages(path=CONFIG_TS):
+    with open(path, encoding='utf-8') as f:
+        return [
+            {'code': code, 'name': name, 'nativeName': native}
+            for code, name, native in SUPPORTED_ENTRY.findall(f.read())
+        ]
+
+
+def read_country_languages(path=DETECTION_TS):
+    with open(path, encoding='utf-8') as f:
+        block = COUNTRY_BLOCK.search(f.read())
+    return dict(COUNTRY_ENTRY.findall(block.group(1))) if block else {}
+
+
+def fold(text):
+    """Lowercase and strip diacritics, the same way languageResolution.ts does."""
+    decomposed = unicodedata.normalize('NFKD', text)
+    return ''.join(c for c in decomposed if not unicodedata.category(c).startswith('M')).lower()
+
+
+def tokens(text):
+    return [t for t in re.split(r'[^\w]+|_', fold(text)) if t]
+
+
+class Resolver:
+    def __init__(self, locales):
+        self.by_lower = {locale.lower(): locale for locale in locales}
+        self.bases = {}
+        for locale in sorted(locales):
+            self.bases.setdefault(locale.split('-')[0].lower(), []).append(locale)
+
+    def base(self, base):
+        preferred = BASE_PREFERENCES.get(base)
+        if preferred and preferred.lower() in self.by_lower:
+            return self.by_lower[preferred.lower()]
+        if base in self.by_lower:
+            return self.by_lower[base]
+        candidates = self.bases.get(base)
+        return candidates[0] if candidates else None
+
+    def tag(self, tag):
+        """Longest prefix of ``tag`` first: zh-Hant-TW tries zh-hant-tw, then zh-hant."""
+        subtags = tag.lower().replace('_', '-').split('-')
+        for end in range(len(subtags), 0, -1):
+            lower = '-'.join(subtags[:end])
+            if lower in self.by_lower:
+                return self.by_lower[lower]
+            override = TAG_OVERRIDES.get(lower)
+            if override and override.lower() in self.by_lower:
+                return self.by_lower[override.lower()]
+        return self.base(subtags[0]) or FALLBACK_LOCALE
+
+
+def build_language_table(catalog, supported, countries):
+    locales = sorted(catalog)
+    resolver = Resolver(locales)
+
+    tags = sorted({*locales, *(lang['code'] for lang in supported), *countries.values(), *EXTRA_TAGS}, key=str.lower)
+    bases = sorted({tag.split('-')[0].lower() for tag in tags})
+
+    search = set()
+    for lang in supported:
+        for field in (lang['code'], lang['name'], lang['nativeName']):
+            for token in tokens(field):
+                search.add((token, lang['code']))
+
+    return {
+        'fallback': FALLBACK_LOCALE,
+        'locales': locales,
+        'tags': {tag.lower(): resolver.tag(tag) for tag in tags},
+        'bases': {base: locale for base in bases if (locale := resolver.base(base))},
+        'countries': {country: resolver.tag(tag) for country, tag in sorted(countries.items())},
+        'search': sorted(search),
+    }
+
+
+PAIR = re.compile(r'\[\n\s+("[^"]*"),\n\s+("[^"]*")\n\s+\]')
+
+
+def render_table_module(table):
+    body = PAIR.sub(r'[\1, \2]', json.dumps(table, ensure_ascii=False, indent=2))
+    return (
+        '// Generated by generate_locales.py from public/locales, SUPPORTED_LANGUAGES\n'
+        '// and COUNTRY_TO_LANGUAGE. Do not edit by hand.\n'
+        "import type { LanguageTable } from './languageResolution';\n"
+        '\n'
+        f'export const LANGUAGE_TABLE: LanguageTable = {body};\n'
+    )
+
+
+def render_language_table(catalog):
+    """Source of the table module for ``catalog``."""
+    return render_table_module(build_language_table(catalog, read_supported_languages(), read_country_languages()))
+
+
+def write_language_table(catalog, path=TABLE_TS):
+    """Write the table module; returns True when the file changed."""
+    module = render_language_table(catalog)
+    if os.path.exists(path):
+        with open(path, encoding='utf-8') as f:
+            if f.read() == module:
+                return False
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(module)
+    return True
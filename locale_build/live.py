@@ -0,0 +1,173 @@
+"""Push catalog changes to running dev clients over server-sent events.
+
+``python3 locale_daemon.py serve --live`` watches the source catalogs and the
+phase scripts, rebuilds when one changes and serves ``GET /events`` on
+``--live-port``. After every build, watched or requested by a client, the
+written catalogs are diffed against the previous build and the changed keys
+go out as one ``catalog`` event::
+
+    event: catalog
+    data: {"changes": [{"lng": "de-DE", "ns": "landing", "resources": {"welcome": {"variations": [...]}}}]}
+
+src/i18n/liveCatalogs.ts merges ``resources`` with ``i18n.addResourceBundle``.
+A deep merge cannot delete, so a catalog that lost keys or array items is
+sent as ``{"lng", "ns", "reload": true}`` and the client refetches just that
+namespace. Derived namespaces are not diffed; liveCatalogs.ts refetches them
+along with their source namespace.
+"""
+import json
+import os
+import queue
+import threading
+
+from . import jsonio
+from .catalog import DERIVED_NAMESPACES, PHASE_SOURCES, is_locale_dir
+from .store import flatten
+
+LIVE_PORT = 5176
+HEARTBEAT_SECONDS = 15
+
+
+def read_written(locales_dir):
+    """``{(locale, ns): data}`` of every catalog on disk, derived ones included."""
+    catalogs = {}
+    for locale in sorted(os.listdir(locales_dir)):
+        if not is_locale_dir(locales_dir, locale):
+            continue
+        for filename in sorted(os.listdir(os.path.join(locales_dir, locale))):
+            if filename.endswith('.json'):
+                path = os.path.join(locales_dir, locale, filename)
+                catalogs[(locale, filename[:-len('.json')])] = jsonio.load_file(path)
+    return catalogs
+
+
+def source_mtimes(locales_dir):
+    """mtimes of the files a rebuild reads catalog text from."""
+    mtimes = {}
+    for module_name, _ in PHASE_SOURCES:
+        path = f'{module_name}.py'
+        if os.path.exists(path):
+            mtimes[path] = os.stat(path).st_mtime_ns
+    for locale in os.listdir(locales_dir):
+        if not is_locale_dir(locales_dir, locale):
+            continue
+        for filename in os.listdir(os.path.join(locales_dir, locale)):
+            if filename.endswith('.json') and filename[:-len('.json')] not in DERIVED_NAMESPACES:
+                path = os.path.join(locales_dir, locale, filename)
+                mtimes[path] = os.stat(path).st_mtime_ns
+    return mtimes
+
+
+def nest(entries):
+    """Turn ``{key_path: value}`` into the nested object i18next stores."""
+    nested = {}
+    for key_path, value in entries.items():
+        *parents, leaf = key_path.split('.')
+        target = nested
+        for part in parents:
+            target = target.setdefault(part, {})
+        target[leaf] = value
+    return nested
+
+
+def _shrinks(before, after):
+    return isinstance(before, list) and (not isinstance(after, list) or len(after) < len(before))
+
+
+def diff_catalogs(previous, current):
+    """Changes from ``previous`` to ``current`` in the ``catalog`` event format."""
+    changes = []
+    for (locale, namespace), data in sorted(current.items()):
+        # The client refetches a derived namespace when its source changes.
+        if namespace in DERIVED_NAMESPACES:
+            continue
+        before = previous.get((locale, namespace))
+        if before == data:
+            continue
+        if before is None:
+            changes.append({'lng': locale, 'ns': namespace, 'resources': data})
+            continue
+        old, new = dict(flatten(before)), dict(flatten(data))
+        if old.keys() - new.keys() or any(_shrinks(old[key], new[key]) for key in old):
+            changes.append({'lng': locale, 'ns': namespace, 'reload': True})
+            continue
+        changed = {key: value for key, value in new.items() if old.get(key) != value}
+        changes.append({'lng': locale, 'ns': namespace, 'resources': nest(changed)})
+    return changes
+
+
+class LiveChannel:
+    """Written catalogs of the last build plus the connected SSE clients."""
+
+    def __init__(self, locales_dir):
+        self.locales_dir = locales_dir
+        self.catalogs = read_written(locales_dir)
+        self.clients = set()
+        self.lock = threading.Lock()
+        self.sequence = 0
+
+    def refresh(self):
+        """Diff the catalogs on disk against the last build and publish the changes."""
+        current = read_written(self.locales_dir)
+        changes = diff_catalogs(self.catalogs, current)
+        self.catalogs = current
+        if changes:
+            self.publish('catalog', {'changes': changes})
+        return changes
+
+    def publish(self, event, payload):
+        with self.lock:
+            self.sequence += 1
+            message = f'id: {self.sequence}\nevent: {event}\ndata: {json.dumps(payload, ensure_ascii=False)}\n\n'
+            for client in self.clients:
+                client.put(message.encode('utf-8'))
+
+    def subscribe(self):
+        client = queue.Queue()
+        with self.lock:
+            self.clients.add(client)
+        return client
+
+    def unsubscribe(self, client):
+        with self.lock:
+            self.clients.discard(client)
+
+    def serve(self, host='127.0.0.1', port=LIVE_PORT):
+        """Start the SSE server on a background thread; returns the server."""
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        channel = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?')[0] != '/events':
+                    self.send_error(404)
+                    return
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/event-stream')
+                self.send_header('Cache-Control', 'no-cache')
+                self.send_header('Access-Control-Allow-Origin', '*')
+                self.end_headers()
+                client = channel.subscribe()
+                try:
+                    self.wfile.write(b'retry: 1000\n\n')
+                    self.wfile.flush()
+                    while True:
+                        try:
+                            message = client.get(timeout=HEARTBEAT_SECONDS)
+                        except queue.Empty:
+                            message = b': ping\n\n'
+                        self.wfile.write(message)
+                        self.wfile.flush()
+                except (BrokenPipeError, ConnectionResetError):
+                    pass
+                finally:
+                    channel.unsubscribe(client)
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer((host, port), Handler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        return server
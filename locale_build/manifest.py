@@ -0,0 +1,152 @@
+"""Versioned build manifest and the previous-build snapshot.
+
+``public/locales/manifest.json`` lists the content hash of every
+(locale, namespace) catalog for the current version, plus a patch entry for
+catalogs that changed since version N-1, and under ``chunks`` the hash of
+every route chunk (``<locale>/_routes/<route>``, ``_sampled/<shard>/...``). The snapshot of the last build is kept
+in the state directory so the next run can diff against it. A build without
+one (a fresh CI container) can take the deployed manifest and catalogs as its
+previous build instead, so versions keep counting and patches keep flowing.
+"""
+import hashlib
+import os
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+from . import jsonio
+from .catalog import iter_catalog, serialize, serialize_namespace
+
+MANIFEST_NAME = 'manifest.json'
+PATCHES_DIR = '_patches'
+PUBLIC_PATH = '/locales'
+STATE_DIR = '.locale-build'
+SNAPSHOT_NAME = 'previous.json'
+TEMPLATE_REPORT_NAME = 'templates.json'
+
+
+def content_hash(payload):
+    return hashlib.sha256(payload).hexdigest()[:12]
+
+
+def catalog_hashes(catalog):
+    """Return ``{(locale, ns): (hash, size)}`` for the serialized catalog."""
+    hashes = {}
+    for locale, namespace, data in iter_catalog(catalog):
+        payload = serialize_namespace(namespace, data)
+        hashes[(locale, namespace)] = (content_hash(payload), len(payload))
+    return hashes
+
+
+def chunk_hashes(entries):
+    """``{locale: {path: hash}}`` of route chunk payloads keyed ``<locale>/<path>``."""
+    chunks = {}
+    for key, payload in sorted(entries.items()):
+        locale, _, path = key.partition('/')
+        chunks.setdefault(locale, {})[path] = content_hash(payload)
+    return chunks
+
+
+def patch_path(locale, namespace, from_hash, to_hash):
+    """Path of a patch file, relative to the locales directory."""
+    return f'{PATCHES_DIR}/{locale}/{namespace}/{from_hash}-{to_hash}.json'
+
+
+def build_manifest(version, hashes, patches, fonts=None, chunks=None):
+    """Assemble the manifest dict.
+
+    ``patches`` maps ``(locale, ns)`` to the hash of the N-1 catalog a patch
+    starts from; ``fonts`` maps a locale to its subset font stylesheet and
+    ``chunks`` is the ``chunk_hashes`` of the route chunks.
+    """
+    files = {}
+    for (locale, namespace), (digest, size) in sorted(hashes.items()):
+        entry = {'hash': digest, 'bytes': size}
+        from_hash = patches.get((locale, namespace))
+        if from_hash:
+            entry['patch'] = {
+                'from': from_hash,
+                'path': patch_path(locale, namespace, from_hash, digest),
+            }
+        files.setdefault(locale, {})[namespace] = entry
+    return {'version': version, 'files': files, 'chunks': chunks or {}, 'fonts': dict(sorted((fonts or {}).items()))}
+
+
+def manifest_hashes(manifest):
+    """Return ``{(locale, ns): hash}`` as recorded in a written manifest."""
+    return {
+        (locale, namespace): entry['hash']
+        for locale, namespaces in manifest['files'].items()
+        for namespace, entry in namespaces.items()
+    }
+
+
+def load_snapshot(state_dir=STATE_DIR):
+    """Return ``(version, catalog)`` of the previous build, or ``(0, None)``."""
+    path = os.path.join(state_dir, SNAPSHOT_NAME)
+    if not os.path.exists(path):
+        return 0, None
+    snapshot = jsonio.load_file(path)
+    return snapshot['version'], snapshot['catalog']
+
+
+def _fetch(url, timeout):
+    with urllib.request.urlopen(url, timeout=timeout) as response:
+        return response.read()
+
+
+def load_deployed_manifest(base_url, timeout=10):
+    """Return the manifest of the build served at ``base_url``, or None."""
+    try:
+        return jsonio.loads(_fetch(f'{base_url.rstrip("/")}{PUBLIC_PATH}/{MANIFEST_NAME}', timeout))
+    except (urllib.error.URLError, OSError, ValueError):
+        return None
+
+
+def load_deployed(base_url, timeout=10, workers=16, manifest=None):
+    """Return ``(version, catalog)`` of the build served at ``base_url``, or ``(0, None)``.
+
+    Reads ``<base_url>/locales/manifest.json`` (unless its ``manifest`` is
+    passed in) and every catalog it lists. Catalogs whose bytes do not match
+    their manifest hash are left out, so they are treated as new rather than
+    patched from the wrong base.
+    """
+    root = base_url.rstrip('/') + PUBLIC_PATH
+    if manifest is None:
+        manifest = load_deployed_manifest(base_url, timeout)
+    if manifest is None:
+        return 0, None
+
+    expected = manifest_hashes(manifest)
+
+    def fetch_one(key):
+        locale, namespace = key
+        try:
+            payload = _fetch(f'{root}/{locale}/{namespace}.json', timeout)
+        except (urllib.error.URLError, OSError):
+            return key, None
+        return key, jsonio.loads(payload) if content_hash(payload) == expected[key] else None
+
+    catalog = {}
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for (locale, namespace), data in pool.map(fetch_one, sorted(expected)):
+            if data is not None:
+                catalog.setdefault(locale, {})[namespace] = data
+    return manifest['version'], catalog
+
+
+def save_snapshot(version, catalog, state_dir=STATE_DIR):
+    os.makedirs(state_dir, exist_ok=True)
+    with open(os.path.join(state_dir, SNAPSHOT_NAME), 'wb') as f:
+        f.write(jsonio.dumps({'version': version, 'catalog': catalog}, compact=True))
+
+
+def write_template_report(report, state_dir=STATE_DIR):
+    """Record which message families were merged into templates, per locale."""
+    write_json(os.path.join(state_dir, TEMPLATE_REPORT_NAME), report)
+
+
+def write_json(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(serialize(data))
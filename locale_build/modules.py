@@ -0,0 +1,68 @@
+"""ES module output mode (``generate_locales.py --modules``).
+
+Writes every (locale, namespace) catalog, and every route chunk, as a module
+under src/i18n/catalogs so Vite hashes, preloads and code-splits them like any
+other chunk. src/i18n/moduleBackend.ts imports them through ``import.meta.glob``
+and falls back to the http backend for anything not emitted.
+
+Each module wraps the compact JSON in ``JSON.parse('...')``: engines parse a
+JSON string literal considerably faster than the equivalent object literal.
+"""
+import json
+import os
+import shutil
+
+from .catalog import iter_catalog, serialize
+from .routes import ROUTES_DIR, route_file
+
+MODULES_DIR = os.path.join('src', 'i18n', 'catalogs')
+
+
+def render_module(label, data):
+    payload = serialize(data, compact=True).decode('utf-8')
+    return (
+        f'// Generated by generate_locales.py --modules from {label}. Do not edit by hand.\n'
+        f'export default JSON.parse({json.dumps(payload, ensure_ascii=False)}) as Record<string, unknown>;\n'
+    )
+
+
+def _write_if_changed(path, module):
+    if os.path.exists(path):
+        with open(path, encoding='utf-8') as f:
+            if f.read() == module:
+                return False
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(module)
+    return True
+
+
+def write_catalog_modules(catalog, route_chunks, modules_dir=MODULES_DIR):
+    """Write the modules and drop stale ones; returns the number written."""
+    expected = set()
+    written = 0
+    for locale, namespace, data in iter_catalog(catalog):
+        path = os.path.join(modules_dir, locale, f'{namespace}.ts')
+        expected.add(path)
+        written += _write_if_changed(path, render_module(f'public/locales/{locale}/{namespace}.json', data))
+    for (locale, route), chunk in sorted(route_chunks.items()):
+        name = route_file(route)
+        path = os.path.join(modules_dir, locale, ROUTES_DIR, f'{name}.ts')
+        expected.add(path)
+        written += _write_if_changed(path, render_module(f'public/locales/{locale}/{ROUTES_DIR}/{name}.json', chunk))
+
+    for root, _, filenames in os.walk(modules_dir, topdown=False):
+        for filename in filenames:
+            if os.path.join(root, filename) not in expected:
+                os.remove(os.path.join(root, filename))
+        if not os.listdir(root):
+            os.rmdir(root)
+    return written
+
+
+def remove_catalog_modules(modules_dir=MODULES_DIR):
+    """Drop a previous --modules output so the app goes back to the http backend."""
+    if not os.path.isdir(modules_dir):
+        return False
+    shutil.rmtree(modules_dir)
+    return True
@@ -0,0 +1,193 @@
+"""Single-file catalog archive (``generate_locales.py --pack ARCHIVE``).
+
+Every catalog and route chunk, byte for byte as written under public/locales,
+goes into one file with a fixed-size index up front, so a static tier or an
+edge node opens one file instead of walking 50+ directories::
+
+    header   32 B   magic "LCPK", format, catalog version, entry count,
+                    string table size, data offset
+    index    32 B   per entry, sorted by key: key offset/length, data
+                    offset/length, 12-character content hash
+    strings         UTF-8 keys, ``<locale>/<namespace>`` or
+                    ``<locale>/_routes/<route>`` (the URL path without .json)
+    data            the payloads, 8-byte aligned
+
+:class:`PackReader` memory-maps the archive and hands out ``memoryview``
+slices of it, so serving a catalog copies nothing.
+
+``python3 -m locale_build.pack ARCHIVE`` lists the entries and verifies
+their hashes.
+"""
+import mmap
+import os
+import struct
+import weakref
+
+from .catalog import iter_catalog, serialize_namespace
+from .manifest import content_hash
+from .routes import route_entries
+
+MAGIC = b'LCPK'
+FORMAT = 1
+HEADER = struct.Struct('<4sHHIIIQ4x')
+ENTRY = struct.Struct('<IHHQI12s')
+ALIGN = 8
+
+
+def _padding(size):
+    return -size % ALIGN
+
+
+def pack_entries(catalog, route_chunks):
+    """``{key: payload}`` for every catalog and route chunk, as written to disk."""
+    entries = {
+        f'{locale}/{namespace}': serialize_namespace(namespace, data)
+        for locale, namespace, data in iter_catalog(catalog)
+    }
+    entries.update(route_entries(route_chunks))
+    return entries
+
+
+def pack_bytes(entries, version):
+    """Serialize ``{key: payload}`` into an archive."""
+    keys = sorted(entries)
+    strings = bytearray()
+    key_spans = []
+    for key in keys:
+        encoded = key.encode('utf-8')
+        key_spans.append((len(strings), len(encoded)))
+        strings += encoded
+
+    data_offset = HEADER.size + ENTRY.size * len(keys) + len(strings)
+    data_offset += _padding(data_offset)
+    index = bytearray()
+    data = bytearray()
+    for key, (key_offset, key_length) in zip(keys, key_spans):
+        payload = entries[key]
+        offset = data_offset + len(data)
+        index += ENTRY.pack(key_offset, key_length, 0, offset, len(payload), content_hash(payload).encode('ascii'))
+        data += payload
+        data += b'\0' * _padding(len(data))
+
+    header = HEADER.pack(MAGIC, FORMAT, 0, version, len(keys), len(strings), data_offset)
+    gap = b'\0' * (data_offset - HEADER.size - len(index) - len(strings))
+    return b''.join((header, index, strings, gap, data))
+
+
+def write_pack(path, entries, version):
+    """Write the archive when its bytes changed; returns ``(written, size)``."""
+    archive = pack_bytes(entries, version)
+    if os.path.exists(path):
+        with open(path, 'rb') as f:
+            if f.read() == archive:
+                return False, len(archive)
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    tmp = f'{path}.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(archive)
+    # Readers that mapped the old archive keep their inode.
+    os.replace(tmp, path)
+    return True, len(archive)
+
+
+class PackReader:
+    """Zero-copy random access to an archive.
+
+    ``reader.get('de-DE', 'landing')`` returns a ``memoryview`` into the
+    mapping; keep the reader open while the view is in use. ``close()``
+    releases the views still alive and never fails: a slice or export a
+    caller took of a view keeps the mapping, which is then unmapped once
+    the last of them is gone.
+    """
+
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._map)
+        # Views handed out by read(); each pins the mapping until released.
+        self._views = weakref.WeakSet()
+        magic, fmt, _, self.version, count, strings_size, _ = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or fmt != FORMAT:
+            self.close()
+            raise ValueError(f'{path} is not a format {FORMAT} locale archive')
+        strings_offset = HEADER.size + ENTRY.size * count
+        strings = bytes(self._view[strings_offset:strings_offset + strings_size])
+        self._index = {}
+        for key_offset, key_length, _, offset, length, digest in ENTRY.iter_unpack(
+            self._view[HEADER.size:strings_offset]
+        ):
+            key = strings[key_offset:key_offset + key_length].decode('utf-8')
+            self._index[key] = (offset, length, digest.decode('ascii'))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    @property
+    def closed(self):
+        return self._map is None
+
+    def close(self):
+        if self._map is None:
+            return
+        for view in [*self._views, self._view]:
+            try:
+                view.release()
+            except BufferError:
+                pass  # exported by the caller; it pins the mapping until released
+        mapping, self._map = self._map, None
+        try:
+            mapping.close()
+        except BufferError:
+            # Slices of a view share its export; dropping our reference lets
+            # the last of them unmap the archive.
+            pass
+
+    def __len__(self):
+        return len(self._index)
+
+    def __contains__(self, key):
+        return key in self._index
+
+    def keys(self):
+        return self._index.keys()
+
+    def entry(self, key):
+        """``(offset, length, content hash)`` of ``key``, or None."""
+        return self._index.get(key)
+
+    def read(self, key):
+        """Payload of ``key`` (``<locale>/<namespace>``) as a memoryview, or None."""
+        if self._map is None:
+            raise ValueError('read from a closed archive')
+        entry = self._index.get(key)
+        if entry is None:
+            return None
+        offset, length, _ = entry
+        view = self._view[offset:offset + length]
+        self._views.add(view)
+        return view
+
+    def get(self, locale, namespace):
+        return self.read(f'{locale}/{namespace}')
+
+
+if __name__ == '__main__':
+    import sys
+
+    if len(sys.argv) != 2:
+        raise SystemExit('usage: python3 -m locale_build.pack ARCHIVE')
+    with PackReader(sys.argv[1]) as reader:
+        bad = []
+        for key in sorted(reader.keys()):
+            offset, length, digest = reader.entry(key)
+            payload = reader.read(key)
+            if content_hash(payload) != digest:
+                bad.append(key)
+            print(f'{offset:>10} {length:>8} {digest}  {key}')
+            payload.release()
+        print(f'{len(reader)} entries, version {reader.version}, {os.path.getsize(sys.argv[1]):,} bytes')
+    if bad:
+        raise SystemExit(f"❌ Hash mismatch: {', '.join(bad)}")
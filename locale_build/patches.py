@@ -0,0 +1,71 @@
+"""RFC 6902 JSON patches between two versions of a catalog.
+
+Only ``add``, ``remove`` and ``replace`` are emitted, which is all the
+client-side applier in src/i18n/catalogPatches.ts understands.
+"""
+import copy
+
+
+def _escape(token):
+    return str(token).replace('~', '~0').replace('/', '~1')
+
+
+def _unescape(token):
+    return token.replace('~1', '/').replace('~0', '~')
+
+
+def diff(old, new, path=''):
+    """Return the list of patch operations turning ``old`` into ``new``."""
+    if old == new:
+        return []
+    if isinstance(old, dict) and isinstance(new, dict):
+        ops = []
+        for key in old:
+            if key not in new:
+                ops.append({'op': 'remove', 'path': f'{path}/{_escape(key)}'})
+        for key, value in new.items():
+            child = f'{path}/{_escape(key)}'
+            if key in old:
+                ops.extend(diff(old[key], value, child))
+            else:
+                ops.append({'op': 'add', 'path': child, 'value': value})
+        return ops
+    if isinstance(old, list) and isinstance(new, list):
+        ops = []
+        common = min(len(old), len(new))
+        for index in range(common):
+            ops.extend(diff(old[index], new[index], f'{path}/{index}'))
+        for index in range(common, len(new)):
+            ops.append({'op': 'add', 'path': f'{path}/{index}', 'value': new[index]})
+        # Remove from the tail so earlier indices stay valid.
+        for index in range(len(old) - 1, common - 1, -1):
+            ops.append({'op': 'remove', 'path': f'{path}/{index}'})
+        return ops
+    return [{'op': 'replace', 'path': path, 'value': new}]
+
+
+def apply(document, ops):
+    """Apply ``ops`` to a deep copy of ``document`` and return the result."""
+    document = copy.deepcopy(document)
+    for op in ops:
+        tokens = [_unescape(t) for t in op['path'].split('/')[1:]]
+        if not tokens:
+            document = copy.deepcopy(op['value'])
+            continue
+        parent = document
+        for token in tokens[:-1]:
+            parent = parent[int(token)] if isinstance(parent, list) else parent[token]
+        last = tokens[-1]
+        if isinstance(parent, list):
+            index = len(parent) if last == '-' else int(last)
+            if op['op'] == 'add':
+                parent.insert(index, copy.deepcopy(op['value']))
+            elif op['op'] == 'remove':
+                del parent[index]
+            else:
+                parent[index] = copy.deepcopy(op['value'])
+        elif op['op'] == 'remove':
+            del parent[last]
+        else:
+            parent[last] = copy.deepcopy(op['value'])
+    return document
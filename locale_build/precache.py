@@ -0,0 +1,59 @@
+"""Service-worker precache manifest for the locale catalogs.
+
+public/locale-sw.js reads this file and precaches the active locale. Each
+entry carries the content hash from the build manifest as its revision, so
+the worker only refetches catalogs whose hash changed. Only the namespaces
+the app loads are listed: ``common``, the namespaces the routes read through
+i18next and ``landingVariations`` with a sampling profile. Namespaces served
+by the compiled modules and the rest stay on the network until something
+asks for them.
+
+Route chunks are listed too. Sampled chunks carry their ``shard``; the
+worker precaches the one matching the visitor's cohort (``cohort % shards``).
+"""
+import os
+
+from .manifest import PUBLIC_PATH, write_json
+from .routes import DEFAULT_NAMESPACE
+from .sampling import SAMPLED_DIR, VARIATIONS_NAMESPACE
+
+PRECACHE_MANIFEST_NAME = 'precache-manifest.json'
+
+
+def app_namespaces(routes, sampled=False, compiled=()):
+    """Namespaces the client loads: ``common``, every route's but the ``compiled`` ones, and the lazy variations."""
+    namespaces = {
+        DEFAULT_NAMESPACE,
+        *(namespace for usage in routes.values() for namespace in usage if namespace not in compiled),
+    }
+    if sampled:
+        namespaces.add(VARIATIONS_NAMESPACE)
+    return namespaces
+
+
+def _chunk_entry(url, path, revision):
+    entry = {'url': url, 'revision': revision}
+    if path.startswith(f'{SAMPLED_DIR}/'):
+        entry['shard'] = int(path.split('/')[1])
+    return entry
+
+
+def build_precache_manifest(manifest, namespaces, shards=0, public_path=PUBLIC_PATH):
+    locales = {}
+    for locale, entries in sorted(manifest['files'].items()):
+        locales[locale] = [
+            {'url': f'{public_path}/{locale}/{namespace}.json', 'revision': entry['hash']}
+            for namespace, entry in sorted(entries.items())
+            if namespace in namespaces
+        ]
+        locales[locale].extend(
+            _chunk_entry(f'{public_path}/{locale}/{path}.json', path, revision)
+            for path, revision in sorted(manifest.get('chunks', {}).get(locale, {}).items())
+        )
+    return {'version': manifest['version'], 'shards': shards, 'locales': locales}
+
+
+def write_precache_manifest(manifest, namespaces, shards, locales_dir):
+    write_json(
+        os.path.join(locales_dir, PRECACHE_MANIFEST_NAME), build_precache_manifest(manifest, namespaces, shards)
+    )
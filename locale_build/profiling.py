@@ -0,0 +1,306 @@
+"""CPU and memory profiles of a generator run, per stage and per locale.
+
+``generate_locales.py --profile-cpu`` runs every stage under cProfile and
+``--profile-mem`` traces allocations with tracemalloc. Work a stage does for
+one locale (the loops wrapped in :func:`locale_scope`) is charged to that
+locale as well, so a locale report sums its cost across all stages.
+
+Reports are written to ``<state-dir>/profile``::
+
+    summary.txt                 wall time, hottest functions, retained/peak memory
+    cpu/stage-<name>.pstats     python3 -m pstats <file>  (``run`` = whole run)
+    cpu/locale-<code>.pstats
+    mem/stage-<name>.txt        top allocation sites by retained bytes
+    mem/locale-<code>.txt       retained/peak bytes per stage, plus allocation
+                                sites for the locales given to --profile-locale
+
+Snapshot diffs cost a few hundred milliseconds each, so allocation sites are
+collected per stage and only for the requested locales.
+"""
+import contextlib
+import cProfile
+import os
+import pstats
+import shutil
+import time
+import tracemalloc
+
+PROFILE_DIR = 'profile'
+ROOT_STAGE = 'run'
+
+_active = None
+
+
+def stage(name):
+    """Charge the enclosed work to stage ``name`` when a profile is running."""
+    return _active.scope('stage', name) if _active is not None else contextlib.nullcontext()
+
+
+def locale_scope(locale):
+    """Charge the enclosed work to ``locale`` within the current stage."""
+    return _active.scope('locale', locale) if _active is not None else contextlib.nullcontext()
+
+
+class _Frame:
+    def __init__(self, kind, name, stage, locale):
+        self.kind = kind
+        self.name = name
+        self.stage = stage
+        self.locale = locale
+        self.start = time.perf_counter()
+        self.memory = 0
+        self.peak = 0
+        self.statistics = None
+
+
+class Profiler:
+    def __init__(self, cpu=False, mem=False, detail_locales=(), top=25):
+        self.cpu = cpu
+        self.mem = mem
+        self.detail_locales = set(detail_locales)
+        self.top = top
+        self.stack = []
+        self.profiles = {}  # (stage, locale or None) -> cProfile.Profile
+        self.seconds = {}  # (kind, name) -> wall seconds
+        self.locale_seconds = {}  # (locale, stage) -> wall seconds
+        self.memory = {}  # (kind, name) -> [retained bytes, peak bytes]
+        self.locale_memory = {}  # (locale, stage) -> [retained bytes, peak bytes]
+        self.allocations = {}  # (kind, name) -> {(file, line): [size, count]}
+        self.recent = None  # sites at the last stage exit, reused by the next stage
+
+    def _profile(self, frame):
+        key = (frame.stage, frame.locale)
+        if key not in self.profiles:
+            self.profiles[key] = cProfile.Profile()
+        return self.profiles[key]
+
+    def _fold_peak(self):
+        """Fold the traced peak since the last boundary into every open frame."""
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        for frame in self.stack:
+            frame.peak = max(frame.peak, peak)
+        return current
+
+    def _statistics(self):
+        snapshot = tracemalloc.take_snapshot().filter_traces([
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+        ])
+        return {
+            (stat.traceback[0].filename, stat.traceback[0].lineno): (stat.size, stat.count)
+            for stat in snapshot.statistics('lineno')
+        }
+
+    def _wants_sites(self, frame):
+        return frame.kind == 'stage' or frame.name in self.detail_locales
+
+    def _enter(self, kind, name):
+        top = self.stack[-1] if self.stack else None
+        if top is not None and self.cpu:
+            self._profile(top).disable()
+        stage_name = name if kind == 'stage' else top.stage
+        frame = _Frame(kind, name, stage_name, name if kind == 'locale' else None)
+        if self.mem:
+            self._fold_peak()
+            if kind == 'stage' and self.recent is not None:
+                frame.statistics, self.recent = self.recent, None
+            else:
+                self.recent = None
+                if self._wants_sites(frame):
+                    frame.statistics = self._statistics()
+                    tracemalloc.reset_peak()  # the snapshot's own memory is not the run's
+            frame.memory = frame.peak = tracemalloc.get_traced_memory()[0]
+        self.stack.append(frame)
+        if self.cpu:
+            self._profile(frame).enable()
+        frame.start = time.perf_counter()
+        return frame
+
+    def _exit(self, frame):
+        if frame not in self.stack:
+            return  # already closed by an enclosing frame
+        seconds = time.perf_counter() - frame.start
+        while self.stack[-1] is not frame:
+            self._exit(self.stack[-1])
+        if self.cpu:
+            self._profile(frame).disable()
+        key = (frame.kind, frame.name)
+        self.seconds[key] = self.seconds.get(key, 0) + seconds
+        if frame.kind == 'locale':
+            locale_key = (frame.locale, frame.stage)
+            self.locale_seconds[locale_key] = self.locale_seconds.get(locale_key, 0) + seconds
+        if self.mem:
+            current = self._fold_peak()
+            retained, peak = current - frame.memory, frame.peak - frame.memory
+            totals = self.memory.setdefault(key, [0, 0])
+            totals[0] += retained
+            totals[1] = max(totals[1], peak)
+            if frame.kind == 'locale':
+                totals = self.locale_memory.setdefault((frame.locale, frame.stage), [0, 0])
+                totals[0] += retained
+                totals[1] = max(totals[1], peak)
+            if frame.statistics is not None:
+                sites = self.allocations.setdefault(key, {})
+                after = self._statistics()
+                for site, (size, count) in after.items():
+                    before_size, before_count = frame.statistics.get(site, (0, 0))
+                    if size != before_size or count != before_count:
+                        totals = sites.setdefault(site, [0, 0])
+                        totals[0] += size - before_size
+                        totals[1] += count - before_count
+                self.recent = after if frame.kind == 'stage' else None
+                tracemalloc.reset_peak()
+        self.stack.pop()
+        if self.stack and self.cpu:
+            self._profile(self.stack[-1]).enable()
+
+    @contextlib.contextmanager
+    def scope(self, kind, name):
+        # Nested stages stay in the enclosing stage, nested locales in the
+        # enclosing locale; a locale outside any explicit stage counts for
+        # the run.
+        if any(frame.kind == kind and frame.name != ROOT_STAGE for frame in self.stack):
+            yield
+            return
+        frame = self._enter(kind, name)
+        try:
+            yield
+        finally:
+            self._exit(frame)
+
+    def start(self):
+        if self.mem:
+            tracemalloc.start()
+        self._enter('stage', ROOT_STAGE)
+
+    def stop(self):
+        if self.stack:
+            self._exit(self.stack[0])
+        if self.mem:
+            tracemalloc.stop()
+
+    def _stats(self, keys):
+        stats = None
+        for key in keys:
+            profile = self.profiles[key]
+            profile.create_stats()
+            if not profile.stats:
+                continue
+            if stats is None:
+                stats = pstats.Stats(profile)
+            else:
+                stats.add(profile)
+        return stats
+
+    def stages(self):
+        return [name for kind, name in self.seconds if kind == 'stage']
+
+    def locales(self):
+        return sorted({name for kind, name in self.seconds if kind == 'locale'})
+
+    def hottest(self, stats, limit=3):
+        """``[(label, own seconds)]`` of the functions with the most own time."""
+        rows = sorted(stats.stats.items(), key=lambda item: -item[1][2])[:limit]
+        return [(pstats.func_std_string(func), timing[2]) for func, timing in rows]
+
+    def _sites_report(self, key):
+        sites = sorted(self.allocations.get(key, {}).items(), key=lambda item: -abs(item[1][0]))
+        lines = [f'Top allocation sites by retained bytes ({len(sites)} sites changed)']
+        for (filename, lineno), (size, count) in sites[:self.top]:
+            lines.append(f'{size:>+12,} B {count:>+8,} blocks  {os.path.relpath(filename)}:{lineno}')
+        return lines
+
+    def write(self, out_dir):
+        """Write the reports; returns the summary lines."""
+        shutil.rmtree(out_dir, ignore_errors=True)
+        summary = []
+        stages = self.stages()
+        locales = self.locales()
+
+        summary.append(f'{"stage":<12} {"wall":>10}' + (f' {"retained":>12} {"peak":>12}' if self.mem else ''))
+        for name in stages:
+            line = f'{name:<12} {self.seconds[("stage", name)] * 1000:>8.1f}ms'
+            if self.mem:
+                retained, peak = self.memory[('stage', name)]
+                line += f' {retained:>+12,} {peak:>12,}'
+            summary.append(line)
+        if locales:
+            ranked = sorted(locales, key=lambda code: -self.seconds[('locale', code)])
+            summary.append('')
+            summary.append(f'{"locale":<12} {"wall":>10}' + (f' {"retained":>12} {"peak":>12}' if self.mem else ''))
+            for code in ranked:
+                line = f'{code:<12} {self.seconds[("locale", code)] * 1000:>8.1f}ms'
+                if self.mem:
+                    retained, peak = self.memory[('locale', code)]
+                    line += f' {retained:>+12,} {peak:>12,}'
+                summary.append(line)
+
+        if self.cpu:
+            cpu_dir = os.path.join(out_dir, 'cpu')
+            os.makedirs(cpu_dir)
+            reports = [(f'stage-{ROOT_STAGE}', list(self.profiles))]
+            reports += [(f'stage-{name}', [key for key in self.profiles if key[0] == name])
+                        for name in stages if name != ROOT_STAGE]
+            reports += [(f'locale-{code}', [key for key in self.profiles if key[1] == code]) for code in locales]
+            summary.append('')
+            summary.append('Hottest functions by own time')
+            for label, keys in reports:
+                stats = self._stats(keys)
+                if stats is None:
+                    continue
+                stats.dump_stats(os.path.join(cpu_dir, f'{label}.pstats'))
+                if label.startswith('stage-'):
+                    for function, seconds in self.hottest(stats):
+                        summary.append(f'{label[len("stage-"):]:<12} {seconds * 1000:>8.1f}ms  {function}')
+
+        if self.mem:
+            mem_dir = os.path.join(out_dir, 'mem')
+            os.makedirs(mem_dir)
+            for name in stages:
+                retained, peak = self.memory[('stage', name)]
+                lines = [f'stage {name}: {retained:+,} B retained, {peak:,} B peak', '']
+                lines += self._sites_report(('stage', name))
+                _write_lines(os.path.join(mem_dir, f'stage-{name}.txt'), lines)
+            for code in locales:
+                retained, peak = self.memory[('locale', code)]
+                lines = [f'locale {code}: {retained:+,} B retained, {peak:,} B peak', '']
+                lines.append(f'{"stage":<12} {"wall":>10} {"retained":>12} {"peak":>12}')
+                for (locale, name), (stage_retained, stage_peak) in self.locale_memory.items():
+                    if locale == code:
+                        seconds = self.locale_seconds[(locale, name)]
+                        lines.append(f'{name:<12} {seconds * 1000:>8.1f}ms {stage_retained:>+12,} {stage_peak:>12,}')
+                if code in self.detail_locales:
+                    lines += [''] + self._sites_report(('locale', code))
+                _write_lines(os.path.join(mem_dir, f'locale-{code}.txt'), lines)
+
+        os.makedirs(out_dir, exist_ok=True)
+        _write_lines(os.path.join(out_dir, 'summary.txt'), summary)
+        return summary
+
+
+def _write_lines(path, lines):
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('\n'.join(lines) + '\n')
+
+
+@contextlib.contextmanager
+def profile(out_dir, cpu=False, mem=False, detail_locales=(), out=None):
+    """Profile the enclosed run and write the reports to ``out_dir``, even if it fails."""
+    global _active
+    if _active is not None:
+        raise SystemExit('❌ A profile is already running')
+    profiler = Profiler(cpu=cpu, mem=mem, detail_locales=detail_locales)
+    _active = profiler
+    profiler.start()
+    try:
+        yield profiler
+    finally:
+        profiler.stop()
+        _active = None
+        summary = profiler.write(out_dir)
+        print(f"\n⏱️  Profile written to {out_dir}", file=out)
+        for line in summary[:len(profiler.stages()) + 1]:
+            print(f'   {line}', file=out)
+        if cpu:
+            print(f'   python3 -m pstats {os.path.join(out_dir, "cpu", f"stage-{ROOT_STAGE}.pstats")}', file=out)
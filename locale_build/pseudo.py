@@ -0,0 +1,129 @@
+"""Pseudo-locales synthesized from en for rendering and animation tests.
+
+``generate_locales.py --pseudo DIR`` writes every pseudo-locale below to
+``DIR/<tag>/`` in the layout of public/locales: ``landing.json`` and
+``messages.json``, so the typewriter and ChatWindowPrompt read them unchanged.
+
+    en-XA   accented, +30% longer (the typical German/Finnish expansion)
+    en-XL   accented, +100% longer (short UI strings in the worst case)
+    ar-XB   every word wrapped in RIGHT-TO-LEFT OVERRIDE: renders mirrored
+    en-XM   three combining marks on every letter: one grapheme, four code points
+    en-XE   an emoji after every word, ZWJ sequences, flags and skin tones included
+
+Placeholders (``{email}``, ``{{name}}``), HTML tags and entities are kept
+as they are. Accented strings are wrapped in ``[ ]`` so clipped text shows.
+The output is deterministic, so runs can be compared.
+"""
+import math
+import re
+
+PSEUDO_NAMESPACES = ('landing', 'messages')
+PROTECTED = re.compile(r'\{\{[^}]*\}\}|\{[^{}]*\}|<[^>]*>|&#?\w+;')
+WORD = re.compile(r'\S+')
+
+ACCENTS = str.maketrans(
+    'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ',
+    'ȧƀƈḓḗƒɠħīĵķŀḿƞǿƥɋřşŧŭṽẇẋẏẑȦƁƇḒḖƑƓĦĪĴĶĿḾȠǾƤɊŘŞŦŬṼẆẊẎẐ',
+)
+FILLER = 'one two three four five six seven eight nine ten'.translate(ACCENTS).split()
+RLO, PDF = '\u202e', '\u202c'
+# Acute, diaeresis, dot below, tilde below, breve, macron below, ring, cedilla.
+COMBINING_MARKS = ('\u0301', '\u0308', '\u0323', '\u0330', '\u0306', '\u0331', '\u030a', '\u0327')
+MARKS_PER_LETTER = 3
+EMOJI = (
+    '🚀', '👩\u200d💻', '🇩🇪', '👍🏽',
+    '❤\ufe0f', '🧑\u200d🤝\u200d🧑', '🎉', '🏳\ufe0f\u200d🌈',
+)
+
+
+def _map_text(text, transform):
+    """Apply ``transform`` to the translatable runs of ``text``."""
+    parts = []
+    position = 0
+    for match in PROTECTED.finditer(text):
+        parts.append(transform(text[position:match.start()]))
+        parts.append(match.group())
+        position = match.end()
+    parts.append(transform(text[position:]))
+    return ''.join(parts)
+
+
+def _filler(length):
+    words = []
+    size = 0
+    while size < length:
+        word = FILLER[len(words) % len(FILLER)]
+        words.append(word)
+        size += len(word) + 1
+    return ' '.join(words)
+
+
+def expander(ratio):
+    """Accent every letter and pad each text run by ``ratio`` of its length."""
+    def run(text):
+        core = text.strip()
+        if not core:
+            return text
+        lead = text[:len(text) - len(text.lstrip())]
+        trail = text[len(text.rstrip()):]
+        return f'{lead}{core.translate(ACCENTS)} {_filler(math.ceil(len(core) * ratio))}{trail}'
+
+    def transform(text):
+        return f'[{_map_text(text, run)}]'
+    return transform
+
+
+def _mirror_run(text):
+    return WORD.sub(lambda match: f'{RLO}{match.group()}{PDF}', text)
+
+
+def _mark_run(text):
+    out = []
+    count = 0
+    for char in text:
+        out.append(char)
+        if char.isalpha():
+            out.extend(COMBINING_MARKS[(count + i) % len(COMBINING_MARKS)] for i in range(MARKS_PER_LETTER))
+            count += 1
+    return ''.join(out)
+
+
+def _emoji_run(text):
+    count = 0
+
+    def add(match):
+        nonlocal count
+        count += 1
+        return f'{match.group()} {EMOJI[(count - 1) % len(EMOJI)]}'
+    return WORD.sub(add, text)
+
+
+PSEUDO_LOCALES = {
+    'en-XA': expander(0.3),
+    'en-XL': expander(1.0),
+    'ar-XB': lambda text: _map_text(text, _mirror_run),
+    'en-XM': lambda text: _map_text(text, _mark_run),
+    'en-XE': lambda text: _map_text(text, _emoji_run),
+}
+
+
+def pseudo_value(value, transform):
+    if isinstance(value, str):
+        return transform(value)
+    if isinstance(value, dict):
+        return {key: pseudo_value(item, transform) for key, item in value.items()}
+    if isinstance(value, list):
+        return [pseudo_value(item, transform) for item in value]
+    return value
+
+
+def build_pseudo_catalog(reference):
+    """``{tag: {ns: data}}`` of the pseudo-locales, from the expanded en catalog."""
+    return {
+        tag: {
+            namespace: pseudo_value(reference[namespace], transform)
+            for namespace in PSEUDO_NAMESPACES
+            if namespace in reference
+        }
+        for tag, transform in PSEUDO_LOCALES.items()
+    }
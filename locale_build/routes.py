@@ -0,0 +1,292 @@
+"""Per-route catalog chunks from a usage scan of src/pages.
+
+Every page under src/pages is a route. Its source and everything it imports
+from src/ are scanned for translation lookups:
+
+* ``t('ns:key.path')`` / ``i18n.t(...)`` with a literal key uses that key;
+* a bare ``t('key')`` uses the first namespace of the file's
+  ``useTranslation(...)`` call (``common`` otherwise);
+* a template key such as ``landing:${key}.variations`` uses the whole
+  namespace, since the key is only known at runtime;
+* namespaces fetched explicitly with ``loadNamespaces('ns')`` stay lazy and
+  are left to the http backend.
+
+For each route with lookups, ``public/locales/<lng>/_routes/<route>.json``
+holds just those strings, grouped by namespace, and src/i18n/routeTable.ts
+tells useRouteCatalog which chunk a page needs. The table also carries the
+App.tsx paths of each route so the chunk can be requested before React mounts.
+
+Namespaces the compiled modules (compile.py) carry in full are read through
+them, so a chunk keeps only their literal lookups, which go through i18next;
+the table lists them under ``compiled`` and a route without anything else
+gets no chunk.
+"""
+import json
+import os
+import re
+
+from .catalog import serialize
+from .profiling import locale_scope
+
+PAGES_DIR = os.path.join('src', 'pages')
+SRC_DIR = 'src'
+ROUTES_DIR = '_routes'
+ROUTE_TABLE_TS = os.path.join('src', 'i18n', 'routeTable.ts')
+APP_TSX = os.path.join('src', 'App.tsx')
+DEFAULT_NAMESPACE = 'common'
+# Generated modules only import types; scanning them would only cost time.
+SKIP_DIRS = (os.path.join('src', 'i18n', 'compiled'),)
+
+IMPORT = re.compile(r'''(?:import|export)\s[^'"]*?from\s+['"]([^'"]+)['"]|import\(\s*['"]([^'"]+)['"]\s*\)''')
+USE_TRANSLATION = re.compile(r'''useTranslation\(\s*(\[[^\]]*\]|['"][^'"]+['"])''')
+LOOKUP = re.compile(r'''\bt\(\s*(?:'([^']*)'|"([^"]*)"|`([^`]*)`)''')
+LOAD_NAMESPACES = re.compile(r'''loadNamespaces\(\s*['"]([^'"]+)['"]''')
+STRING = re.compile(r'''['"]([^'"]+)['"]''')
+PAGE_IMPORT = re.compile(r'''import\s+(\w+)\s+from\s+['"]\./pages/([^'"]+)['"]''')
+ROUTE_ELEMENT = re.compile(r'''<Route\s+path="(/[^"]*)"\s+element=\{\s*(?:<\w+[^>]*>\s*)*<(\w+)\s*/>''')
+EXTENSIONS = ('.tsx', '.ts', '/index.tsx', '/index.ts')
+
+# Member of a key set read with runtime keys: the route needs the whole namespace.
+ALL_KEYS = '*'
+
+
+def resolve_import(spec, importer, src_dir=SRC_DIR):
+    if spec.startswith('@/'):
+        base = os.path.join(src_dir, spec[2:])
+    elif spec.startswith('.'):
+        base = os.path.normpath(os.path.join(os.path.dirname(importer), spec))
+    else:
+        return None
+    for candidate in (base, *(base + ext for ext in EXTENSIONS)):
+        if os.path.isfile(candidate) and candidate.endswith(('.ts', '.tsx')):
+            return candidate
+    return None
+
+
+_scanned = {}
+
+
+def scan_file(path, src_dir=SRC_DIR):
+    """Return ``(imports, {ns: set(keys)}, lazy_namespaces)`` for one file.
+
+    The last result per file is kept, with the mtime and size it was read
+    at, for repeated builds in one process.
+    """
+    stat = os.stat(path)
+    version = (stat.st_mtime_ns, stat.st_size)
+    cached = _scanned.get((path, src_dir))
+    if cached is None or cached[0] != version:
+        cached = _scanned[(path, src_dir)] = (version, _scan_source(path, src_dir))
+    return cached[1]
+
+
+def _scan_source(path, src_dir):
+    with open(path, encoding='utf-8') as f:
+        source = f.read()
+
+    imports = []
+    for match in IMPORT.finditer(source):
+        resolved = resolve_import(match.group(1) or match.group(2), path, src_dir)
+        if resolved and not resolved.startswith(SKIP_DIRS):
+            imports.append(resolved)
+
+    default_ns = DEFAULT_NAMESPACE
+    declared = USE_TRANSLATION.search(source)
+    if declared:
+        default_ns = STRING.search(declared.group(1)).group(1)
+
+    usage = {}
+    for match in LOOKUP.finditer(source):
+        literal = match.group(1) if match.group(1) is not None else match.group(2)
+        key = literal if literal is not None else match.group(3)
+        namespace, sep, key_path = key.partition(':')
+        if not sep:
+            namespace, key_path = default_ns, key
+        if '${' in namespace or not namespace:
+            continue
+        if literal is None and '${' in key_path:
+            key_path = ALL_KEYS
+        usage.setdefault(namespace, set()).add(key_path)
+    return imports, usage, set(LOAD_NAMESPACES.findall(source))
+
+
+def merge_usage(target, usage):
+    for namespace, keys in usage.items():
+        target.setdefault(namespace, set()).update(keys)
+
+
+def scan_routes(pages_dir=PAGES_DIR, src_dir=SRC_DIR):
+    """Return ``{route: {ns: set(keys)}}`` for routes with lookups."""
+    files = {}
+    routes = {}
+    for root, _, filenames in os.walk(pages_dir):
+        for filename in sorted(filenames):
+            if not filename.endswith('.tsx'):
+                continue
+            page = os.path.join(root, filename)
+            seen, stack, usage, lazy = set(), [page], {}, set()
+            while stack:
+                path = stack.pop()
+                if path in seen:
+                    continue
+                seen.add(path)
+                if path not in files:
+                    files[path] = scan_file(path, src_dir)
+                imports, file_usage, file_lazy = files[path]
+                merge_usage(usage, file_usage)
+                lazy.update(file_lazy)
+                stack.extend(imports)
+            usage = {ns: keys for ns, keys in usage.items() if ns not in lazy}
+            if usage:
+                route = os.path.relpath(page, pages_dir)[:-len('.tsx')].replace(os.sep, '/')
+                routes[route] = usage
+    # Forget files no route reaches any more (deleted or no longer imported).
+    for key in [key for key in _scanned if key[1] == src_dir and key[0] not in files]:
+        del _scanned[key]
+    return dict(sorted(routes.items()))
+
+
+def route_paths(app_path=APP_TSX):
+    """Return ``{route: [path, ...]}`` for the top-level ``<Route>``s in App.tsx."""
+    with open(app_path, encoding='utf-8') as f:
+        source = f.read()
+    pages = {name: page for name, page in PAGE_IMPORT.findall(source)}
+    paths = {}
+    for path, component in ROUTE_ELEMENT.findall(source):
+        if component in pages:
+            paths.setdefault(pages[component], []).append(path)
+    return paths
+
+
+def pick(data, key_paths):
+    """Copy only ``key_paths`` (and the templates they reference) out of ``data``."""
+    picked = {}
+    pending = list(key_paths)
+    while pending:
+        parts = pending.pop().split('.')
+        source, target = data, picked
+        for i, part in enumerate(parts):
+            if not isinstance(source, dict) or part not in source:
+                break
+            if i == len(parts) - 1:
+                target[part] = source[part]
+                if i == 0 and isinstance(source[part], dict) and 'template' in source[part]:
+                    pending.append(source[part]['template'])
+            else:
+                target = target.setdefault(part, {})
+                source = source[part]
+    return picked
+
+
+def route_file(route):
+    return route.replace('/', '.')
+
+
+def chunk_usage(usage, compiled=()):
+    """The part of a route's ``usage`` its chunk carries.
+
+    Of the ``compiled`` namespaces only the literal lookups are kept; the rest
+    is read from the compiled module.
+    """
+    shipped = {}
+    for namespace, keys in usage.items():
+        if namespace in compiled:
+            keys = keys - {ALL_KEYS}
+        if keys:
+            shipped[namespace] = keys
+    return shipped
+
+
+def build_route_chunks(catalog, routes, compiled=()):
+    """Return ``{(locale, route): {ns: data}}`` for the routes that need a chunk."""
+    chunks = {}
+    for locale, namespaces in catalog.items():
+        with locale_scope(locale):
+            for route, usage in routes.items():
+                shipped = chunk_usage(usage, compiled)
+                if not shipped:
+                    continue
+                chunk = {}
+                for namespace, keys in sorted(shipped.items()):
+                    if namespace not in namespaces:
+                        continue
+                    data = namespaces[namespace] if ALL_KEYS in keys else pick(namespaces[namespace], sorted(keys))
+                    if data:
+                        chunk[namespace] = data
+                chunks[(locale, route)] = chunk
+    return chunks
+
+
+def route_entries(chunks):
+    """``{key: payload}`` of the route chunks in the ``pack_entries`` key format."""
+    return {
+        f'{locale}/{ROUTES_DIR}/{route_file(route)}': serialize(chunk, compact=True)
+        for (locale, route), chunk in sorted(chunks.items())
+    }
+
+
+def write_route_chunks(chunks, locales_dir):
+    """Write chunks whose bytes changed and drop stale ones; returns written paths."""
+    written = []
+    expected = {}
+    for (locale, route), chunk in sorted(chunks.items()):
+        expected.setdefault(locale, set()).add(f'{route_file(route)}.json')
+        path = os.path.join(locales_dir, locale, ROUTES_DIR, f'{route_file(route)}.json')
+        payload = serialize(chunk, compact=True)
+        if os.path.exists(path):
+            with open(path, 'rb') as f:
+                if f.read() == payload:
+                    continue
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as f:
+            f.write(payload)
+        written.append(path)
+
+    for locale in os.listdir(locales_dir):
+        routes_dir = os.path.join(locales_dir, locale, ROUTES_DIR)
+        if not os.path.isdir(routes_dir):
+            continue
+        for filename in os.listdir(routes_dir):
+            if filename not in expected.get(locale, ()):
+                os.remove(os.path.join(routes_dir, filename))
+    return written
+
+
+def render_route_table(routes, paths, sampled=(), shards=0, compiled=()):
+    """``sampled`` routes also get ``shards``: their chunk is written per cohort shard.
+
+    ``namespaces`` are the namespaces in the chunk (none: there is no chunk).
+    ``partial`` lists those it only holds some keys of; the client loads them
+    in full once the page is idle. ``compiled`` namespaces come from the
+    compiled module, which the client awaits with the chunk.
+    """
+    table = {}
+    for route, usage in routes.items():
+        shipped = chunk_usage(usage, compiled)
+        table[route] = {
+            'file': route_file(route),
+            'namespaces': sorted(shipped),
+            'partial': sorted(ns for ns, keys in shipped.items() if ALL_KEYS not in keys and ns not in compiled),
+            'compiled': sorted(namespace for namespace in usage if namespace in compiled),
+            'paths': paths.get(route, []),
+        }
+    for route in sampled if shards else ():
+        table[route]['shards'] = shards
+    return (
+        '// Generated by generate_locales.py from a usage scan of src/pages. Do not edit by hand.\n'
+        f'export const ROUTE_CATALOGS = {json.dumps(table, indent=2)} as const;\n'
+        '\n'
+        'export type RouteName = keyof typeof ROUTE_CATALOGS;\n'
+    )
+
+
+def write_route_table(routes, path=ROUTE_TABLE_TS, sampled=(), shards=0, compiled=()):
+    """Write the route table module; returns True when the file changed."""
+    module = render_route_table(routes, route_paths(), sampled, shards, compiled)
+    if os.path.exists(path):
+        with open(path, encoding='utf-8') as f:
+            if f.read() == module:
+                return False
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(module)
+    return True
@@ -0,0 +1,146 @@
+"""Variation sampling profile (``generate_locales.py --sample K --shards N``).
+
+Every ``variations`` list in ``landing`` ships all its entries, but a session
+shows one or two. With a sampling profile each route chunk that carries
+``landing`` is also written once per cohort shard, to
+``<locale>/_sampled/<shard>/<route>.json``, with every list cut to K
+entries. The subset is a deterministic function of (shard, key path), the
+same in every locale, and the kept items stay in their original order with
+their original positions under ``variationIndices``, so key-usage telemetry
+still records the index into the full list.
+
+The full lists go into the derived ``landingVariations`` namespace
+(``{key: {variations: [...]}}``), which the client loads lazily once the page
+is idle; after that ``getRandomMessage`` draws from every variation again.
+
+The route table marks sampled routes with ``shards``; routeCatalogs.ts picks
+the shard from the ``i18nCohort`` cookie, which the edge (locale_edge.py)
+reads to preload the same file.
+"""
+import hashlib
+import os
+import shutil
+
+from .catalog import serialize
+from .profiling import locale_scope
+from .routes import route_file
+
+SAMPLED_NAMESPACE = 'landing'
+VARIATIONS_NAMESPACE = 'landingVariations'
+SAMPLED_DIR = '_sampled'
+COHORT_COOKIE = 'i18nCohort'
+COHORTS = 1 << 16  # cohort ids are 0..COHORTS-1; shard = cohort % shards
+
+
+def sample_indices(key_path, count, k, shard):
+    """The ``k`` positions of a ``count``-item list kept in ``shard``, ascending."""
+    if count <= k:
+        return list(range(count))
+    ranked = sorted(
+        range(count),
+        key=lambda index: hashlib.blake2b(f'{shard}/{key_path}/{index}'.encode(), digest_size=8).digest(),
+    )
+    return sorted(ranked[:k])
+
+
+def sample_namespace(data, k, shard, prefix=''):
+    """Copy of ``data`` with every ``variations`` list cut to ``k`` entries."""
+    sampled = {}
+    for key, value in data.items():
+        path = f'{prefix}{key}'
+        if isinstance(value, dict):
+            variations = value.get('variations')
+            if isinstance(variations, list) and len(variations) > k:
+                indices = sample_indices(path, len(variations), k, shard)
+                value = {**value, 'variations': [variations[i] for i in indices], 'variationIndices': indices}
+            else:
+                value = sample_namespace(value, k, shard, f'{path}.')
+        sampled[key] = value
+    return sampled
+
+
+def variations_namespace(data):
+    """Only the ``variations`` lists of ``data``, nested as in the source."""
+    full = {}
+    for key, value in data.items():
+        if not isinstance(value, dict):
+            continue
+        if isinstance(value.get('variations'), list):
+            full[key] = {'variations': value['variations']}
+        elif nested := variations_namespace(value):
+            full[key] = nested
+    return full
+
+
+def add_variations_namespace(catalog):
+    """Add ``landingVariations`` next to every locale's ``landing``."""
+    for locale, namespaces in catalog.items():
+        if SAMPLED_NAMESPACE in namespaces:
+            with locale_scope(locale):
+                namespaces[VARIATIONS_NAMESPACE] = variations_namespace(namespaces[SAMPLED_NAMESPACE])
+    return catalog
+
+
+def sampled_routes(routes):
+    """Routes whose chunk carries the sampled namespace."""
+    return [route for route, usage in routes.items() if SAMPLED_NAMESPACE in usage]
+
+
+def build_sampled_chunks(route_chunks, k, shards):
+    """``{(locale, route, shard): chunk}`` for the chunks that carry ``landing``."""
+    sampled = {}
+    for (locale, route), chunk in route_chunks.items():
+        if SAMPLED_NAMESPACE not in chunk:
+            continue
+        with locale_scope(locale):
+            for shard in range(shards):
+                sampled[(locale, route, shard)] = {
+                    **chunk, SAMPLED_NAMESPACE: sample_namespace(chunk[SAMPLED_NAMESPACE], k, shard),
+                }
+    return sampled
+
+
+def sampled_entries(sampled):
+    """``{key: payload}`` in the ``pack_entries`` key format."""
+    return {
+        f'{locale}/{SAMPLED_DIR}/{shard}/{route_file(route)}': serialize(chunk, compact=True)
+        for (locale, route, shard), chunk in sorted(sampled.items())
+    }
+
+
+def write_sampled_chunks(sampled, locales_dir):
+    """Write changed sampled chunks and drop stale ones; returns written paths.
+
+    An empty ``sampled`` removes every ``_sampled`` directory and
+    ``landingVariations.json`` (a build without the profile).
+    """
+    expected = {
+        os.path.join(locales_dir, *key.split('/')) + '.json': payload
+        for key, payload in sampled_entries(sampled).items()
+    }
+    written = []
+    for path, payload in expected.items():
+        if os.path.exists(path):
+            with open(path, 'rb') as f:
+                if f.read() == payload:
+                    continue
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as f:
+            f.write(payload)
+        written.append(path)
+
+    for locale in os.listdir(locales_dir):
+        sampled_dir = os.path.join(locales_dir, locale, SAMPLED_DIR)
+        if not sampled:
+            shutil.rmtree(sampled_dir, ignore_errors=True)
+            variations_path = os.path.join(locales_dir, locale, f'{VARIATIONS_NAMESPACE}.json')
+            if os.path.exists(variations_path):
+                os.remove(variations_path)
+            continue
+        for root, _, filenames in os.walk(sampled_dir, topdown=False):
+            for filename in filenames:
+                if os.path.join(root, filename) not in expected:
+                    os.remove(os.path.join(root, filename))
+            if root != sampled_dir and not os.listdir(root):
+                os.rmdir(root)
+    return written
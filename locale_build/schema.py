@@ -0,0 +1,151 @@
+"""Structural validation of every locale against a schema derived from en.
+
+The en catalogs define the shape: objects with their keys, non-empty arrays
+of strings (``variations``) and strings, plus the placeholders each string
+carries. :func:`compile_validator` turns that schema into straight-line
+Python source, one function per namespace, so checking a locale is a run of
+``type() is`` tests with no schema walking.
+
+Problems that break rendering (wrong type, empty ``variations``, a dropped
+``{email}``) are errors and fail the build. Keys en has and a locale lacks
+are warnings: i18next falls back to en for those.
+"""
+import re
+import time
+
+from .catalog import DERIVED_NAMESPACES
+from .profiling import locale_scope
+
+REFERENCE_LOCALE = 'en'
+PLACEHOLDER = re.compile(r'\{\{?\s*(\w+)\s*\}?\}')
+NON_IDENTIFIER = re.compile(r'\W', re.ASCII)
+
+
+def derive_schema(data):
+    """Schema node for one en value."""
+    if isinstance(data, dict):
+        return {'type': 'object', 'keys': {key: derive_schema(value) for key, value in data.items()}}
+    if isinstance(data, list) and data and all(isinstance(item, str) for item in data):
+        common = set.intersection(*(set(PLACEHOLDER.findall(item)) for item in data))
+        return {'type': 'strings', 'placeholders': sorted(common)}
+    if isinstance(data, str):
+        return {'type': 'string', 'placeholders': sorted(set(PLACEHOLDER.findall(data)))}
+    return {'type': 'any'}
+
+
+class _Emitter:
+    def __init__(self):
+        self.lines = []
+        self.counter = 0
+
+    def var(self):
+        self.counter += 1
+        return f'v{self.counter}'
+
+    def emit(self, depth, line):
+        self.lines.append('    ' * depth + line)
+
+    def placeholders(self, depth, value, path, names):
+        for name in names:
+            self.emit(depth, f'if {"{" + name + "}"!r} not in {value} and {"{{" + name + "}}"!r} not in {value}:')
+            self.emit(depth + 1, f'errors.append(({path}, "missing placeholder {{{name}}}"))')
+
+    def node(self, schema, value, path, depth):
+        """Emit the checks for ``value`` at the static key ``path``."""
+        kind = schema['type']
+        where = repr(path)
+        if kind == 'object':
+            self.emit(depth, f'if type({value}) is not dict:')
+            self.emit(depth + 1, f'errors.append(({where}, "expected an object"))')
+            self.emit(depth, 'else:')
+            for key, child in schema['keys'].items():
+                child_value = self.var()
+                child_path = f'{path}.{key}' if path else key
+                self.emit(depth + 1, f'{child_value} = {value}.get({key!r}, MISSING)')
+                self.emit(depth + 1, f'if {child_value} is MISSING:')
+                self.emit(depth + 2, f'warnings.append(({child_path!r}, "missing"))')
+                self.emit(depth + 1, 'else:')
+                self.node(child, child_value, child_path, depth + 2)
+            known = repr(frozenset(schema['keys']))
+            self.emit(depth + 1, f'for extra in {value}.keys() - {known}:')
+            self.emit(depth + 2, f'warnings.append(({(path + ".") if path else ""!r} + extra, "not in en"))')
+        elif kind == 'strings':
+            item = self.var()
+            item_path = f'{(path + ".")!r} + str(index)'
+            self.emit(depth, f'if type({value}) is not list or not {value}:')
+            self.emit(depth + 1, f'errors.append(({where}, "expected a non-empty array of strings"))')
+            self.emit(depth, 'else:')
+            self.emit(depth + 1, f'for index, {item} in enumerate({value}):')
+            self.emit(depth + 2, f'if type({item}) is not str or not {item}:')
+            self.emit(depth + 3, f'errors.append(({item_path}, "expected a non-empty string"))')
+            if schema['placeholders']:
+                self.emit(depth + 2, 'else:')
+                self.placeholders(depth + 3, item, item_path, schema['placeholders'])
+        elif kind == 'string':
+            self.emit(depth, f'if type({value}) is not str:')
+            self.emit(depth + 1, f'errors.append(({where}, "expected a string"))')
+            if schema['placeholders']:
+                self.emit(depth, 'else:')
+                self.placeholders(depth + 1, value, where, schema['placeholders'])
+        else:
+            self.emit(depth, 'pass')
+
+
+def validator_names(namespaces):
+    """``{namespace: function name}``; the index keeps names unique whatever the file name."""
+    return {
+        namespace: f'validate_{index}_{NON_IDENTIFIER.sub("_", namespace)}'
+        for index, namespace in enumerate(namespaces)
+    }
+
+
+def validator_source(schemas, names):
+    """Python source of one ``validate_<n>_<ns>(data, errors, warnings)`` per namespace."""
+    emitter = _Emitter()
+    for namespace, schema in schemas.items():
+        emitter.emit(0, f'def {names[namespace]}(v0, errors, warnings):')
+        emitter.node(schema, 'v0', '', 1)
+        emitter.emit(0, '')
+    return '\n'.join(emitter.lines)
+
+
+def compile_validator(reference):
+    """Return ``{namespace: validate(data, errors, warnings)}`` for the en catalogs."""
+    schemas = {
+        namespace: derive_schema(data)
+        for namespace, data in reference.items()
+        if namespace not in DERIVED_NAMESPACES
+    }
+    names = validator_names(schemas)
+    scope = {'MISSING': object(), 'frozenset': frozenset}
+    exec(compile(validator_source(schemas, names), '<locale schema>', 'exec'), scope)
+    return {namespace: scope[names[namespace]] for namespace in schemas}
+
+
+def validate_catalog(catalog, reference_locale=REFERENCE_LOCALE):
+    """Validate every locale; returns ``(errors, warnings, seconds)``.
+
+    ``errors`` and ``warnings`` are lists of ``(locale, namespace, key_path, message)``.
+    """
+    start = time.perf_counter()
+    validators = compile_validator(catalog[reference_locale])
+    errors, warnings = [], []
+    for locale, namespaces in catalog.items():
+        for namespace, validate in validators.items():
+            if namespace not in namespaces:
+                warnings.append((locale, namespace, '', 'missing namespace'))
+                continue
+            locale_errors, locale_warnings = [], []
+            with locale_scope(locale):
+                validate(namespaces[namespace], locale_errors, locale_warnings)
+            errors.extend((locale, namespace, path, message) for path, message in locale_errors)
+            warnings.extend((locale, namespace, path, message) for path, message in locale_warnings)
+    return errors, warnings, time.perf_counter() - start
+
+
+def summarize_warnings(warnings):
+    """Group warnings as ``[(namespace, key_path, message, [locales])]``."""
+    grouped = {}
+    for locale, namespace, path, message in warnings:
+        grouped.setdefault((namespace, path, message), []).append(locale)
+    return [(*key, sorted(locales)) for key, locales in sorted(grouped.items())]
@@ -0,0 +1,194 @@
+"""Indexed SQLite store of every catalog string.
+
+Each leaf of a source namespace is one row of ``strings``: locale, namespace,
+dotted key path, JSON-encoded value, the hash of that value, and when it last
+changed. Arrays (``variations``) and empty objects are stored as one leaf.
+``position`` keeps document order so a namespace can be emitted byte-identical
+to :func:`locale_build.catalog.serialize` straight from a cursor.
+
+The store lives in the state directory and is synced by every build before
+it writes: the catalog files that changed are emitted from the store's
+cursors. locale_store.py runs queries against it.
+"""
+import json
+import os
+import sqlite3
+from datetime import datetime, timezone
+
+from .catalog import DERIVED_NAMESPACES
+from .manifest import STATE_DIR, content_hash
+
+STORE_NAME = 'catalog.sqlite'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS strings (
+    locale TEXT NOT NULL,
+    namespace TEXT NOT NULL,
+    key_path TEXT NOT NULL,
+    value TEXT NOT NULL,
+    source_hash TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    PRIMARY KEY (locale, namespace, key_path)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS strings_by_key ON strings (namespace, key_path);
+CREATE INDEX IF NOT EXISTS strings_by_update ON strings (updated_at);
+CREATE TABLE IF NOT EXISTS builds (
+    version INTEGER PRIMARY KEY,
+    built_at TEXT NOT NULL
+);
+"""
+
+
+def store_path(state_dir=STATE_DIR):
+    return os.path.join(state_dir, STORE_NAME)
+
+
+def connect(state_dir=STATE_DIR):
+    os.makedirs(state_dir, exist_ok=True)
+    conn = sqlite3.connect(store_path(state_dir))
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def flatten(data, prefix=''):
+    """Yield ``(key_path, value)`` leaves in document order."""
+    for key, value in data.items():
+        path = f'{prefix}{key}'
+        if isinstance(value, dict) and value:
+            yield from flatten(value, f'{path}.')
+        else:
+            yield path, value
+
+
+def _encode(value):
+    return json.dumps(value, ensure_ascii=False)
+
+
+def sync(conn, catalog, version=None):
+    """Bring the store in line with ``catalog``; returns ``(changed, removed)``.
+
+    Only rows whose value hash differs are rewritten, so ``updated_at`` marks
+    the build in which a string last changed. Without ``version`` the build
+    is recorded later, with :func:`record_build`.
+    """
+    now = datetime.now(timezone.utc).isoformat(timespec='microseconds')
+    existing = {
+        (locale, namespace, key_path): (source_hash, position)
+        for locale, namespace, key_path, source_hash, position in conn.execute(
+            'SELECT locale, namespace, key_path, source_hash, position FROM strings'
+        )
+    }
+
+    upserts = []
+    seen = set()
+    changed = 0
+    for locale, namespaces in catalog.items():
+        for namespace, data in namespaces.items():
+            if namespace in DERIVED_NAMESPACES:
+                continue
+            for position, (key_path, value) in enumerate(flatten(data)):
+                key = (locale, namespace, key_path)
+                seen.add(key)
+                encoded = _encode(value)
+                digest = content_hash(encoded.encode('utf-8'))
+                previous = existing.get(key)
+                if previous != (digest, position):
+                    upserts.append((*key, encoded, digest, now, position))
+                    changed += previous is None or previous[0] != digest
+    removed = [key for key in existing if key not in seen]
+
+    with conn:
+        conn.executemany(
+            'INSERT INTO strings (locale, namespace, key_path, value, source_hash, updated_at, position)'
+            ' VALUES (?, ?, ?, ?, ?, ?, ?)'
+            ' ON CONFLICT (locale, namespace, key_path) DO UPDATE SET'
+            '   value = excluded.value,'
+            '   updated_at = CASE WHEN strings.source_hash = excluded.source_hash'
+            '     THEN strings.updated_at ELSE excluded.updated_at END,'
+            '   source_hash = excluded.source_hash,'
+            '   position = excluded.position',
+            upserts,
+        )
+        conn.executemany('DELETE FROM strings WHERE locale = ? AND namespace = ? AND key_path = ?', removed)
+    if version is not None:
+        record_build(conn, version, now)
+    return changed, len(removed)
+
+
+def record_build(conn, version, built_at=None):
+    """Mark build ``version``; strings changed later are ``changed_since`` it."""
+    built_at = built_at or datetime.now(timezone.utc).isoformat(timespec='microseconds')
+    with conn:
+        conn.execute('INSERT OR IGNORE INTO builds (version, built_at) VALUES (?, ?)', (version, built_at))
+
+
+def locales(conn):
+    return [row[0] for row in conn.execute('SELECT DISTINCT locale FROM strings ORDER BY locale')]
+
+
+def missing(conn, namespace, key_path):
+    """Locales without ``key_path`` (or anything under it) in ``namespace``."""
+    return [row[0] for row in conn.execute(
+        'SELECT DISTINCT locale FROM strings AS s'
+        ' WHERE NOT EXISTS (SELECT 1 FROM strings WHERE locale = s.locale AND namespace = ?'
+        '   AND (key_path = ? OR key_path BETWEEN ? AND ?))'
+        ' ORDER BY locale',
+        (namespace, key_path, f'{key_path}.', f'{key_path}.\uffff'),
+    )]
+
+
+def changed_since(conn, version):
+    """Rows updated after build ``version`` was recorded."""
+    row = conn.execute('SELECT built_at FROM builds WHERE version = ?', (version,)).fetchone()
+    if row is None:
+        raise SystemExit(f'❌ No build {version} in the store')
+    return conn.execute(
+        'SELECT locale, namespace, key_path, value, updated_at FROM strings'
+        ' WHERE updated_at > ? ORDER BY locale, namespace, position',
+        row,
+    )
+
+
+def lookup(conn, namespace, key_path):
+    """Value of ``key_path`` per locale."""
+    return conn.execute(
+        'SELECT locale, value FROM strings WHERE namespace = ? AND key_path = ? ORDER BY locale',
+        (namespace, key_path),
+    )
+
+
+def _indent(text, depth):
+    return text.replace('\n', '\n' + '  ' * depth)
+
+
+def stream_namespace(conn, locale, namespace):
+    """Yield the namespace serialized like ``json.dumps(indent=2)``, chunk by chunk.
+
+    Rows come straight off an ordered cursor; nothing is rebuilt in memory.
+    """
+    cursor = conn.execute(
+        'SELECT key_path, value FROM strings WHERE locale = ? AND namespace = ? ORDER BY position',
+        (locale, namespace),
+    )
+    stack = []
+    first = True
+    for key_path, value in cursor:
+        parts = key_path.split('.')
+        common = 0
+        while common < min(len(stack), len(parts) - 1) and stack[common] == parts[common]:
+            common += 1
+        while len(stack) > common:
+            stack.pop()
+            yield '\n' + '  ' * (len(stack) + 1) + '}'
+        for part in parts[len(stack):-1]:
+            yield ('{' if first else ',') + '\n' + '  ' * (len(stack) + 1) + f'{_encode(part)}: '
+            stack.append(part)
+            first = True
+        leaf = _indent(json.dumps(json.loads(value), ensure_ascii=False, indent=2), len(stack) + 1)
+        yield ('{' if first else ',') + '\n' + '  ' * (len(stack) + 1) + f'{_encode(parts[-1])}: {leaf}'
+        first = False
+    while stack:
+        stack.pop()
+        yield '\n' + '  ' * (len(stack) + 1) + '}'
+    yield '{}' if first else '\n}'
@@ -0,0 +1,235 @@
+"""Key-usage telemetry: which catalog keys and variations users actually see.
+
+src/i18n/keyTelemetry.ts batches hits and posts them to a collector;
+``python3 locale_telemetry.py collect`` is a local stand-in that appends each
+batch as one JSON line::
+
+    {"hits": [{"locale": "de-DE", "ns": "landing", "key": "welcome.variations", "variation": 2}]}
+
+Bare hit objects on a line are accepted as well, with an optional ``count``.
+
+Ingestion streams the logs through a count-min sketch and a Space-Saving
+top-k, so memory stays fixed however many hits come in. The sketch never
+undercounts: a key whose estimate is 0 was never seen. The report ranks the
+en keys of the tracked namespaces as hot or cold. generate_locales.py
+``--usage`` reads it to restrict the compiled modules to the hot keys and to
+list the cold keys as pruning candidates.
+"""
+import hashlib
+import math
+import os
+from array import array
+
+from . import jsonio
+from .manifest import STATE_DIR, write_json
+from .store import flatten
+
+USAGE_REPORT_NAME = 'key-usage.json'
+TELEMETRY_DIR = 'telemetry'
+TRACKED_NAMESPACES = ('landing', 'messages')
+HOT_SHARE = 0.95
+
+
+def report_path(state_dir=STATE_DIR):
+    return os.path.join(state_dir, USAGE_REPORT_NAME)
+
+
+def _hashes(item):
+    digest = hashlib.blake2b(item.encode('utf-8'), digest_size=16).digest()
+    return int.from_bytes(digest[:8], 'little'), int.from_bytes(digest[8:], 'little') | 1
+
+
+class CountMinSketch:
+    """Frequency estimates in ``width * depth`` counters.
+
+    Estimates exceed the true count by at most ``e / width * total`` with
+    probability ``1 - exp(-depth)``, and are never below it.
+    """
+
+    def __init__(self, width=1 << 14, depth=4):
+        self.width = width
+        self.depth = depth
+        self.rows = [array('Q', bytes(8 * width)) for _ in range(depth)]
+        self.total = 0
+
+    def _cells(self, item):
+        h1, h2 = _hashes(item)
+        return [(h1 + row * h2) % self.width for row in range(self.depth)]
+
+    def add(self, item, count=1):
+        self.total += count
+        for row, cell in zip(self.rows, self._cells(item)):
+            row[cell] += count
+
+    def estimate(self, item):
+        return min(row[cell] for row, cell in zip(self.rows, self._cells(item)))
+
+    def error_bound(self):
+        return math.ceil(math.e / self.width * self.total)
+
+
+class SpaceSaving:
+    """Top-``capacity`` items by count (Metwally et al.).
+
+    Each tracked item carries the count it may have inherited on eviction,
+    so ``count - error`` is a guaranteed lower bound.
+    """
+
+    def __init__(self, capacity=256):
+        self.capacity = capacity
+        self.counts = {}  # item -> [count, error]
+
+    def add(self, item, count=1):
+        entry = self.counts.get(item)
+        if entry is not None:
+            entry[0] += count
+        elif len(self.counts) < self.capacity:
+            self.counts[item] = [count, 0]
+        else:
+            victim = min(self.counts, key=lambda key: self.counts[key][0])
+            floor = self.counts.pop(victim)[0]
+            self.counts[item] = [floor + count, floor]
+
+    def top(self, limit=None):
+        ranked = sorted(self.counts.items(), key=lambda item: (-item[1][0], item[0]))
+        return [(item, count, error) for item, (count, error) in ranked[:limit]]
+
+
+def key_id(namespace, key_path):
+    return f'{namespace}:{key_path}'
+
+
+def variation_id(namespace, key_path, index):
+    return f'{namespace}:{key_path}#{index}'
+
+
+def iter_hits(lines):
+    """Yield ``(locale, ns, key, variation, count)``; malformed hits yield None."""
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            record = jsonio.loads(line)
+        except ValueError:
+            yield None
+            continue
+        hits = record.get('hits') if isinstance(record, dict) and 'hits' in record else [record]
+        for hit in hits if isinstance(hits, list) else [None]:
+            if not isinstance(hit, dict) or not isinstance(hit.get('ns'), str) or not isinstance(hit.get('key'), str):
+                yield None
+                continue
+            variation = hit.get('variation')
+            count = hit.get('count', 1)
+            yield (
+                hit.get('locale') if isinstance(hit.get('locale'), str) else None,
+                hit['ns'],
+                hit['key'],
+                variation if isinstance(variation, int) and variation >= 0 else None,
+                count if isinstance(count, int) and count > 0 else 1,
+            )
+
+
+class Usage:
+    """Bounded-memory aggregate of any number of hit logs."""
+
+    def __init__(self, width=1 << 14, depth=4, capacity=256):
+        self.sketch = CountMinSketch(width, depth)
+        self.top_keys = SpaceSaving(capacity)
+        self.top_locales = SpaceSaving(capacity)
+        self.hits = 0
+        self.skipped = 0
+
+    def add(self, locale, namespace, key_path, variation, count):
+        item = key_id(namespace, key_path)
+        self.hits += count
+        self.sketch.add(item, count)
+        self.top_keys.add(item, count)
+        if variation is not None:
+            self.sketch.add(variation_id(namespace, key_path, variation), count)
+        if locale is not None:
+            self.top_locales.add(locale, count)
+
+    def ingest(self, path):
+        with open(path, encoding='utf-8') as f:
+            for hit in iter_hits(f):
+                if hit is None:
+                    self.skipped += 1
+                else:
+                    self.add(*hit)
+
+
+def tracked_keys(reference):
+    """``[(ns, key_path, variations or None)]`` for the en catalogs."""
+    keys = []
+    for namespace in TRACKED_NAMESPACES:
+        for key_path, value in flatten(reference.get(namespace, {})):
+            keys.append((namespace, key_path, len(value) if isinstance(value, list) else None))
+    return keys
+
+
+def build_report(usage, reference, hot_share=HOT_SHARE, cold_max=0):
+    """Rank every tracked en key; hot keys cover ``hot_share`` of the hits."""
+    # Sketch estimates are upper bounds. Keys the catalog does not know are
+    # ranked by the top-k, whose items are only those seen often enough.
+    rows = []
+    for namespace, key_path, variations in tracked_keys(reference):
+        entry = {'ns': namespace, 'key': key_path, 'count': usage.sketch.estimate(key_id(namespace, key_path))}
+        if variations:
+            entry['variations'] = [
+                usage.sketch.estimate(variation_id(namespace, key_path, index)) for index in range(variations)
+            ]
+        rows.append(entry)
+    rows.sort(key=lambda entry: (-entry['count'], entry['ns'], entry['key']))
+
+    hot = []
+    covered = 0
+    for entry in rows:
+        if entry['count'] == 0 or covered >= hot_share * usage.hits:
+            break
+        covered += entry['count']
+        hot.append(key_id(entry['ns'], entry['key']))
+
+    known = {key_id(entry['ns'], entry['key']) for entry in rows}
+    return {
+        'hits': usage.hits,
+        'skipped': usage.skipped,
+        'sketch': {
+            'width': usage.sketch.width,
+            'depth': usage.sketch.depth,
+            'errorBound': usage.sketch.error_bound(),
+        },
+        'hotShare': hot_share,
+        'hot': hot,
+        'cold': [key_id(entry['ns'], entry['key']) for entry in rows if entry['count'] <= cold_max],
+        'keys': rows,
+        'unknown': [
+            {'key': item, 'count': count, 'error': error}
+            for item, count, error in usage.top_keys.top()
+            if item not in known
+        ],
+        'locales': [
+            {'locale': locale, 'count': count, 'error': error}
+            for locale, count, error in usage.top_locales.top()
+        ],
+    }
+
+
+def write_report(report, state_dir=STATE_DIR):
+    path = report_path(state_dir)
+    write_json(path, report)
+    return path
+
+
+def load_hot_keys(path):
+    """``{ns: [key_path, ...]}`` of the hot keys in a usage report."""
+    if not os.path.exists(path):
+        raise SystemExit(f'❌ No usage report at {path}, run python3 locale_telemetry.py ingest first')
+    report = jsonio.load_file(path)
+    if not report.get('hits'):
+        raise SystemExit(f'❌ {path} has no hits, nothing to rank')
+    hot = {}
+    for item in report['hot']:
+        namespace, _, key_path = item.partition(':')
+        hot.setdefault(namespace, []).append(key_path)
+    return hot, report['cold']
@@ -0,0 +1,164 @@
+"""Collapse near-duplicate message families into parameterized templates.
+
+Sibling keys that share a camelCase suffix (``googleSignup``,
+``facebookSignup``, ``microsoftSignup``) often carry the same variations with
+only one word swapped. Per locale, such a family is rewritten as one template
+plus small references::
+
+    "providerSignup": {"variations": ["<h1>Thank you, {provider}! ..."]},
+    "googleSignup": {"template": "providerSignup", "params": {"provider": "Google"}}
+
+``fillMessageTemplate`` in src/i18n/messageHelpers.ts expands them at runtime.
+Families are only merged where every variation matches exactly once the word
+is substituted, so locales with hand-varied wording keep their full entries.
+"""
+import re
+
+from .profiling import locale_scope
+
+TEMPLATE_NAMESPACES = ('messages',)
+# Placeholder name per family suffix; anything else becomes {variant}.
+TEMPLATE_PARAMS = {'Signup': 'provider'}
+DEFAULT_PARAM = 'variant'
+
+KEY_PARTS = re.compile(r'^([a-z0-9]+)([A-Z]\w*)$')
+# ASCII words, other-script words and single separators, so a Latin brand
+# name inside Thai or CJK text is still its own token.
+TOKEN = re.compile(r'[A-Za-z0-9]+|[^\WA-Za-z0-9_]+|\W|_')
+
+
+def _variations_only(entry):
+    return (
+        isinstance(entry, dict)
+        and set(entry) == {'variations'}
+        and isinstance(entry['variations'], list)
+        and all(isinstance(v, str) for v in entry['variations'])
+    )
+
+
+def _compare(reference, other):
+    """Return ``(ref_word, other_word, positions)`` if the variations are
+    equal or differ only by one consistent word swap, else None."""
+    if len(reference) != len(other):
+        return None
+    swap = None
+    positions = []
+    for ref_text, other_text in zip(reference, other):
+        ref_tokens, other_tokens = TOKEN.findall(ref_text), TOKEN.findall(other_text)
+        if len(ref_tokens) != len(other_tokens):
+            return None
+        differing = [i for i, (a, b) in enumerate(zip(ref_tokens, other_tokens)) if a != b]
+        for i in differing:
+            pair = (ref_tokens[i], other_tokens[i])
+            if swap is None:
+                swap = pair
+            elif pair != swap:
+                return None
+        positions.append(tuple(differing))
+    if swap is None:
+        # Exact duplicates collapse into a template without a placeholder.
+        return None, None, positions
+    return swap[0], swap[1], positions
+
+
+def find_families(entries):
+    """Return ``[(suffix, {key: word}, reference_key, positions)]`` for ``entries``."""
+    groups = {}
+    for key, entry in entries.items():
+        match = KEY_PARTS.match(key)
+        if match and _variations_only(entry):
+            groups.setdefault(match.group(2), []).append(key)
+
+    families = []
+    for suffix, keys in groups.items():
+        remaining = list(keys)
+        while len(remaining) >= 2:
+            reference = remaining.pop(0)
+            words, positions = {}, None
+            for key in list(remaining):
+                result = _compare(entries[reference]['variations'], entries[key]['variations'])
+                if result is None:
+                    continue
+                ref_word, word, key_positions = result
+                if words and (words[reference] != ref_word or key_positions != positions):
+                    continue
+                words.setdefault(reference, ref_word)
+                words[key] = word
+                positions = key_positions
+                remaining.remove(key)
+            if words:
+                families.append((suffix, words, reference, positions))
+    return families
+
+
+def collapse(entries):
+    """Return ``(collapsed_entries, report)`` for one namespace dict."""
+    collapsed = dict(entries)
+    report = []
+    for suffix, words, reference, positions in find_families(entries):
+        param = TEMPLATE_PARAMS.get(suffix, DEFAULT_PARAM)
+        template_key = f'{param}{suffix}'
+        counter = 2
+        while template_key in collapsed:
+            template_key = f'{param}{suffix}{counter}'
+            counter += 1
+
+        variations = []
+        for text, differing in zip(entries[reference]['variations'], positions):
+            tokens = TOKEN.findall(text)
+            for i in differing:
+                tokens[i] = f'{{{param}}}'
+            variations.append(''.join(tokens))
+
+        collapsed[template_key] = {'variations': variations}
+        for key, word in words.items():
+            collapsed[key] = {'template': template_key}
+            if word is not None:
+                collapsed[key]['params'] = {param: word}
+        report.append({'template': template_key, 'keys': sorted(words), 'param': param})
+    return collapsed, report
+
+
+def expand(entries):
+    """Inverse of :func:`collapse`: give template references their variations back."""
+    expanded = {}
+    for key, entry in entries.items():
+        if isinstance(entry, dict) and 'template' in entry:
+            template = entries[entry['template']]['variations']
+            filled = []
+            for text in template:
+                for name, value in entry.get('params', {}).items():
+                    text = text.replace(f'{{{name}}}', value)
+                filled.append(text)
+            expanded[key] = {'variations': filled}
+        elif not (isinstance(entry, dict) and _is_template_target(entries, key)):
+            expanded[key] = entry
+    return expanded
+
+
+def _is_template_target(entries, key):
+    return any(isinstance(e, dict) and e.get('template') == key for e in entries.values())
+
+
+def expand_templates(catalog):
+    for locale, namespaces in catalog.items():
+        for namespace in TEMPLATE_NAMESPACES:
+            if namespace in namespaces:
+                with locale_scope(locale):
+                    namespaces[namespace] = expand(namespaces[namespace])
+    return catalog
+
+
+def collapse_templates(catalog):
+    """Collapse families in place; returns ``{locale: [family, ...]}``."""
+    report = {}
+    for locale, namespaces in catalog.items():
+        for namespace in TEMPLATE_NAMESPACES:
+            if namespace in namespaces:
+                with locale_scope(locale):
+                    namespaces[namespace], families = collapse(namespaces[namespace])
+                if families:
+                    report.setdefault(locale, []).extend(
+                        dict(family, namespace=namespace) for family in families
+                    )
+    return report
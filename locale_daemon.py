@@ -0,0 +1,233 @@
+"""Resident locale generator with a thin client over a Unix socket.
+
+    python3 locale_daemon.py serve &                 # keep the generator warm
+    python3 locale_daemon.py build [-- --modules]    # generate_locales.py args
+    python3 locale_daemon.py validate                # schema + budgets, no writes
+    python3 locale_daemon.py query missing landing:buttons
+    python3 locale_daemon.py status | stop
+    python3 locale_daemon.py serve --live [-- --modules]  # rebuild on edit, push to clients
+
+The daemon keeps the imported generator, the phase dicts (reloaded when a
+script changes) and scanned route sources in memory, so a repeated build
+skips interpreter start-up and most scanning work. Requests run one at a
+time. When no daemon is listening the client runs the command in-process,
+so hooks and CI work either way.
+
+With ``--live`` the daemon also watches the source catalogs and phase
+scripts, rebuilds on change (with the generate_locales.py args after ``--``)
+and pushes the changed keys to dev clients over server-sent events; see
+locale_build/live.py.
+
+Protocol: one JSON request line ``{"command", "args", "cwd"}``; the daemon
+answers with ``{"out": text}`` lines and a final ``{"exit": code}``.
+"""
+import argparse
+import json
+import os
+import socket
+import sys
+import time
+
+from locale_build.live import LIVE_PORT
+
+SOCKET_PATH = os.path.join('.locale-build', 'daemon.sock')
+COMMANDS = ('build', 'validate', 'query', 'status', 'stop')
+
+
+def run_command(command, argv, out=None):
+    """Run one command in this process, writing to ``out``; returns the exit code."""
+    try:
+        if command in ('build', 'validate'):
+            import generate_locales
+
+            return generate_locales.main([*argv, '--validate-only'] if command == 'validate' else argv, out) or 0
+        if command == 'query':
+            import locale_store
+
+            return locale_store.main(argv, out) or 0
+        raise SystemExit(f'❌ {command} needs the daemon')
+    except SystemExit as exc:
+        if isinstance(exc.code, str):
+            print(exc.code, file=out)
+            return 1
+        return exc.code or 0
+
+
+class _SocketWriter:
+    """Output stream of one request: forwards writes as ``{"out": ...}`` lines.
+
+    Handed to the command rather than swapped in for ``sys.stdout``, so other
+    threads of the daemon keep writing to its own console.
+    """
+
+    def __init__(self, wfile):
+        self.wfile = wfile
+
+    @property
+    def buffer(self):
+        # ``export`` writes UTF-8 bytes; they travel as text like the rest.
+        return self
+
+    def write(self, text):
+        if isinstance(text, bytes):
+            text = text.decode('utf-8')
+        if text:
+            self.wfile.write(json.dumps({'out': text}).encode('utf-8') + b'\n')
+        return len(text)
+
+    def flush(self):
+        self.wfile.flush()
+
+
+def watch(channel, lock, build_args, interval=0.5):
+    """Rebuild whenever a source catalog or phase script changes."""
+    from locale_build.live import source_mtimes
+
+    seen = source_mtimes(channel.locales_dir)
+    while True:
+        time.sleep(interval)
+        if source_mtimes(channel.locales_dir) == seen:
+            continue
+        with lock:
+            print('🔁 Sources changed, rebuilding')
+            run_command('build', build_args)
+            changes = channel.refresh()
+            # The build rewrites landing.json; only later edits count.
+            seen = source_mtimes(channel.locales_dir)
+            print(f'📡 Pushed {len(changes)} catalog changes to {len(channel.clients)} clients')
+
+
+def serve(socket_path=SOCKET_PATH, live=False, live_port=None, build_args=()):
+    import socketserver
+    import threading
+    import traceback
+
+    import generate_locales
+    import locale_store  # noqa: F401  warm the imports before the first request
+
+    root = os.path.realpath(os.getcwd())
+    started = time.time()
+    served = {'requests': 0}
+    lock = threading.Lock()
+    channel = None
+    if live:
+        from locale_build.live import LiveChannel
+
+        channel = LiveChannel(generate_locales.parse_args(list(build_args)).locales_dir)
+        channel.serve(port=live_port)
+        threading.Thread(target=watch, args=(channel, lock, list(build_args)), daemon=True).start()
+        print(f'📡 Live catalog events on http://127.0.0.1:{live_port}/events')
+
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self):
+            request = json.loads(self.rfile.readline())
+            writer = _SocketWriter(self.wfile)
+            with lock:
+                served['requests'] += 1
+                start = time.perf_counter()
+                command, argv = request['command'], request.get('args', [])
+                if os.path.realpath(request.get('cwd', root)) != root:
+                    print(f'❌ This daemon serves {root}', file=writer)
+                    code = 1
+                elif command == 'status':
+                    print(f'🟢 pid {os.getpid()}, up {time.time() - started:.0f}s, '
+                          f'{served["requests"]} requests, serving {root}', file=writer)
+                    code = 0
+                elif command == 'stop':
+                    print('👋 Stopping', file=writer)
+                    threading.Thread(target=self.server.shutdown).start()
+                    code = 0
+                else:
+                    try:
+                        code = run_command(command, argv, writer)
+                        if channel is not None and command == 'build' and code == 0:
+                            print(f'📡 Pushed {len(channel.refresh())} catalog changes to {len(channel.clients)} clients',
+                                  file=writer)
+                    except Exception:
+                        traceback.print_exc(file=writer)
+                        code = 1
+                    if command != 'query':  # query output is data, e.g. an exported catalog
+                        print(f'⏱️  {command} took {(time.perf_counter() - start) * 1000:.0f}ms in the daemon',
+                              file=writer)
+            self.wfile.write(json.dumps({'exit': code}).encode('utf-8') + b'\n')
+
+    if os.path.exists(socket_path):
+        try:
+            with socket.socket(socket.AF_UNIX) as probe:
+                probe.connect(socket_path)
+            raise SystemExit(f'❌ A daemon is already listening on {socket_path}')
+        except ConnectionRefusedError:
+            os.remove(socket_path)
+    os.makedirs(os.path.dirname(socket_path) or '.', exist_ok=True)
+
+    with socketserver.ThreadingUnixStreamServer(socket_path, Handler) as server:
+        print(f'🟢 Locale daemon listening on {socket_path} (pid {os.getpid()})')
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            os.remove(socket_path)
+    return 0
+
+
+def request(command, argv, socket_path=SOCKET_PATH):
+    """Send one request; returns the exit code, or None when no daemon listens."""
+    client = socket.socket(socket.AF_UNIX)
+    try:
+        client.connect(socket_path)
+    except (FileNotFoundError, ConnectionRefusedError):
+        client.close()
+        return None
+    with client, client.makefile('rb') as responses:
+        payload = {'command': command, 'args': argv, 'cwd': os.getcwd()}
+        client.sendall(json.dumps(payload).encode('utf-8') + b'\n')
+        for line in responses:
+            message = json.loads(line)
+            if 'exit' in message:
+                return message['exit']
+            sys.stdout.write(message['out'])
+            sys.stdout.flush()
+    raise SystemExit('❌ The daemon closed the connection')
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Run the locale generator as a resident daemon, or talk to it.')
+    parser.add_argument('--socket', default=SOCKET_PATH, help='Unix socket path (default: %(default)s)')
+    parser.add_argument('--no-fallback', action='store_true',
+                        help='fail instead of running in-process when no daemon is listening')
+    parser.add_argument('command', choices=('serve', *COMMANDS))
+    parser.add_argument('args', nargs=argparse.REMAINDER,
+                        help='serve options, or arguments for generate_locales.py / locale_store.py')
+    args = parser.parse_args(argv)
+    if args.command == 'serve':
+        serve_parser = argparse.ArgumentParser(prog=f'{parser.prog} serve')
+        serve_parser.add_argument('--live', action='store_true',
+                                  help='rebuild on source changes and push them to dev clients over SSE')
+        serve_parser.add_argument('--live-port', type=int, default=LIVE_PORT,
+                                  help='SSE port for --live (default: %(default)s)')
+        serve_parser.add_argument('args', nargs=argparse.REMAINDER, help='generate_locales.py arguments for --live builds')
+        serve_args = serve_parser.parse_args(args.args)
+        args.live, args.live_port, args.args = serve_args.live, serve_args.live_port, serve_args.args
+    if args.args[:1] == ['--']:
+        args.args = args.args[1:]
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.command == 'serve':
+        return serve(args.socket, live=args.live, live_port=args.live_port, build_args=args.args)
+
+    code = request(args.command, args.args, args.socket)
+    if code is not None:
+        return code
+    if args.no_fallback or args.command in ('status', 'stop'):
+        raise SystemExit(f'❌ No daemon on {args.socket}; start one with: python3 locale_daemon.py serve')
+    print('💡 No daemon running, running in-process (start one with: python3 locale_daemon.py serve)',
+          file=sys.stderr)
+    return run_command(args.command, args.args)
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
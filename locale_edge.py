@@ -0,0 +1,246 @@
+"""Edge stand-in: serve the app with the visitor's locale resolved up front.
+
+    npm run build && python3 locale_edge.py              # http://localhost:8787
+    python3 locale_edge.py --pack public/locales.pack --country-header CF-IPCountry
+    curl -si -H 'Accept-Language: de-CH,de;q=0.9' http://localhost:8787/login
+
+A document request (any path without a file extension) is negotiated with
+locale_build.edge (the i18next cookie, Accept-Language, ``?lng=``, then the
+country header) and answered with ``103 Early Hints`` carrying
+``Link: rel=preload`` for that locale's common catalog and route chunk (plus
+the en fallback), then the index.html of --dist with the same Link header and
+``<html lang dir data-edge-locale>`` filled in. The preloaded URLs carry the
+content hashes of <locales-dir>/manifest.json as ``?v=``, like the client's
+requests. ``/locales/...json`` comes from the --pack archive when given, else
+from public/locales, with the content hash as a strong ETag; a request whose
+``?v=`` matches that hash is cacheable for good. Everything else is a static
+file of --dist.
+"""
+import argparse
+import json
+import mimetypes
+import os
+import random
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from locale_build.catalog import LOCALES_DIR
+from locale_build.edge import (
+    QUERY_PARAM, catalog_key, cohort_of, inject_locale, link_header, negotiate, preload_urls, read_language_table,
+    read_route_table, route_entry,
+)
+from locale_build.manifest import MANIFEST_NAME, content_hash
+from locale_build.sampling import COHORT_COOKIE, COHORTS
+
+EDGE_PORT = 8787
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Serve the app with edge locale negotiation and preload hints.')
+    parser.add_argument('--port', type=int, default=EDGE_PORT)
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--dist', default='dist', help='built app to serve (default: %(default)s)')
+    parser.add_argument('--locales-dir', default=LOCALES_DIR, help='catalog root (default: %(default)s)')
+    parser.add_argument('--pack', metavar='ARCHIVE', help='serve catalogs from a generate_locales.py --pack archive')
+    parser.add_argument('--country-header', metavar='HEADER',
+                        help='request header with the visitor country, e.g. CF-IPCountry (replaces geolocation)')
+    parser.add_argument('--no-early-hints', dest='early_hints', action='store_false',
+                        help='send the Link header on the final response only')
+    parser.add_argument('--verbose', action='store_true', help='log every negotiated document request')
+    return parser.parse_args(argv)
+
+
+class FileCache:
+    """Static files with their content hash, reread when the mtime changes."""
+
+    def __init__(self):
+        self.files = {}
+        self.lock = threading.Lock()
+
+    def get(self, path):
+        """``(body, hash)`` of ``path``, or None."""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        with self.lock:
+            cached = self.files.get(path)
+            if cached and cached[0] == stat.st_mtime_ns:
+                return cached[1:]
+        with open(path, 'rb') as f:
+            body = f.read()
+        entry = (stat.st_mtime_ns, body, content_hash(body))
+        with self.lock:
+            self.files[path] = entry
+        return entry[1:]
+
+
+class Edge:
+    def __init__(self, args):
+        self.args = args
+        self.table = read_language_table()
+        self.routes = read_route_table()
+        self.files = FileCache()
+        self.pack = None
+        if args.pack:
+            from locale_build.pack import PackReader
+
+            self.pack = PackReader(args.pack)
+        index = os.path.join(args.dist, 'index.html')
+        if not os.path.exists(index):
+            print(f"⚠️  No {index}; serving the source index.html (run npm run build for the real app)")
+            index = 'index.html'
+        self.index = index
+        self._manifest = (None, None)
+
+    def manifest(self):
+        """The build manifest of --locales-dir, reread after a rebuild, or None."""
+        found = self.files.get(os.path.join(self.args.locales_dir, MANIFEST_NAME))
+        if found is None:
+            return None
+        body, digest = found
+        cached_digest, manifest = self._manifest
+        if cached_digest != digest:
+            manifest = json.loads(body)
+            self._manifest = (digest, manifest)
+        return manifest
+
+    def catalog(self, key):
+        """``(body, hash)`` of a catalog or route chunk, or None."""
+        if self.pack is not None:
+            entry = self.pack.entry(key)
+            if entry is not None:
+                return self.pack.read(key), entry[2]
+        return self.files.get(os.path.join(self.args.locales_dir, *key.split('/')) + '.json')
+
+    def static(self, path):
+        root = os.path.realpath(self.args.dist)
+        target = os.path.realpath(os.path.join(root, path.lstrip('/')))
+        if not target.startswith(root + os.sep) or not os.path.isfile(target):
+            return None
+        return self.files.get(target)
+
+    def document(self, path, headers, query):
+        """``(locale, source, link, body, new cohort)`` of a document request.
+
+        A visitor without a cohort who lands on a sampled route gets one, so
+        the preload and the client's fetch name the same shard.
+        """
+        country = headers.get(self.args.country_header) if self.args.country_header else None
+        locale, source = negotiate(
+            self.table,
+            accept_language=headers.get('Accept-Language', ''),
+            cookie=headers.get('Cookie', ''),
+            query_lng=query.get(QUERY_PARAM, [None])[0],
+            country=country,
+        )
+        route = route_entry(self.routes, path)
+        cohort = cohort_of(headers.get('Cookie', ''))
+        new_cohort = None
+        if cohort is None and route is not None and route.get('shards'):
+            cohort = new_cohort = random.randrange(COHORTS)
+        link = link_header(preload_urls(locale, route, self.table['fallback'], cohort, self.manifest()))
+        html, _ = self.files.get(self.index)
+        return locale, source, link, inject_locale(html.decode('utf-8'), locale).encode('utf-8'), new_cohort
+
+
+class EdgeServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # Browsers open several keep-alive connections per visitor.
+    request_queue_size = 1024
+
+
+def make_handler(edge):
+    class Handler(BaseHTTPRequestHandler):
+        # 1xx responses need HTTP/1.1; every response sets Content-Length.
+        protocol_version = 'HTTP/1.1'
+
+        def do_HEAD(self):
+            self.do_GET(head=True)
+
+        def do_GET(self, head=False):
+            url = urlsplit(self.path)
+            key = catalog_key(url.path)
+            if key is not None:
+                found = edge.catalog(key)
+                if found is None:
+                    self.send_error(404)
+                    return
+                versioned = parse_qs(url.query).get('v', [None])[0] == found[1]
+                self._send_cached(found, 'application/json', head, immutable=versioned)
+            elif os.path.splitext(url.path)[1]:
+                found = edge.static(url.path)
+                if found is None:
+                    self.send_error(404)
+                    return
+                content_type = mimetypes.guess_type(url.path)[0] or 'application/octet-stream'
+                self._send_cached(found, content_type, head)
+            else:
+                self._send_document(url, head)
+
+        def _send_document(self, url, head):
+            locale, source, link, body, new_cohort = edge.document(url.path, self.headers, parse_qs(url.query))
+            if edge.args.early_hints and self.request_version == 'HTTP/1.1':
+                self.send_response_only(103)
+                self.send_header('Link', link)
+                self.end_headers()
+                self.wfile.flush()
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/html; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.send_header('Content-Language', locale)
+            self.send_header('Link', link)
+            self.send_header('Vary', ', '.join(filter(None, ('Accept-Language', 'Cookie', edge.args.country_header))))
+            self.send_header('Cache-Control', 'no-cache')
+            if new_cohort is not None:
+                # Same cookie routeCatalogs.ts would set on its own
+                self.send_header('Set-Cookie', f'{COHORT_COOKIE}={new_cohort}; Path=/; Max-Age=31536000; SameSite=Lax')
+            self.end_headers()
+            if not head:
+                self.wfile.write(body)
+            if edge.args.verbose:
+                print(f"🌐 {url.path} → {locale} ({source})")
+
+        def _send_cached(self, found, content_type, head, immutable=False):
+            body, digest = found
+            etag = f'"{digest}"'
+            if etag in (tag.strip() for tag in self.headers.get('If-None-Match', '').split(',')):
+                self.send_response(304)
+                self.send_header('ETag', etag)
+                self.end_headers()
+                return
+            self.send_response(200)
+            self.send_header('Content-Type', content_type)
+            self.send_header('Content-Length', str(len(body)))
+            self.send_header('ETag', etag)
+            # Only ?v=<hash> URLs are content-addressed; anything else revalidates.
+            self.send_header('Cache-Control', 'public, max-age=31536000, immutable' if immutable else 'no-cache')
+            self.end_headers()
+            if not head:
+                self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    edge = Edge(args)
+    source = args.pack or args.locales_dir
+    with EdgeServer((args.host, args.port), make_handler(edge)) as server:
+        print(f"🚀 Edge on http://{args.host}:{args.port}, {len(edge.table['locales'])} locales, catalogs from {source}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            if edge.pack is not None:
+                edge.pack.close()
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
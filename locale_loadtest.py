@@ -0,0 +1,299 @@
+"""Replay first visits against a server that serves public/locales.
+
+    npm run build && npm run preview                      # http://localhost:5174
+    python3 locale_loadtest.py --visits 2000 --concurrency 100
+    python3 locale_loadtest.py --pattern full --warm 0.5 --mix en=40,de-DE=10,fr-FR=10
+    python3 locale_loadtest.py --base http://localhost:8787 --duration 30
+
+A visit is what a browser with an empty or warm cache fetches for one page
+in one language, plus the en fallback:
+
+    route   common.json and the route chunk of --path (what the app loads now)
+    full    every namespace file of the locale (the old http-backend pattern)
+
+Warm visitors revalidate with the ETag / Last-Modified of a priming pass, so
+a server that honours them answers 304. Each visit uses up to --parallel
+keep-alive connections, like a browser. The report gives throughput,
+p50/p95/p99 latency per request and per visit, status codes and bytes per
+visit (headers and bodies as received).
+"""
+import argparse
+import asyncio
+import os
+import random
+import time
+from urllib.parse import urlsplit
+
+from locale_build.catalog import LOCALES_DIR, is_locale_dir
+from locale_build.routes import ROUTES_DIR, route_file, route_paths
+
+FALLBACK_LOCALE = 'en'
+INITIAL_NAMESPACES = ('common',)  # `ns` in src/i18n/config.ts
+
+
+def parse_mix(value):
+    weights = {}
+    for part in value.split(','):
+        locale, sep, weight = part.partition('=')
+        try:
+            weights[locale.strip()] = float(weight) if sep else 1.0
+        except ValueError:
+            raise argparse.ArgumentTypeError(f'expected LOCALE=WEIGHT, got {part!r}') from None
+    return weights
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Load-test the static serving of the locale catalogs.')
+    parser.add_argument('--base', default='http://localhost:5174', help='server origin (default: %(default)s)')
+    parser.add_argument('--locales-dir', default=LOCALES_DIR, help='catalog tree to derive URLs from (default: %(default)s)')
+    parser.add_argument('--pattern', choices=('route', 'full'), default='route',
+                        help='what one visit fetches (default: %(default)s)')
+    parser.add_argument('--path', default='/', help='page visited with --pattern route (default: %(default)s)')
+    parser.add_argument('--mix', type=parse_mix,
+                        help='language weights, e.g. en=40,de-DE=10 (default: en half the visits, the rest uniform)')
+    parser.add_argument('--warm', type=float, default=0.0, help='share of visitors with a warm cache (default: 0)')
+    parser.add_argument('--visits', type=int, default=1000, help='visits to run (default: %(default)s)')
+    parser.add_argument('--duration', type=float, help='run for this many seconds instead of --visits')
+    parser.add_argument('--concurrency', type=int, default=50, help='visits in flight (default: %(default)s)')
+    parser.add_argument('--parallel', type=int, default=6, help='connections per visit (default: %(default)s)')
+    parser.add_argument('--gzip', action='store_true', help='send Accept-Encoding: gzip, br like a browser')
+    parser.add_argument('--timeout', type=float, default=10.0, help='per-request timeout in seconds')
+    parser.add_argument('--seed', type=int, default=1, help='random seed for the visitor mix (default: %(default)s)')
+    return parser.parse_args(argv)
+
+
+def visit_urls(locales_dir, pattern, path):
+    """``{locale: [url path, ...]}`` of what one visit fetches, fallback included."""
+    locales = sorted(name for name in os.listdir(locales_dir) if is_locale_dir(locales_dir, name))
+    if pattern == 'full':
+        own = {
+            locale: [
+                f'/locales/{locale}/{filename}'
+                for filename in sorted(os.listdir(os.path.join(locales_dir, locale)))
+                if filename.endswith('.json')
+            ]
+            for locale in locales
+        }
+    else:
+        routes = [route for route, paths in route_paths().items() if path in paths]
+        if not routes:
+            raise SystemExit(f'❌ No route in src/App.tsx serves {path}')
+        files = [f'{namespace}.json' for namespace in INITIAL_NAMESPACES]
+        files.append(f'{ROUTES_DIR}/{route_file(routes[0])}.json')
+        own = {locale: [f'/locales/{locale}/{filename}' for filename in files] for locale in locales}
+    return {
+        locale: urls + (own[FALLBACK_LOCALE] if locale != FALLBACK_LOCALE else [])
+        for locale, urls in own.items()
+    }
+
+
+def language_weights(locales, mix):
+    if mix:
+        unknown = set(mix) - set(locales)
+        if unknown:
+            raise SystemExit(f"❌ No catalogs for {', '.join(sorted(unknown))}")
+        return list(mix), list(mix.values())
+    others = [locale for locale in locales if locale != FALLBACK_LOCALE]
+    return [FALLBACK_LOCALE, *others], [len(others), *([1] * len(others))]
+
+
+class Connection:
+    """One keep-alive HTTP/1.1 connection."""
+
+    def __init__(self, host, port, ssl, timeout):
+        self.host, self.port, self.ssl, self.timeout = host, port, ssl, timeout
+        self.reader = self.writer = None
+
+    async def request(self, path, headers):
+        """GET ``path``; returns ``(status, response headers, bytes received)``."""
+        for attempt in (0, 1):
+            if self.writer is None:
+                self.reader, self.writer = await asyncio.open_connection(self.host, self.port, ssl=self.ssl)
+            lines = [f'GET {path} HTTP/1.1', f'Host: {self.host}:{self.port}', *headers, '', '']
+            self.writer.write('\r\n'.join(lines).encode('latin-1'))
+            try:
+                return await asyncio.wait_for(self._response(), self.timeout)
+            except (ConnectionError, asyncio.IncompleteReadError):
+                # The server closed an idle keep-alive connection; retry once
+                await self.close()
+                if attempt:
+                    raise
+
+    async def _response(self):
+        head = await self.reader.readuntil(b'\r\n\r\n')
+        status_line, *header_lines = head.decode('latin-1').split('\r\n')
+        status = int(status_line.split()[1])
+        headers = {}
+        for line in header_lines:
+            name, sep, value = line.partition(':')
+            if sep:
+                headers[name.strip().lower()] = value.strip()
+        received = len(head)
+        if status == 304 or status < 200:
+            pass
+        elif headers.get('transfer-encoding', '').lower() == 'chunked':
+            while True:
+                size_line = await self.reader.readuntil(b'\r\n')
+                size = int(size_line.split(b';')[0], 16)
+                received += len(size_line) + size + 2
+                await self.reader.readexactly(size + 2)
+                if size == 0:
+                    break
+        elif 'content-length' in headers:
+            length = int(headers['content-length'])
+            await self.reader.readexactly(length)
+            received += length
+        else:
+            received += len(await self.reader.read())
+            await self.close()
+        if headers.get('connection', '').lower() == 'close':
+            await self.close()
+        return status, headers, received
+
+    async def close(self):
+        if self.writer is not None:
+            self.writer.close()
+            try:
+                await self.writer.wait_closed()
+            except (ConnectionError, OSError):
+                pass
+        self.reader = self.writer = None
+
+
+class Stats:
+    def __init__(self):
+        self.request_latencies = []
+        self.visit_latencies = []
+        self.visit_bytes = []
+        self.statuses = {}
+        self.errors = {}
+        self.warm_visits = 0
+
+    def report(self, seconds):
+        visits = len(self.visit_latencies)
+        requests = len(self.request_latencies)
+        total_bytes = sum(self.visit_bytes)
+        print(f"⏱️  {visits:,} visits, {requests:,} requests in {seconds:.1f}s "
+              f"({self.warm_visits:,} warm)")
+        print(f"   throughput  {visits / seconds:,.1f} visits/s, {requests / seconds:,.1f} req/s, "
+              f"{total_bytes / seconds / 1e6:,.2f} MB/s")
+        for label, samples in (('request', self.request_latencies), ('visit', self.visit_latencies)):
+            if samples:
+                p50, p95, p99 = (percentile(samples, q) for q in (50, 95, 99))
+                print(f"   {label:<8}    p50 {p50 * 1000:,.1f}ms  p95 {p95 * 1000:,.1f}ms  "
+                      f"p99 {p99 * 1000:,.1f}ms  max {max(samples) * 1000:,.1f}ms")
+        if visits:
+            print(f"   bytes/visit {total_bytes / visits:,.0f} average, {percentile(self.visit_bytes, 95):,.0f} p95")
+        print("   status      " + ', '.join(f'{status}: {count:,}' for status, count in sorted(self.statuses.items())))
+        for error, count in sorted(self.errors.items()):
+            print(f"❌ {count:,} × {error}")
+
+
+def percentile(samples, q):
+    """Nearest-rank percentile."""
+    ordered = sorted(samples)
+    return ordered[max(0, min(len(ordered) - 1, -(-q * len(ordered) // 100) - 1))]
+
+
+class LoadTest:
+    def __init__(self, args):
+        self.args = args
+        base = urlsplit(args.base)
+        self.host = base.hostname
+        self.ssl = base.scheme == 'https'
+        self.port = base.port or (443 if self.ssl else 80)
+        self.prefix = base.path.rstrip('/')
+        self.urls = visit_urls(args.locales_dir, args.pattern, args.path)
+        self.locales, self.weights = language_weights(list(self.urls), args.mix)
+        self.validators = {}
+        self.random = random.Random(args.seed)
+        self.stats = Stats()
+        self.headers = ['Accept: application/json', 'User-Agent: locale-loadtest']
+        if args.gzip:
+            self.headers.append('Accept-Encoding: gzip, br')
+
+    def connection(self):
+        return Connection(self.host, self.port, self.ssl, self.args.timeout)
+
+    async def prime(self):
+        """Fetch every URL once, untimed, to learn its validators."""
+        connection = self.connection()
+        try:
+            for url in sorted({url for urls in self.urls.values() for url in urls}):
+                status, headers, _ = await connection.request(self.prefix + url, self.headers)
+                if status != 200:
+                    raise SystemExit(f'❌ {self.args.base}{url} answered {status}; is the server serving public/?')
+                validators = []
+                if 'etag' in headers:
+                    validators.append(f"If-None-Match: {headers['etag']}")
+                if 'last-modified' in headers:
+                    validators.append(f"If-Modified-Since: {headers['last-modified']}")
+                self.validators[url] = validators
+        finally:
+            await connection.close()
+
+    async def visit(self):
+        locale = self.random.choices(self.locales, self.weights)[0]
+        warm = self.random.random() < self.args.warm
+        self.stats.warm_visits += warm
+        queue = list(self.urls[locale])
+        received = 0
+
+        async def worker():
+            nonlocal received
+            connection = self.connection()
+            try:
+                while queue:
+                    url = queue.pop(0)
+                    headers = self.headers + (self.validators.get(url, []) if warm else [])
+                    start = time.perf_counter()
+                    try:
+                        status, _, size = await connection.request(self.prefix + url, headers)
+                    except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError, ValueError) as exc:
+                        error = type(exc).__name__
+                        self.stats.errors[error] = self.stats.errors.get(error, 0) + 1
+                        await connection.close()
+                        continue
+                    self.stats.request_latencies.append(time.perf_counter() - start)
+                    self.stats.statuses[status] = self.stats.statuses.get(status, 0) + 1
+                    received += size
+            finally:
+                await connection.close()
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(min(self.args.parallel, len(queue)))))
+        self.stats.visit_latencies.append(time.perf_counter() - start)
+        self.stats.visit_bytes.append(received)
+
+    async def run(self):
+        await self.prime()
+        deadline = time.perf_counter() + self.args.duration if self.args.duration else None
+        remaining = self.args.visits
+
+        async def visitor():
+            nonlocal remaining
+            while (deadline is None and remaining > 0) or (deadline is not None and time.perf_counter() < deadline):
+                remaining -= 1
+                await self.visit()
+
+        start = time.perf_counter()
+        await asyncio.gather(*(visitor() for _ in range(self.args.concurrency)))
+        return time.perf_counter() - start
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    test = LoadTest(args)
+    mode = f'{args.duration:g}s' if args.duration else f'{args.visits:,} visits'
+    print(f"🚀 {mode} against {args.base}, {args.concurrency} concurrent, pattern {args.pattern}, "
+          f"{len(test.locales)} languages, {args.warm:.0%} warm")
+    try:
+        seconds = asyncio.run(test.run())
+    except ConnectionRefusedError:
+        raise SystemExit(f'❌ Nothing listening on {args.base}; start npm run preview or pass --base') from None
+    test.stats.report(seconds)
+    return 1 if test.stats.errors else 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
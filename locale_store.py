@@ -0,0 +1,79 @@
+"""Query the SQLite translation store that generate_locales.py keeps in sync.
+
+    python3 locale_store.py missing landing:passwordCreate.message
+    python3 locale_store.py get messages:completion.title
+    python3 locale_store.py changed 4
+    python3 locale_store.py export fr-FR landing > landing.json
+    python3 locale_store.py import
+"""
+import argparse
+import os
+import sys
+from contextlib import closing
+
+from locale_build.catalog import LOCALES_DIR, build_catalog
+from locale_build.manifest import STATE_DIR, load_snapshot
+from locale_build.store import changed_since, connect, lookup, missing, store_path, stream_namespace, sync
+from locale_build.templates import collapse_templates, expand_templates
+
+
+def parse_key(value):
+    namespace, sep, key_path = value.partition(':')
+    if not sep or not key_path:
+        raise argparse.ArgumentTypeError(f'expected NAMESPACE:KEY.PATH, got {value!r}')
+    return namespace, key_path
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Query the translation store in the state directory.')
+    parser.add_argument('--state-dir', default=STATE_DIR, help='generator state directory (default: %(default)s)')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    command = commands.add_parser('missing', help='locales that lack a key')
+    command.add_argument('key', type=parse_key, metavar='NAMESPACE:KEY.PATH')
+    command = commands.add_parser('get', help='value of a key in every locale')
+    command.add_argument('key', type=parse_key, metavar='NAMESPACE:KEY.PATH')
+    command = commands.add_parser('changed', help='strings changed after a build version')
+    command.add_argument('version', type=int)
+    command = commands.add_parser('export', help='stream one namespace to stdout, byte-identical to its catalog file')
+    command.add_argument('locale')
+    command.add_argument('namespace')
+    command = commands.add_parser('import', help='sync the store from the JSON catalogs without a build')
+    command.add_argument('--locales-dir', default=LOCALES_DIR, help='catalog root (default: %(default)s)')
+    return parser.parse_args(argv)
+
+
+def main(argv=None, out=None):
+    """Run one query; results go to ``out`` (default: stdout)."""
+    args = parse_args(argv)
+    out = out if out is not None else sys.stdout
+    if args.command != 'import' and not os.path.exists(store_path(args.state_dir)):
+        raise SystemExit('❌ No translation store yet, run python3 generate_locales.py first')
+
+    with closing(connect(args.state_dir)) as conn:
+        if args.command == 'missing':
+            for locale in missing(conn, *args.key):
+                print(locale, file=out)
+        elif args.command == 'get':
+            for locale, value in lookup(conn, *args.key):
+                print(f'{locale}\t{value}', file=out)
+        elif args.command == 'changed':
+            for locale, namespace, key_path, value, updated_at in changed_since(conn, args.version):
+                print(f'{updated_at}\t{locale}/{namespace}:{key_path}\t{value}', file=out)
+        elif args.command == 'export':
+            # Bytes, not text: the output matches the catalog file whatever the terminal encoding
+            for chunk in stream_namespace(conn, args.locale, args.namespace):
+                out.buffer.write(chunk.encode('utf-8'))
+            out.buffer.flush()
+        elif args.command == 'import':
+            version, _ = load_snapshot(args.state_dir)
+            # The catalog generate_locales.py syncs: phase scripts merged, templates as written.
+            catalog = expand_templates(build_catalog(args.locales_dir))
+            collapse_templates(catalog)
+            changed, removed = sync(conn, catalog, version)
+            print(f"✅ Imported {args.locales_dir}: {changed} strings changed, {removed} removed", file=out)
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
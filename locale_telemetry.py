@@ -0,0 +1,119 @@
+"""Collect key-usage hits from dev clients and rank catalog keys hot or cold.
+
+    python3 locale_telemetry.py collect                # local collector on :5175
+    python3 locale_telemetry.py ingest                 # every log under .locale-build/telemetry
+    python3 locale_telemetry.py ingest hits-*.ndjson --hot-share 0.9
+    python3 generate_locales.py --usage .locale-build/key-usage.json
+
+Point the app at the collector with VITE_I18N_TELEMETRY_URL=http://localhost:5175/hits.
+"""
+import argparse
+import glob
+import os
+from datetime import datetime, timezone
+
+from locale_build.catalog import LOCALES_DIR, build_catalog
+from locale_build.manifest import STATE_DIR
+from locale_build.telemetry import HOT_SHARE, TELEMETRY_DIR, Usage, build_report, write_report
+from locale_build.templates import expand_templates
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Collect and analyse catalog key usage.')
+    parser.add_argument('--state-dir', default=STATE_DIR, help='generator state directory (default: %(default)s)')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    command = commands.add_parser('collect', help='accept hit batches over HTTP and append them to a log')
+    command.add_argument('--port', type=int, default=5175)
+    command.add_argument('--host', default='127.0.0.1')
+    command = commands.add_parser('ingest', help='aggregate hit logs into the key-usage report')
+    command.add_argument('logs', nargs='*', help=f'newline JSON logs (default: <state-dir>/{TELEMETRY_DIR}/*.ndjson)')
+    command.add_argument('--locales-dir', default=LOCALES_DIR, help='catalog root (default: %(default)s)')
+    command.add_argument('--hot-share', type=float, default=HOT_SHARE,
+                         help='share of hits the hot keys must cover (default: %(default)s)')
+    command.add_argument('--width', type=int, default=1 << 14, help='count-min sketch width (default: %(default)s)')
+    command.add_argument('--depth', type=int, default=4, help='count-min sketch depth (default: %(default)s)')
+    command.add_argument('--top', type=int, default=256, help='heavy hitters kept per dimension (default: %(default)s)')
+    return parser.parse_args(argv)
+
+
+def collect(args):
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    log_dir = os.path.join(args.state_dir, TELEMETRY_DIR)
+    os.makedirs(log_dir, exist_ok=True)
+    log_path = os.path.join(log_dir, f"hits-{datetime.now(timezone.utc):%Y%m%d-%H%M%S}.ndjson")
+    log = open(log_path, 'ab')
+
+    class Handler(BaseHTTPRequestHandler):
+        def _cors(self):
+            self.send_header('Access-Control-Allow-Origin', '*')
+            self.send_header('Access-Control-Allow-Methods', 'POST, OPTIONS')
+            self.send_header('Access-Control-Allow-Headers', 'Content-Type')
+
+        def do_OPTIONS(self):
+            self.send_response(204)
+            self._cors()
+            self.end_headers()
+
+        def do_POST(self):
+            body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+            # One batch per line; the ingest step skips anything malformed.
+            log.write(body.replace(b'\n', b' ').strip() + b'\n')
+            log.flush()
+            self.send_response(204)
+            self._cors()
+            self.end_headers()
+
+        def log_message(self, format, *args):
+            pass
+
+    with ThreadingHTTPServer((args.host, args.port), Handler) as server:
+        print(f"📡 Collecting key hits on http://{args.host}:{args.port}/hits into {log_path}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            log.close()
+    return 0
+
+
+def ingest(args):
+    logs = args.logs or sorted(glob.glob(os.path.join(args.state_dir, TELEMETRY_DIR, '*.ndjson')))
+    if not logs:
+        raise SystemExit('❌ No hit logs, run python3 locale_telemetry.py collect first')
+
+    usage = Usage(width=args.width, depth=args.depth, capacity=args.top)
+    for path in logs:
+        usage.ingest(path)
+    reference = expand_templates(build_catalog(args.locales_dir))['en']
+    report = build_report(usage, reference, hot_share=args.hot_share)
+    path = write_report(report, args.state_dir)
+
+    print(f"📊 {report['hits']:,} hits from {len(logs)} logs ({report['skipped']} malformed skipped), "
+          f"estimates within +{report['sketch']['errorBound']:,}")
+    print(f"🔥 {len(report['hot'])} hot keys cover {args.hot_share:.0%} of hits:")
+    counts = {f"{entry['ns']}:{entry['key']}": entry for entry in report['keys']}
+    for item in report['hot'][:15]:
+        entry = counts[item]
+        variations = f"  variations {entry['variations']}" if 'variations' in entry else ''
+        print(f"   {entry['count']:>8,}  {item}{variations}")
+    print(f"🧊 {len(report['cold'])} of {len(report['keys'])} keys never seen")
+    for item in report['cold'][:15]:
+        print(f"   {item}")
+    for entry in report['unknown'][:5]:
+        print(f"⚠️  {entry['key']} is not in the en catalog ({entry['count']:,} hits)")
+    print(f"✅ Wrote {path}")
+    return 0
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.command == 'collect':
+        return collect(args)
+    return ingest(args)
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
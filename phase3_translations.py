@@ -1,6 +1,7 @@
-import json
 import os
 
+from locale_build.catalog import serialize
+
 # Phase 3: Eastern European Languages
 phase3_translations = {
     'ru-RU': {  # Russian
@@ -628,15 +629,16 @@ phase3_translations = {
     }
 }
 
-locales_dir = 'public/locales'
+if __name__ == '__main__':
+    locales_dir = 'public/locales'
 
-for lang_code, translations in phase3_translations.items():
-    lang_dir = os.path.join(locales_dir, lang_code)
-    landing_path = os.path.join(lang_dir, 'landing.json')
+    for lang_code, translations in phase3_translations.items():
+        lang_dir = os.path.join(locales_dir, lang_code)
+        landing_path = os.path.join(lang_dir, 'landing.json')
     
-    with open(landing_path, 'w', encoding='utf-8') as f:
-        json.dump(translations, f, ensure_ascii=False, indent=2)
+        with open(landing_path, 'wb') as f:
+            f.write(serialize(translations))
     
-    print(f"✅ Created {lang_code}/landing.json")
+        print(f"✅ Created {lang_code}/landing.json")
 
-print(f"\n🎉 Phase 3 complete! Created landing.json for {len(phase3_translations)} languages")
+    print(f"\n🎉 Phase 3 complete! Created landing.json for {len(phase3_translations)} languages")
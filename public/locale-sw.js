@@ -0,0 +1,125 @@
+/**
+ * Locale catalog service worker
+ * Precaches the active locale's catalogs listed in
+ * /locales/precache-manifest.json (written by generate_locales.py) and serves
+ * /locales/<lng>/<ns>.json and the route chunks under _routes/ and
+ * _sampled/<shard>/ cache-first. Cache keys carry the file's content hash, so
+ * a new build only refetches the files whose hash changed. A `?v=` hash other
+ * than the listed one reloads the manifest; if it still differs, the request
+ * goes to the network uncached. Of the sampled chunks only the visitor's
+ * shard (`cohort % shards`) is precached.
+ * The manifest is refetched when the worker activates and whenever a page
+ * reports a build version other than the one the worker holds.
+ */
+
+const CACHE_NAME = 'locale-catalogs-v1';
+const MANIFEST_URL = '/locales/precache-manifest.json';
+const CATALOG_PATTERN = /^\/locales\/[^/]+\/(?:_routes\/|_sampled\/\d+\/)?[^/]+\.json$/;
+
+let revisions = null;
+let version = null;
+let shards = 0;
+
+const revisionKey = (url, revision) => `${url}?__rev=${revision}`;
+
+async function loadManifest(refresh) {
+  if (revisions && !refresh) return revisions;
+
+  const cache = await caches.open(CACHE_NAME);
+  let manifest = null;
+  try {
+    const response = await fetch(MANIFEST_URL, { cache: 'no-cache' });
+    if (response.ok) {
+      await cache.put(MANIFEST_URL, response.clone());
+      manifest = await response.json();
+    }
+  } catch {
+    // Offline - fall back to the last manifest we saw
+  }
+  if (!manifest) {
+    const cached = await cache.match(MANIFEST_URL);
+    manifest = cached ? await cached.json() : { locales: {} };
+  }
+
+  version = manifest.version ?? null;
+  shards = manifest.shards ?? 0;
+  revisions = new Map();
+  for (const entries of Object.values(manifest.locales)) {
+    for (const { url, revision, shard } of entries) {
+      revisions.set(url, { revision, shard });
+    }
+  }
+  return revisions;
+}
+
+async function pruneStaleRevisions(cache, current) {
+  const valid = new Set([...current].map(([url, { revision }]) => revisionKey(url, revision)));
+  for (const request of await cache.keys()) {
+    const url = new URL(request.url);
+    if (url.searchParams.has('__rev') && !valid.has(url.pathname + url.search)) {
+      await cache.delete(request);
+    }
+  }
+}
+
+const inCohort = (shard, cohort) =>
+  shard === undefined || (cohort != null && shards > 0 && shard === cohort % shards);
+
+async function precacheLocale(lng, buildVersion, cohort) {
+  const current = await loadManifest(buildVersion == null || buildVersion !== version);
+  const cache = await caches.open(CACHE_NAME);
+  const prefix = `/locales/${lng}/`;
+
+  await Promise.all(
+    [...current]
+      .filter(([url, { shard }]) => url.startsWith(prefix) && inCohort(shard, cohort))
+      .map(async ([url, { revision }]) => {
+        const key = revisionKey(url, revision);
+        if (await cache.match(key)) return;
+        const response = await fetch(url, { cache: 'no-cache' });
+        if (response.ok) await cache.put(key, response);
+      })
+  );
+  await pruneStaleRevisions(cache, current);
+}
+
+async function serveCatalog(request) {
+  const url = new URL(request.url);
+  const requested = url.searchParams.get('v');
+  let revision = (await loadManifest(false)).get(url.pathname)?.revision;
+  if (requested && revision && revision !== requested) {
+    // The page runs another build than the worker's manifest describes:
+    // refresh it, and never answer a ?v= URL with a body of another revision
+    revision = (await loadManifest(true)).get(url.pathname)?.revision;
+    if (revision !== requested) return fetch(request);
+  }
+  if (!revision) return fetch(request);
+
+  const cache = await caches.open(CACHE_NAME);
+  const key = revisionKey(url.pathname, revision);
+  const cached = await cache.match(key);
+  if (cached) return cached;
+
+  const response = await fetch(request);
+  if (response.ok) await cache.put(key, response.clone());
+  return response;
+}
+
+self.addEventListener('install', () => self.skipWaiting());
+
+self.addEventListener('activate', (event) => {
+  event.waitUntil(Promise.all([self.clients.claim(), loadManifest(true)]));
+});
+
+self.addEventListener('message', (event) => {
+  if (event.data?.type === 'PRECACHE_LOCALE' && event.data.lng) {
+    event.waitUntil(precacheLocale(event.data.lng, event.data.version, event.data.cohort));
+  }
+});
+
+self.addEventListener('fetch', (event) => {
+  const url = new URL(event.request.url);
+  if (event.request.method !== 'GET' || url.origin !== self.location.origin) return;
+  if (!CATALOG_PATTERN.test(url.pathname)) return;
+  event.respondWith(serveCatalog(event.request));
+});
@@ -1,6 +1,7 @@
 import { useState, useRef, useEffect } from 'react';
 import { useTranslation } from 'react-i18next';
 import { SUPPORTED_LANGUAGES, RTL_LANGUAGES } from '@/i18n/config';
+import { searchLanguageCodes } from '@/i18n/languageResolution';
 import { Globe, MapPin } from 'lucide-react';
 
 interface LanguageSwitcherProps {
@@ -55,12 +56,11 @@ export default function LanguageSwitcher({ className = '', textColor = 'text-gra
     setSearchQuery('');
   };
 
-  // Filter languages based on search
-  const filteredLanguages = SUPPORTED_LANGUAGES.filter(lang =>
-    lang.name.toLowerCase().includes(searchQuery.toLowerCase()) ||
-    lang.nativeName.toLowerCase().includes(searchQuery.toLowerCase()) ||
-    lang.code.toLowerCase().includes(searchQuery.toLowerCase())
-  );
+  // Filter languages based on search (prefix lookup in the generated index)
+  const matchingCodes = searchLanguageCodes(searchQuery);
+  const filteredLanguages = matchingCodes
+    ? SUPPORTED_LANGUAGES.filter(lang => matchingCodes.has(lang.code))
+    : SUPPORTED_LANGUAGES;
 
   return (
     <div className={`relative ${className}`} ref={dropdownRef}>
@@ -0,0 +1,184 @@
+/**
+ * Catalog delta patches
+ * generate_locales.py writes /locales/manifest.json with the content hash of
+ * every (locale, namespace) catalog, plus an RFC 6902 patch from the previous
+ * version for catalogs that changed. A client holding the previous catalog can
+ * fetch the patch instead of the whole file.
+ *
+ * ModuleBackend keeps every catalog it fetches in Cache Storage together with
+ * its hash; on the next visit it patches that copy up to the current manifest
+ * and only fetches the full file when no patch starts from it.
+ *
+ * Catalogs and route chunks are requested with their hash as `?v=` once the
+ * manifest has loaded: the edge (locale_build/edge.py) preloads exactly those
+ * URLs, and a new build changes the URL of every file that changed.
+ */
+
+export type CatalogPatchOp =
+  | { op: 'add' | 'replace'; path: string; value: unknown }
+  | { op: 'remove'; path: string };
+
+export interface CatalogManifestEntry {
+  hash: string;
+  bytes: number;
+  patch?: { from: string; path: string };
+}
+
+export interface CatalogManifest {
+  version: number;
+  files: Record<string, Record<string, CatalogManifestEntry>>;
+  /** Hash per route chunk, e.g. chunks['de-DE']['_routes/Landing'] */
+  chunks?: Record<string, Record<string, string>>;
+  /** Subset font stylesheet per locale (see localeFonts.ts) */
+  fonts?: Record<string, string>;
+}
+
+export interface CachedCatalog {
+  hash: string;
+  data: Record<string, unknown>;
+}
+
+const unescapeToken = (token: string): string => token.replace(/~1/g, '/').replace(/~0/g, '~');
+
+/**
+ * Apply patch operations to a catalog and return the patched copy
+ */
+export const applyCatalogPatch = <T>(catalog: T, ops: CatalogPatchOp[]): T => {
+  let document: unknown = structuredClone(catalog);
+
+  for (const op of ops) {
+    const tokens = op.path.split('/').slice(1).map(unescapeToken);
+    if (tokens.length === 0) {
+      document = op.op === 'remove' ? undefined : structuredClone(op.value);
+      continue;
+    }
+
+    let parent = document as Record<string, unknown> | unknown[];
+    for (const token of tokens.slice(0, -1)) {
+      parent = (Array.isArray(parent) ? parent[Number(token)] : parent[token]) as typeof parent;
+    }
+
+    const last = tokens[tokens.length - 1];
+    if (Array.isArray(parent)) {
+      const index = last === '-' ? parent.length : Number(last);
+      if (op.op === 'add') parent.splice(index, 0, structuredClone(op.value));
+      else if (op.op === 'remove') parent.splice(index, 1);
+      else parent[index] = structuredClone(op.value);
+    } else if (op.op === 'remove') {
+      delete parent[last];
+    } else {
+      parent[last] = structuredClone(op.value);
+    }
+  }
+
+  return document as T;
+};
+
+/**
+ * Bring a cached catalog up to the manifest version.
+ * Returns null when the cache is too old for the published patch, in which
+ * case the caller should fetch the full catalog.
+ */
+export const updateCachedCatalog = async (
+  manifest: CatalogManifest,
+  lng: string,
+  ns: string,
+  cached: CachedCatalog,
+  basePath = '/locales'
+): Promise<CachedCatalog | null> => {
+  const entry = manifest.files[lng]?.[ns];
+  if (!entry) return null;
+  if (entry.hash === cached.hash) return cached;
+  const { patch } = entry;
+  if (!patch || patch.from !== cached.hash) return null;
+
+  const response = await fetch(`${basePath}/${patch.path}`);
+  if (!response.ok) return null;
+
+  const ops = (await response.json()) as CatalogPatchOp[];
+  return { hash: entry.hash, data: applyCatalogPatch(cached.data, ops) };
+};
+
+const PATCH_CACHE = 'locale-catalog-data';
+let manifestRequest: Promise<CatalogManifest | null> | null = null;
+let loadedManifest: CatalogManifest | null = null;
+
+/**
+ * The build manifest, fetched once per page load (null in dev or offline)
+ */
+export const loadCatalogManifest = (basePath = '/locales'): Promise<CatalogManifest | null> => {
+  manifestRequest ??= fetch(`${basePath}/manifest.json`, { cache: 'no-cache' })
+    .then(response => (response.ok ? (response.json() as Promise<CatalogManifest>) : null))
+    .catch(() => null)
+    .then(manifest => (loadedManifest = manifest));
+  return manifestRequest;
+};
+
+const versionedUrl = (path: string, hash: string | undefined): string => (hash ? `${path}?v=${hash}` : path);
+
+/**
+ * URL of a namespace catalog; carries the hash once loadCatalogManifest has resolved
+ */
+export const catalogUrl = (lng: string, ns: string, basePath = '/locales'): string =>
+  versionedUrl(`${basePath}/${lng}/${ns}.json`, loadedManifest?.files[lng]?.[ns]?.hash);
+
+/**
+ * URL of a route chunk such as `_routes/Landing` or `_sampled/3/Landing`
+ */
+export const chunkFileUrl = async (lng: string, path: string, basePath = '/locales'): Promise<string> => {
+  const manifest = await loadCatalogManifest(basePath);
+  return versionedUrl(`${basePath}/${lng}/${path}.json`, manifest?.chunks?.[lng]?.[path]);
+};
+
+const cacheKey = (lng: string, ns: string): string => `/locale-catalog-data/${lng}/${ns}`;
+
+/**
+ * Load a catalog from the copy kept by rememberCatalog, patched up to the
+ * current manifest. Resolves null when there is no usable copy.
+ */
+export const loadPatchedCatalog = async (lng: string, ns: string): Promise<Record<string, unknown> | null> => {
+  if (!('caches' in window)) return null;
+  try {
+    const manifest = await loadCatalogManifest();
+    if (!manifest) return null;
+    const cache = await caches.open(PATCH_CACHE);
+    const stored = await cache.match(cacheKey(lng, ns));
+    if (!stored) return null;
+
+    const cached = (await stored.json()) as CachedCatalog;
+    const updated = await updateCachedCatalog(manifest, lng, ns, cached);
+    if (!updated) return null;
+    if (updated.hash !== cached.hash) {
+      await cache.put(cacheKey(lng, ns), new Response(JSON.stringify(updated)));
+    }
+    return updated.data;
+  } catch {
+    return null;
+  }
+};
+
+/**
+ * Content hash of a catalog body, as locale_build/manifest.py computes it
+ * (the first 12 hex digits of its SHA-256)
+ */
+const contentHash = async (body: string): Promise<string> => {
+  const digest = await crypto.subtle.digest('SHA-256', new TextEncoder().encode(body));
+  return Array.from(new Uint8Array(digest).slice(0, 6), byte => byte.toString(16).padStart(2, '0')).join('');
+};
+
+/**
+ * Keep a fully fetched catalog, so the next build's patch can be applied to it.
+ * It is stored under the hash of the body as received, which may be an older
+ * build than the manifest's (a cache or the worker answered), so a patch is
+ * only ever applied to the version it starts from.
+ */
+export const rememberCatalog = async (lng: string, ns: string, data: Record<string, unknown>, body: string): Promise<void> => {
+  if (!('caches' in window) || !crypto.subtle) return;
+  try {
+    const hash = await contentHash(body);
+    const cache = await caches.open(PATCH_CACHE);
+    await cache.put(cacheKey(lng, ns), new Response(JSON.stringify({ hash, data })));
+  } catch {
+    // Storage full or unavailable - the next visit fetches the full catalog
+  }
+};
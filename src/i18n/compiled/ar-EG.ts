@@ -0,0 +1,145 @@
+// Generated by generate_locales.py from public/locales/ar-EG. Do not edit by hand.
+import type { CompiledCatalog } from '../compiledMessages';
+
+const catalog: CompiledCatalog = {
+  landing: {
+    welcome: {
+      variations: [
+        "أهلاً! 👋 منورين iLaunching. نبدأ؟",
+        "أهلاً! جاهز تبدأ حاجة عظيمة؟",
+        "أهلاً وسهلاً! يلا نبدأ رحلتك.",
+        "أهلاً! إنت في المكان الصح. يلا نبدأ!",
+      ],
+    },
+    welcomeBack: {
+      variations: [
+        "أهلاً بيك تاني! 😊",
+        "أهلاً، أنا فاكرك! منور تاني!",
+        "فرحان إني شايفك تاني!",
+        "إنت راجع تاني! أهلاً بيك!",
+      ],
+    },
+    acknowledge: {
+      variations: [
+        "شكراً! ثانية واحدة...",
+        "تمام، بشوف...",
+        "ثانية، بتأكد...",
+        "وصل! كشف سريع...",
+      ],
+    },
+    checking: {
+      variations: [
+        (p) => "بدور على <strong>" + (p.email ?? '') + "</strong>...",
+        (p) => "بتأكد من <strong>" + (p.email ?? '') + "</strong>...",
+        (p) => "بشوف <strong>" + (p.email ?? '') + "</strong> في النظام...",
+        (p) => "ثانية، بدور على <strong>" + (p.email ?? '') + "</strong>...",
+      ],
+    },
+    wrongFormat: {
+      variations: [
+        "ده مش شكل إيميل صح. تحاول تاني؟",
+        "أوبس! الإيميل غلط. تشيك تاني؟",
+        "فيه حاجة غلط في الإيميل ده. تقدر تشوف؟",
+        "شكل الإيميل غريب. تشيك تاني؟",
+      ],
+    },
+    userNotRegistered: {
+      variations: [
+        "يبدو إنك جديد هنا! ده حلو. عايز تنضم؟",
+        "مشفتكش في النظام لسه. جاهز تبدأ؟",
+        "وش جديد! عايز تعمل حساب؟",
+        "إنت لسه مسجلتش. نغير ده؟",
+      ],
+    },
+    askName: {
+      variations: [
+        "اختيار حلو! اسمك إيه؟",
+        "تمام! أناديك إيه؟",
+        "عظيم! قولي اسمك.",
+        "كويس! اسمك إيه؟",
+      ],
+    },
+    loginPrompt: {
+      variations: [
+        "أهلاً بيك تاني! إيميلك إيه؟",
+        "فرحان إني شايفك تاني! اكتب إيميلك.",
+        "يلا ندخلك. إيميلك إيه؟",
+        "جاهز تدخل؟ قول إيميلك.",
+      ],
+    },
+    passwordPrompt: {
+      variations: [
+        "شايفك! دلوقتي اكتب الباسورد.",
+        "لقيتك! الباسورد إيه؟",
+        "إنت هناك! اكتب الباسورد عشان تكمل.",
+        "فهمت! دلوقتي الباسورد لو سمحت.",
+      ],
+    },
+    passwordCreate: {
+      message: "تمام! دلوقتي نأمن حسابك. اعمل باسورد (8 حروف على الأقل):",
+    },
+    passwordTooShort: {
+      message: "الباسورد لازم يكون 8 حروف على الأقل. تحاول تاني؟",
+    },
+    nameRequired: {
+      message: "محتاج اسمك عشان أكمل. اسمك إيه؟",
+    },
+    errors: {
+      generic: "أوبس! حصل حاجة غلط. حاول تاني.",
+      emailCheck: "فشل التأكد من الإيميل",
+      loginFailed: "الدخول فشل. شيك على بياناتك.",
+      signupFailed: "التسجيل فشل. حاول تاني.",
+    },
+    placeholders: {
+      email: "اكتب إيميلك هنا...",
+      name: "اكتب اسمك...",
+      password_create: "اعمل باسورد (على الأقل 8 حروف)...",
+      password_input: "اكتب الباسورد بتاعك...",
+    },
+    buttons: {
+      yesPlease: "أيوة لو سمحت",
+      logMeIn: "دخول",
+      continueWithoutSignup: "كمل من غير تسجيل",
+    },
+  },
+  messages: {
+    emailSignup: {
+      variations: [
+        "<h1>أهلاً! 🎉</h1><hr /><h2>أهلاً! 🚀</h2>",
+      ],
+    },
+    googleSignup: {
+      variations: [
+        "<h1>أهلاً! 🎉</h1><hr /><h2>أهلاً! 🚀</h2>",
+      ],
+    },
+    facebookSignup: {
+      variations: [
+        "<h1>أهلاً! 🎉</h1><hr /><h2>أهلاً! 🚀</h2>",
+      ],
+    },
+    microsoftSignup: {
+      variations: [
+        "<h1>أهلاً! 🎉</h1><hr /><h2>أهلاً! 🚀</h2>",
+      ],
+    },
+    completion: {
+      title: "✅ خلاص!",
+      subtitle: "كل حاجة جاهزة. قولي لما تكون مستعد تبدأ!",
+    },
+    default: {
+      title: "أهلاً! 🎉",
+      subtitle: "كل حاجة جاهزة. قولي لما تكون مستعد تبدأ!",
+      building: "بيحمل...",
+      joining: "",
+    },
+  },
+};
+
+export default catalog;
+
+// Regenerated while the dev server runs: accept the update instead of
+// reloading the page (liveCatalogs.ts pushes the new strings).
+if (import.meta.hot) {
+  import.meta.hot.accept();
+}
@@ -0,0 +1,151 @@
+// Generated by generate_locales.py from public/locales/ar. Do not edit by hand.
+import type { CompiledCatalog } from '../compiledMessages';
+
+const catalog: CompiledCatalog = {
+  landing: {
+    welcome: {
+      variations: [
+        "مرحباً! 👋 أهلاً بك في iLaunching. هل نبدأ؟",
+        "مرحباً! هل أنت مستعد لبدء شيء رائع؟",
+        "أهلاً وسهلاً! لنبدأ رحلتك.",
+        "مرحباً! أنت في المكان الصحيح. لنبدأ!",
+      ],
+    },
+    welcomeBack: {
+      variations: [
+        "مرحباً بعودتك! 😊",
+        "مرحباً، أتذكرك! أهلاً بعودتك!",
+        "سعيد برؤيتك مرة أخرى!",
+        "أنت هنا مرة أخرى! أهلاً وسهلاً!",
+      ],
+    },
+    acknowledge: {
+      variations: [
+        "شكراً! لحظة واحدة...",
+        "رائع، جارٍ التحقق...",
+        "ثانية واحدة، جارٍ التحقق...",
+        "تم الاستلام! فحص سريع...",
+      ],
+    },
+    checking: {
+      variations: [
+        (p) => "جارٍ البحث عن <strong>" + (p.email ?? '') + "</strong>...",
+        (p) => "جارٍ التحقق من <strong>" + (p.email ?? '') + "</strong>...",
+        (p) => "جارٍ التحقق من <strong>" + (p.email ?? '') + "</strong> في النظام...",
+        (p) => "لحظة، جارٍ البحث عن <strong>" + (p.email ?? '') + "</strong>...",
+      ],
+    },
+    wrongFormat: {
+      variations: [
+        "هممم، هذا لا يبدو بريداً إلكترونياً صحيحاً. حاول مرة أخرى؟",
+        "عفواً! تنسيق البريد الإلكتروني غير صحيح. تحقق مرة أخرى؟",
+        "هناك خطأ في هذا البريد الإلكتروني. هل يمكنك التحقق؟",
+        "تنسيق البريد الإلكتروني يبدو غريباً. تحقق مرة أخرى؟",
+      ],
+    },
+    userNotRegistered: {
+      variations: [
+        "يبدو أنك جديد هنا! هذا مثير. هل تريد الانضمام؟",
+        "لا أراك في النظام بعد. هل أنت مستعد للبدء؟",
+        "وجه جديد! هل تريد إنشاء حساب؟",
+        "أنت غير مسجل بعد. هل نغير ذلك؟",
+      ],
+    },
+    askName: {
+      variations: [
+        "اختيار رائع! ما اسمك؟",
+        "ممتاز! ماذا أناديك؟",
+        "رائع! أخبرني باسمك.",
+        "جيد! ما اسمك؟",
+      ],
+    },
+    loginPrompt: {
+      variations: [
+        "مرحباً بعودتك! ما هو بريدك الإلكتروني؟",
+        "سعيد برؤيتك مرة أخرى! أدخل بريدك الإلكتروني.",
+        "لنقم بتسجيل دخولك. ما هو بريدك الإلكتروني؟",
+        "هل أنت مستعد لتسجيل الدخول؟ شارك بريدك الإلكتروني.",
+      ],
+    },
+    passwordPrompt: {
+      variations: [
+        "أراك! الآن أدخل كلمة المرور.",
+        "وجدتك! ما هي كلمة المرور؟",
+        "أنت هناك! أدخل كلمة المرور للمتابعة.",
+        "فهمت! الآن كلمة المرور، من فضلك.",
+      ],
+    },
+    passwordCreate: {
+      message: "ممتاز! الآن لنؤمن حسابك. أنشئ كلمة مرور (8 أحرف على الأقل):",
+    },
+    passwordTooShort: {
+      message: "يجب أن تكون كلمة المرور 8 أحرف على الأقل. حاول مرة أخرى؟",
+    },
+    nameRequired: {
+      message: "أحتاج اسمك للمتابعة. ما اسمك؟",
+    },
+    errors: {
+      generic: "عفواً! حدث خطأ ما. يرجى المحاولة مرة أخرى.",
+      emailCheck: "فشل التحقق من البريد الإلكتروني",
+      loginFailed: "فشل تسجيل الدخول. تحقق من بيانات الاعتماد.",
+      signupFailed: "فشل التسجيل. يرجى المحاولة مرة أخرى.",
+    },
+    placeholders: {
+      email: "اكتب بريدك الإلكتروني هنا...",
+      name: "أدخل اسمك...",
+      password_create: "أنشئ كلمة مرور (8 أحرف على الأقل)...",
+      password_input: "أدخل كلمة المرور...",
+    },
+    buttons: {
+      yesPlease: "نعم من فضلك",
+      logMeIn: "تسجيل الدخول",
+      continueWithoutSignup: "المتابعة بدون تسجيل",
+    },
+  },
+  messages: {
+    emailSignup: {
+      variations: [
+        "<h1>مثالي! تم التحقق من بريدك الإلكتروني. 🎉</h1><hr /><h2>مرحباً بك! 🚀</h2><p>لنبني شيئاً رائعاً معاً...</p>",
+        "<h1>رائع! تم تأكيد البريد الإلكتروني. ✅</h1><hr /><h2>وقت البدء! 💪</h2><p>هل أنت مستعد لبدء رحلتك؟</p>",
+        "<h1>عظيم! تم التحقق. 🎊</h1><hr /><h2>هيا بنا! 🌟</h2><p>مغامرتك تبدأ الآن...</p>",
+        "<h1>ممتاز! تم تأكيد البريد. ✨</h1><hr /><h2>مرحباً بك في الفريق! 🎯</h2><p>لنصنع شيئاً مميزاً...</p>",
+      ],
+    },
+    googleSignup: {
+      variations: [
+        "<h1>مرحباً! تسجيل الدخول عبر Google ناجح. 🎉</h1><hr /><h2>سعداء برؤيتك! 👋</h2><p>تجربتك الشخصية في انتظارك...</p>",
+        "<h1>أهلاً! تم الاتصال عبر Google. ✅</h1><hr /><h2>هيا بنا! 🚀</h2><p>وقت إنشاء شيء رائع...</p>",
+        "<h1>مثالي! تم ربط حساب Google. 🌟</h1><hr /><h2>مرحباً بعودتك! 💫</h2><p>لنستمر من حيث توقفنا...</p>",
+        "<h1>رائع! اكتمل تسجيل الدخول عبر Google. ✨</h1><hr /><h2>جاهزون للبدء! 🎯</h2><p>رحلتك تبدأ هنا...</p>",
+      ],
+    },
+    facebookSignup: {
+      variations: [
+        "<h1>مرحباً! تسجيل الدخول عبر Facebook ناجح. 🎉</h1><hr /><h2>سعداء بوجودك! 👋</h2><p>تجربتك تبدأ الآن...</p>",
+        "<h1>أهلاً! تم الاتصال عبر Facebook. ✅</h1><hr /><h2>مثالي! 🚀</h2><p>لنصنع شيئاً رائعاً...</p>",
+        "<h1>عظيم! تم ربط حساب Facebook. 🌟</h1><hr /><h2>مرحباً بك في النادي! 💫</h2><p>وقت البدء...</p>",
+        "<h1>ممتاز! اكتمل تسجيل الدخول عبر Facebook. ✨</h1><hr /><h2>هيا بنا! 🎯</h2><p>رحلتك في انتظارك...</p>",
+      ],
+    },
+    microsoftSignup: {
+      variations: [
+        "<h1>مرحباً! تسجيل الدخول عبر Microsoft ناجح. 🎉</h1><hr /><h2>كل شيء جاهز! 👋</h2><p>مساحة العمل الخاصة بك جاهزة...</p>",
+        "<h1>أهلاً! تم الاتصال عبر Microsoft. ✅</h1><hr /><h2>جاهزون للبدء! 🚀</h2><p>لنكن منتجين...</p>",
+        "<h1>عظيم! تم ربط حساب Microsoft. 🌟</h1><hr /><h2>مرحباً بك! 💫</h2><p>وقت البدء...</p>",
+        "<h1>رائع! اكتمل تسجيل الدخول عبر Microsoft. ✨</h1><hr /><h2>هيا بنا! 🎯</h2><p>أدواتك في انتظارك...</p>",
+      ],
+    },
+    completion: {
+      title: "✅ تم الانتهاء!",
+      subtitle: "كل شيء جاهز. دعني أعرف عندما تكون مستعدًا للبدء!",
+    },
+  },
+};
+
+export default catalog;
+
+// Regenerated while the dev server runs: accept the update instead of
+// reloading the page (liveCatalogs.ts pushes the new strings).
+if (import.meta.hot) {
+  import.meta.hot.accept();
+}
@@ -0,0 +1,145 @@
+// Generated by generate_locales.py from public/locales/bg-BG. Do not edit by hand.
+import type { CompiledCatalog } from '../compiledMessages';
+
+const catalog: CompiledCatalog = {
+  landing: {
+    welcome: {
+      variations: [
+        "Здравей! 👋 Добре дошъл в iLaunching. Започваме ли?",
+        "Хей! Готов ли си да започнеш нещо невероятно?",
+        "Добре дошъл! Да започнем пътуването ти.",
+        "Здравей! На правилното място си. Да започваме!",
+      ],
+    },
+    welcomeBack: {
+      variations: [
+        "Добре дошъл отново! 😊",
+        "Хей, помня те! Добре дошъл отново!",
+        "Радвам се да те видя отново!",
+        "Ето те отново! Добре дошъл!",
+      ],
+    },
+    acknowledge: {
+      variations: [
+        "Благодаря! Момент...",
+        "Перфектно, проверявам...",
+        "Секунда, проверявам...",
+        "Получено! Бърза проверка...",
+      ],
+    },
+    checking: {
+      variations: [
+        (p) => "Търся <strong>" + (p.email ?? '') + "</strong>...",
+        (p) => "Проверявам <strong>" + (p.email ?? '') + "</strong>...",
+        (p) => "Проверявам <strong>" + (p.email ?? '') + "</strong> в системата...",
+        (p) => "Момент, търся <strong>" + (p.email ?? '') + "</strong>...",
+      ],
+    },
+    wrongFormat: {
+      variations: [
+        "Хмм, това не изглежда като валиден имейл. Опитай пак?",
+        "Опа! Невалиден формат на имейл. Провери отново?",
+        "Нещо не е наред с този имейл. Можеш ли да провериш?",
+        "Този формат на имейл изглежда странно. Провери отново?",
+      ],
+    },
+    userNotRegistered: {
+      variations: [
+        "Изглежда си нов тук! Вълнуващо е. Искаш ли да се присъединиш?",
+        "Още не те виждам в системата. Готов ли си да започнеш?",
+        "Ново лице! Искаш ли да създадеш профил?",
+        "Още не си регистриран. Да променим това?",
+      ],
+    },
+    askName: {
+      variations: [
+        "Страхотен избор! Как се казваш?",
+        "Перфектно! Как да те наричам?",
+        "Чудесно! Кажи ми името си.",
+        "Добре! Как се казваш?",
+      ],
+    },
+    loginPrompt: {
+      variations: [
+        "Добре дошъл отново! Какъв е имейлът ти?",
+        "Радвам се да те видя отново! Въведи имейла си.",
+        "Да те влезем. Какъв е имейлът ти?",
+        "Готов ли си да влезеш? Сподели имейла си.",
+      ],
+    },
+    passwordPrompt: {
+      variations: [
+        "Виждам те! Сега въведи паролата си.",
+        "Намерих те! Каква е паролата ти?",
+        "Ето те! Въведи паролата си за да продължиш.",
+        "Разбрах! Сега паролата ти, моля.",
+      ],
+    },
+    passwordCreate: {
+      message: "Перфектно! Сега да защитим профила ти. Създай парола (поне 8 символа):",
+    },
+    passwordTooShort: {
+      message: "Паролата ти трябва да е поне 8 символа. Опитай пак?",
+    },
+    nameRequired: {
+      message: "Трябва ми името ти за да продължа. Как се казваш?",
+    },
+    errors: {
+      generic: "Опа! Нещо се обърка. Моля опитай отново.",
+      emailCheck: "Проверката на имейла се провали",
+      loginFailed: "Влизането се провали. Провери данните си.",
+      signupFailed: "Регистрацията се провали. Моля опитай отново.",
+    },
+    placeholders: {
+      email: "Въведете вашия имейл тук...",
+      name: "Въведете вашето име...",
+      password_create: "Създайте парола (минимум 8 знака)...",
+      password_input: "Въведете вашата парола...",
+    },
+    buttons: {
+      yesPlease: "Да, Моля",
+      logMeIn: "Влизане",
+      continueWithoutSignup: "Продължете без регистрация",
+    },
+  },
+  messages: {
+    emailSignup: {
+      variations: [
+        "<h1>Добре дошли! 🎉</h1><hr /><h2>Добре дошли! 🚀</h2>",
+      ],
+    },
+    googleSignup: {
+      variations: [
+        "<h1>Добре дошли! 🎉</h1><hr /><h2>Добре дошли! 🚀</h2>",
+      ],
+    },
+    facebookSignup: {
+      variations: [
+        "<h1>Добре дошли! 🎉</h1><hr /><h2>Добре дошли! 🚀</h2>",
+      ],
+    },
+    microsoftSignup: {
+      variations: [
+        "<h1>Добре дошли! 🎉</h1><hr /><h2>Добре дошли! 🚀</h2>",
+      ],
+    },
+    completion: {
+      title: "✅ Готово!",
+      subtitle: "Всичко е готово. Уведомете ме, когато сте готови да започнете!",
+    },
+    default: {
+      title: "Добре дошли! 🎉",
+      subtitle: "Всичко е готово. Уведомете ме, когато сте готови да започнете!",
+      building: "Зареждане...",
+      joining: "",
+    },
+  },
+};
+
+export default catalog;
+
+// Regenerated while the dev server runs: accept the update instead of
+// reloading the page (liveCatalogs.ts pushes the new strings).
+if (import.meta.hot) {
+  import.meta.hot.accept();
+}
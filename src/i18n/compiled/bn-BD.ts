@@ -0,0 +1,145 @@
+// Generated by generate_locales.py from public/locales/bn-BD. Do not edit by hand.
+import type { CompiledCatalog } from '../compiledMessages';
+
+const catalog: CompiledCatalog = {
+  landing: {
+    welcome: {
+      variations: [
+        "হ্যালো! 👋 iLaunching-এ স্বাগতম। শুরু করি?",
+        "হেই! কিছু দুর্দান্ত শুরু করতে প্রস্তুত?",
+        "স্বাগতম! আসুন আপনার যাত্রা শুরু করি।",
+        "হ্যালো! আপনি সঠিক জায়গায় আছেন। চলুন শুরু করি!",
+      ],
+    },
+    welcomeBack: {
+      variations: [
+        "আবার স্বাগতম! 😊",
+        "হেই, আমি মনে রেখেছি! আবার স্বাগতম!",
+        "আপনাকে আবার দেখে ভালো লাগলো!",
+        "আপনি আবার এসেছেন! স্বাগতম!",
+      ],
+    },
+    acknowledge: {
+      variations: [
+        "ধন্যবাদ! একটু অপেক্ষা করুন...",
+        "পারফেক্ট, চেক করছি...",
+        "একসেকেন্ড, যাচাই করছি...",
+        "পেয়েছি! দ্রুত চেক...",
+      ],
+    },
+    checking: {
+      variations: [
+        (p) => "<strong>" + (p.email ?? '') + "</strong> খুঁজছি...",
+        (p) => "<strong>" + (p.email ?? '') + "</strong> চেক করছি...",
+        (p) => "সিস্টেমে <strong>" + (p.email ?? '') + "</strong> চেক করছি...",
+        (p) => "একটু অপেক্ষা করুন, <strong>" + (p.email ?? '') + "</strong> খুঁজছি...",
+      ],
+    },
+    wrongFormat: {
+      variations: [
+        "হুম, এটি বৈধ ইমেইল মনে হচ্ছে না। আবার চেষ্টা করবেন?",
+        "ওহ! অবৈধ ইমেইল ফরম্যাট। আবার চেক করবেন?",
+        "ঐ ইমেইলে কিছু সমস্যা আছে। আপনি কি চেক করতে পারেন?",
+        "ঐ ইমেইল ফরম্যাট অদ্ভুত লাগছে। আবার চেক করবেন?",
+      ],
+    },
+    userNotRegistered: {
+      variations: [
+        "মনে হচ্ছে আপনি এখানে নতুন! এটা উত্তেজনাপূর্ণ। যোগ দিতে চান?",
+        "আমি এখনো সিস্টেমে আপনাকে দেখতে পাচ্ছি না। শুরু করতে প্রস্তুত?",
+        "নতুন মুখ! অ্যাকাউন্ট তৈরি করতে চান?",
+        "আপনি এখনো নিবন্ধিত নন। আমরা কি এটা পরিবর্তন করব?",
+      ],
+    },
+    askName: {
+      variations: [
+        "দুর্দান্ত পছন্দ! আপনার নাম কি?",
+        "পারফেক্ট! আমি আপনাকে কী বলব?",
+        "চমৎকার! আমাকে আপনার নাম বলুন।",
+        "ভালো! আপনার নাম কি?",
+      ],
+    },
+    loginPrompt: {
+      variations: [
+        "আবার স্বাগতম! আপনার ইমেইল কী?",
+        "আপনাকে আবার দেখে ভালো লাগলো! আপনার ইমেইল দিন।",
+        "আসুন আপনাকে লগইন করাই। আপনার ইমেইল কী?",
+        "লগইন করতে প্রস্তুত? আপনার ইমেইল শেয়ার করুন।",
+      ],
+    },
+    passwordPrompt: {
+      variations: [
+        "আমি আপনাকে দেখতে পাচ্ছি! এখন আপনার পাসওয়ার্ড দিন।",
+        "খুঁজে পেয়েছি! আপনার পাসওয়ার্ড কী?",
+        "আপনি সেখানে আছেন! চালিয়ে যেতে পাসওয়ার্ড দিন।",
+        "বুঝেছি! এখন আপনার পাসওয়ার্ড, প্লিজ।",
+      ],
+    },
+    passwordCreate: {
+      message: "পারফেক্ট! এখন আসুন আপনার অ্যাকাউন্ট সুরক্ষিত করি। একটি পাসওয়ার্ড তৈরি করুন (কমপক্ষে ৮টি অক্ষর):",
+    },
+    passwordTooShort: {
+      message: "আপনার পাসওয়ার্ড কমপক্ষে ৮টি অক্ষর হতে হবে। আবার চেষ্টা করবেন?",
+    },
+    nameRequired: {
+      message: "চালিয়ে যেতে আমার আপনার নাম দরকার। আপনার নাম কী?",
+    },
+    errors: {
+      generic: "ওহ! কিছু ভুল হয়েছে। অনুগ্রহ করে আবার চেষ্টা করুন।",
+      emailCheck: "ইমেইল চেক ব্যর্থ হয়েছে",
+      loginFailed: "লগইন ব্যর্থ হয়েছে। আপনার তথ্য চেক করুন।",
+      signupFailed: "সাইনআপ ব্যর্থ হয়েছে। অনুগ্রহ করে আবার চেষ্টা করুন।",
+    },
+    placeholders: {
+      email: "আপনার ইমেইল এখানে টাইপ করুন...",
+      name: "আপনার নাম লিখুন...",
+      password_create: "একটি পাসওয়ার্ড তৈরি করুন (কমপক্ষে ৮টি অক্ষর)...",
+      password_input: "আপনার পাসওয়ার্ড লিখুন...",
+    },
+    buttons: {
+      yesPlease: "হ্যাঁ, অনুগ্রহ করে",
+      logMeIn: "লগ ইন করুন",
+      continueWithoutSignup: "সাইন আপ ছাড়া চালিয়ে যান",
+    },
+  },
+  messages: {
+    emailSignup: {
+      variations: [
+        "<h1>স্বাগতম! 🎉</h1><hr /><h2>স্বাগতম! 🚀</h2>",
+      ],
+    },
+    googleSignup: {
+      variations: [
+        "<h1>স্বাগতম! 🎉</h1><hr /><h2>স্বাগতম! 🚀</h2>",
+      ],
+    },
+    facebookSignup: {
+      variations: [
+        "<h1>স্বাগতম! 🎉</h1><hr /><h2>স্বাগতম! 🚀</h2>",
+      ],
+    },
+    microsoftSignup: {
+      variations: [
+        "<h1>স্বাগতম! 🎉</h1><hr /><h2>স্বাগতম! 🚀</h2>",
+      ],
+    },
+    completion: {
+      title: "✅ সম্পন্ন!",
+      subtitle: "সবকিছু প্রস্তুত। আপনি শুরু করার জন্য প্রস্তুত হলে আমাকে জানান!",
+    },
+    default: {
+      title: "স্বাগতম! 🎉",
+      subtitle: "সবকিছু প্রস্তুত। আপনি শুরু করার জন্য প্রস্তুত হলে আমাকে জানান!",
+      building: "লোড হচ্ছে...",
+      joining: "",
+    },
+  },
+};
+
+export default catalog;
+
+// Regenerated while the dev server runs: accept the update instead of
+// reloading the page (liveCatalogs.ts pushes the new strings).
+if (import.meta.hot) {
+  import.meta.hot.accept();
+}
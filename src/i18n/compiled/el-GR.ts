@@ -0,0 +1,45 @@
+// Generated by generate_locales.py from public/locales/el-GR. Do not edit by hand.
+import type { CompiledCatalog } from '../compiledMessages';
+
+const catalog: CompiledCatalog = {
+  messages: {
+    emailSignup: {
+      variations: [
+        "<h1>Καλώς ήρθατε! 🎉</h1><hr /><h2>Καλώς ήρθατε! 🚀</h2>",
+      ],
+    },
+    googleSignup: {
+      variations: [
+        "<h1>Καλώς ήρθατε! 🎉</h1><hr /><h2>Καλώς ήρθατε! 🚀</h2>",
+      ],
+    },
+    facebookSignup: {
+      variations: [
+        "<h1>Καλώς ήρθατε! 🎉</h1><hr /><h2>Καλώς ήρθατε! 🚀</h2>",
+      ],
+    },
+    microsoftSignup: {
+      variations: [
+        "<h1>Καλώς ήρθατε! 🎉</h1><hr /><h2>Καλώς ήρθατε! 🚀</h2>",
+      ],
+    },
+    completion: {
+      title: "✅ Ολοκληρώθηκε!",
+      subtitle: "Όλα είναι έτοιμα. Ενημέρωσέ με όταν είσαι έτοιμος να ξεκινήσεις!",
+    },
+    default: {
+      title: "Καλώς ήρθατε! 🎉",
+      subtitle: "Όλα είναι έτοιμα. Ενημέρωσέ με όταν είσαι έτοιμος να ξεκινήσεις!",
+      building: "Φόρτωση...",
+      joining: "",
+    },
+  },
+};
+
+export default catalog;
+
+// Regenerated while the dev server runs: accept the update instead of
+// reloading the page (liveCatalogs.ts pushes the new strings).
+if (import.meta.hot) {
+  import.meta.hot.accept();
+}
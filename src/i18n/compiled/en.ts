@@ -0,0 +1,157 @@
+// Generated by generate_locales.py from public/locales/en. Do not edit by hand.
+import type { CompiledCatalog } from '../compiledMessages';
+
+const catalog: CompiledCatalog = {
+  landing: {
+    welcome: {
+      variations: [
+        "You're at iLaunching, where ideas turn into brands that actually matter. I'm i. I don't do pitches. I help you move. What's your email so I can see if we've met before?",
+        "Welcome to iLaunching. You showed up early. That's already the right move. I'm i, and I'm here to clear the path, not sell you on it. Drop your email and let's see if you're already in the system.",
+        "This is iLaunching, the place where founders build faster than they thought possible. I'm i. Think of me as the quiet partner who just gets it done. What's your email? Let me check if we know each other.",
+        "You found iLaunching. Good timing. I'm i, built to help you skip the noise and build something real. Share your email so I can see if we've worked together before.",
+      ],
+    },
+    welcomeBack: {
+      variations: [
+        "Back already? I like your energy. I'm i, and I'm right here waiting. What's your email again?",
+        "You're back! Good. That means you're serious. I'm i. Drop your email and let's pick up where we left off.",
+        "Welcome back to iLaunching. Ready to dive in this time? I'm i. What's your email so we can get moving?",
+        "Second look? Smart move. I'm i, and I'm still here ready to help you build. What's your email?",
+      ],
+    },
+    acknowledge: {
+      variations: [
+        "Thank you! Just a moment while I check that.",
+        "Got it! Give me a second to look you up.",
+        "Perfect! Let me see what we have here.",
+        "Thanks! Checking our system now.",
+      ],
+    },
+    checking: {
+      variations: [
+        (p) => "Perfect! Let me check if " + (p.email ?? '') + " is in our system.",
+        (p) => "Got it! Looking up " + (p.email ?? '') + " now.",
+        (p) => "Excellent! Searching for " + (p.email ?? '') + " in our records.",
+        (p) => "Thanks! Let me see if " + (p.email ?? '') + " is already with us.",
+      ],
+    },
+    wrongFormat: {
+      variations: [
+        "That's not an email. Try again with something that looks like one.",
+        "I need a real email to move forward. Check the format.",
+        "That doesn't work. Use a proper email address.",
+        "Not quite. Make sure it's a valid email format.",
+      ],
+    },
+    userNotRegistered: {
+      variations: [
+        "Looks like you're new here! That's exciting. Want to join?",
+        "I don't see you in the system yet. Ready to get started?",
+        "New face! Would you like to create an account?",
+        "You're not registered yet. Shall we change that?",
+      ],
+    },
+    askName: {
+      variations: [
+        "Great choice! What's your name?",
+        "Perfect! What should I call you?",
+        "Awesome! Let me know your name.",
+        "Nice! What's your name?",
+      ],
+    },
+    loginPrompt: {
+      variations: [
+        "Welcome back! What's your email?",
+        "Good to see you again! Enter your email.",
+        "Let's get you logged in. What's your email?",
+        "Ready to log in? Share your email.",
+      ],
+    },
+    passwordPrompt: {
+      variations: [
+        "I see you! Now enter your password.",
+        "Found you! What's your password?",
+        "There you are! Enter your password to continue.",
+        "Got it! Now your password, please.",
+      ],
+    },
+    passwordCreate: {
+      message: "Perfect! Now let's secure your account. Create a password (at least 8 characters):",
+    },
+    passwordTooShort: {
+      message: "Your password needs to be at least 8 characters long. Try again?",
+    },
+    nameRequired: {
+      message: "I'll need your name to continue. What should I call you?",
+    },
+    errors: {
+      generic: "Oops! Something went wrong. Please try again.",
+      emailCheck: "Failed to check email",
+      loginFailed: "Login failed. Check your credentials.",
+      signupFailed: "Signup failed. Please try again.",
+    },
+    placeholders: {
+      email: "Type your email here...",
+      name: "Enter your name...",
+      password_create: "Create a password (at least 8 characters)...",
+      password_input: "Enter your password...",
+    },
+    buttons: {
+      yesPlease: "Yes Please",
+      logMeIn: "Log Me In",
+      continueWithoutSignup: "Continue without signing up",
+    },
+  },
+  messages: {
+    emailSignup: {
+      variations: [
+        "<h1>Perfect! Your email is verified. 🎉</h1><hr /><h2>Welcome to the network! 🚀</h2><p>I'm building your personal hub inside our global network...</p><p>✨ <strong>You're joining thousands of creators</strong> who are already launching their dreams.</p>",
+        "<h1>Email confirmed! You're all set. ✨</h1><hr /><h2>Welcome aboard! 🚀</h2><p>Setting up your personal workspace right now...</p><p>💫 <strong>Join thousands of creators</strong> already building their future here.</p>",
+        "<h1>Verified! Let's get you started. 🎯</h1><hr /><h2>Welcome to the community! 🌟</h2><p>Creating your hub in our global network...</p><p>🚀 <strong>You're now part of something special</strong> — thousands of dreamers launching together.</p>",
+        "<h1>Great! Your email checks out. ✅</h1><hr /><h2>Welcome to the network! 🎉</h2><p>Building your personal command center...</p><p>⭐ <strong>Thousands of creators</strong> are already here, and now you are too!</p>",
+      ],
+    },
+    googleSignup: {
+      variations: [
+        "<h1>Thank you, Google! 🙏</h1><p>Your seamless authentication just made getting started so much easier.</p><hr /><h2>Welcome to the network! 🎉</h2><p>I'm building your personal hub inside our global network right now...</p><p>✨ <strong>You're joining thousands of creators</strong> who are already launching their dreams.</p>",
+        "<h1>Thanks for using Google! 🚀</h1><p>Quick and secure — exactly what we love to see.</p><hr /><h2>Welcome aboard! 🌟</h2><p>Setting up your workspace in our global network...</p><p>💫 <strong>Thousands of creators</strong> are already here building their future.</p>",
+        "<h1>Google makes it easy! ✨</h1><p>Appreciate the smooth authentication experience.</p><hr /><h2>Welcome to the community! 🎯</h2><p>Creating your personal hub right now...</p><p>🚀 <strong>You're now part of something special</strong> with thousands of dreamers.</p>",
+        "<h1>Google, you're the best! 🎉</h1><p>Seamless sign-in means we can get you started faster.</p><hr /><h2>Welcome to the network! ⚡</h2><p>Building your command center...</p><p>⭐ <strong>Join thousands of creators</strong> already launching their dreams here.</p>",
+      ],
+    },
+    facebookSignup: {
+      variations: [
+        "<h1>Thank you, Facebook! 🙏</h1><p>Your seamless authentication just made getting started so much easier.</p><hr /><h2>Welcome to the network! 🎉</h2><p>I'm building your personal hub inside our global network right now...</p><p>✨ <strong>You're joining thousands of creators</strong> who are already launching their dreams.</p>",
+        "<h1>Thanks for using Facebook! 🚀</h1><p>Quick and secure — exactly what we love to see.</p><hr /><h2>Welcome aboard! 🌟</h2><p>Setting up your workspace in our global network...</p><p>💫 <strong>Thousands of creators</strong> are already here building their future.</p>",
+        "<h1>Facebook makes it easy! ✨</h1><p>Appreciate the smooth authentication experience.</p><hr /><h2>Welcome to the community! 🎯</h2><p>Creating your personal hub right now...</p><p>🚀 <strong>You're now part of something special</strong> with thousands of dreamers.</p>",
+        "<h1>Facebook, you're awesome! 🎉</h1><p>Seamless sign-in means we can get you started faster.</p><hr /><h2>Welcome to the network! ⚡</h2><p>Building your command center...</p><p>⭐ <strong>Join thousands of creators</strong> already launching their dreams here.</p>",
+      ],
+    },
+    microsoftSignup: {
+      variations: [
+        "<h1>Thank you, Microsoft! 🙏</h1><p>Your seamless authentication just made getting started so much easier.</p><hr /><h2>Welcome to the network! 🎉</h2><p>I'm building your personal hub inside our global network right now...</p><p>✨ <strong>You're joining thousands of creators</strong> who are already launching their dreams.</p>",
+        "<h1>Thanks for using Microsoft! 🚀</h1><p>Quick and secure — exactly what we love to see.</p><hr /><h2>Welcome aboard! 🌟</h2><p>Setting up your workspace in our global network...</p><p>💫 <strong>Thousands of creators</strong> are already here building their future.</p>",
+        "<h1>Microsoft makes it easy! ✨</h1><p>Appreciate the smooth authentication experience.</p><hr /><h2>Welcome to the community! 🎯</h2><p>Creating your personal hub right now...</p><p>🚀 <strong>You're now part of something special</strong> with thousands of dreamers.</p>",
+        "<h1>Microsoft, you're the best! 🎉</h1><p>Seamless sign-in means we can get you started faster.</p><hr /><h2>Welcome to the network! ⚡</h2><p>Building your command center...</p><p>⭐ <strong>Join thousands of creators</strong> already launching their dreams here.</p>",
+      ],
+    },
+    completion: {
+      title: "✅ All done!",
+      subtitle: "Everything is ready. Let me know when you're ready to get started!",
+    },
+    default: {
+      title: "Welcome to the network! 🎉",
+      subtitle: "Your account is ready!",
+      building: "I'm building your personal hub inside our global network right now...",
+      joining: "✨ <strong>You're joining thousands of creators</strong> who are already launching their dreams.",
+    },
+  },
+};
+
+export default catalog;
+
+// Regenerated while the dev server runs: accept the update instead of
+// reloading the page (liveCatalogs.ts pushes the new strings).
+if (import.meta.hot) {
+  import.meta.hot.accept();
+}
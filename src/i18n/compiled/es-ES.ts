@@ -0,0 +1,146 @@
+// Generated by generate_locales.py from public/locales/es-ES. Do not edit by hand.
+import type { CompiledCatalog } from '../compiledMessages';
+
+const catalog: CompiledCatalog = {
+  landing: {
+    welcome: {
+      variations: [
+        "Estás en iLaunching, donde las ideas se convierten en marcas que realmente importan. Soy i. No hago presentaciones. Te ayudo a avanzar. ¿Cuál es tu email para ver si ya nos conocemos?",
+        "Bienvenido a iLaunching. Llegaste temprano. Ya es el movimiento correcto. Soy i, y estoy aquí para despejar el camino, no para vendértelo. Comparte tu email y veamos si ya estás en el sistema.",
+        "Esto es iLaunching, el lugar donde los fundadores construyen más rápido de lo que pensaban posible. Soy i. Piensa en mí como el socio silencioso que simplemente hace las cosas. ¿Cuál es tu email? Déjame verificar si nos conocemos.",
+        "Encontraste iLaunching. Buen momento. Soy i, construido para ayudarte a saltarte el ruido y construir algo real. Comparte tu email para ver si hemos trabajado juntos antes.",
+      ],
+    },
+    welcomeBack: {
+      variations: [
+        "¿Ya de vuelta? Me gusta tu energía. Soy i, y estoy aquí esperando. ¿Cuál es tu email otra vez?",
+        "¡Has vuelto! Bien. Eso significa que lo tomas en serio. Soy i. Comparte tu email y continuemos donde lo dejamos.",
+        "Bienvenido de nuevo a iLaunching. ¿Listo para sumergirte esta vez? Soy i. ¿Cuál es tu email para que podamos empezar?",
+        "¿Segunda mirada? Movimiento inteligente. Soy i, y todavía estoy aquí listo para ayudarte a construir. ¿Cuál es tu email?",
+      ],
+    },
+    acknowledge: {
+      variations: [
+        "¡Gracias! Un momento mientras verifico eso.",
+        "¡Entendido! Dame un segundo para buscarte.",
+        "¡Perfecto! Déjame ver qué tenemos aquí.",
+        "¡Gracias! Verificando nuestro sistema ahora.",
+      ],
+    },
+    checking: {
+      variations: [
+        (p) => "¡Perfecto! Déjame verificar si " + (p.email ?? '') + " está en nuestro sistema.",
+        (p) => "¡Entendido! Buscando " + (p.email ?? '') + " ahora.",
+        (p) => "¡Excelente! Buscando " + (p.email ?? '') + " en nuestros registros.",
+        (p) => "¡Gracias! Déjame ver si " + (p.email ?? '') + " ya está con nosotros.",
+      ],
+    },
+    wrongFormat: {
+      variations: [
+        "Eso no es un email. Intenta de nuevo con algo que parezca uno.",
+        "Necesito un email real para avanzar. Verifica el formato.",
+        "Eso no funciona. Usa una dirección de email válida.",
+        "No del todo. Asegúrate de que sea un formato de email válido.",
+      ],
+    },
+    userNotRegistered: {
+      variations: [
+        "¡Parece que eres nuevo aquí! Eso es emocionante. ¿Quieres unirte?",
+        "Todavía no te veo en el sistema. ¿Listo para empezar?",
+        "¡Cara nueva! ¿Te gustaría crear una cuenta?",
+        "Aún no estás registrado. ¿Lo cambiamos?",
+      ],
+    },
+    askName: {
+      variations: [
+        "¡Gran elección! ¿Cuál es tu nombre?",
+        "¡Perfecto! ¿Cómo te llamo?",
+        "¡Genial! Dime tu nombre.",
+        "¡Bien! ¿Cuál es tu nombre?",
+      ],
+    },
+    loginPrompt: {
+      variations: [
+        "¡Bienvenido de nuevo! ¿Cuál es tu email?",
+        "¡Qué bueno verte otra vez! Ingresa tu email.",
+        "Vamos a iniciar sesión. ¿Cuál es tu email?",
+        "¿Listo para entrar? Comparte tu email.",
+      ],
+    },
+    passwordPrompt: {
+      variations: [
+        "¡Te veo! Ahora ingresa tu contraseña.",
+        "¡Te encontré! ¿Cuál es tu contraseña?",
+        "¡Ahí estás! Ingresa tu contraseña para continuar.",
+        "¡Entendido! Ahora tu contraseña, por favor.",
+      ],
+    },
+    passwordCreate: {
+      message: "¡Perfecto! Ahora aseguremos tu cuenta. Crea una contraseña (mínimo 8 caracteres):",
+    },
+    passwordTooShort: {
+      message: "Tu contraseña debe tener al menos 8 caracteres. ¿Intentas de nuevo?",
+    },
+    nameRequired: {
+      message: "Necesitaré tu nombre para continuar. ¿Cómo te llamas?",
+    },
+    errors: {
+      generic: "¡Ups! Algo salió mal. Inténtalo de nuevo.",
+      emailCheck: "Error al verificar el email",
+      loginFailed: "Error de inicio de sesión. Verifica tus credenciales.",
+      signupFailed: "Error al registrarse. Inténtalo de nuevo.",
+    },
+    placeholders: {
+      email: "Escribe tu correo aquí...",
+      name: "Ingresa tu nombre...",
+      password_create: "Crea una contraseña (mínimo 8 caracteres)...",
+      password_input: "Ingresa tu contraseña...",
+    },
+    buttons: {
+      yesPlease: "Sí, Por Favor",
+      logMeIn: "Iniciar Sesión",
+      continueWithoutSignup: "Continuar sin registrarse",
+    },
+  },
+  messages: {
+    emailSignup: {
+      variations: [
+        "<h1>¡Perfecto! Tu correo está verificado. 🎉</h1><hr /><h2>¡Bienvenido a la red! 🚀</h2><p>Estoy construyendo tu centro personal dentro de nuestra red global...</p><p>✨ <strong>Te unes a miles de creadores</strong> que ya están lanzando sus sueños.</p>",
+        "<h1>¡Correo confirmado! Todo listo. ✨</h1><hr /><h2>¡Bienvenido a bordo! 🚀</h2><p>Configurando tu espacio de trabajo personal ahora...</p><p>💫 <strong>Miles de creadores</strong> ya están aquí construyendo su futuro.</p>",
+      ],
+    },
+    googleSignup: {
+      variations: [
+        "<h1>¡Gracias, Google! 🙏</h1><p>Tu autenticación perfecta hizo que comenzar fuera mucho más fácil.</p><hr /><h2>¡Bienvenido a la red! 🎉</h2><p>Estoy construyendo tu centro personal dentro de nuestra red global ahora...</p><p>✨ <strong>Te unes a miles de creadores</strong> que ya están lanzando sus sueños.</p>",
+      ],
+    },
+    facebookSignup: {
+      variations: [
+        "<h1>¡Gracias, Facebook! 🙏</h1><p>Tu autenticación perfecta hizo que comenzar fuera mucho más fácil.</p><hr /><h2>¡Bienvenido a la red! 🎉</h2><p>Estoy construyendo tu centro personal dentro de nuestra red global ahora...</p><p>✨ <strong>Te unes a miles de creadores</strong> que ya están lanzando sus sueños.</p>",
+      ],
+    },
+    microsoftSignup: {
+      variations: [
+        "<h1>¡Gracias, Microsoft! 🙏</h1><p>Tu autenticación perfecta hizo que comenzar fuera mucho más fácil.</p><hr /><h2>¡Bienvenido a la red! 🎉</h2><p>Estoy construyendo tu centro personal dentro de nuestra red global ahora...</p><p>✨ <strong>Te unes a miles de creadores</strong> que ya están lanzando sus sueños.</p>",
+      ],
+    },
+    completion: {
+      title: "✅ ¡Todo listo!",
+      subtitle: "Todo está preparado. ¡Avísame cuando estés listo para empezar!",
+    },
+    default: {
+      title: "¡Bienvenido a la red! 🎉",
+      subtitle: "¡Tu cuenta está lista!",
+      building: "Estoy construyendo tu centro personal dentro de nuestra red global ahora...",
+      joining: "✨ <strong>Te unes a miles de creadores</strong> que ya están lanzando sus sueños.",
+    },
+  },
+};
+
+export default catalog;
+
+// Regenerated while the dev server runs: accept the update instead of
+// reloading the page (liveCatalogs.ts pushes the new strings).
+if (import.meta.hot) {
+  import.meta.hot.accept();
+}
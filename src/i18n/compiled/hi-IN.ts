@@ -0,0 +1,142 @@
+// Generated by generate_locales.py from public/locales/hi-IN. Do not edit by hand.
+import type { CompiledCatalog } from '../compiledMessages';
+
+const catalog: CompiledCatalog = {
+  landing: {
+    welcome: {
+      variations: [
+        "नमस्ते! 👋 iLaunching में आपका स्वागत है। शुरू करें?",
+        "नमस्ते! कुछ शानदार शुरू करने के लिए तैयार हैं?",
+        "स्वागत है! आइए अपनी यात्रा शुरू करें।",
+        "नमस्ते! आप सही जगह पर हैं। चलिए शुरू करते हैं!",
+      ],
+    },
+    welcomeBack: {
+      variations: [
+        "वापसी पर स्वागत है! 😊",
+        "अरे, मुझे याद है! वापसी पर स्वागत है!",
+        "आपको फिर से देखकर खुशी हुई!",
+        "आप फिर आ गए! स्वागत है!",
+      ],
+    },
+    acknowledge: {
+      variations: [
+        "धन्यवाद! एक क्षण...",
+        "बढ़िया, जाँच रहे हैं...",
+        "एक सेकंड, सत्यापित कर रहे हैं...",
+        "प्राप्त हुआ! त्वरित जाँच...",
+      ],
+    },
+    checking: {
+      variations: [
+        (p) => "<strong>" + (p.email ?? '') + "</strong> की खोज कर रहे हैं...",
+        (p) => "<strong>" + (p.email ?? '') + "</strong> की जाँच कर रहे हैं...",
+        (p) => "सिस्टम में <strong>" + (p.email ?? '') + "</strong> की जाँच कर रहे हैं...",
+        (p) => "एक क्षण, <strong>" + (p.email ?? '') + "</strong> की खोज कर रहे हैं...",
+      ],
+    },
+    wrongFormat: {
+      variations: [
+        "हम्म, यह वैध ईमेल नहीं लगता। फिर से कोशिश करें?",
+        "ओह! अमान्य ईमेल प्रारूप। फिर से जाँचें?",
+        "उस ईमेल में कुछ गलत है। क्या आप जाँच सकते हैं?",
+        "वह ईमेल प्रारूप अजीब लगता है। फिर से जाँचें?",
+      ],
+    },
+    userNotRegistered: {
+      variations: [
+        "लगता है आप यहाँ नए हैं! यह रोमांचक है। शामिल होना चाहते हैं?",
+        "मुझे अभी तक सिस्टम में आप नहीं दिख रहे। शुरू करने के लिए तैयार हैं?",
+        "नया चेहरा! खाता बनाना चाहते हैं?",
+        "आप अभी तक पंजीकृत नहीं हैं। क्या हम इसे बदल दें?",
+      ],
+    },
+    askName: {
+      variations: [
+        "बढ़िया चुनाव! आपका नाम क्या है?",
+        "परफेक्ट! मुझे आपको क्या बुलाना चाहिए?",
+        "शानदार! मुझे अपना नाम बताएं।",
+        "अच्छा! आपका नाम क्या है?",
+      ],
+    },
+    loginPrompt: {
+      variations: [
+        "वापसी पर स्वागत है! आपका ईमेल क्या है?",
+        "आपको फिर से देखकर खुशी हुई! अपना ईमेल दर्ज करें।",
+        "आइए आपको लॉग इन करें। आपका ईमेल क्या है?",
+        "लॉग इन करने के लिए तैयार हैं? अपना ईमेल साझा करें।",
+      ],
+    },
+    passwordPrompt: {
+      variations: [
+        "मैं आपको देख रहा हूँ! अब अपना पासवर्ड दर्ज करें।",
+        "मिल गया! आपका पासवर्ड क्या है?",
+        "आप वहाँ हैं! जारी रखने के लिए पासवर्ड दर्ज करें।",
+        "समझ गया! अब आपका पासवर्ड, कृपया।",
+      ],
+    },
+    passwordCreate: {
+      message: "परफेक्ट! अब आइए अपने खाते को सुरक्षित करें। एक पासवर्ड बनाएं (कम से कम 8 वर्ण):",
+    },
+    passwordTooShort: {
+      message: "आपके पासवर्ड में कम से कम 8 वर्ण होने चाहिए। फिर से कोशिश करें?",
+    },
+    nameRequired: {
+      message: "जारी रखने के लिए मुझे आपके नाम की आवश्यकता है। आपका नाम क्या है?",
+    },
+    errors: {
+      generic: "ओह! कुछ गलत हो गया। कृपया फिर से प्रयास करें।",
+      emailCheck: "ईमेल जाँच विफल",
+      loginFailed: "लॉगिन विफल। अपने क्रेडेंशियल्स की जाँच करें।",
+      signupFailed: "साइनअप विफल। कृपया फिर से प्रयास करें।",
+    },
+    placeholders: {
+      email: "अपना ईमेल यहां टाइप करें...",
+      name: "अपना नाम दर्ज करें...",
+      password_create: "पासवर्ड बनाएं (कम से कम 8 अक्षर)...",
+      password_input: "अपना पासवर्ड दर्ज करें...",
+    },
+    buttons: {
+      yesPlease: "हाँ, कृपया",
+      logMeIn: "लॉग इन करें",
+      continueWithoutSignup: "बिना साइन अप किए जारी रखें",
+    },
+  },
+  messages: {
+    emailSignup: {
+      variations: [
+        "<h1>बिल्कुल सही! आपका ईमेल सत्यापित हो गया है। 🎉</h1><hr /><h2>स्वागत है! 🚀</h2><p>आइए मिलकर कुछ अद्भुत बनाएं...</p>",
+        "<h1>शानदार! ईमेल पुष्टि हो गई। ✅</h1><hr /><h2>शुरू करने का समय! 💪</h2><p>अपनी यात्रा शुरू करने के लिए तैयार हैं?</p>",
+        "<h1>बढ़िया! सत्यापित हो गया। 🎊</h1><hr /><h2>चलिए! 🌟</h2><p>आपका रोमांच अब शुरू होता है...</p>",
+        "<h1>उत्कृष्ट! ईमेल पुष्टि हो गई। ✨</h1><hr /><h2>टीम में आपका स्वागत है! 🎯</h2><p>कुछ खास बनाएं...</p>",
+      ],
+    },
+    googleSignup: {
+      variations: [
+        "<h1>स्वागत है! Google लॉगिन सफल। 🎉</h1><hr /><h2>आपसे मिलकर खुशी हुई! 👋</h2><p>आपका व्यक्तिगत अनुभव प्रतीक्षा कर रहा है...</p>",
+      ],
+    },
+    facebookSignup: {
+      variations: [
+        "<h1>स्वागत है! Facebook लॉगिन सफल। 🎉</h1><hr /><h2>आपको पाकर खुशी है! 👋</h2><p>आपका अनुभव अब शुरू होता है...</p>",
+      ],
+    },
+    microsoftSignup: {
+      variations: [
+        "<h1>स्वागत है! Microsoft लॉगिन सफल। 🎉</h1><hr /><h2>सब तैयार है! 👋</h2><p>आपका वर्कस्पेस तैयार है...</p>",
+      ],
+    },
+    completion: {
+      title: "✅ सब तैयार!",
+      subtitle: "सब कुछ तैयार है। जब आप शुरू करने के लिए तैयार हों तो मुझे बताएं!",
+    },
+  },
+};
+
+export default catalog;
+
+// Regenerated while the dev server runs: accept the update instead of
+// reloading the page (liveCatalogs.ts pushes the new strings).
+if (import.meta.hot) {
+  import.meta.hot.accept();
+}
@@ -0,0 +1,145 @@
+// Generated by generate_locales.py from public/locales/hy-AM. Do not edit by hand.
+import type { CompiledCatalog } from '../compiledMessages';
+
+const catalog: CompiledCatalog = {
+  landing: {
+    welcome: {
+      variations: [
+        "Բարև! 👋 Բարի գալուստ iLaunching։ Սկսե՞նք։",
+        "Բարև! Պատրա՞ստ եք սկսել ինչ-որ հրաշալի բան:",
+        "Բարի գալուստ! Եկեք սկսենք ձեր ճանապարհորդությունը։",
+        "Բարև! Դուք ճիշտ տեղում եք։ Եկեք սկսենք!",
+      ],
+    },
+    welcomeBack: {
+      variations: [
+        "Բարի վերադարձ! 😊",
+        "Բարև, հիշում եմ քեզ! Բարի վերադարձ!",
+        "Ուրախ եմ կրկին տեսնել քեզ!",
+        "Դու կրկին այստեղ ես! Բարի գալուստ!",
+      ],
+    },
+    acknowledge: {
+      variations: [
+        "Շնորհակալություն! Մի պահ...",
+        "Հիանալի է, ստուգում եմ...",
+        "Մի վայրկյան, հաստատում եմ...",
+        "Ստացվեց! Արագ ստուգում...",
+      ],
+    },
+    checking: {
+      variations: [
+        (p) => "Փնտրում եմ <strong>" + (p.email ?? '') + "</strong>...",
+        (p) => "Ստուգում եմ <strong>" + (p.email ?? '') + "</strong>...",
+        (p) => "Ստուգում եմ <strong>" + (p.email ?? '') + "</strong> համակարգում...",
+        (p) => "Մի պահ, փնտրում եմ <strong>" + (p.email ?? '') + "</strong>...",
+      ],
+    },
+    wrongFormat: {
+      variations: [
+        "Հմմ, սա չի նման վավեր էլփոստի։ Փորձե՞նք կրկին։",
+        "Վա՜յ! Անվավեր էլփոստի ֆորմատ։ Ստուգե՞նք կրկին։",
+        "Այդ էլփոստի հետ ինչ-որ սխալ կա։ Կարո՞ղ եք ստուգել։",
+        "Այդ էլփոստի ֆորմատը տարօրինակ է։ Ստուգե՞նք կրկին։",
+      ],
+    },
+    userNotRegistered: {
+      variations: [
+        "Կարծես նոր եք այստեղ։ Դա հետաքրքիր է։ Ցանկանո՞ւմ եք միանալ։",
+        "Դեռ չեմ տեսնում ձեզ համակարգում։ Պատրա՞ստ եք սկսելու։",
+        "Նոր դեմք! Ցանկանո՞ւմ եք ստեղծել հաշիվ։",
+        "Դուք դեռ գրանցված չեք։ Փոխե՞նք դա։",
+      ],
+    },
+    askName: {
+      variations: [
+        "Հիանալի ընտրություն! Ինչպե՞ս են ձեզ կոչում։",
+        "Կատարյալ! Ինչպե՞ս կոչեմ ձեզ։",
+        "Զարմանալի է! Ասեք ձեր անունը։",
+        "Լավ է! Ինչպե՞ս են ձեզ կոչում։",
+      ],
+    },
+    loginPrompt: {
+      variations: [
+        "Բարի վերադարձ! Ո՞րն է ձեր էլփոստը։",
+        "Ուրախ եմ կրկին տեսնել ձեզ! Մուտքագրեք ձեր էլփոստը։",
+        "Եկեք մուտք գործենք։ Ո՞րն է ձեր էլփոստը։",
+        "Պատրա՞ստ եք մուտք գործել։ Կիսվեք ձեր էլփոստով։",
+      ],
+    },
+    passwordPrompt: {
+      variations: [
+        "Տեսնում եմ ձեզ! Այժմ մուտքագրեք ձեր գաղտնաբառը։",
+        "Գտա! Ո՞րն է ձեր գաղտնաբառը։",
+        "Դուք այնտեղ եք! Մուտքագրեք գաղտնաբառը շարունակելու համար։",
+        "Հասկացա! Այժմ ձեր գաղտնաբառը, խնդրում եմ։",
+      ],
+    },
+    passwordCreate: {
+      message: "Կատարյալ! Այժմ եկեք ապահովենք ձեր հաշիվը։ Ստեղծեք գաղտնաբառ (առնվազն 8 նիշ):",
+    },
+    passwordTooShort: {
+      message: "Ձեր գաղտնաբառը պետք է լինի առնվազն 8 նիշ։ Փորձե՞նք կրկին։",
+    },
+    nameRequired: {
+      message: "Ինձ պետք է ձեր անունը շարունակելու համար։ Ինչպե՞ս են ձեզ կոչում։",
+    },
+    errors: {
+      generic: "Վա՜յ! Ինչ-որ բան սխալ գնաց։ Խնդրում եմ փորձեք կրկին։",
+      emailCheck: "Էլփոստի ստուգումը ձախողվեց",
+      loginFailed: "Մուտքը ձախողվեց։ Ստուգեք ձեր տվյալները։",
+      signupFailed: "Գրանցումը ձախողվեց։ Խնդրում եմ փորձեք կրկին։",
+    },
+    placeholders: {
+      email: "Մուտքագրեք ձեր էլ․ հասցեն այստեղ...",
+      name: "Մուտքագրեք ձեր անունը...",
+      password_create: "Ստեղծեք գաղտնաբառ (առնվազն 8 նիշ)...",
+      password_input: "Մուտքագրեք ձեր գաղտնաբառը...",
+    },
+    buttons: {
+      yesPlease: "Այո, Խնդրում Եմ",
+      logMeIn: "Մուտք Գործել",
+      continueWithoutSignup: "Շարունակել առանց գրանցման",
+    },
+  },
+  messages: {
+    emailSignup: {
+      variations: [
+        "<h1>Բարի գալուստ! 🎉</h1><hr /><h2>Բարի գալուստ! 🚀</h2>",
+      ],
+    },
+    googleSignup: {
+      variations: [
+        "<h1>Բարի գալուստ! 🎉</h1><hr /><h2>Բարի գալուստ! 🚀</h2>",
+      ],
+    },
+    facebookSignup: {
+      variations: [
+        "<h1>Բարի գալուստ! 🎉</h1><hr /><h2>Բարի գալուստ! 🚀</h2>",
+      ],
+    },
+    microsoftSignup: {
+      variations: [
+        "<h1>Բարի գալուստ! 🎉</h1><hr /><h2>Բարի գալուստ! 🚀</h2>",
+      ],
+    },
+    completion: {
+      title: "✅ Պատրաստ է!",
+      subtitle: "Ամեն ինչ պատրաստ է։ Տեղեկացրեք ինձ, երբ պատրաստ լինեք սկսելու։",
+    },
+    default: {
+      title: "Բարի գալուստ! 🎉",
+      subtitle: "Ամեն ինչ պատրաստ է։ Տեղեկացրեք ինձ, երբ պատրաստ լինեք սկսելու։",
+      building: "Բեռնվում է...",
+      joining: "",
+    },
+  },
+};
+
+export default catalog;
+
+// Regenerated while the dev server runs: accept the update instead of
+// reloading the page (liveCatalogs.ts pushes the new strings).
+if (import.meta.hot) {
+  import.meta.hot.accept();
+}
@@ -0,0 +1,151 @@
+// Generated by generate_locales.py from public/locales/it-IT. Do not edit by hand.
+import type { CompiledCatalog } from '../compiledMessages';
+
+const catalog: CompiledCatalog = {
+  landing: {
+    welcome: {
+      variations: [
+        "Ciao! 👋 Benvenuto su iLaunching. Iniziamo?",
+        "Ehi! Pronto a iniziare qualcosa di straordinario?",
+        "Benvenuto! Facciamo partire il tuo viaggio.",
+        "Ciao! Sei nel posto giusto. Partiamo!",
+      ],
+    },
+    welcomeBack: {
+      variations: [
+        "Bentornato! 😊",
+        "Ehi, ti ricordo! Bentornato!",
+        "Che bello rivederti!",
+        "Eccoti di nuovo qui! Benvenuto!",
+      ],
+    },
+    acknowledge: {
+      variations: [
+        "Grazie! Un attimo...",
+        "Perfetto, controllo...",
+        "Un secondo, verifico...",
+        "Ricevuto! Controllo veloce...",
+      ],
+    },
+    checking: {
+      variations: [
+        (p) => "Cerco <strong>" + (p.email ?? '') + "</strong>...",
+        (p) => "Verifico <strong>" + (p.email ?? '') + "</strong>...",
+        (p) => "Controllo <strong>" + (p.email ?? '') + "</strong> nel sistema...",
+        (p) => "Un attimo, cerco <strong>" + (p.email ?? '') + "</strong>...",
+      ],
+    },
+    wrongFormat: {
+      variations: [
+        "Hmm, questo non sembra un'email valida. Riprova?",
+        "Ops! Formato email non valido. Controllalo di nuovo?",
+        "Qualcosa non va con quell'email. Puoi verificare?",
+        "Quel formato email sembra strano. Ricontrolla?",
+      ],
+    },
+    userNotRegistered: {
+      variations: [
+        "Sembra che tu sia nuovo qui! È emozionante. Vuoi unirti?",
+        "Non ti vedo ancora nel sistema. Pronto per iniziare?",
+        "Faccia nuova! Vuoi creare un account?",
+        "Non sei ancora registrato. Lo cambiamo?",
+      ],
+    },
+    askName: {
+      variations: [
+        "Ottima scelta! Come ti chiami?",
+        "Perfetto! Come dovrei chiamarti?",
+        "Fantastico! Fammi sapere il tuo nome.",
+        "Bene! Qual è il tuo nome?",
+      ],
+    },
+    loginPrompt: {
+      variations: [
+        "Bentornato! Qual è la tua email?",
+        "Bello rivederti! Inserisci la tua email.",
+        "Facciamo il login. Qual è la tua email?",
+        "Pronto per accedere? Condividi la tua email.",
+      ],
+    },
+    passwordPrompt: {
+      variations: [
+        "Ti vedo! Ora inserisci la tua password.",
+        "Trovato! Qual è la tua password?",
+        "Eccoti! Inserisci la password per continuare.",
+        "Capito! Ora la tua password, per favore.",
+      ],
+    },
+    passwordCreate: {
+      message: "Perfetto! Ora proteggiamo il tuo account. Crea una password (almeno 8 caratteri):",
+    },
+    passwordTooShort: {
+      message: "La tua password deve essere di almeno 8 caratteri. Riprova?",
+    },
+    nameRequired: {
+      message: "Ho bisogno del tuo nome per continuare. Come ti chiami?",
+    },
+    errors: {
+      generic: "Ops! Qualcosa è andato storto. Riprova.",
+      emailCheck: "Verifica email fallita",
+      loginFailed: "Login fallito. Controlla le tue credenziali.",
+      signupFailed: "Registrazione fallita. Riprova.",
+    },
+    placeholders: {
+      email: "Digita la tua email qui...",
+      name: "Inserisci il tuo nome...",
+      password_create: "Crea una password (minimo 8 caratteri)...",
+      password_input: "Inserisci la tua password...",
+    },
+    buttons: {
+      yesPlease: "Sì, Per Favore",
+      logMeIn: "Accedi",
+      continueWithoutSignup: "Continua senza registrarti",
+    },
+  },
+  messages: {
+    emailSignup: {
+      variations: [
+        "<h1>Perfetto! La tua email è verificata. 🎉</h1><hr /><h2>Benvenuto a bordo! 🚀</h2><p>Costruiamo qualcosa di straordinario insieme...</p>",
+        "<h1>Fantastico! Email confermata. ✅</h1><hr /><h2>È ora di partire! 💪</h2><p>Pronto per iniziare il tuo viaggio?</p>",
+        "<h1>Ottimo! Sei verificato. 🎊</h1><hr /><h2>Andiamo! 🌟</h2><p>La tua avventura inizia ora...</p>",
+        "<h1>Eccellente! Email confermata. ✨</h1><hr /><h2>Benvenuto nel team! 🎯</h2><p>Creiamo qualcosa di speciale...</p>",
+      ],
+    },
+    googleSignup: {
+      variations: [
+        "<h1>Benvenuto! Accesso Google riuscito. 🎉</h1><hr /><h2>Piacere di vederti! 👋</h2><p>La tua esperienza personalizzata ti aspetta...</p>",
+        "<h1>Ciao! Connesso con Google. ✅</h1><hr /><h2>Andiamo! 🚀</h2><p>È ora di creare qualcosa di fantastico...</p>",
+        "<h1>Perfetto! Account Google collegato. 🌟</h1><hr /><h2>Bentornato! 💫</h2><p>Riprendiamo da dove ci eravamo fermati...</p>",
+        "<h1>Fantastico! Accesso Google completato. ✨</h1><hr /><h2>Pronti a partire! 🎯</h2><p>Il tuo viaggio inizia qui...</p>",
+      ],
+    },
+    facebookSignup: {
+      variations: [
+        "<h1>Benvenuto! Accesso Facebook riuscito. 🎉</h1><hr /><h2>Felici di averti! 👋</h2><p>La tua esperienza inizia ora...</p>",
+        "<h1>Ciao! Connesso con Facebook. ✅</h1><hr /><h2>Perfetto! 🚀</h2><p>Creiamo qualcosa di straordinario...</p>",
+        "<h1>Ottimo! Account Facebook collegato. 🌟</h1><hr /><h2>Benvenuto nel club! 💫</h2><p>È ora di iniziare...</p>",
+        "<h1>Eccellente! Accesso Facebook completato. ✨</h1><hr /><h2>Andiamo! 🎯</h2><p>Il tuo viaggio ti aspetta...</p>",
+      ],
+    },
+    microsoftSignup: {
+      variations: [
+        "<h1>Benvenuto! Accesso Microsoft riuscito. 🎉</h1><hr /><h2>Tutto pronto! 👋</h2><p>Il tuo workspace è pronto...</p>",
+        "<h1>Ciao! Connesso con Microsoft. ✅</h1><hr /><h2>Pronti a partire! 🚀</h2><p>Siamo produttivi...</p>",
+        "<h1>Ottimo! Account Microsoft collegato. 🌟</h1><hr /><h2>Benvenuto a bordo! 💫</h2><p>È ora di iniziare...</p>",
+        "<h1>Fantastico! Accesso Microsoft completato. ✨</h1><hr /><h2>Andiamo! 🎯</h2><p>I tuoi strumenti ti aspettano...</p>",
+      ],
+    },
+    completion: {
+      title: "✅ Tutto fatto!",
+      subtitle: "Tutto è pronto. Fammi sapere quando sei pronto per iniziare!",
+    },
+  },
+};
+
+export default catalog;
+
+// Regenerated while the dev server runs: accept the update instead of
+// reloading the page (liveCatalogs.ts pushes the new strings).
+if (import.meta.hot) {
+  import.meta.hot.accept();
+}
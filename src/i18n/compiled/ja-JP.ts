@@ -0,0 +1,151 @@
+// Generated by generate_locales.py from public/locales/ja-JP. Do not edit by hand.
+import type { CompiledCatalog } from '../compiledMessages';
+
+const catalog: CompiledCatalog = {
+  landing: {
+    welcome: {
+      variations: [
+        "こんにちは！ 👋 iLaunchingへようこそ。始めましょうか？",
+        "こんにちは！素晴らしいことを始める準備はできていますか？",
+        "ようこそ！あなたの旅を始めましょう。",
+        "こんにちは！正しい場所に来ました。始めましょう！",
+      ],
+    },
+    welcomeBack: {
+      variations: [
+        "おかえりなさい！ 😊",
+        "おや、覚えています！おかえりなさい！",
+        "またお会いできて嬉しいです！",
+        "お帰りなさい！",
+      ],
+    },
+    acknowledge: {
+      variations: [
+        "ありがとうございます！少々お待ちください...",
+        "完璧です、確認中...",
+        "少々お待ちください、確認しています...",
+        "受信しました！クイックチェック...",
+      ],
+    },
+    checking: {
+      variations: [
+        (p) => "<strong>" + (p.email ?? '') + "</strong>を検索中...",
+        (p) => "<strong>" + (p.email ?? '') + "</strong>を確認中...",
+        (p) => "システム内で<strong>" + (p.email ?? '') + "</strong>をチェック中...",
+        (p) => "少々お待ちください、<strong>" + (p.email ?? '') + "</strong>を検索中...",
+      ],
+    },
+    wrongFormat: {
+      variations: [
+        "うーん、これは有効なメールアドレスのようには見えません。もう一度試してみますか？",
+        "おっと！無効なメール形式です。もう一度確認しますか？",
+        "そのメールに何か問題があります。確認していただけますか？",
+        "そのメール形式は奇妙に見えます。もう一度確認しますか？",
+      ],
+    },
+    userNotRegistered: {
+      variations: [
+        "新しい方のようですね！ワクワクします。参加しますか？",
+        "まだシステムに登録されていません。始める準備はできていますか？",
+        "新しい顔ですね！アカウントを作成しますか？",
+        "まだ登録されていませんね。変更しましょうか？",
+      ],
+    },
+    askName: {
+      variations: [
+        "素晴らしい選択です！お名前は何ですか？",
+        "完璧です！何とお呼びすればよろしいですか？",
+        "素晴らしい！お名前を教えてください。",
+        "いいですね！お名前は何ですか？",
+      ],
+    },
+    loginPrompt: {
+      variations: [
+        "おかえりなさい！メールアドレスは何ですか？",
+        "またお会いできて嬉しいです！メールアドレスを入力してください。",
+        "ログインしましょう。メールアドレスは何ですか？",
+        "ログインする準備はできていますか？メールアドレスを共有してください。",
+      ],
+    },
+    passwordPrompt: {
+      variations: [
+        "見つけました！パスワードを入力してください。",
+        "発見しました！パスワードは何ですか？",
+        "そこにいましたね！続行するにはパスワードを入力してください。",
+        "わかりました！パスワードをお願いします。",
+      ],
+    },
+    passwordCreate: {
+      message: "完璧です！アカウントを保護しましょう。パスワードを作成してください（8文字以上）：",
+    },
+    passwordTooShort: {
+      message: "パスワードは8文字以上である必要があります。もう一度試しますか？",
+    },
+    nameRequired: {
+      message: "続行するにはお名前が必要です。お名前は何ですか？",
+    },
+    errors: {
+      generic: "おっと！問題が発生しました。もう一度お試しください。",
+      emailCheck: "メールの確認に失敗しました",
+      loginFailed: "ログインに失敗しました。認証情報を確認してください。",
+      signupFailed: "登録に失敗しました。もう一度お試しください。",
+    },
+    placeholders: {
+      email: "メールアドレスを入力してください...",
+      name: "お名前を入力してください...",
+      password_create: "パスワードを作成してください（8文字以上）...",
+      password_input: "パスワードを入力してください...",
+    },
+    buttons: {
+      yesPlease: "はい、お願いします",
+      logMeIn: "ログイン",
+      continueWithoutSignup: "登録せずに続ける",
+    },
+  },
+  messages: {
+    emailSignup: {
+      variations: [
+        "<h1>完璧！メールが確認されました。🎉</h1><hr /><h2>ようこそ！🚀</h2><p>素晴らしいものを一緒に作りましょう...</p>",
+        "<h1>素晴らしい！メール確認完了。✅</h1><hr /><h2>さあ始めましょう！💪</h2><p>旅を始める準備はできましたか？</p>",
+        "<h1>最高！確認されました。🎊</h1><hr /><h2>行きましょう！🌟</h2><p>あなたの冒険が今始まります...</p>",
+        "<h1>優秀！メール確認済み。✨</h1><hr /><h2>チームへようこそ！🎯</h2><p>特別なものを作りましょう...</p>",
+      ],
+    },
+    googleSignup: {
+      variations: [
+        "<h1>ようこそ！Googleログイン成功。🎉</h1><hr /><h2>お会いできて嬉しいです！👋</h2><p>あなた専用の体験が待っています...</p>",
+        "<h1>こんにちは！Googleで接続されました。✅</h1><hr /><h2>行きましょう！🚀</h2><p>素晴らしいものを作る時間です...</p>",
+        "<h1>完璧！Googleアカウントがリンクされました。🌟</h1><hr /><h2>お帰りなさい！💫</h2><p>前回の続きから始めましょう...</p>",
+        "<h1>素晴らしい！Googleログイン完了。✨</h1><hr /><h2>準備完了！🎯</h2><p>あなたの旅がここから始まります...</p>",
+      ],
+    },
+    facebookSignup: {
+      variations: [
+        "<h1>ようこそ！Facebookログイン成功。🎉</h1><hr /><h2>お迎えできて嬉しいです！👋</h2><p>あなたの体験が今始まります...</p>",
+        "<h1>こんにちは！Facebookで接続されました。✅</h1><hr /><h2>完璧！🚀</h2><p>素晴らしいものを作りましょう...</p>",
+        "<h1>最高！Facebookアカウントがリンクされました。🌟</h1><hr /><h2>クラブへようこそ！💫</h2><p>始める時間です...</p>",
+        "<h1>優秀！Facebookログイン完了。✨</h1><hr /><h2>行きましょう！🎯</h2><p>あなたの旅が待っています...</p>",
+      ],
+    },
+    microsoftSignup: {
+      variations: [
+        "<h1>ようこそ！Microsoftログイン成功。🎉</h1><hr /><h2>すべて設定完了！👋</h2><p>ワークスペースの準備ができました...</p>",
+        "<h1>こんにちは！Microsoftで接続されました。✅</h1><hr /><h2>始める準備完了！🚀</h2><p>生産的になりましょう...</p>",
+        "<h1>最高！Microsoftアカウントがリンクされました。🌟</h1><hr /><h2>ようこそ！💫</h2><p>始める時間です...</p>",
+        "<h1>素晴らしい！Microsoftログイン完了。✨</h1><hr /><h2>行きましょう！🎯</h2><p>ツールが待っています...</p>",
+      ],
+    },
+    completion: {
+      title: "✅ 完了しました！",
+      subtitle: "すべて準備ができました。開始する準備ができたらお知らせください！",
+    },
+  },
+};
+
+export default catalog;
+
+// Regenerated while the dev server runs: accept the update instead of
+// reloading the page (liveCatalogs.ts pushes the new strings).
+if (import.meta.hot) {
+  import.meta.hot.accept();
+}
@@ -0,0 +1,151 @@
+// Generated by generate_locales.py from public/locales/ko-KR. Do not edit by hand.
+import type { CompiledCatalog } from '../compiledMessages';
+
+const catalog: CompiledCatalog = {
+  landing: {
+    welcome: {
+      variations: [
+        "안녕하세요! 👋 iLaunching에 오신 것을 환영합니다. 시작할까요?",
+        "안녕하세요! 멋진 일을 시작할 준비가 되셨나요?",
+        "환영합니다! 여정을 시작해볼까요.",
+        "안녕하세요! 제대로 찾아오셨네요. 시작합시다!",
+      ],
+    },
+    welcomeBack: {
+      variations: [
+        "다시 오신 것을 환영합니다! 😊",
+        "이봐요, 기억해요! 다시 오신 것을 환영합니다!",
+        "다시 만나서 반가워요!",
+        "또 오셨네요! 환영합니다!",
+      ],
+    },
+    acknowledge: {
+      variations: [
+        "감사합니다! 잠시만요...",
+        "좋아요, 확인 중...",
+        "잠시만요, 확인하고 있습니다...",
+        "받았습니다! 빠른 확인...",
+      ],
+    },
+    checking: {
+      variations: [
+        (p) => "<strong>" + (p.email ?? '') + "</strong> 찾는 중...",
+        (p) => "<strong>" + (p.email ?? '') + "</strong> 확인 중...",
+        (p) => "시스템에서 <strong>" + (p.email ?? '') + "</strong> 확인 중...",
+        (p) => "잠시만요, <strong>" + (p.email ?? '') + "</strong> 찾는 중...",
+      ],
+    },
+    wrongFormat: {
+      variations: [
+        "흠, 유효한 이메일처럼 보이지 않네요. 다시 시도해볼까요?",
+        "이런! 잘못된 이메일 형식입니다. 다시 확인해볼까요?",
+        "해당 이메일에 문제가 있습니다. 확인해주시겠어요?",
+        "이메일 형식이 이상해 보이네요. 다시 확인해볼까요?",
+      ],
+    },
+    userNotRegistered: {
+      variations: [
+        "여기 처음이신 것 같네요! 흥미진진한데요. 가입하시겠어요?",
+        "시스템에서 아직 못 찾았어요. 시작할 준비되셨나요?",
+        "새로운 얼굴이네요! 계정을 만들고 싶으신가요?",
+        "아직 등록되지 않으셨네요. 바꿔볼까요?",
+      ],
+    },
+    askName: {
+      variations: [
+        "좋은 선택입니다! 이름이 뭐예요?",
+        "완벽해요! 뭐라고 부르면 될까요?",
+        "멋져요! 이름을 알려주세요.",
+        "좋아요! 이름이 뭐예요?",
+      ],
+    },
+    loginPrompt: {
+      variations: [
+        "다시 오신 것을 환영합니다! 이메일이 뭐예요?",
+        "다시 만나서 반가워요! 이메일을 입력하세요.",
+        "로그인합시다. 이메일이 뭐예요?",
+        "로그인할 준비되셨나요? 이메일을 공유해주세요.",
+      ],
+    },
+    passwordPrompt: {
+      variations: [
+        "찾았어요! 이제 비밀번호를 입력하세요.",
+        "발견했습니다! 비밀번호가 뭐예요?",
+        "거기 있었네요! 계속하려면 비밀번호를 입력하세요.",
+        "알겠습니다! 이제 비밀번호를 입력해주세요.",
+      ],
+    },
+    passwordCreate: {
+      message: "완벽해요! 이제 계정을 보호합시다. 비밀번호를 만드세요 (최소 8자):",
+    },
+    passwordTooShort: {
+      message: "비밀번호는 최소 8자 이상이어야 합니다. 다시 시도해볼까요?",
+    },
+    nameRequired: {
+      message: "계속하려면 이름이 필요해요. 이름이 뭐예요?",
+    },
+    errors: {
+      generic: "이런! 문제가 발생했습니다. 다시 시도해주세요.",
+      emailCheck: "이메일 확인 실패",
+      loginFailed: "로그인 실패. 자격 증명을 확인하세요.",
+      signupFailed: "가입 실패. 다시 시도해주세요.",
+    },
+    placeholders: {
+      email: "여기에 이메일을 입력하세요...",
+      name: "이름을 입력하세요...",
+      password_create: "비밀번호를 생성하세요 (최소 8자)...",
+      password_input: "비밀번호를 입력하세요...",
+    },
+    buttons: {
+      yesPlease: "네, 부탁드립니다",
+      logMeIn: "로그인",
+      continueWithoutSignup: "가입하지 않고 계속하기",
+    },
+  },
+  messages: {
+    emailSignup: {
+      variations: [
+        "<h1>완벽해요! 이메일이 확인되었습니다. 🎉</h1><hr /><h2>환영합니다! 🚀</h2><p>함께 멋진 것을 만들어봐요...</p>",
+        "<h1>환상적이에요! 이메일 확인 완료. ✅</h1><hr /><h2>시작할 시간이에요! 💪</h2><p>여정을 시작할 준비가 되셨나요?</p>",
+        "<h1>좋아요! 확인되었습니다. 🎊</h1><hr /><h2>가봅시다! 🌟</h2><p>당신의 모험이 지금 시작됩니다...</p>",
+        "<h1>훌륭해요! 이메일 확인됨. ✨</h1><hr /><h2>팀에 오신 것을 환영합니다! 🎯</h2><p>특별한 것을 만들어봐요...</p>",
+      ],
+    },
+    googleSignup: {
+      variations: [
+        "<h1>환영합니다! Google 로그인 성공. 🎉</h1><hr /><h2>만나서 반가워요! 👋</h2><p>맞춤형 경험이 기다리고 있어요...</p>",
+        "<h1>안녕하세요! Google로 연결되었습니다. ✅</h1><hr /><h2>가봅시다! 🚀</h2><p>멋진 것을 만들 시간이에요...</p>",
+        "<h1>완벽해요! Google 계정이 연결되었습니다. 🌟</h1><hr /><h2>돌아오신 것을 환영합니다! 💫</h2><p>중단했던 곳부터 계속해봐요...</p>",
+        "<h1>환상적이에요! Google 로그인 완료. ✨</h1><hr /><h2>시작 준비 완료! 🎯</h2><p>여정이 여기서 시작됩니다...</p>",
+      ],
+    },
+    facebookSignup: {
+      variations: [
+        "<h1>환영합니다! Facebook 로그인 성공. 🎉</h1><hr /><h2>함께해서 기뻐요! 👋</h2><p>경험이 지금 시작됩니다...</p>",
+        "<h1>안녕하세요! Facebook으로 연결되었습니다. ✅</h1><hr /><h2>완벽해요! 🚀</h2><p>멋진 것을 만들어봐요...</p>",
+        "<h1>좋아요! Facebook 계정이 연결되었습니다. 🌟</h1><hr /><h2>클럽에 오신 것을 환영합니다! 💫</h2><p>시작할 시간이에요...</p>",
+        "<h1>훌륭해요! Facebook 로그인 완료. ✨</h1><hr /><h2>가봅시다! 🎯</h2><p>여정이 기다리고 있어요...</p>",
+      ],
+    },
+    microsoftSignup: {
+      variations: [
+        "<h1>환영합니다! Microsoft 로그인 성공. 🎉</h1><hr /><h2>모두 설정 완료! 👋</h2><p>작업 공간이 준비되었습니다...</p>",
+        "<h1>안녕하세요! Microsoft로 연결되었습니다. ✅</h1><hr /><h2>시작 준비 완료! 🚀</h2><p>생산적으로 해봐요...</p>",
+        "<h1>좋아요! Microsoft 계정이 연결되었습니다. 🌟</h1><hr /><h2>환영합니다! 💫</h2><p>시작할 시간이에요...</p>",
+        "<h1>환상적이에요! Microsoft 로그인 완료. ✨</h1><hr /><h2>가봅시다! 🎯</h2><p>도구가 기다리고 있어요...</p>",
+      ],
+    },
+    completion: {
+      title: "✅ 완료!",
+      subtitle: "모든 준비가 완료되었습니다. 시작할 준비가 되면 알려주세요!",
+    },
+  },
+};
+
+export default catalog;
+
+// Regenerated while the dev server runs: accept the update instead of
+// reloading the page (liveCatalogs.ts pushes the new strings).
+if (import.meta.hot) {
+  import.meta.hot.accept();
+}
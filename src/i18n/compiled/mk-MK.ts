@@ -0,0 +1,145 @@
+// Generated by generate_locales.py from public/locales/mk-MK. Do not edit by hand.
+import type { CompiledCatalog } from '../compiledMessages';
+
+const catalog: CompiledCatalog = {
+  landing: {
+    welcome: {
+      variations: [
+        "Здраво! 👋 Добредојдовте во iLaunching. Да почнеме?",
+        "Еј! Подготвени да започнете нешто неверојатно?",
+        "Добредојдовте! Да го започнеме вашето патување.",
+        "Здраво! Сте на вистинското место. Да почнеме!",
+      ],
+    },
+    welcomeBack: {
+      variations: [
+        "Добредојдовте назад! 😊",
+        "Еј, ве памтам! Добредојдовте назад!",
+        "Радосен сум да ве видам повторно!",
+        "Повторно сте тука! Добредојдовте!",
+      ],
+    },
+    acknowledge: {
+      variations: [
+        "Благодарам! Момент...",
+        "Совршено, проверувам...",
+        "Секунда, верификувам...",
+        "Примено! Брза проверка...",
+      ],
+    },
+    checking: {
+      variations: [
+        (p) => "Барам <strong>" + (p.email ?? '') + "</strong>...",
+        (p) => "Проверувам <strong>" + (p.email ?? '') + "</strong>...",
+        (p) => "Проверувам <strong>" + (p.email ?? '') + "</strong> во системот...",
+        (p) => "Момент, барам <strong>" + (p.email ?? '') + "</strong>...",
+      ],
+    },
+    wrongFormat: {
+      variations: [
+        "Хмм, ова не изгледа како валиден емаил. Обидете се повторно?",
+        "Упс! Невалиден формат на емаил. Проверете повторно?",
+        "Нешто не е во ред со тој емаил. Можете ли да проверите?",
+        "Форматот на емаилот изгледа чудно. Проверете повторно?",
+      ],
+    },
+    userNotRegistered: {
+      variations: [
+        "Изгледа дека сте нови тука! Тоа е возбудливо. Сакате да се приклучите?",
+        "Сè уште не ве гледам во системот. Подготвени да започнете?",
+        "Ново лице! Сакате да креирате сметка?",
+        "Сè уште не сте регистрирани. Да го промениме тоа?",
+      ],
+    },
+    askName: {
+      variations: [
+        "Одличен избор! Како се викате?",
+        "Совршено! Како да ве викам?",
+        "Одлично! Кажете ми го вашето име.",
+        "Добро! Како се викате?",
+      ],
+    },
+    loginPrompt: {
+      variations: [
+        "Добредојдовте назад! Кој е вашиот емаил?",
+        "Радосен сум да ве видам повторно! Внесете го вашиот емаил.",
+        "Да ве најавиме. Кој е вашиот емаил?",
+        "Подготвени за најава? Споделете го вашиот емаил.",
+      ],
+    },
+    passwordPrompt: {
+      variations: [
+        "Ве гледам! Сега внесете ја вашата лозинка.",
+        "Ве најдов! Која е вашата лозинка?",
+        "Таму сте! Внесете лозинка за да продолжите.",
+        "Разбрав! Сега вашата лозинка, ве молам.",
+      ],
+    },
+    passwordCreate: {
+      message: "Совршено! Сега да ја обезбедиме вашата сметка. Креирајте лозинка (најмалку 8 знаци):",
+    },
+    passwordTooShort: {
+      message: "Вашата лозинка мора да има најмалку 8 знаци. Обидете се повторно?",
+    },
+    nameRequired: {
+      message: "Ми треба вашето име за да продолжам. Како се викате?",
+    },
+    errors: {
+      generic: "Упс! Нешто тргна наопаку. Ве молам обидете се повторно.",
+      emailCheck: "Проверката на емаилот не успеа",
+      loginFailed: "Најавата не успеа. Проверете ги вашите податоци.",
+      signupFailed: "Регистрацијата не успеа. Ве молам обидете се повторно.",
+    },
+    placeholders: {
+      email: "Внесете ја вашата е-пошта тука...",
+      name: "Внесете го вашето име...",
+      password_create: "Создадете лозинка (најмалку 8 карактери)...",
+      password_input: "Внесете ја вашата лозинка...",
+    },
+    buttons: {
+      yesPlease: "Да, Ве Молам",
+      logMeIn: "Најави Се",
+      continueWithoutSignup: "Продолжи без регистрација",
+    },
+  },
+  messages: {
+    emailSignup: {
+      variations: [
+        "<h1>Добредојдовте! 🎉</h1><hr /><h2>Добредојдовте! 🚀</h2>",
+      ],
+    },
+    googleSignup: {
+      variations: [
+        "<h1>Добредојдовте! 🎉</h1><hr /><h2>Добредојдовте! 🚀</h2>",
+      ],
+    },
+    facebookSignup: {
+      variations: [
+        "<h1>Добредојдовте! 🎉</h1><hr /><h2>Добредојдовте! 🚀</h2>",
+      ],
+    },
+    microsoftSignup: {
+      variations: [
+        "<h1>Добредојдовте! 🎉</h1><hr /><h2>Добредојдовте! 🚀</h2>",
+      ],
+    },
+    completion: {
+      title: "✅ Готово!",
+      subtitle: "Сè е подготвено. Јавете ми кога ќе бидете подготвени да почнете!",
+    },
+    default: {
+      title: "Добредојдовте! 🎉",
+      subtitle: "Сè е подготвено. Јавете ми кога ќе бидете подготвени да почнете!",
+      building: "Вчитување...",
+      joining: "",
+    },
+  },
+};
+
+export default catalog;
+
+// Regenerated while the dev server runs: accept the update instead of
+// reloading the page (liveCatalogs.ts pushes the new strings).
+if (import.meta.hot) {
+  import.meta.hot.accept();
+}
@@ -0,0 +1,145 @@
+// Generated by generate_locales.py from public/locales/nb-NO. Do not edit by hand.
+import type { CompiledCatalog } from '../compiledMessages';
+
+const catalog: CompiledCatalog = {
+  landing: {
+    welcome: {
+      variations: [
+        "Hei! 👋 Velkommen til iLaunching. Skal vi begynne?",
+        "Hei! Klar til å starte noe fantastisk?",
+        "Velkommen! La oss starte reisen din.",
+        "Hei! Du er på rett sted. La oss begynne!",
+      ],
+    },
+    welcomeBack: {
+      variations: [
+        "Velkommen tilbake! 😊",
+        "Hei, jeg husker deg! Velkommen tilbake!",
+        "Hyggelig å se deg igjen!",
+        "Der er du igjen! Velkommen!",
+      ],
+    },
+    acknowledge: {
+      variations: [
+        "Takk! Et øyeblikk...",
+        "Perfekt, sjekker...",
+        "Ett sekund, kontrollerer...",
+        "Mottatt! Rask sjekk...",
+      ],
+    },
+    checking: {
+      variations: [
+        (p) => "Leter etter <strong>" + (p.email ?? '') + "</strong>...",
+        (p) => "Kontrollerer <strong>" + (p.email ?? '') + "</strong>...",
+        (p) => "Sjekker <strong>" + (p.email ?? '') + "</strong> i systemet...",
+        (p) => "Et øyeblikk, leter etter <strong>" + (p.email ?? '') + "</strong>...",
+      ],
+    },
+    wrongFormat: {
+      variations: [
+        "Hmm, det ser ikke ut som en gyldig e-post. Prøv igjen?",
+        "Oops! Ugyldig e-postformat. Sjekk det igjen?",
+        "Noe er galt med den e-posten. Kan du sjekke?",
+        "Det e-postformatet ser rart ut. Sjekk igjen?",
+      ],
+    },
+    userNotRegistered: {
+      variations: [
+        "Det ser ut som du er ny her! Det er spennende. Vil du bli med?",
+        "Jeg ser deg ikke i systemet ennå. Klar til å starte?",
+        "Nytt ansikt! Vil du opprette en konto?",
+        "Du er ikke registrert ennå. Skal vi endre det?",
+      ],
+    },
+    askName: {
+      variations: [
+        "Flott valg! Hva heter du?",
+        "Perfekt! Hva skal jeg kalle deg?",
+        "Fantastisk! La meg vite navnet ditt.",
+        "Bra! Hva heter du?",
+      ],
+    },
+    loginPrompt: {
+      variations: [
+        "Velkommen tilbake! Hva er e-posten din?",
+        "Hyggelig å se deg igjen! Skriv inn e-posten din.",
+        "La oss logge deg inn. Hva er e-posten din?",
+        "Klar til å logge inn? Del e-posten din.",
+      ],
+    },
+    passwordPrompt: {
+      variations: [
+        "Jeg ser deg! Skriv nå inn passordet ditt.",
+        "Funnet! Hva er passordet ditt?",
+        "Der er du! Skriv inn passordet ditt for å fortsette.",
+        "Forstått! Nå passordet ditt, takk.",
+      ],
+    },
+    passwordCreate: {
+      message: "Perfekt! Nå sikrer vi kontoen din. Opprett et passord (minst 8 tegn):",
+    },
+    passwordTooShort: {
+      message: "Passordet ditt må være minst 8 tegn langt. Prøv igjen?",
+    },
+    nameRequired: {
+      message: "Jeg trenger navnet ditt for å fortsette. Hva heter du?",
+    },
+    errors: {
+      generic: "Oops! Noe gikk galt. Prøv igjen.",
+      emailCheck: "E-postsjekk mislyktes",
+      loginFailed: "Innlogging mislyktes. Sjekk påloggingsinformasjonen din.",
+      signupFailed: "Registrering mislyktes. Prøv igjen.",
+    },
+    placeholders: {
+      email: "Skriv inn e-posten din her...",
+      name: "Skriv inn navnet ditt...",
+      password_create: "Opprett et passord (minst 8 tegn)...",
+      password_input: "Skriv inn passordet ditt...",
+    },
+    buttons: {
+      yesPlease: "Ja Takk",
+      logMeIn: "Logg Inn",
+      continueWithoutSignup: "Fortsett uten påmelding",
+    },
+  },
+  messages: {
+    emailSignup: {
+      variations: [
+        "<h1>Velkommen! 🎉</h1><hr /><h2>Velkommen! 🚀</h2>",
+      ],
+    },
+    googleSignup: {
+      variations: [
+        "<h1>Velkommen! 🎉</h1><hr /><h2>Velkommen! 🚀</h2>",
+      ],
+    },
+    facebookSignup: {
+      variations: [
+        "<h1>Velkommen! 🎉</h1><hr /><h2>Velkommen! 🚀</h2>",
+      ],
+    },
+    microsoftSignup: {
+      variations: [
+        "<h1>Velkommen! 🎉</h1><hr /><h2>Velkommen! 🚀</h2>",
+      ],
+    },
+    completion: {
+      title: "✅ Ferdig!",
+      subtitle: "Alt er klart. Gi meg beskjed når du er klar til å begynne!",
+    },
+    default: {
+      title: "Velkommen! 🎉",
+      subtitle: "Alt er klart. Gi meg beskjed når du er klar til å begynne!",
+      building: "Laster...",
+      joining: "",
+    },
+  },
+};
+
+export default catalog;
+
+// Regenerated while the dev server runs: accept the update instead of
+// reloading the page (liveCatalogs.ts pushes the new strings).
+if (import.meta.hot) {
+  import.meta.hot.accept();
+}
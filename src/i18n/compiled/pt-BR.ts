@@ -0,0 +1,151 @@
+// Generated by generate_locales.py from public/locales/pt-BR. Do not edit by hand.
+import type { CompiledCatalog } from '../compiledMessages';
+
+const catalog: CompiledCatalog = {
+  landing: {
+    welcome: {
+      variations: [
+        "Você está no iLaunching, onde ideias se transformam em marcas que realmente importam. Eu sou i. Não faço discursos. Eu ajudo você a avançar. Qual é seu email para ver se já nos conhecemos?",
+        "Bem-vindo ao iLaunching. Você chegou cedo. Já é a jogada certa. Eu sou i, e estou aqui para abrir o caminho, não para vendê-lo. Compartilhe seu email e vamos ver se você já está no sistema.",
+        "Isto é iLaunching, o lugar onde fundadores constroem mais rápido do que pensavam ser possível. Eu sou i. Pense em mim como o parceiro silencioso que simplesmente faz acontecer. Qual é seu email? Deixe-me verificar se nos conhecemos.",
+        "Você encontrou o iLaunching. Bom timing. Eu sou i, feito para ajudá-lo a pular o ruído e construir algo real. Compartilhe seu email para eu ver se já trabalhamos juntos antes.",
+      ],
+    },
+    welcomeBack: {
+      variations: [
+        "Já voltou? Gosto da sua energia. Eu sou i, e estou aqui esperando. Qual é seu email mesmo?",
+        "Você voltou! Bom. Isso significa que você está levando a sério. Eu sou i. Compartilhe seu email e vamos continuar de onde paramos.",
+        "Bem-vindo de volta ao iLaunching. Pronto para mergulhar desta vez? Eu sou i. Qual é seu email para podermos começar?",
+        "Segunda olhada? Movimento inteligente. Eu sou i, e ainda estou aqui pronto para ajudá-lo a construir. Qual é seu email?",
+      ],
+    },
+    acknowledge: {
+      variations: [
+        "Obrigado! Um momento enquanto verifico isso.",
+        "Entendi! Me dê um segundo para procurá-lo.",
+        "Perfeito! Deixe-me ver o que temos aqui.",
+        "Obrigado! Verificando nosso sistema agora.",
+      ],
+    },
+    checking: {
+      variations: [
+        (p) => "Perfeito! Deixe-me verificar se " + (p.email ?? '') + " está em nosso sistema.",
+        (p) => "Entendi! Procurando " + (p.email ?? '') + " agora.",
+        (p) => "Excelente! Procurando " + (p.email ?? '') + " em nossos registros.",
+        (p) => "Obrigado! Deixe-me ver se " + (p.email ?? '') + " já está conosco.",
+      ],
+    },
+    wrongFormat: {
+      variations: [
+        "Isso não é um email. Tente novamente com algo que pareça um.",
+        "Preciso de um email real para avançar. Verifique o formato.",
+        "Isso não funciona. Use um endereço de email válido.",
+        "Não exatamente. Certifique-se de que é um formato de email válido.",
+      ],
+    },
+    userNotRegistered: {
+      variations: [
+        "Parece que você é novo aqui! Isso é emocionante. Quer participar?",
+        "Ainda não te vejo no sistema. Pronto para começar?",
+        "Cara nova! Gostaria de criar uma conta?",
+        "Você ainda não está registrado. Vamos mudar isso?",
+      ],
+    },
+    askName: {
+      variations: [
+        "Ótima escolha! Qual é o seu nome?",
+        "Perfeito! Como devo te chamar?",
+        "Incrível! Me diga seu nome.",
+        "Legal! Qual é o seu nome?",
+      ],
+    },
+    loginPrompt: {
+      variations: [
+        "Bem-vindo de volta! Qual é o seu email?",
+        "Que bom te ver de novo! Digite seu email.",
+        "Vamos fazer o login. Qual é o seu email?",
+        "Pronto para entrar? Compartilhe seu email.",
+      ],
+    },
+    passwordPrompt: {
+      variations: [
+        "Te encontrei! Agora digite sua senha.",
+        "Achei você! Qual é sua senha?",
+        "Aí está você! Digite sua senha para continuar.",
+        "Entendi! Agora sua senha, por favor.",
+      ],
+    },
+    passwordCreate: {
+      message: "Perfeito! Agora vamos proteger sua conta. Crie uma senha (pelo menos 8 caracteres):",
+    },
+    passwordTooShort: {
+      message: "Sua senha precisa ter pelo menos 8 caracteres. Tentar de novo?",
+    },
+    nameRequired: {
+      message: "Vou precisar do seu nome para continuar. Como você se chama?",
+    },
+    errors: {
+      generic: "Ops! Algo deu errado. Tente novamente.",
+      emailCheck: "Falha ao verificar email",
+      loginFailed: "Login falhou. Verifique suas credenciais.",
+      signupFailed: "Cadastro falhou. Tente novamente.",
+    },
+    placeholders: {
+      email: "Digite seu e-mail aqui...",
+      name: "Digite seu nome...",
+      password_create: "Crie uma senha (mínimo 8 caracteres)...",
+      password_input: "Digite sua senha...",
+    },
+    buttons: {
+      yesPlease: "Sim, Por Favor",
+      logMeIn: "Entrar",
+      continueWithoutSignup: "Continuar sem cadastro",
+    },
+  },
+  messages: {
+    emailSignup: {
+      variations: [
+        "<h1>Perfeito! Seu e-mail está verificado. 🎉</h1><hr /><h2>Bem-vindo a bordo! 🚀</h2><p>Vamos construir algo incrível juntos...</p>",
+        "<h1>Fantástico! E-mail confirmado. ✅</h1><hr /><h2>Hora de começar! 💪</h2><p>Pronto para iniciar sua jornada?</p>",
+        "<h1>Ótimo! Você está verificado. 🎊</h1><hr /><h2>Vamos lá! 🌟</h2><p>Sua aventura começa agora...</p>",
+        "<h1>Excelente! E-mail confirmado. ✨</h1><hr /><h2>Bem-vindo ao time! 🎯</h2><p>Vamos criar algo especial...</p>",
+      ],
+    },
+    googleSignup: {
+      variations: [
+        "<h1>Bem-vindo! Login com Google bem-sucedido. 🎉</h1><hr /><h2>Que bom te ver! 👋</h2><p>Sua experiência personalizada espera...</p>",
+        "<h1>Olá! Conectado com Google. ✅</h1><hr /><h2>Vamos lá! 🚀</h2><p>Hora de criar algo incrível...</p>",
+        "<h1>Perfeito! Conta Google conectada. 🌟</h1><hr /><h2>Bem-vindo de volta! 💫</h2><p>Vamos continuar de onde paramos...</p>",
+        "<h1>Fantástico! Login com Google concluído. ✨</h1><hr /><h2>Prontos para começar! 🎯</h2><p>Sua jornada começa aqui...</p>",
+      ],
+    },
+    facebookSignup: {
+      variations: [
+        "<h1>Bem-vindo! Login com Facebook bem-sucedido. 🎉</h1><hr /><h2>Feliz em ter você! 👋</h2><p>Sua experiência começa agora...</p>",
+        "<h1>Olá! Conectado com Facebook. ✅</h1><hr /><h2>Perfeito! 🚀</h2><p>Vamos criar algo incrível...</p>",
+        "<h1>Ótimo! Conta Facebook conectada. 🌟</h1><hr /><h2>Bem-vindo ao clube! 💫</h2><p>Hora de começar...</p>",
+        "<h1>Excelente! Login com Facebook concluído. ✨</h1><hr /><h2>Vamos lá! 🎯</h2><p>Sua jornada espera...</p>",
+      ],
+    },
+    microsoftSignup: {
+      variations: [
+        "<h1>Bem-vindo! Login com Microsoft bem-sucedido. 🎉</h1><hr /><h2>Tudo configurado! 👋</h2><p>Seu workspace está pronto...</p>",
+        "<h1>Olá! Conectado com Microsoft. ✅</h1><hr /><h2>Prontos para começar! 🚀</h2><p>Vamos ser produtivos...</p>",
+        "<h1>Ótimo! Conta Microsoft conectada. 🌟</h1><hr /><h2>Bem-vindo a bordo! 💫</h2><p>Hora de começar...</p>",
+        "<h1>Fantástico! Login com Microsoft concluído. ✨</h1><hr /><h2>Vamos lá! 🎯</h2><p>Suas ferramentas esperam...</p>",
+      ],
+    },
+    completion: {
+      title: "✅ Tudo pronto!",
+      subtitle: "Tudo está pronto. Me avise quando estiver pronto para começar!",
+    },
+  },
+};
+
+export default catalog;
+
+// Regenerated while the dev server runs: accept the update instead of
+// reloading the page (liveCatalogs.ts pushes the new strings).
+if (import.meta.hot) {
+  import.meta.hot.accept();
+}
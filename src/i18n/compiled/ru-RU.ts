@@ -0,0 +1,151 @@
+// Generated by generate_locales.py from public/locales/ru-RU. Do not edit by hand.
+import type { CompiledCatalog } from '../compiledMessages';
+
+const catalog: CompiledCatalog = {
+  landing: {
+    welcome: {
+      variations: [
+        "Привет! 👋 Добро пожаловать в iLaunching. Начнём?",
+        "Привет! Готовы начать что-то потрясающее?",
+        "Добро пожаловать! Давайте начнём ваш путь.",
+        "Привет! Вы пришли в нужное место. Поехали!",
+      ],
+    },
+    welcomeBack: {
+      variations: [
+        "С возвращением! 😊",
+        "Эй, я помню вас! С возвращением!",
+        "Рад видеть вас снова!",
+        "Вы снова здесь! Добро пожаловать!",
+      ],
+    },
+    acknowledge: {
+      variations: [
+        "Спасибо! Минуточку...",
+        "Отлично, проверяю...",
+        "Секунду, проверяю...",
+        "Принято! Быстрая проверка...",
+      ],
+    },
+    checking: {
+      variations: [
+        (p) => "Ищу <strong>" + (p.email ?? '') + "</strong>...",
+        (p) => "Проверяю <strong>" + (p.email ?? '') + "</strong>...",
+        (p) => "Проверяю <strong>" + (p.email ?? '') + "</strong> в системе...",
+        (p) => "Минутку, ищу <strong>" + (p.email ?? '') + "</strong>...",
+      ],
+    },
+    wrongFormat: {
+      variations: [
+        "Хм, это не похоже на действительный email. Попробуйте ещё раз?",
+        "Упс! Неверный формат email. Проверьте ещё раз?",
+        "Что-то не так с этим email. Можете проверить?",
+        "Этот формат email выглядит странно. Проверить ещё раз?",
+      ],
+    },
+    userNotRegistered: {
+      variations: [
+        "Похоже, вы здесь впервые! Это здорово. Хотите присоединиться?",
+        "Я не вижу вас в системе. Готовы начать?",
+        "Новое лицо! Хотите создать аккаунт?",
+        "Вы ещё не зарегистрированы. Изменим это?",
+      ],
+    },
+    askName: {
+      variations: [
+        "Отличный выбор! Как вас зовут?",
+        "Идеально! Как мне вас называть?",
+        "Замечательно! Скажите ваше имя.",
+        "Хорошо! Как вас зовут?",
+      ],
+    },
+    loginPrompt: {
+      variations: [
+        "С возвращением! Какой ваш email?",
+        "Рад видеть вас снова! Введите email.",
+        "Давайте войдём. Какой ваш email?",
+        "Готовы войти? Поделитесь email.",
+      ],
+    },
+    passwordPrompt: {
+      variations: [
+        "Вижу вас! Теперь введите пароль.",
+        "Нашёл! Какой ваш пароль?",
+        "Вот вы где! Введите пароль для продолжения.",
+        "Понял! Теперь ваш пароль, пожалуйста.",
+      ],
+    },
+    passwordCreate: {
+      message: "Отлично! Теперь защитим ваш аккаунт. Создайте пароль (минимум 8 символов):",
+    },
+    passwordTooShort: {
+      message: "Ваш пароль должен быть не менее 8 символов. Попробовать ещё раз?",
+    },
+    nameRequired: {
+      message: "Мне нужно ваше имя, чтобы продолжить. Как вас зовут?",
+    },
+    errors: {
+      generic: "Упс! Что-то пошло не так. Попробуйте ещё раз.",
+      emailCheck: "Не удалось проверить email",
+      loginFailed: "Вход не удался. Проверьте учётные данные.",
+      signupFailed: "Регистрация не удалась. Попробуйте ещё раз.",
+    },
+    placeholders: {
+      email: "Введите вашу электронную почту здесь...",
+      name: "Введите ваше имя...",
+      password_create: "Создайте пароль (минимум 8 символов)...",
+      password_input: "Введите ваш пароль...",
+    },
+    buttons: {
+      yesPlease: "Да, Пожалуйста",
+      logMeIn: "Войти",
+      continueWithoutSignup: "Продолжить без регистрации",
+    },
+  },
+  messages: {
+    emailSignup: {
+      variations: [
+        "<h1>Отлично! Ваша почта подтверждена. 🎉</h1><hr /><h2>Добро пожаловать! 🚀</h2><p>Давайте создадим что-то удивительное вместе...</p>",
+        "<h1>Фантастика! Email подтверждён. ✅</h1><hr /><h2>Время начинать! 💪</h2><p>Готовы начать своё путешествие?</p>",
+        "<h1>Супер! Вы подтверждены. 🎊</h1><hr /><h2>Поехали! 🌟</h2><p>Ваше приключение начинается сейчас...</p>",
+        "<h1>Превосходно! Почта подтверждена. ✨</h1><hr /><h2>Добро пожаловать в команду! 🎯</h2><p>Создадим что-то особенное...</p>",
+      ],
+    },
+    googleSignup: {
+      variations: [
+        "<h1>Добро пожаловать! Вход через Google успешен. 🎉</h1><hr /><h2>Рады вас видеть! 👋</h2><p>Ваш персональный опыт ждёт...</p>",
+        "<h1>Привет! Подключено через Google. ✅</h1><hr /><h2>Поехали! 🚀</h2><p>Время создать что-то потрясающее...</p>",
+        "<h1>Отлично! Аккаунт Google привязан. 🌟</h1><hr /><h2>С возвращением! ��</h2><p>Продолжим с того места, где остановились...</p>",
+        "<h1>Фантастика! Вход через Google завершён. ✨</h1><hr /><h2>Готовы начать! 🎯</h2><p>Ваше путешествие начинается здесь...</p>",
+      ],
+    },
+    facebookSignup: {
+      variations: [
+        "<h1>Добро пожаловать! Вход через Facebook успешен. 🎉</h1><hr /><h2>Рады вас видеть! 👋</h2><p>Ваш опыт начинается сейчас...</p>",
+        "<h1>Привет! Подключено через Facebook. ✅</h1><hr /><h2>Отлично! 🚀</h2><p>Создадим что-то удивительное...</p>",
+        "<h1>Супер! Аккаунт Facebook привязан. 🌟</h1><hr /><h2>Добро пожаловать в клуб! 💫</h2><p>Время начинать...</p>",
+        "<h1>Превосходно! Вход через Facebook завершён. ✨</h1><hr /><h2>Поехали! 🎯</h2><p>Ваше путешествие ждёт...</p>",
+      ],
+    },
+    microsoftSignup: {
+      variations: [
+        "<h1>Добро пожаловать! Вход через Microsoft успешен. 🎉</h1><hr /><h2>Всё настроено! 👋</h2><p>Ваше рабочее пространство готово...</p>",
+        "<h1>Привет! Подключено через Microsoft. ✅</h1><hr /><h2>Готовы начать! 🚀</h2><p>Давайте будем продуктивны...</p>",
+        "<h1>Отлично! Аккаунт Microsoft привязан. 🌟</h1><hr /><h2>Добро пожаловать! 💫</h2><p>Время начинать...</p>",
+        "<h1>Фантастика! Вход через Microsoft завершён. ✨</h1><hr /><h2>Поехали! 🎯</h2><p>Ваши инструменты ждут...</p>",
+      ],
+    },
+    completion: {
+      title: "✅ Всё готово!",
+      subtitle: "Всё готово. Дайте знать, когда будете готовы начать!",
+    },
+  },
+};
+
+export default catalog;
+
+// Regenerated while the dev server runs: accept the update instead of
+// reloading the page (liveCatalogs.ts pushes the new strings).
+if (import.meta.hot) {
+  import.meta.hot.accept();
+}
@@ -0,0 +1,145 @@
+// Generated by generate_locales.py from public/locales/sl-SI. Do not edit by hand.
+import type { CompiledCatalog } from '../compiledMessages';
+
+const catalog: CompiledCatalog = {
+  landing: {
+    welcome: {
+      variations: [
+        "Zdravo! 👋 Dobrodošli v iLaunching. Začnemo?",
+        "Hej! Pripravljeni začeti nekaj neverjetnega?",
+        "Dobrodošli! Začnimo vašo pot.",
+        "Zdravo! Na pravem mestu ste. Začnimo!",
+      ],
+    },
+    welcomeBack: {
+      variations: [
+        "Dobrodošli nazaj! 😊",
+        "Hej, spomnim se vas! Dobrodošli nazaj!",
+        "Vesel sem, da vas spet vidim!",
+        "Spet ste tu! Dobrodošli!",
+      ],
+    },
+    acknowledge: {
+      variations: [
+        "Hvala! Trenutek...",
+        "Odlično, preverjam...",
+        "Sekunda, preverjam...",
+        "Prejeto! Hitra preverba...",
+      ],
+    },
+    checking: {
+      variations: [
+        (p) => "Iščem <strong>" + (p.email ?? '') + "</strong>...",
+        (p) => "Preverjam <strong>" + (p.email ?? '') + "</strong>...",
+        (p) => "Preverjam <strong>" + (p.email ?? '') + "</strong> v sistemu...",
+        (p) => "Trenutek, iščem <strong>" + (p.email ?? '') + "</strong>...",
+      ],
+    },
+    wrongFormat: {
+      variations: [
+        "Hmm, to ne izgleda kot veljaven e-poštni naslov. Poskusite znova?",
+        "Ups! Neveljaven format e-pošte. Preverite znova?",
+        "Nekaj ni v redu s tem e-poštnim naslovom. Lahko preverite?",
+        "Format e-pošte izgleda čudno. Preveriti znova?",
+      ],
+    },
+    userNotRegistered: {
+      variations: [
+        "Zdi se, da ste tukaj novi! To je vznemirljivo. Želite se pridružiti?",
+        "Še vas ne vidim v sistemu. Pripravljeni začeti?",
+        "Nov obraz! Želite ustvariti račun?",
+        "Še niste registrirani. Spremenimo to?",
+      ],
+    },
+    askName: {
+      variations: [
+        "Odlična izbira! Kako vam je ime?",
+        "Popolno! Kako naj vas kličem?",
+        "Čudovito! Povejte mi svoje ime.",
+        "Dobro! Kako vam je ime?",
+      ],
+    },
+    loginPrompt: {
+      variations: [
+        "Dobrodošli nazaj! Kaj je vaš e-poštni naslov?",
+        "Vesel sem, da vas spet vidim! Vnesite svoj e-poštni naslov.",
+        "Prijavimo vas. Kaj je vaš e-poštni naslov?",
+        "Pripravljeni za prijavo? Delite svoj e-poštni naslov.",
+      ],
+    },
+    passwordPrompt: {
+      variations: [
+        "Vidim vas! Zdaj vnesite svoje geslo.",
+        "Našel sem vas! Kakšno je vaše geslo?",
+        "Tu ste! Vnesite geslo za nadaljevanje.",
+        "Razumem! Zdaj vaše geslo, prosim.",
+      ],
+    },
+    passwordCreate: {
+      message: "Popolno! Zdaj zavarujmo vaš račun. Ustvarite geslo (najmanj 8 znakov):",
+    },
+    passwordTooShort: {
+      message: "Vaše geslo mora imeti najmanj 8 znakov. Poskusite znova?",
+    },
+    nameRequired: {
+      message: "Potrebujem vaše ime za nadaljevanje. Kako vam je ime?",
+    },
+    errors: {
+      generic: "Ups! Nekaj je šlo narobe. Prosim poskusite znova.",
+      emailCheck: "Preverjanje e-pošte ni uspelo",
+      loginFailed: "Prijava ni uspela. Preverite svoje podatke.",
+      signupFailed: "Registracija ni uspela. Prosim poskusite znova.",
+    },
+    placeholders: {
+      email: "Vnesite svoj e-poštni naslov tukaj...",
+      name: "Vnesite svoje ime...",
+      password_create: "Ustvarite geslo (najmanj 8 znakov)...",
+      password_input: "Vnesite svoje geslo...",
+    },
+    buttons: {
+      yesPlease: "Ja, Prosim",
+      logMeIn: "Prijavi Se",
+      continueWithoutSignup: "Nadaljuj brez registracije",
+    },
+  },
+  messages: {
+    emailSignup: {
+      variations: [
+        "<h1>Dobrodošli! 🎉</h1><hr /><h2>Dobrodošli! 🚀</h2>",
+      ],
+    },
+    googleSignup: {
+      variations: [
+        "<h1>Dobrodošli! 🎉</h1><hr /><h2>Dobrodošli! 🚀</h2>",
+      ],
+    },
+    facebookSignup: {
+      variations: [
+        "<h1>Dobrodošli! 🎉</h1><hr /><h2>Dobrodošli! 🚀</h2>",
+      ],
+    },
+    microsoftSignup: {
+      variations: [
+        "<h1>Dobrodošli! 🎉</h1><hr /><h2>Dobrodošli! 🚀</h2>",
+      ],
+    },
+    completion: {
+      title: "✅ Končano!",
+      subtitle: "Vse je pripravljeno. Obvestite me, ko boste pripravljeni začeti!",
+    },
+    default: {
+      title: "Dobrodošli! 🎉",
+      subtitle: "Vse je pripravljeno. Obvestite me, ko boste pripravljeni začeti!",
+      building: "Nalaganje...",
+      joining: "",
+    },
+  },
+};
+
+export default catalog;
+
+// Regenerated while the dev server runs: accept the update instead of
+// reloading the page (liveCatalogs.ts pushes the new strings).
+if (import.meta.hot) {
+  import.meta.hot.accept();
+}
@@ -0,0 +1,145 @@
+// Generated by generate_locales.py from public/locales/sr-RS. Do not edit by hand.
+import type { CompiledCatalog } from '../compiledMessages';
+
+const catalog: CompiledCatalog = {
+  landing: {
+    welcome: {
+      variations: [
+        "Здраво! 👋 Добродошли у iLaunching. Почињемо?",
+        "Хеј! Спремни да започнете нешто невероватно?",
+        "Добродошли! Започнимо ваше путовање.",
+        "Здраво! На правом сте месту. Крећемо!",
+      ],
+    },
+    welcomeBack: {
+      variations: [
+        "Добродошли натраг! 😊",
+        "Хеј, сећам се вас! Добродошли натраг!",
+        "Драго ми је да вас поново видим!",
+        "Опет сте ту! Добродошли!",
+      ],
+    },
+    acknowledge: {
+      variations: [
+        "Хвала! Тренутак...",
+        "Савршено, проверавам...",
+        "Секунда, проверавам...",
+        "Примљено! Брза провера...",
+      ],
+    },
+    checking: {
+      variations: [
+        (p) => "Тражим <strong>" + (p.email ?? '') + "</strong>...",
+        (p) => "Проверавам <strong>" + (p.email ?? '') + "</strong>...",
+        (p) => "Проверавам <strong>" + (p.email ?? '') + "</strong> у систему...",
+        (p) => "Тренутак, тражим <strong>" + (p.email ?? '') + "</strong>...",
+      ],
+    },
+    wrongFormat: {
+      variations: [
+        "Хмм, ово не изгледа као исправан email. Покушати поново?",
+        "Упс! Неисправан формат emailа. Проверити поново?",
+        "Нешто није у реду са тим emailом. Можете ли проверити?",
+        "Формат emailа изгледа чудно. Проверити поново?",
+      ],
+    },
+    userNotRegistered: {
+      variations: [
+        "Изгледа да сте нови овде! То је узбудљиво. Желите ли да се придружите?",
+        "Још вас не видим у систему. Спремни за почетак?",
+        "Ново лице! Желите ли да креирате налог?",
+        "Још нисте регистровани. Променимо то?",
+      ],
+    },
+    askName: {
+      variations: [
+        "Одличан избор! Како се зовете?",
+        "Савршено! Како да вас зовем?",
+        "Дивно! Реците ми своје име.",
+        "Добро! Како се зовете?",
+      ],
+    },
+    loginPrompt: {
+      variations: [
+        "Добродошли натраг! Који је ваш email?",
+        "Драго ми је да вас поново видим! Унесите свој email.",
+        "Пријавимо вас. Који је ваш email?",
+        "Спремни за пријаву? Поделите свој email.",
+      ],
+    },
+    passwordPrompt: {
+      variations: [
+        "Видим вас! Сада унесите своју лозинку.",
+        "Пронашао сам вас! Која је ваша лозинка?",
+        "Ту сте! Унесите лозинку за наставак.",
+        "Схватам! Сада вашу лозинку, молим.",
+      ],
+    },
+    passwordCreate: {
+      message: "Савршено! Сада обезбедимо ваш налог. Креирајте лозинку (најмање 8 знакова):",
+    },
+    passwordTooShort: {
+      message: "Ваша лозинка мора имати најмање 8 знакова. Покушати поново?",
+    },
+    nameRequired: {
+      message: "Требам ваше име за наставак. Како се зовете?",
+    },
+    errors: {
+      generic: "Упс! Нешто је пошло по злу. Молим покушајте поново.",
+      emailCheck: "Провера emailа није успела",
+      loginFailed: "Пријава није успела. Проверите своје податке.",
+      signupFailed: "Регистрација није успела. Молим покушајте поново.",
+    },
+    placeholders: {
+      email: "Унесите ваш е-маил овде...",
+      name: "Унесите ваше име...",
+      password_create: "Креирајте лозинку (минимум 8 карактера)...",
+      password_input: "Унесите вашу лозинку...",
+    },
+    buttons: {
+      yesPlease: "Да, Молим",
+      logMeIn: "Пријави Се",
+      continueWithoutSignup: "Настави без регистрације",
+    },
+  },
+  messages: {
+    emailSignup: {
+      variations: [
+        "<h1>Добродошли! 🎉</h1><hr /><h2>Добродошли! 🚀</h2>",
+      ],
+    },
+    googleSignup: {
+      variations: [
+        "<h1>Добродошли! 🎉</h1><hr /><h2>Добродошли! 🚀</h2>",
+      ],
+    },
+    facebookSignup: {
+      variations: [
+        "<h1>Добродошли! 🎉</h1><hr /><h2>Добродошли! 🚀</h2>",
+      ],
+    },
+    microsoftSignup: {
+      variations: [
+        "<h1>Добродошли! 🎉</h1><hr /><h2>Добродошли! 🚀</h2>",
+      ],
+    },
+    completion: {
+      title: "✅ Готово!",
+      subtitle: "Све је спремно. Јавите ми када будете спремни да почнете!",
+    },
+    default: {
+      title: "Добродошли! 🎉",
+      subtitle: "Све је спремно. Јавите ми када будете спремни да почнете!",
+      building: "Учитавање...",
+      joining: "",
+    },
+  },
+};
+
+export default catalog;
+
+// Regenerated while the dev server runs: accept the update instead of
+// reloading the page (liveCatalogs.ts pushes the new strings).
+if (import.meta.hot) {
+  import.meta.hot.accept();
+}
@@ -0,0 +1,145 @@
+// Generated by generate_locales.py from public/locales/th-TH. Do not edit by hand.
+import type { CompiledCatalog } from '../compiledMessages';
+
+const catalog: CompiledCatalog = {
+  landing: {
+    welcome: {
+      variations: [
+        "สวัสดี! 👋 ยินดีต้อนรับสู่ iLaunching เริ่มกันเลยไหม?",
+        "เฮ้! พร้อมที่จะเริ่มสิ่งที่ยอดเยี่ยมแล้วหรือยัง?",
+        "ยินดีต้อนรับ! มาเริ่มการเดินทางของคุณกันเถอะ",
+        "สวัสดี! คุณมาถูกที่แล้ว เริ่มกันเลย!",
+      ],
+    },
+    welcomeBack: {
+      variations: [
+        "ยินดีต้อนรับกลับมา! 😊",
+        "เฮ้ ฉันจำคุณได้! ยินดีต้อนรับกลับมา!",
+        "ดีใจที่ได้เจอคุณอีกครั้ง!",
+        "คุณกลับมาอีกแล้ว! ยินดีต้อนรับ!",
+      ],
+    },
+    acknowledge: {
+      variations: [
+        "ขอบคุณ! สักครู่...",
+        "เยี่ยม กำลังตรวจสอบ...",
+        "สักวินาที กำลังตรวจสอบ...",
+        "ได้รับแล้ว! ตรวจสอบอย่างรวดเร็ว...",
+      ],
+    },
+    checking: {
+      variations: [
+        (p) => "กำลังค้นหา <strong>" + (p.email ?? '') + "</strong>...",
+        (p) => "กำลังตรวจสอบ <strong>" + (p.email ?? '') + "</strong>...",
+        (p) => "กำลังตรวจสอบ <strong>" + (p.email ?? '') + "</strong> ในระบบ...",
+        (p) => "สักครู่ กำลังค้นหา <strong>" + (p.email ?? '') + "</strong>...",
+      ],
+    },
+    wrongFormat: {
+      variations: [
+        "อืม นี่ดูไม่เหมือนอีเมลที่ถูกต้อง ลองอีกครั้งไหม?",
+        "อ๊ะ! รูปแบบอีเมลไม่ถูกต้อง ตรวจสอบอีกครั้งไหม?",
+        "มีบางอย่างผิดปกติกับอีเมลนั้น คุณช่วยตรวจสอบได้ไหม?",
+        "รูปแบบอีเมลดูแปลกๆ ตรวจสอบอีกครั้งไหม?",
+      ],
+    },
+    userNotRegistered: {
+      variations: [
+        "ดูเหมือนคุณจะเป็นคนใหม่ที่นี่! น่าตื่นเต้นมาก อยากเข้าร่วมไหม?",
+        "ฉันยังไม่เห็นคุณในระบบ พร้อมที่จะเริ่มต้นหรือยัง?",
+        "หน้าใหม่! อยากสร้างบัญชีไหม?",
+        "คุณยังไม่ได้ลงทะเบียน เราจะเปลี่ยนแปลงไหม?",
+      ],
+    },
+    askName: {
+      variations: [
+        "เลือกได้ดีมาก! ชื่อของคุณคืออะไร?",
+        "สุดยอด! ฉันควรเรียกคุณว่าอะไร?",
+        "เยี่ยมมาก! บอกชื่อของคุณหน่อย",
+        "ดีมาก! ชื่อของคุณคืออะไร?",
+      ],
+    },
+    loginPrompt: {
+      variations: [
+        "ยินดีต้อนรับกลับมา! อีเมลของคุณคืออะไร?",
+        "ดีใจที่ได้เจอคุณอีกครั้ง! ใส่อีเมลของคุณ",
+        "มาล็อกอินกัน อีเมลของคุณคืออะไร?",
+        "พร้อมล็อกอินแล้วหรือยัง? แชร์อีเมลของคุณ",
+      ],
+    },
+    passwordPrompt: {
+      variations: [
+        "ฉันเห็นคุณแล้ว! ตอนนี้ใส่รหัสผ่านของคุณ",
+        "เจอแล้ว! รหัสผ่านของคุณคืออะไร?",
+        "อยู่ตรงนั้น! ใส่รหัสผ่านเพื่อดำเนินการต่อ",
+        "เข้าใจแล้ว! ตอนนี้รหัสผ่านของคุณค่ะ",
+      ],
+    },
+    passwordCreate: {
+      message: "สุดยอด! ตอนนี้มาปกป้องบัญชีของคุณกันเถอะ สร้างรหัสผ่าน (อย่างน้อย 8 ตัวอักษร):",
+    },
+    passwordTooShort: {
+      message: "รหัสผ่านของคุณต้องมีอย่างน้อย 8 ตัวอักษร ลองอีกครั้งไหม?",
+    },
+    nameRequired: {
+      message: "ฉันต้องการชื่อของคุณเพื่อดำเนินการต่อ ชื่อของคุณคืออะไร?",
+    },
+    errors: {
+      generic: "อ๊ะ! มีบางอย่างผิดพลาด กรุณาลองอีกครั้ง",
+      emailCheck: "ตรวจสอบอีเมลล้มเหลว",
+      loginFailed: "ล็อกอินล้มเหลว ตรวจสอบข้อมูลประจำตัวของคุณ",
+      signupFailed: "การลงทะเบียนล้มเหลว กรุณาลองอีกครั้ง",
+    },
+    placeholders: {
+      email: "พิมพ์อีเมลของคุณที่นี่...",
+      name: "ป้อนชื่อของคุณ...",
+      password_create: "สร้างรหัสผ่าน (อย่างน้อย 8 ตัวอักษร)...",
+      password_input: "ป้อนรหัสผ่านของคุณ...",
+    },
+    buttons: {
+      yesPlease: "ใช่ค่ะ/ครับ",
+      logMeIn: "เข้าสู่ระบบ",
+      continueWithoutSignup: "ดำเนินการต่อโดยไม่ต้องสมัคร",
+    },
+  },
+  messages: {
+    emailSignup: {
+      variations: [
+        "<h1>ยินดีต้อนรับ! 🎉</h1><hr /><h2>ยินดีต้อนรับ! 🚀</h2>",
+      ],
+    },
+    googleSignup: {
+      variations: [
+        "<h1>ยินดีต้อนรับ! 🎉</h1><hr /><h2>ยินดีต้อนรับ! 🚀</h2>",
+      ],
+    },
+    facebookSignup: {
+      variations: [
+        "<h1>ยินดีต้อนรับ! 🎉</h1><hr /><h2>ยินดีต้อนรับ! 🚀</h2>",
+      ],
+    },
+    microsoftSignup: {
+      variations: [
+        "<h1>ยินดีต้อนรับ! 🎉</h1><hr /><h2>ยินดีต้อนรับ! 🚀</h2>",
+      ],
+    },
+    completion: {
+      title: "✅ เสร็จสิ้น!",
+      subtitle: "ทุกอย่างพร้อมแล้ว แจ้งให้ฉันทราบเมื่อคุณพร้อมที่จะเริ่ม!",
+    },
+    default: {
+      title: "ยินดีต้อนรับ! 🎉",
+      subtitle: "ทุกอย่างพร้อมแล้ว แจ้งให้ฉันทราบเมื่อคุณพร้อมที่จะเริ่ม!",
+      building: "กำลังโหลด...",
+      joining: "",
+    },
+  },
+};
+
+export default catalog;
+
+// Regenerated while the dev server runs: accept the update instead of
+// reloading the page (liveCatalogs.ts pushes the new strings).
+if (import.meta.hot) {
+  import.meta.hot.accept();
+}
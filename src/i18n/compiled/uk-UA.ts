@@ -0,0 +1,145 @@
+// Generated by generate_locales.py from public/locales/uk-UA. Do not edit by hand.
+import type { CompiledCatalog } from '../compiledMessages';
+
+const catalog: CompiledCatalog = {
+  landing: {
+    welcome: {
+      variations: [
+        "Привіт! 👋 Ласкаво просимо до iLaunching. Почнемо?",
+        "Привіт! Готові почати щось чудове?",
+        "Ласкаво просимо! Почнемо вашу подорож.",
+        "Привіт! Ви в правильному місці. Почнемо!",
+      ],
+    },
+    welcomeBack: {
+      variations: [
+        "З поверненням! 😊",
+        "Гей, я пам'ятаю вас! З поверненням!",
+        "Радий бачити вас знову!",
+        "Ви знову тут! Ласкаво просимо!",
+      ],
+    },
+    acknowledge: {
+      variations: [
+        "Дякую! Хвилинку...",
+        "Чудово, перевіряю...",
+        "Секунду, перевіряю...",
+        "Прийнято! Швидка перевірка...",
+      ],
+    },
+    checking: {
+      variations: [
+        (p) => "Шукаю <strong>" + (p.email ?? '') + "</strong>...",
+        (p) => "Перевіряю <strong>" + (p.email ?? '') + "</strong>...",
+        (p) => "Перевіряю <strong>" + (p.email ?? '') + "</strong> в системі...",
+        (p) => "Хвилинку, шукаю <strong>" + (p.email ?? '') + "</strong>...",
+      ],
+    },
+    wrongFormat: {
+      variations: [
+        "Хм, це не схоже на дійсний email. Спробуйте ще раз?",
+        "Ой! Невірний формат email. Перевірте ще раз?",
+        "Щось не так з цим email. Можете перевірити?",
+        "Цей формат email виглядає дивно. Перевірити ще раз?",
+      ],
+    },
+    userNotRegistered: {
+      variations: [
+        "Схоже, ви тут вперше! Це чудово. Хочете приєднатися?",
+        "Я не бачу вас у системі. Готові почати?",
+        "Нове обличчя! Хочете створити обліковий запис?",
+        "Ви ще не зареєстровані. Змінимо це?",
+      ],
+    },
+    askName: {
+      variations: [
+        "Чудовий вибір! Як вас звати?",
+        "Ідеально! Як мені вас називати?",
+        "Прекрасно! Скажіть ваше ім'я.",
+        "Добре! Як вас звати?",
+      ],
+    },
+    loginPrompt: {
+      variations: [
+        "З поверненням! Який ваш email?",
+        "Радий бачити вас знову! Введіть email.",
+        "Давайте увійдемо. Який ваш email?",
+        "Готові увійти? Поділіться email.",
+      ],
+    },
+    passwordPrompt: {
+      variations: [
+        "Бачу вас! Тепер введіть пароль.",
+        "Знайшов! Який ваш пароль?",
+        "Ось ви де! Введіть пароль для продовження.",
+        "Зрозумів! Тепер ваш пароль, будь ласка.",
+      ],
+    },
+    passwordCreate: {
+      message: "Чудово! Тепер захистимо ваш обліковий запис. Створіть пароль (мінімум 8 символів):",
+    },
+    passwordTooShort: {
+      message: "Ваш пароль має бути не менше 8 символів. Спробувати ще раз?",
+    },
+    nameRequired: {
+      message: "Мені потрібне ваше ім'я, щоб продовжити. Як вас звати?",
+    },
+    errors: {
+      generic: "Ой! Щось пішло не так. Спробуйте ще раз.",
+      emailCheck: "Не вдалося перевірити email",
+      loginFailed: "Вхід не вдався. Перевірте облікові дані.",
+      signupFailed: "Реєстрація не вдалася. Спробуйте ще раз.",
+    },
+    placeholders: {
+      email: "Введіть вашу електронну пошту тут...",
+      name: "Введіть ваше ім'я...",
+      password_create: "Створіть пароль (мінімум 8 символів)...",
+      password_input: "Введіть ваш пароль...",
+    },
+    buttons: {
+      yesPlease: "Так, Будь Ласка",
+      logMeIn: "Увійти",
+      continueWithoutSignup: "Продовжити без реєстрації",
+    },
+  },
+  messages: {
+    emailSignup: {
+      variations: [
+        "<h1>Ласкаво просимо! 🎉</h1><hr /><h2>Ласкаво просимо! 🚀</h2>",
+      ],
+    },
+    googleSignup: {
+      variations: [
+        "<h1>Ласкаво просимо! 🎉</h1><hr /><h2>Ласкаво просимо! 🚀</h2>",
+      ],
+    },
+    facebookSignup: {
+      variations: [
+        "<h1>Ласкаво просимо! 🎉</h1><hr /><h2>Ласкаво просимо! 🚀</h2>",
+      ],
+    },
+    microsoftSignup: {
+      variations: [
+        "<h1>Ласкаво просимо! 🎉</h1><hr /><h2>Ласкаво просимо! 🚀</h2>",
+      ],
+    },
+    completion: {
+      title: "✅ Готово!",
+      subtitle: "Все готово. Дайте знати, коли будете готові почати!",
+    },
+    default: {
+      title: "Ласкаво просимо! 🎉",
+      subtitle: "Все готово. Дайте знати, коли будете готові почати!",
+      building: "Завантаження...",
+      joining: "",
+    },
+  },
+};
+
+export default catalog;
+
+// Regenerated while the dev server runs: accept the update instead of
+// reloading the page (liveCatalogs.ts pushes the new strings).
+if (import.meta.hot) {
+  import.meta.hot.accept();
+}
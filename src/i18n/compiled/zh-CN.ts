@@ -0,0 +1,151 @@
+// Generated by generate_locales.py from public/locales/zh-CN. Do not edit by hand.
+import type { CompiledCatalog } from '../compiledMessages';
+
+const catalog: CompiledCatalog = {
+  landing: {
+    welcome: {
+      variations: [
+        "你好！ 👋 欢迎来到iLaunching。开始吧？",
+        "嘿！准备好开始一些了不起的事情了吗？",
+        "欢迎！让我们开始您的旅程。",
+        "你好！您来对地方了。开始吧！",
+      ],
+    },
+    welcomeBack: {
+      variations: [
+        "欢迎回来！ 😊",
+        "嘿，我记得你！欢迎回来！",
+        "很高兴再次见到你！",
+        "你又来了！欢迎！",
+      ],
+    },
+    acknowledge: {
+      variations: [
+        "谢谢！稍等...",
+        "完美，正在检查...",
+        "稍等，正在验证...",
+        "收到！快速检查...",
+      ],
+    },
+    checking: {
+      variations: [
+        (p) => "正在查找<strong>" + (p.email ?? '') + "</strong>...",
+        (p) => "正在检查<strong>" + (p.email ?? '') + "</strong>...",
+        (p) => "正在系统中检查<strong>" + (p.email ?? '') + "</strong>...",
+        (p) => "稍等，正在查找<strong>" + (p.email ?? '') + "</strong>...",
+      ],
+    },
+    wrongFormat: {
+      variations: [
+        "嗯，这看起来不像是有效的电子邮件。再试一次？",
+        "哎呀！无效的电子邮件格式。再检查一次？",
+        "该电子邮件有问题。您能检查一下吗？",
+        "该电子邮件格式看起来很奇怪。再检查一次？",
+      ],
+    },
+    userNotRegistered: {
+      variations: [
+        "看起来你是新来的！太令人兴奋了。想加入吗？",
+        "我在系统中还没有看到您。准备开始了吗？",
+        "新面孔！想创建一个账户吗？",
+        "您还没有注册。我们改变一下？",
+      ],
+    },
+    askName: {
+      variations: [
+        "很棒的选择！您叫什么名字？",
+        "完美！我应该怎么称呼您？",
+        "太好了！告诉我您的名字。",
+        "好的！您叫什么名字？",
+      ],
+    },
+    loginPrompt: {
+      variations: [
+        "欢迎回来！您的电子邮件是什么？",
+        "很高兴再次见到您！输入您的电子邮件。",
+        "让我们登录。您的电子邮件是什么？",
+        "准备登录了吗？分享您的电子邮件。",
+      ],
+    },
+    passwordPrompt: {
+      variations: [
+        "我看到你了！现在输入您的密码。",
+        "找到了！您的密码是什么？",
+        "你在那里！输入您的密码以继续。",
+        "明白了！现在请输入您的密码。",
+      ],
+    },
+    passwordCreate: {
+      message: "完美！现在让我们保护您的账户。创建一个密码（至少8个字符）：",
+    },
+    passwordTooShort: {
+      message: "您的密码需要至少8个字符。再试一次？",
+    },
+    nameRequired: {
+      message: "我需要您的名字才能继续。您叫什么名字？",
+    },
+    errors: {
+      generic: "哎呀！出了点问题。请再试一次。",
+      emailCheck: "检查电子邮件失败",
+      loginFailed: "登录失败。检查您的凭据。",
+      signupFailed: "注册失败。请再试一次。",
+    },
+    placeholders: {
+      email: "在此输入您的电子邮件...",
+      name: "输入您的姓名...",
+      password_create: "创建密码（至少8个字符）...",
+      password_input: "输入您的密码...",
+    },
+    buttons: {
+      yesPlease: "好的，谢谢",
+      logMeIn: "登录",
+      continueWithoutSignup: "不注册继续",
+    },
+  },
+  messages: {
+    emailSignup: {
+      variations: [
+        "<h1>完美！您的邮箱已验证。🎉</h1><hr /><h2>欢迎加入！🚀</h2><p>让我们一起创造精彩...</p>",
+        "<h1>太棒了！邮箱确认完成。✅</h1><hr /><h2>开始吧！💪</h2><p>准备好开始您的旅程了吗？</p>",
+        "<h1>很好！已验证。🎊</h1><hr /><h2>出发！🌟</h2><p>您的冒险现在开始...</p>",
+        "<h1>优秀！邮箱已确认。✨</h1><hr /><h2>欢迎加入团队！🎯</h2><p>让我们创造特别的东西...</p>",
+      ],
+    },
+    googleSignup: {
+      variations: [
+        "<h1>欢迎！Google登录成功。🎉</h1><hr /><h2>很高兴见到您！👋</h2><p>您的个性化体验等着您...</p>",
+        "<h1>您好！已通过Google连接。✅</h1><hr /><h2>出发！🚀</h2><p>是时候创造精彩了...</p>",
+        "<h1>完美！Google账户已关联。🌟</h1><hr /><h2>欢迎回来！💫</h2><p>让我们从上次继续...</p>",
+        "<h1>太棒了！Google登录完成。✨</h1><hr /><h2>准备开始！🎯</h2><p>您的旅程从这里开始...</p>",
+      ],
+    },
+    facebookSignup: {
+      variations: [
+        "<h1>欢迎！Facebook登录成功。🎉</h1><hr /><h2>很高兴有您！👋</h2><p>您的体验现在开始...</p>",
+        "<h1>您好！已通过Facebook连接。✅</h1><hr /><h2>完美！🚀</h2><p>让我们创造精彩...</p>",
+        "<h1>很好！Facebook账户已关联。🌟</h1><hr /><h2>欢迎加入俱乐部！💫</h2><p>是时候开始了...</p>",
+        "<h1>优秀！Facebook登录完成。✨</h1><hr /><h2>出发！🎯</h2><p>您的旅程在等待...</p>",
+      ],
+    },
+    microsoftSignup: {
+      variations: [
+        "<h1>欢迎！Microsoft登录成功。🎉</h1><hr /><h2>一切就绪！👋</h2><p>您的工作区已准备好...</p>",
+        "<h1>您好！已通过Microsoft连接。✅</h1><hr /><h2>准备开始！🚀</h2><p>让我们高效工作...</p>",
+        "<h1>很好！Microsoft账户已关联。🌟</h1><hr /><h2>欢迎加入！💫</h2><p>是时候开始了...</p>",
+        "<h1>太棒了！Microsoft登录完成。✨</h1><hr /><h2>出发！🎯</h2><p>您的工具在等待...</p>",
+      ],
+    },
+    completion: {
+      title: "✅ 全部完成！",
+      subtitle: "一切准备就绪。准备好后请告诉我！",
+    },
+  },
+};
+
+export default catalog;
+
+// Regenerated while the dev server runs: accept the update instead of
+// reloading the page (liveCatalogs.ts pushes the new strings).
+if (import.meta.hot) {
+  import.meta.hot.accept();
+}
@@ -0,0 +1,145 @@
+// Generated by generate_locales.py from public/locales/zh-TW. Do not edit by hand.
+import type { CompiledCatalog } from '../compiledMessages';
+
+const catalog: CompiledCatalog = {
+  landing: {
+    welcome: {
+      variations: [
+        "你好！ 👋 歡迎來到iLaunching。開始吧？",
+        "嘿！準備好開始一些了不起的事情了嗎？",
+        "歡迎！讓我們開始您的旅程。",
+        "你好！您來對地方了。開始吧！",
+      ],
+    },
+    welcomeBack: {
+      variations: [
+        "歡迎回來！ 😊",
+        "嘿，我記得你！歡迎回來！",
+        "很高興再次見到你！",
+        "你又來了！歡迎！",
+      ],
+    },
+    acknowledge: {
+      variations: [
+        "謝謝！稍等...",
+        "完美，正在檢查...",
+        "稍等，正在驗證...",
+        "收到！快速檢查...",
+      ],
+    },
+    checking: {
+      variations: [
+        (p) => "正在查找<strong>" + (p.email ?? '') + "</strong>...",
+        (p) => "正在檢查<strong>" + (p.email ?? '') + "</strong>...",
+        (p) => "正在系統中檢查<strong>" + (p.email ?? '') + "</strong>...",
+        (p) => "稍等，正在查找<strong>" + (p.email ?? '') + "</strong>...",
+      ],
+    },
+    wrongFormat: {
+      variations: [
+        "嗯，這看起來不像是有效的電子郵件。再試一次？",
+        "哎呀！無效的電子郵件格式。再檢查一次？",
+        "該電子郵件有問題。您能檢查一下嗎？",
+        "該電子郵件格式看起來很奇怪。再檢查一次？",
+      ],
+    },
+    userNotRegistered: {
+      variations: [
+        "看起來你是新來的！太令人興奮了。想加入嗎？",
+        "我在系統中還沒有看到您。準備開始了嗎？",
+        "新面孔！想創建一個帳戶嗎？",
+        "您還沒有註冊。我們改變一下？",
+      ],
+    },
+    askName: {
+      variations: [
+        "很棒的選擇！您叫什麼名字？",
+        "完美！我應該怎麼稱呼您？",
+        "太好了！告訴我您的名字。",
+        "好的！您叫什麼名字？",
+      ],
+    },
+    loginPrompt: {
+      variations: [
+        "歡迎回來！您的電子郵件是什麼？",
+        "很高興再次見到您！輸入您的電子郵件。",
+        "讓我們登錄。您的電子郵件是什麼？",
+        "準備登錄了嗎？分享您的電子郵件。",
+      ],
+    },
+    passwordPrompt: {
+      variations: [
+        "我看到你了！現在輸入您的密碼。",
+        "找到了！您的密碼是什麼？",
+        "你在那裡！輸入您的密碼以繼續。",
+        "明白了！現在請輸入您的密碼。",
+      ],
+    },
+    passwordCreate: {
+      message: "完美！現在讓我們保護您的帳戶。創建一個密碼（至少8個字符）：",
+    },
+    passwordTooShort: {
+      message: "您的密碼需要至少8個字符。再試一次？",
+    },
+    nameRequired: {
+      message: "我需要您的名字才能繼續。您叫什麼名字？",
+    },
+    errors: {
+      generic: "哎呀！出了點問題。請再試一次。",
+      emailCheck: "檢查電子郵件失敗",
+      loginFailed: "登錄失敗。檢查您的憑據。",
+      signupFailed: "註冊失敗。請再試一次。",
+    },
+    placeholders: {
+      email: "在此輸入您的電子郵件...",
+      name: "輸入您的姓名...",
+      password_create: "建立密碼（至少8個字元）...",
+      password_input: "輸入您的密碼...",
+    },
+    buttons: {
+      yesPlease: "好的，謝謝",
+      logMeIn: "登入",
+      continueWithoutSignup: "不註冊繼續",
+    },
+  },
+  messages: {
+    emailSignup: {
+      variations: [
+        "<h1>歡迎! 🎉</h1><hr /><h2>歡迎! 🚀</h2>",
+      ],
+    },
+    googleSignup: {
+      variations: [
+        "<h1>歡迎! 🎉</h1><hr /><h2>歡迎! 🚀</h2>",
+      ],
+    },
+    facebookSignup: {
+      variations: [
+        "<h1>歡迎! 🎉</h1><hr /><h2>歡迎! 🚀</h2>",
+      ],
+    },
+    microsoftSignup: {
+      variations: [
+        "<h1>歡迎! 🎉</h1><hr /><h2>歡迎! 🚀</h2>",
+      ],
+    },
+    completion: {
+      title: "✅ 全部完成！",
+      subtitle: "一切準備就緒。準備好後請告訴我！",
+    },
+    default: {
+      title: "歡迎! 🎉",
+      subtitle: "一切準備就緒。準備好後請告訴我！",
+      building: "載入中...",
+      joining: "",
+    },
+  },
+};
+
+export default catalog;
+
+// Regenerated while the dev server runs: accept the update instead of
+// reloading the page (liveCatalogs.ts pushes the new strings).
+if (import.meta.hot) {
+  import.meta.hot.accept();
+}
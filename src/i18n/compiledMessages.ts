@@ -0,0 +1,161 @@
+import i18n from './config';
+
+/**
+ * Precompiled catalogs
+ * generate_locales.py parses every `landing` and `messages` string once and
+ * writes src/i18n/compiled/<locale>.ts: plain strings stay literals, strings
+ * with `{name}` / `{{name}}` placeholders become functions. Rendering them
+ * skips i18next's interpolation parsing and any regex replace.
+ */
+export type CompiledMessage = string | ((params: Record<string, string>) => string);
+export type CompiledValue = CompiledMessage | CompiledValue[] | { [key: string]: CompiledValue };
+export type CompiledCatalog = Record<string, { [key: string]: CompiledValue }>;
+
+const modules = import.meta.glob<{ default: CompiledCatalog }>('./compiled/*.ts');
+const loaded = new Map<string, CompiledCatalog>();
+// Same placeholders as PLACEHOLDER in locale_build/compile.py
+const PLACEHOLDER = /\{\{\s*(\w+)\s*\}\}|\{(\w+)\}/g;
+
+/**
+ * Load the compiled catalog of a locale. Resolves false when the build has
+ * no module for it.
+ */
+export const loadCompiledMessages = async (lng: string): Promise<boolean> => {
+  const loader = modules[`./compiled/${lng}.ts`];
+  if (!loader) {
+    return false;
+  }
+  if (!loaded.has(lng)) {
+    const module = await loader();
+    loaded.set(lng, module.default);
+  }
+  return true;
+};
+
+const lookup = (catalog: CompiledCatalog | undefined, ns: string, keyPath: string): CompiledValue | undefined => {
+  let value: CompiledValue | undefined = catalog?.[ns];
+  for (const part of keyPath.split('.')) {
+    if (value === undefined || typeof value !== 'object' || Array.isArray(value)) {
+      return undefined;
+    }
+    value = value[part];
+  }
+  return value;
+};
+
+/**
+ * Look up a compiled value for the current language, e.g. ('landing', 'checking.variations'),
+ * then for the fallback language as i18next would. Returns undefined until
+ * the locale's module has loaded; callers fall back to i18n.t.
+ */
+export const getCompiled = (ns: string, keyPath: string): CompiledValue | undefined => {
+  const fallback = i18n.options.fallbackLng;
+  const languages = [i18n.resolvedLanguage || i18n.language, ...(typeof fallback === 'string' ? [fallback] : [])];
+  for (const lng of languages) {
+    const value = lookup(loaded.get(lng), ns, keyPath);
+    if (value !== undefined) {
+      return value;
+    }
+  }
+  return undefined;
+};
+
+/**
+ * Compiled message list (e.g. `variations`), or undefined when not available
+ */
+export const getCompiledList = (ns: string, keyPath: string): CompiledMessage[] | undefined => {
+  const value = getCompiled(ns, keyPath);
+  if (!Array.isArray(value) || value.length === 0) {
+    return undefined;
+  }
+  return value.every(item => typeof item === 'string' || typeof item === 'function')
+    ? (value as CompiledMessage[])
+    : undefined;
+};
+
+/**
+ * Compile a catalog string at runtime, as compile.py does at build time
+ * (a missing param renders as an empty string)
+ */
+const compileMessage = (text: string): CompiledMessage =>
+  text.search(PLACEHOLDER) < 0
+    ? text
+    : params => text.replace(PLACEHOLDER, (_match, double?: string, single?: string) => params[double ?? single ?? ''] ?? '');
+
+const compileValue = (value: unknown): CompiledValue | undefined => {
+  if (typeof value === 'string') {
+    return compileMessage(value);
+  }
+  if (Array.isArray(value)) {
+    return value.map(compileValue).filter((item): item is CompiledValue => item !== undefined);
+  }
+  if (value && typeof value === 'object') {
+    const compiled: { [key: string]: CompiledValue } = {};
+    for (const [key, item] of Object.entries(value)) {
+      const entry = compileValue(item);
+      if (entry !== undefined) {
+        compiled[key] = entry;
+      }
+    }
+    return compiled;
+  }
+  return undefined;
+};
+
+const isCompiledObject = (value: CompiledValue | undefined): value is { [key: string]: CompiledValue } =>
+  typeof value === 'object' && value !== null && !Array.isArray(value);
+
+const mergeCompiled = (target: { [key: string]: CompiledValue }, source: { [key: string]: CompiledValue }): void => {
+  for (const [key, value] of Object.entries(source)) {
+    const current = target[key];
+    if (isCompiledObject(current) && isCompiledObject(value)) {
+      mergeCompiled(current, value);
+    } else {
+      target[key] = value;
+    }
+  }
+};
+
+/**
+ * Apply strings pushed live (liveCatalogs.ts) to a loaded compiled catalog.
+ * `resources` holds expanded messages (no template references); with
+ * `replace` they are the whole namespace, otherwise only the changed keys.
+ * Namespaces the catalog does not carry stay on i18next.
+ */
+export const patchCompiledMessages = (
+  lng: string,
+  ns: string,
+  resources: Record<string, unknown>,
+  replace = false
+): void => {
+  const catalog = loaded.get(lng);
+  const compiled = compileValue(resources);
+  if (!catalog || !(ns in catalog) || !isCompiledObject(compiled)) {
+    return;
+  }
+  if (replace) {
+    catalog[ns] = compiled;
+  } else {
+    mergeCompiled(catalog[ns], compiled);
+  }
+};
+
+/**
+ * Render a compiled message with its parameters
+ */
+export const renderMessage = (message: CompiledMessage, params: Record<string, string> = {}): string =>
+  typeof message === 'function' ? message(params) : message;
+
+/**
+ * Keep the current language's compiled catalog loaded
+ */
+export const registerCompiledMessages = (): void => {
+  const load = (lng: string) => {
+    loadCompiledMessages(lng).catch(error => {
+      console.warn('Compiled messages unavailable, using i18next interpolation:', error);
+    });
+  };
+
+  load(i18n.resolvedLanguage || i18n.language);
+  i18n.on('languageChanged', () => load(i18n.resolvedLanguage || i18n.language));
+};
@@ -1,7 +1,9 @@
 import i18n from 'i18next';
 import { initReactI18next } from 'react-i18next';
 import LanguageDetector from 'i18next-browser-languagedetector';
-import Backend from 'i18next-http-backend';
+import { resolveLanguage } from './languageResolution';
+import { catalogUrl } from './catalogPatches';
+import ModuleBackend from './moduleBackend';
 
 // All supported languages with their metadata
 export const SUPPORTED_LANGUAGES = [
@@ -114,7 +116,7 @@ export const SUPPORTED_LANGUAGES = [
 export const RTL_LANGUAGES = ['ar', 'ar-EG', 'ar-SA', 'ar-AE', 'he-IL', 'fa-IR', 'ur-PK'];
 
 i18n
-  .use(Backend)
+  .use(ModuleBackend)
   .use(LanguageDetector)
   .use(initReactI18next)
   .init({
@@ -124,6 +126,7 @@ i18n
     // Language detection options - Enhanced for geographic and browser detection
     detection: {
       // Priority order: Manual selection > Navigator/Browser > HTML tag > Query string
+      // (the edge, locale_build/edge.py, negotiates in the same order)
       order: ['localStorage', 'navigator', 'htmlTag', 'querystring', 'cookie'],
       caches: ['localStorage', 'cookie'],
       lookupLocalStorage: 'i18nextLng',
@@ -132,86 +135,21 @@ i18n
       cookieMinutes: 10080, // 7 days
       cookieDomain: window.location.hostname,
       
-      // Convert browser language codes to our supported codes
-      convertDetectedLanguage: (lng: string) => {
-        // Normalize language code
-        const normalized = lng.toLowerCase();
-        
-        // Map common browser language codes to our supported languages
-        const languageMap: Record<string, string> = {
-          'en-us': 'en',
-          'en-gb': 'en-GB',
-          'en-au': 'en-AU',
-          'en-in': 'en-IN',
-          'es-es': 'es-ES',
-          'es-mx': 'es-MX',
-          'es-ar': 'es-AR',
-          'pt-br': 'pt-BR',
-          'pt-pt': 'pt-PT',
-          'zh-cn': 'zh-CN',
-          'zh-tw': 'zh-TW',
-          'zh-hk': 'zh-HK',
-          'fr-fr': 'fr-FR',
-          'fr-ca': 'fr-CA',
-          'fr-be': 'fr-BE',
-          'de-de': 'de-DE',
-          'ar-sa': 'ar-SA',
-          'ar-eg': 'ar-EG',
-          'ar-ae': 'ar-AE',
-        };
-        
-        // Check exact match
-        if (languageMap[normalized]) {
-          return languageMap[normalized];
-        }
-        
-        // Try base language
-        const baseLang = normalized.split('-')[0];
-        const baseVariants: Record<string, string> = {
-          'en': 'en',
-          'es': 'es-ES',
-          'pt': 'pt-BR',
-          'fr': 'fr-FR',
-          'de': 'de-DE',
-          'zh': 'zh-CN',
-          'ar': 'ar',
-          'ja': 'ja-JP',
-          'ko': 'ko-KR',
-          'it': 'it-IT',
-          'ru': 'ru-RU',
-          'nl': 'nl-NL',
-          'pl': 'pl-PL',
-          'tr': 'tr-TR',
-          'vi': 'vi-VN',
-          'th': 'th-TH',
-          'id': 'id-ID',
-          'hi': 'hi-IN',
-          'bn': 'bn-BD',
-          'uk': 'uk-UA',
-          'sv': 'sv-SE',
-          'no': 'nb-NO',
-          'da': 'da-DK',
-          'fi': 'fi-FI',
-          'cs': 'cs-CZ',
-          'hu': 'hu-HU',
-          'ro': 'ro-RO',
-          'el': 'el-GR',
-          'he': 'he-IL',
-          'fa': 'fa-IR',
-          'ur': 'ur-PK',
-        };
-        
-        return baseVariants[baseLang] || lng;
-      },
+      // Convert browser language codes to a locale that has catalogs
+      // (table generated from public/locales by generate_locales.py)
+      convertDetectedLanguage: resolveLanguage,
     },
     
-    // Backend options for loading translation files
+    // Backend options for loading translation files (used by ModuleBackend
+    // for every catalog not emitted as an ES module)
     backend: {
-      loadPath: '/locales/{{lng}}/{{ns}}.json',
+      // /locales/{{lng}}/{{ns}}.json?v=<hash> (see catalogPatches.ts)
+      loadPath: (lngs: string[], namespaces: string[]) => catalogUrl(lngs[0], namespaces[0]),
     },
     
-    // Namespaces (separate translation files)
-    ns: ['common', 'auth', 'messages', 'landing', 'onboarding', 'smartHub'],
+    // Namespaces (separate translation files). Only `common` loads up front;
+    // pages load their strings as route chunks (see routeCatalogs.ts).
+    ns: ['common'],
     defaultNS: 'common',
     
     interpolation: {
@@ -220,6 +158,9 @@ i18n
     
     react: {
       useSuspense: true,
+      // Re-render when a bundle is added (route chunks, live catalog
+      // updates), not only on language changes
+      bindI18nStore: 'added',
     },
   });
 
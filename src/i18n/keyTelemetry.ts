@@ -0,0 +1,67 @@
+import i18n from './config';
+
+/**
+ * Key-usage telemetry
+ * The message helpers record which catalog key (and which variation of it)
+ * was shown. Hits are batched and posted to VITE_I18N_TELEMETRY_URL, e.g.
+ * the local collector of `python3 locale_telemetry.py collect`; without the
+ * variable nothing is recorded. `locale_telemetry.py ingest` turns the logs
+ * into the hot/cold report that `generate_locales.py --usage` reads.
+ */
+interface KeyHit {
+  locale: string;
+  ns: string;
+  key: string;
+  variation?: number;
+}
+
+const TELEMETRY_URL: string | undefined = import.meta.env.VITE_I18N_TELEMETRY_URL;
+const FLUSH_SIZE = 50;
+const FLUSH_DELAY_MS = 5000;
+
+let pending: KeyHit[] = [];
+let timer: ReturnType<typeof setTimeout> | undefined;
+
+const flush = (): void => {
+  if (timer !== undefined) {
+    clearTimeout(timer);
+    timer = undefined;
+  }
+  if (!TELEMETRY_URL || pending.length === 0) {
+    return;
+  }
+  const body = JSON.stringify({ hits: pending });
+  pending = [];
+  if (!navigator.sendBeacon?.(TELEMETRY_URL, body)) {
+    fetch(TELEMETRY_URL, { method: 'POST', body, keepalive: true }).catch(() => undefined);
+  }
+};
+
+if (TELEMETRY_URL) {
+  window.addEventListener('pagehide', flush);
+}
+
+/**
+ * Record that `ns:key` (variation `variation` of a `variations` list) was shown
+ */
+export const recordKeyHit = (ns: string, key: string, variation?: number): void => {
+  if (!TELEMETRY_URL) {
+    return;
+  }
+  pending.push({ locale: i18n.resolvedLanguage || i18n.language, ns, key, variation });
+  if (pending.length >= FLUSH_SIZE) {
+    flush();
+  } else if (timer === undefined) {
+    timer = setTimeout(flush, FLUSH_DELAY_MS);
+  }
+};
+
+/**
+ * Index of a random variation, recorded as a hit of `ns:keyPath`. A sampled
+ * list passes the positions its items have in the full list (`variationIndices`).
+ */
+export const pickVariation = (ns: string, keyPath: string, count: number, indices?: number[]): number => {
+  const index = Math.floor(Math.random() * count);
+  recordKeyHit(ns, keyPath, indices?.[index] ?? index);
+  return index;
+};
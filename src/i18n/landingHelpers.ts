@@ -1,35 +1,78 @@
 import i18n from './config';
+import { getCompiled, getCompiledList, renderMessage } from './compiledMessages';
+import { pickVariation, recordKeyHit } from './keyTelemetry';
 
 /**
- * Helper function to get a random message from an array
+ * Helper function to get a random message from an array, recorded as a hit of
+ * the landing key it came from
  */
-const getRandomMessage = (variations: string[]): string => {
-  const randomIndex = Math.floor(Math.random() * variations.length);
-  return variations[randomIndex];
+const getRandomMessage = <T>(key: string, variations: T[], indices?: number[]): T => {
+  return variations[pickVariation('landing', `${key}.variations`, variations.length, indices)];
+};
+
+interface VariationList {
+  variations: string[];
+  /** Positions in the full list, set in sampled route chunks */
+  variationIndices?: number[];
+}
+
+const isVariationList = (value: unknown): value is VariationList =>
+  typeof value === 'object' && value !== null && Array.isArray((value as VariationList).variations);
+
+/**
+ * Random variation of a landing key, rendered from the precompiled catalog
+ * when it is loaded and through i18next otherwise. A sampled route chunk
+ * (see routeCatalogs.ts) holds only some variations until the full lists in
+ * `landingVariations` have loaded; builds with a sampling profile leave
+ * `landing` out of the compiled catalog, so those lookups use i18next.
+ * Missing params render as empty strings, as in the compiled messages.
+ */
+const getRandomVariation = (key: string, params: Record<string, string> = {}): string => {
+  const compiled = getCompiledList('landing', `${key}.variations`);
+  if (compiled) {
+    return renderMessage(getRandomMessage(key, compiled), params);
+  }
+  // Passed as a variable so the route scan leaves landingVariations lazy
+  const fullKey = `landingVariations:${key}.variations`;
+  const full = i18n.t(fullKey, { returnObjects: true });
+  const entry: unknown = Array.isArray(full) ? { variations: full } : i18n.t(`landing:${key}`, { returnObjects: true });
+  if (!isVariationList(entry) || entry.variations.length === 0) {
+    return '';
+  }
+  const message = getRandomMessage(key, entry.variations, entry.variationIndices);
+  return message.replace(/\{(\w+)\}/g, (_match, name: string) => params[name] ?? '');
+};
+
+/**
+ * Single landing string, precompiled when available
+ */
+const getLandingText = (key: string): string => {
+  recordKeyHit('landing', key);
+  const compiled = getCompiled('landing', key);
+  return typeof compiled === 'string' || typeof compiled === 'function'
+    ? renderMessage(compiled)
+    : i18n.t(`landing:${key}`);
 };
 
 /**
  * Get a random welcome message in the current language
  */
 export const getRandomWelcomeMessage = (): string => {
-  const variations = i18n.t('landing:welcome.variations', { returnObjects: true }) as string[];
-  return getRandomMessage(variations);
+  return getRandomVariation('welcome');
 };
 
 /**
  * Get a random welcome back message in the current language
  */
 export const getRandomWelcomeBackMessage = (): string => {
-  const variations = i18n.t('landing:welcomeBack.variations', { returnObjects: true }) as string[];
-  return getRandomMessage(variations);
+  return getRandomVariation('welcomeBack');
 };
 
 /**
  * Get a random acknowledge message in the current language
  */
 export const getRandomAcknowledgeMessage = (): string => {
-  const variations = i18n.t('landing:acknowledge.variations', { returnObjects: true }) as string[];
-  return getRandomMessage(variations);
+  return getRandomVariation('acknowledge');
 };
 
 /**
@@ -37,70 +80,63 @@ export const getRandomAcknowledgeMessage = (): string => {
  * @param email - The email to check
  */
 export const getRandomCheckingEmailMessage = (email: string): string => {
-  const variations = i18n.t('landing:checking.variations', { returnObjects: true }) as string[];
-  const message = getRandomMessage(variations);
-  return message.replace('{email}', email);
+  return getRandomVariation('checking', { email });
 };
 
 /**
  * Get a random wrong format message in the current language
  */
 export const getRandomWrongFormatMessage = (): string => {
-  const variations = i18n.t('landing:wrongFormat.variations', { returnObjects: true }) as string[];
-  return getRandomMessage(variations);
+  return getRandomVariation('wrongFormat');
 };
 
 /**
  * Get a random user not registered message in the current language
  */
 export const getRandomUserNotRegisteredMessage = (): string => {
-  const variations = i18n.t('landing:userNotRegistered.variations', { returnObjects: true }) as string[];
-  return getRandomMessage(variations);
+  return getRandomVariation('userNotRegistered');
 };
 
 /**
  * Get a random ask name message in the current language
  */
 export const getRandomAskNameMessage = (): string => {
-  const variations = i18n.t('landing:askName.variations', { returnObjects: true }) as string[];
-  return getRandomMessage(variations);
+  return getRandomVariation('askName');
 };
 
 /**
  * Get a random login prompt message in the current language
  */
 export const getRandomLoginMessage = (): string => {
-  const variations = i18n.t('landing:loginPrompt.variations', { returnObjects: true }) as string[];
-  return getRandomMessage(variations);
+  return getRandomVariation('loginPrompt');
 };
 
 /**
  * Get a random password prompt message in the current language
  */
 export const getRandomPasswordPrompt = (): string => {
-  const variations = i18n.t('landing:passwordPrompt.variations', { returnObjects: true }) as string[];
-  return getRandomMessage(variations);
+  return getRandomVariation('passwordPrompt');
 };
 
 /**
  * Get password create message in the current language
  */
 export const getPasswordCreateMessage = (): string => {
-  return i18n.t('landing:passwordCreate.message');
+  return getLandingText('passwordCreate.message');
 };
 
 /**
  * Get password too short message in the current language
  */
 export const getPasswordTooShortMessage = (): string => {
-  return i18n.t('landing:passwordTooShort.message');
+  return getLandingText('passwordTooShort.message');
 };
 
 /**
  * Get name required message in the current language
  */
 export const getNameRequiredMessage = (): string => {
-  return i18n.t('landing:nameRequired.message');
+  return getLandingText('nameRequired.message');
 };
 
 /**
@@ -108,54 +144,54 @@ export const getNameRequiredMessage = (): string => {
  * @param type - The type of error (generic, emailCheck, loginFailed, signupFailed)
  */
 export const getErrorMessage = (type: 'generic' | 'emailCheck' | 'loginFailed' | 'signupFailed' = 'generic'): string => {
-  return i18n.t(`landing:errors.${type}`);
+  return getLandingText(`errors.${type}`);
 };
 
 /**
  * Get email placeholder in the current language
  */
 export const getEmailPlaceholder = (): string => {
-  return i18n.t('landing:placeholders.email');
+  return getLandingText('placeholders.email');
 };
 
 /**
  * Get name placeholder in the current language
  */
 export const getNamePlaceholder = (): string => {
-  return i18n.t('landing:placeholders.name');
+  return getLandingText('placeholders.name');
 };
 
 /**
  * Get password create placeholder in the current language
  */
 export const getPasswordCreatePlaceholder = (): string => {
-  return i18n.t('landing:placeholders.password_create');
+  return getLandingText('placeholders.password_create');
 };
 
 /**
  * Get password input placeholder in the current language
  */
 export const getPasswordInputPlaceholder = (): string => {
-  return i18n.t('landing:placeholders.password_input');
+  return getLandingText('placeholders.password_input');
 };
 
 /**
  * Get "Yes Please" button text in the current language
  */
 export const getYesPleaseButtonText = (): string => {
-  return i18n.t('landing:buttons.yesPlease');
+  return getLandingText('buttons.yesPlease');
 };
 
 /**
  * Get "Log Me In" button text in the current language
  */
 export const getLogMeInButtonText = (): string => {
-  return i18n.t('landing:buttons.logMeIn');
+  return getLandingText('buttons.logMeIn');
 };
 
 /**
  * Get "Continue without signing up" button text in the current language
  */
 export const getContinueWithoutSignupText = (): string => {
-  return i18n.t('landing:buttons.continueWithoutSignup');
+  return getLandingText('buttons.continueWithoutSignup');
 };
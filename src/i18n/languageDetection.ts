@@ -6,6 +6,9 @@
  * 3. Browser/system language settings
  */
 
+import { LANGUAGE_TABLE } from './languageTable';
+import { hasCatalogs, resolveCountryLanguage, resolveLanguage } from './languageResolution';
+
 // Language to country/region mapping for geographic detection
 export const COUNTRY_TO_LANGUAGE: Record<string, string> = {
   // English-speaking countries
@@ -79,9 +82,10 @@ export async function detectLanguageByGeolocation(): Promise<string | null> {
         const data = await response.json();
         const countryCode = data.country_code || data.countryCode || data.country;
 
-        if (countryCode && COUNTRY_TO_LANGUAGE[countryCode]) {
-          console.log(`🌍 Detected location: ${countryCode}, Language: ${COUNTRY_TO_LANGUAGE[countryCode]}`);
-          return COUNTRY_TO_LANGUAGE[countryCode];
+        const language = countryCode ? resolveCountryLanguage(countryCode) : null;
+        if (language) {
+          console.log(`🌍 Detected location: ${countryCode}, Language: ${language}`);
+          return language;
         }
       } catch (err) {
         // Try next service
@@ -105,27 +109,12 @@ export function detectLanguageFromBrowser(): string | null {
     const browserLanguages = navigator.languages || [navigator.language];
 
     for (const lang of browserLanguages) {
-      // Normalize language code (e.g., "en-US" -> "en")
-      const normalizedLang = lang.toLowerCase();
-
-      // Try exact match first (e.g., "en-US")
-      if (isSupportedLanguage(normalizedLang)) {
-        console.log(`🌐 Browser language detected: ${normalizedLang}`);
-        return normalizedLang;
-      }
-
-      // Try base language (e.g., "en")
-      const baseLang = normalizedLang.split('-')[0];
-      if (isSupportedLanguage(baseLang)) {
-        console.log(`🌐 Browser base language detected: ${baseLang}`);
-        return baseLang;
-      }
-
-      // Try to find a variant match (e.g., "en" -> "en-US")
-      const variantMatch = findLanguageVariant(baseLang);
-      if (variantMatch) {
-        console.log(`🌐 Browser language variant detected: ${variantMatch}`);
-        return variantMatch;
+      // Resolve against the generated table so we only land on locales with catalogs;
+      // a tag that only resolves to the fallback lets the next preference win
+      const resolved = resolveLanguage(lang);
+      if (resolved !== LANGUAGE_TABLE.fallback || lang.toLowerCase().split('-')[0] === LANGUAGE_TABLE.fallback) {
+        console.log(`🌐 Browser language detected: ${lang} -> ${resolved}`);
+        return resolved;
       }
     }
 
@@ -155,26 +144,9 @@ function isSupportedLanguage(langCode: string): boolean {
   return supportedCodes.includes(langCode);
 }
 
-/**
- * Find a supported language variant for a base language
- */
-function findLanguageVariant(baseLang: string): string | null {
-  const variantMap: Record<string, string> = {
-    en: 'en',
-    es: 'es-ES',
-    fr: 'fr-FR',
-    pt: 'pt-BR',
-    zh: 'zh-CN',
-    ar: 'ar',
-    nl: 'nl-NL',
-  };
-
-  return variantMap[baseLang] || null;
-}
-
 /**
  * Get the best language for the user based on all available detection methods
- * Priority: Manual selection > Geographic location > Browser settings > Default (en)
+ * Priority: Manual selection > Edge > Geographic location > Browser settings > Default (en)
  */
 export async function detectBestLanguage(): Promise<string> {
   // 1. Check manual selection (localStorage)
@@ -186,21 +158,29 @@ export async function detectBestLanguage(): Promise<string> {
     return manualSelection;
   }
 
-  // 2. Try geographic location detection
+  // 2. Locale resolved by the edge from the cookie, Accept-Language, ?lng= or country
+  // (locale_edge.py); it already preloaded that locale's catalogs
+  const edgeLanguage = document.documentElement.dataset.edgeLocale;
+  if (edgeLanguage && hasCatalogs(edgeLanguage)) {
+    console.log(`🛰️ Using edge-resolved language: ${edgeLanguage}`);
+    return edgeLanguage;
+  }
+
+  // 3. Try geographic location detection
   const geoLanguage = await detectLanguageByGeolocation();
   if (geoLanguage && isSupportedLanguage(geoLanguage)) {
     console.log(`🌍 Using geographic location: ${geoLanguage}`);
     return geoLanguage;
   }
 
-  // 3. Try browser/system settings
+  // 4. Try browser/system settings
   const browserLanguage = detectLanguageFromBrowser();
   if (browserLanguage) {
     console.log(`🌐 Using browser language: ${browserLanguage}`);
     return browserLanguage;
   }
 
-  // 4. Default to English
+  // 5. Default to English
   console.log(`🔤 Using default language: en`);
   return 'en';
 }
@@ -0,0 +1,88 @@
+import { LANGUAGE_TABLE } from './languageTable';
+
+/**
+ * Language resolution backed by the table generate_locales.py builds from the
+ * catalogs in public/locales. Every result is a locale that has catalogs.
+ */
+export interface LanguageTable {
+  fallback: string;
+  locales: string[];
+  /** Lowercased BCP-47 tag -> locale */
+  tags: Record<string, string>;
+  /** Lowercased base language -> locale */
+  bases: Record<string, string>;
+  /** ISO country code -> locale */
+  countries: Record<string, string>;
+  /** Sorted [folded token, language code] pairs for prefix search */
+  search: [string, string][];
+}
+
+/**
+ * Lowercase and strip diacritics (mirrors fold() in locale_build/languages.py)
+ */
+export const foldSearchText = (text: string): string =>
+  text.normalize('NFKD').replace(/\p{M}/gu, '').toLowerCase();
+
+/**
+ * Resolve any browser/BCP-47 tag to a locale with catalogs. The longest known
+ * prefix wins, so zh-Hant-TW resolves through zh-hant before the base language.
+ */
+export function resolveLanguage(tag: string): string {
+  const subtags = tag.toLowerCase().replace(/_/g, '-').split('-');
+  for (let end = subtags.length; end > 0; end--) {
+    const locale = LANGUAGE_TABLE.tags[subtags.slice(0, end).join('-')];
+    if (locale) return locale;
+  }
+  return LANGUAGE_TABLE.bases[subtags[0]] || LANGUAGE_TABLE.fallback;
+}
+
+/**
+ * Resolve an ISO country code to a locale with catalogs
+ */
+export function resolveCountryLanguage(countryCode: string): string | null {
+  return LANGUAGE_TABLE.countries[countryCode.toUpperCase()] || null;
+}
+
+/**
+ * Whether a locale has catalogs in public/locales
+ */
+export function hasCatalogs(locale: string): boolean {
+  return LANGUAGE_TABLE.locales.includes(locale);
+}
+
+const lowerBound = (prefix: string): number => {
+  const { search } = LANGUAGE_TABLE;
+  let low = 0;
+  let high = search.length;
+  while (low < high) {
+    const mid = (low + high) >>> 1;
+    if (search[mid][0] < prefix) low = mid + 1;
+    else high = mid;
+  }
+  return low;
+};
+
+const codesWithPrefix = (prefix: string): Set<string> => {
+  const { search } = LANGUAGE_TABLE;
+  const codes = new Set<string>();
+  for (let i = lowerBound(prefix); i < search.length && search[i][0].startsWith(prefix); i++) {
+    codes.add(search[i][1]);
+  }
+  return codes;
+};
+
+/**
+ * Codes of languages whose name, native name or code has a word starting with
+ * every word of the query. Returns null for an empty query (match everything).
+ */
+export function searchLanguageCodes(query: string): Set<string> | null {
+  const words = foldSearchText(query).split(/[^\p{L}\p{N}]+/u).filter(Boolean);
+  if (words.length === 0) return null;
+
+  let result = codesWithPrefix(words[0]);
+  for (const word of words.slice(1)) {
+    const next = codesWithPrefix(word);
+    result = new Set([...result].filter(code => next.has(code)));
+  }
+  return result;
+}
@@ -0,0 +1,760 @@
+// Generated by generate_locales.py from public/locales, SUPPORTED_LANGUAGES
+// and COUNTRY_TO_LANGUAGE. Do not edit by hand.
+import type { LanguageTable } from './languageResolution';
+
+export const LANGUAGE_TABLE: LanguageTable = {
+  "fallback": "en",
+  "locales": [
+    "af-ZA",
+    "ar",
+    "ar-EG",
+    "bg-BG",
+    "bn-BD",
+    "ca-ES",
+    "cs-CZ",
+    "da-DK",
+    "de-DE",
+    "el-GR",
+    "en",
+    "es-AR",
+    "es-ES",
+    "es-MX",
+    "et-EE",
+    "fi-FI",
+    "fr-BE",
+    "fr-CA",
+    "fr-FR",
+    "he-IL",
+    "hi-IN",
+    "hr-HR",
+    "hu-HU",
+    "hy-AM",
+    "id-ID",
+    "it-IT",
+    "ja-JP",
+    "ko-KR",
+    "lt-LT",
+    "lv-LV",
+    "mk-MK",
+    "ms-MY",
+    "nb-NO",
+    "nl-NL",
+    "pl-PL",
+    "pt-BR",
+    "pt-PT",
+    "ro-RO",
+    "ru-RU",
+    "sk-SK",
+    "sl-SI",
+    "sq-AL",
+    "sr-RS",
+    "sv-SE",
+    "th-TH",
+    "tr-TR",
+    "uk-UA",
+    "vi-VN",
+    "zh-CN",
+    "zh-TW"
+  ],
+  "tags": {
+    "af-za": "af-ZA",
+    "ar": "ar",
+    "ar-ae": "ar",
+    "ar-eg": "ar-EG",
+    "ar-sa": "ar",
+    "as-in": "en",
+    "az-az": "en",
+    "bg-bg": "bg-BG",
+    "bn-bd": "bn-BD",
+    "ca-es": "ca-ES",
+    "ceb-ph": "en",
+    "cs-cz": "cs-CZ",
+    "cy-gb": "en",
+    "da-dk": "da-DK",
+    "de-de": "de-DE",
+    "el-gr": "el-GR",
+    "en": "en",
+    "en-au": "en",
+    "en-ca": "en",
+    "en-gb": "en",
+    "en-ie": "en",
+    "en-in": "en",
+    "en-nz": "en",
+    "en-ph": "en",
+    "en-us": "en",
+    "es-419": "es-MX",
+    "es-ar": "es-AR",
+    "es-co": "es-MX",
+    "es-es": "es-ES",
+    "es-mx": "es-MX",
+    "et-ee": "et-EE",
+    "eu-es": "en",
+    "fa-ir": "en",
+    "ff-sn": "en",
+    "fi-fi": "fi-FI",
+    "fil-ph": "en",
+    "fr-be": "fr-BE",
+    "fr-ca": "fr-CA",
+    "fr-fr": "fr-FR",
+    "gl-es": "en",
+    "gu-in": "en",
+    "ha-ng": "en",
+    "he-il": "he-IL",
+    "hi-in": "hi-IN",
+    "hr-hr": "hr-HR",
+    "hu-hu": "hu-HU",
+    "hy-am": "hy-AM",
+    "id-id": "id-ID",
+    "ig-ng": "en",
+    "it-it": "it-IT",
+    "ja-jp": "ja-JP",
+    "jv-id": "en",
+    "ka-ge": "en",
+    "kk-kz": "en",
+    "km-kh": "en",
+    "kn-in": "en",
+    "ko-kr": "ko-KR",
+    "ku-tr": "en",
+    "ky-kg": "en",
+    "lt-lt": "lt-LT",
+    "lv-lv": "lv-LV",
+    "ma-in": "en",
+    "mg-mg": "en",
+    "mk-mk": "mk-MK",
+    "ml-in": "en",
+    "mn-mn": "en",
+    "mr-in": "en",
+    "ms-my": "ms-MY",
+    "my-mm": "en",
+    "nb-no": "nb-NO",
+    "ne-np": "en",
+    "nl-be": "nl-NL",
+    "nl-nl": "nl-NL",
+    "nn-no": "nb-NO",
+    "no": "nb-NO",
+    "om-et": "en",
+    "pa-in": "en",
+    "pa-pk": "en",
+    "pl-pl": "pl-PL",
+    "pt-br": "pt-BR",
+    "pt-pt": "pt-PT",
+    "ro-ro": "ro-RO",
+    "ru-ru": "ru-RU",
+    "sd-in": "en",
+    "si-lk": "en",
+    "sk-sk": "sk-SK",
+    "sl-si": "sl-SI",
+    "sn-zw": "en",
+    "so-so": "en",
+    "sq-al": "sq-AL",
+    "sr-rs": "sr-RS",
+    "su-id": "en",
+    "sv-se": "sv-SE",
+    "sw-ke": "en",
+    "ta-in": "en",
+    "te-in": "en",
+    "th-th": "th-TH",
+    "tl-ph": "en",
+    "tr-tr": "tr-TR",
+    "uk-ua": "uk-UA",
+    "ur-pk": "en",
+    "uz-uz": "en",
+    "vi-vn": "vi-VN",
+    "wo-sn": "en",
+    "xh-za": "en",
+    "yo-ng": "en",
+    "zh-cn": "zh-CN",
+    "zh-hans": "zh-CN",
+    "zh-hant": "zh-TW",
+    "zh-hk": "zh-TW",
+    "zh-mo": "zh-TW",
+    "zh-sg": "zh-CN",
+    "zh-tw": "zh-TW",
+    "zu-za": "en"
+  },
+  "bases": {
+    "af": "af-ZA",
+    "ar": "ar",
+    "bg": "bg-BG",
+    "bn": "bn-BD",
+    "ca": "ca-ES",
+    "cs": "cs-CZ",
+    "da": "da-DK",
+    "de": "de-DE",
+    "el": "el-GR",
+    "en": "en",
+    "es": "es-ES",
+    "et": "et-EE",
+    "fi": "fi-FI",
+    "fr": "fr-FR",
+    "he": "he-IL",
+    "hi": "hi-IN",
+    "hr": "hr-HR",
+    "hu": "hu-HU",
+    "hy": "hy-AM",
+    "id": "id-ID",
+    "it": "it-IT",
+    "ja": "ja-JP",
+    "ko": "ko-KR",
+    "lt": "lt-LT",
+    "lv": "lv-LV",
+    "mk": "mk-MK",
+    "ms": "ms-MY",
+    "nb": "nb-NO",
+    "nl": "nl-NL",
+    "nn": "nb-NO",
+    "no": "nb-NO",
+    "pl": "pl-PL",
+    "pt": "pt-BR",
+    "ro": "ro-RO",
+    "ru": "ru-RU",
+    "sk": "sk-SK",
+    "sl": "sl-SI",
+    "sq": "sq-AL",
+    "sr": "sr-RS",
+    "sv": "sv-SE",
+    "th": "th-TH",
+    "tr": "tr-TR",
+    "uk": "uk-UA",
+    "vi": "vi-VN",
+    "zh": "zh-CN"
+  },
+  "countries": {
+    "AE": "ar",
+    "AL": "sq-AL",
+    "AM": "hy-AM",
+    "AO": "pt-PT",
+    "AR": "es-AR",
+    "AT": "de-DE",
+    "AU": "en",
+    "AZ": "en",
+    "BD": "bn-BD",
+    "BE": "fr-BE",
+    "BG": "bg-BG",
+    "BH": "ar",
+    "BO": "es-MX",
+    "BR": "pt-BR",
+    "CA": "fr-CA",
+    "CH": "de-DE",
+    "CI": "fr-FR",
+    "CL": "es-MX",
+    "CM": "fr-FR",
+    "CN": "zh-CN",
+    "CO": "es-MX",
+    "CR": "es-MX",
+    "CU": "es-MX",
+    "CZ": "cs-CZ",
+    "DE": "de-DE",
+    "DK": "da-DK",
+    "DO": "es-MX",
+    "EC": "es-MX",
+    "EE": "et-EE",
+    "EG": "ar-EG",
+    "ES": "es-ES",
+    "ET": "en",
+    "FI": "fi-FI",
+    "FR": "fr-FR",
+    "GB": "en",
+    "GE": "en",
+    "GR": "el-GR",
+    "GT": "es-MX",
+    "HK": "zh-TW",
+    "HN": "es-MX",
+    "HR": "hr-HR",
+    "HU": "hu-HU",
+    "ID": "id-ID",
+    "IE": "en",
+    "IL": "he-IL",
+    "IN": "hi-IN",
+    "IQ": "ar",
+    "IR": "en",
+    "IT": "it-IT",
+    "JO": "ar",
+    "JP": "ja-JP",
+    "KE": "en",
+    "KG": "en",
+    "KH": "en",
+    "KR": "ko-KR",
+    "KW": "ar",
+    "KZ": "en",
+    "LA": "th-TH",
+    "LB": "ar",
+    "LK": "en",
+    "LT": "lt-LT",
+    "LU": "fr-FR",
+    "LV": "lv-LV",
+    "LY": "ar",
+    "MA": "ar",
+    "MC": "fr-FR",
+    "MG": "en",
+    "MK": "mk-MK",
+    "MM": "en",
+    "MX": "es-MX",
+    "MY": "ms-MY",
+    "MZ": "pt-PT",
+    "NG": "en",
+    "NI": "es-MX",
+    "NL": "nl-NL",
+    "NO": "nb-NO",
+    "NP": "en",
+    "NZ": "en",
+    "OM": "ar",
+    "PA": "es-MX",
+    "PE": "es-MX",
+    "PH": "en",
+    "PK": "en",
+    "PL": "pl-PL",
+    "PT": "pt-PT",
+    "PY": "es-MX",
+    "QA": "ar",
+    "RO": "ro-RO",
+    "RS": "sr-RS",
+    "RU": "ru-RU",
+    "SA": "ar",
+    "SE": "sv-SE",
+    "SG": "zh-CN",
+    "SI": "sl-SI",
+    "SK": "sk-SK",
+    "SN": "en",
+    "SO": "en",
+    "SV": "es-MX",
+    "SY": "ar",
+    "TH": "th-TH",
+    "TN": "ar",
+    "TR": "tr-TR",
+    "TW": "zh-TW",
+    "UA": "uk-UA",
+    "US": "en",
+    "UY": "es-MX",
+    "UZ": "en",
+    "VE": "es-MX",
+    "VN": "vi-VN",
+    "YE": "ar",
+    "ZA": "af-ZA",
+    "ZW": "en"
+  },
+  "search": [
+    ["419", "es-419"],
+    ["ae", "ar-AE"],
+    ["af", "af-ZA"],
+    ["afrikaans", "af-ZA"],
+    ["al", "sq-AL"],
+    ["albanian", "sq-AL"],
+    ["am", "hy-AM"],
+    ["america", "es-419"],
+    ["ar", "ar"],
+    ["ar", "ar-AE"],
+    ["ar", "ar-EG"],
+    ["ar", "ar-SA"],
+    ["ar", "es-AR"],
+    ["arab", "ar-AE"],
+    ["arabia", "ar-SA"],
+    ["arabic", "ar"],
+    ["arabic", "ar-AE"],
+    ["arabic", "ar-EG"],
+    ["arabic", "ar-SA"],
+    ["argentina", "es-AR"],
+    ["armenian", "hy-AM"],
+    ["as", "as-IN"],
+    ["assamese", "as-IN"],
+    ["au", "en-AU"],
+    ["australia", "en-AU"],
+    ["az", "az-AZ"],
+    ["azerbaijani", "az-AZ"],
+    ["azərbaycan", "az-AZ"],
+    ["bahasa", "id-ID"],
+    ["bahasa", "ms-MY"],
+    ["basa", "jv-ID"],
+    ["basa", "su-ID"],
+    ["basque", "eu-ES"],
+    ["bd", "bn-BD"],
+    ["be", "fr-BE"],
+    ["be", "nl-BE"],
+    ["belgie", "nl-BE"],
+    ["belgique", "fr-BE"],
+    ["belgium", "fr-BE"],
+    ["belgium", "nl-BE"],
+    ["bengali", "bn-BD"],
+    ["bg", "bg-BG"],
+    ["bn", "bn-BD"],
+    ["bokmal", "nb-NO"],
+    ["br", "pt-BR"],
+    ["brasil", "pt-BR"],
+    ["brazil", "pt-BR"],
+    ["bulgarian", "bg-BG"],
+    ["burmese", "my-MM"],
+    ["ca", "ca-ES"],
+    ["ca", "fr-CA"],
+    ["canada", "fr-CA"],
+    ["catala", "ca-ES"],
+    ["catalan", "ca-ES"],
+    ["ceb", "ceb-PH"],
+    ["cebuano", "ceb-PH"],
+    ["cestina", "cs-CZ"],
+    ["chinese", "zh-CN"],
+    ["chinese", "zh-HK"],
+    ["chinese", "zh-TW"],
+    ["cn", "zh-CN"],
+    ["co", "es-CO"],
+    ["colombia", "es-CO"],
+    ["croatian", "hr-HR"],
+    ["cs", "cs-CZ"],
+    ["cy", "cy-GB"],
+    ["cymraeg", "cy-GB"],
+    ["cz", "cs-CZ"],
+    ["czech", "cs-CZ"],
+    ["da", "da-DK"],
+    ["danish", "da-DK"],
+    ["dansk", "da-DK"],
+    ["de", "de-DE"],
+    ["deutsch", "de-DE"],
+    ["dk", "da-DK"],
+    ["dutch", "nl-BE"],
+    ["dutch", "nl-NL"],
+    ["ee", "et-EE"],
+    ["eesti", "et-EE"],
+    ["eg", "ar-EG"],
+    ["egypt", "ar-EG"],
+    ["el", "el-GR"],
+    ["emirates", "ar-AE"],
+    ["en", "en"],
+    ["en", "en-AU"],
+    ["en", "en-GB"],
+    ["en", "en-IN"],
+    ["en", "en-PH"],
+    ["english", "en"],
+    ["english", "en-AU"],
+    ["english", "en-GB"],
+    ["english", "en-IN"],
+    ["english", "en-PH"],
+    ["es", "ca-ES"],
+    ["es", "es-419"],
+    ["es", "es-AR"],
+    ["es", "es-CO"],
+    ["es", "es-ES"],
+    ["es", "es-MX"],
+    ["es", "eu-ES"],
+    ["es", "gl-ES"],
+    ["espanol", "es-419"],
+    ["espanol", "es-AR"],
+    ["espanol", "es-CO"],
+    ["espanol", "es-ES"],
+    ["espanol", "es-MX"],
+    ["estonian", "et-EE"],
+    ["et", "et-EE"],
+    ["et", "om-ET"],
+    ["eu", "eu-ES"],
+    ["euskara", "eu-ES"],
+    ["fa", "fa-IR"],
+    ["farsi", "fa-IR"],
+    ["ff", "ff-SN"],
+    ["fi", "fi-FI"],
+    ["finnish", "fi-FI"],
+    ["fr", "fr-BE"],
+    ["fr", "fr-CA"],
+    ["fr", "fr-FR"],
+    ["francais", "fr-BE"],
+    ["francais", "fr-CA"],
+    ["francais", "fr-FR"],
+    ["france", "fr-FR"],
+    ["french", "fr-BE"],
+    ["french", "fr-CA"],
+    ["french", "fr-FR"],
+    ["fula", "ff-SN"],
+    ["fulfulde", "ff-SN"],
+    ["galego", "gl-ES"],
+    ["galician", "gl-ES"],
+    ["gb", "cy-GB"],
+    ["gb", "en-GB"],
+    ["ge", "ka-GE"],
+    ["georgian", "ka-GE"],
+    ["german", "de-DE"],
+    ["gl", "gl-ES"],
+    ["gr", "el-GR"],
+    ["greek", "el-GR"],
+    ["gu", "gu-IN"],
+    ["gujarati", "gu-IN"],
+    ["ha", "ha-NG"],
+    ["hausa", "ha-NG"],
+    ["he", "he-IL"],
+    ["hebrew", "he-IL"],
+    ["hi", "hi-IN"],
+    ["hindi", "hi-IN"],
+    ["hk", "zh-HK"],
+    ["hong", "zh-HK"],
+    ["hr", "hr-HR"],
+    ["hrvatski", "hr-HR"],
+    ["hu", "hu-HU"],
+    ["hungarian", "hu-HU"],
+    ["hy", "hy-AM"],
+    ["id", "id-ID"],
+    ["id", "jv-ID"],
+    ["id", "su-ID"],
+    ["ig", "ig-NG"],
+    ["igbo", "ig-NG"],
+    ["il", "he-IL"],
+    ["in", "as-IN"],
+    ["in", "en-IN"],
+    ["in", "gu-IN"],
+    ["in", "hi-IN"],
+    ["in", "kn-IN"],
+    ["in", "ma-IN"],
+    ["in", "ml-IN"],
+    ["in", "mr-IN"],
+    ["in", "pa-IN"],
+    ["in", "sd-IN"],
+    ["in", "ta-IN"],
+    ["in", "te-IN"],
+    ["india", "en-IN"],
+    ["india", "pa-IN"],
+    ["indonesia", "id-ID"],
+    ["indonesian", "id-ID"],
+    ["ir", "fa-IR"],
+    ["isixhosa", "xh-ZA"],
+    ["isizulu", "zu-ZA"],
+    ["it", "it-IT"],
+    ["italian", "it-IT"],
+    ["italiano", "it-IT"],
+    ["ja", "ja-JP"],
+    ["japanese", "ja-JP"],
+    ["javanese", "jv-ID"],
+    ["jawa", "jv-ID"],
+    ["jp", "ja-JP"],
+    ["jv", "jv-ID"],
+    ["ka", "ka-GE"],
+    ["kannada", "kn-IN"],
+    ["kazakh", "kk-KZ"],
+    ["ke", "sw-KE"],
+    ["kg", "ky-KG"],
+    ["kh", "km-KH"],
+    ["khmer", "km-KH"],
+    ["kingdom", "en-GB"],
+    ["kiswahili", "sw-KE"],
+    ["kk", "kk-KZ"],
+    ["km", "km-KH"],
+    ["kn", "kn-IN"],
+    ["ko", "ko-KR"],
+    ["kong", "zh-HK"],
+    ["korean", "ko-KR"],
+    ["kr", "ko-KR"],
+    ["ku", "ku-TR"],
+    ["kurdi", "ku-TR"],
+    ["kurdish", "ku-TR"],
+    ["ky", "ky-KG"],
+    ["kyrgyz", "ky-KG"],
+    ["kz", "kk-KZ"],
+    ["latin", "es-419"],
+    ["latinoamerica", "es-419"],
+    ["latvian", "lv-LV"],
+    ["latviesu", "lv-LV"],
+    ["lietuviu", "lt-LT"],
+    ["lithuanian", "lt-LT"],
+    ["lk", "si-LK"],
+    ["lt", "lt-LT"],
+    ["lv", "lv-LV"],
+    ["ma", "ma-IN"],
+    ["macedonian", "mk-MK"],
+    ["magyar", "hu-HU"],
+    ["maithili", "ma-IN"],
+    ["malagasy", "mg-MG"],
+    ["malayalam", "ml-IN"],
+    ["malaysian", "ms-MY"],
+    ["marathi", "mr-IN"],
+    ["melayu", "ms-MY"],
+    ["mexico", "es-MX"],
+    ["mg", "mg-MG"],
+    ["mk", "mk-MK"],
+    ["ml", "ml-IN"],
+    ["mm", "my-MM"],
+    ["mn", "mn-MN"],
+    ["mongolian", "mn-MN"],
+    ["mr", "mr-IN"],
+    ["ms", "ms-MY"],
+    ["mx", "es-MX"],
+    ["my", "ms-MY"],
+    ["my", "my-MM"],
+    ["nb", "nb-NO"],
+    ["ne", "ne-NP"],
+    ["nederlands", "nl-BE"],
+    ["nederlands", "nl-NL"],
+    ["nepali", "ne-NP"],
+    ["netherlands", "nl-NL"],
+    ["ng", "ha-NG"],
+    ["ng", "ig-NG"],
+    ["ng", "yo-NG"],
+    ["nl", "nl-BE"],
+    ["nl", "nl-NL"],
+    ["no", "nb-NO"],
+    ["norsk", "nb-NO"],
+    ["norwegian", "nb-NO"],
+    ["np", "ne-NP"],
+    ["om", "om-ET"],
+    ["oromo", "om-ET"],
+    ["oromoo", "om-ET"],
+    ["oʻzbek", "uz-UZ"],
+    ["pa", "pa-IN"],
+    ["pa", "pa-PK"],
+    ["pakistan", "pa-PK"],
+    ["ph", "ceb-PH"],
+    ["ph", "en-PH"],
+    ["ph", "tl-PH"],
+    ["philippines", "en-PH"],
+    ["pk", "pa-PK"],
+    ["pk", "ur-PK"],
+    ["pl", "pl-PL"],
+    ["polish", "pl-PL"],
+    ["polski", "pl-PL"],
+    ["portugal", "pt-PT"],
+    ["portugues", "pt-BR"],
+    ["portugues", "pt-PT"],
+    ["portuguese", "pt-BR"],
+    ["portuguese", "pt-PT"],
+    ["pt", "pt-BR"],
+    ["pt", "pt-PT"],
+    ["punjabi", "pa-IN"],
+    ["punjabi", "pa-PK"],
+    ["ro", "ro-RO"],
+    ["romana", "ro-RO"],
+    ["romanian", "ro-RO"],
+    ["rs", "sr-RS"],
+    ["ru", "ru-RU"],
+    ["russian", "ru-RU"],
+    ["sa", "ar-SA"],
+    ["saudi", "ar-SA"],
+    ["sd", "sd-IN"],
+    ["se", "sv-SE"],
+    ["serbian", "sr-RS"],
+    ["shona", "sn-ZW"],
+    ["shqip", "sq-AL"],
+    ["si", "si-LK"],
+    ["si", "sl-SI"],
+    ["simplified", "zh-CN"],
+    ["sindhi", "sd-IN"],
+    ["sinhala", "si-LK"],
+    ["sk", "sk-SK"],
+    ["sl", "sl-SI"],
+    ["slovak", "sk-SK"],
+    ["slovencina", "sk-SK"],
+    ["slovenian", "sl-SI"],
+    ["slovenscina", "sl-SI"],
+    ["sn", "ff-SN"],
+    ["sn", "sn-ZW"],
+    ["sn", "wo-SN"],
+    ["so", "so-SO"],
+    ["somali", "so-SO"],
+    ["soomaali", "so-SO"],
+    ["spain", "es-ES"],
+    ["spanish", "es-419"],
+    ["spanish", "es-AR"],
+    ["spanish", "es-CO"],
+    ["spanish", "es-ES"],
+    ["spanish", "es-MX"],
+    ["sq", "sq-AL"],
+    ["sr", "sr-RS"],
+    ["states", "en"],
+    ["su", "su-ID"],
+    ["sunda", "su-ID"],
+    ["sundanese", "su-ID"],
+    ["suomi", "fi-FI"],
+    ["sv", "sv-SE"],
+    ["svenska", "sv-SE"],
+    ["sw", "sw-KE"],
+    ["swahili", "sw-KE"],
+    ["swedish", "sv-SE"],
+    ["ta", "ta-IN"],
+    ["tagalog", "tl-PH"],
+    ["taiwan", "zh-TW"],
+    ["tamil", "ta-IN"],
+    ["te", "te-IN"],
+    ["telugu", "te-IN"],
+    ["th", "th-TH"],
+    ["thai", "th-TH"],
+    ["tieng", "vi-VN"],
+    ["tl", "tl-PH"],
+    ["tr", "ku-TR"],
+    ["tr", "tr-TR"],
+    ["traditional", "zh-HK"],
+    ["traditional", "zh-TW"],
+    ["turkce", "tr-TR"],
+    ["turkey", "ku-TR"],
+    ["turkish", "tr-TR"],
+    ["tw", "zh-TW"],
+    ["ua", "uk-UA"],
+    ["uk", "en-GB"],
+    ["uk", "uk-UA"],
+    ["ukrainian", "uk-UA"],
+    ["united", "ar-AE"],
+    ["united", "en"],
+    ["united", "en-GB"],
+    ["ur", "ur-PK"],
+    ["urdu", "ur-PK"],
+    ["uz", "uz-UZ"],
+    ["uzbek", "uz-UZ"],
+    ["vi", "vi-VN"],
+    ["viet", "vi-VN"],
+    ["vietnamese", "vi-VN"],
+    ["vn", "vi-VN"],
+    ["welsh", "cy-GB"],
+    ["wo", "wo-SN"],
+    ["wolof", "wo-SN"],
+    ["xh", "xh-ZA"],
+    ["xhosa", "xh-ZA"],
+    ["yo", "yo-NG"],
+    ["yoruba", "yo-NG"],
+    ["za", "af-ZA"],
+    ["za", "xh-ZA"],
+    ["za", "zu-ZA"],
+    ["zh", "zh-CN"],
+    ["zh", "zh-HK"],
+    ["zh", "zh-TW"],
+    ["zu", "zu-ZA"],
+    ["zulu", "zu-ZA"],
+    ["zw", "sn-ZW"],
+    ["ελληνικα", "el-GR"],
+    ["български", "bg-BG"],
+    ["кыргызча", "ky-KG"],
+    ["македонски", "mk-MK"],
+    ["монгол", "mn-MN"],
+    ["русскии", "ru-RU"],
+    ["српски", "sr-RS"],
+    ["украінська", "uk-UA"],
+    ["қазақ", "kk-KZ"],
+    ["հայերեն", "hy-AM"],
+    ["עברית", "he-IL"],
+    ["اردو", "ur-PK"],
+    ["الامارات", "ar-AE"],
+    ["السعودية", "ar-SA"],
+    ["العربية", "ar"],
+    ["العربية", "ar-AE"],
+    ["العربية", "ar-EG"],
+    ["العربية", "ar-SA"],
+    ["سنڌي", "sd-IN"],
+    ["فارسی", "fa-IR"],
+    ["مصر", "ar-EG"],
+    ["پنجابی", "pa-PK"],
+    ["नपल", "ne-NP"],
+    ["मथल", "ma-IN"],
+    ["मरठ", "mr-IN"],
+    ["हनद", "hi-IN"],
+    ["অসময", "as-IN"],
+    ["বল", "bn-BD"],
+    ["ਪਜਬ", "pa-IN"],
+    ["ગજરત", "gu-IN"],
+    ["தமழ", "ta-IN"],
+    ["తలగ", "te-IN"],
+    ["ಕನನಡ", "kn-IN"],
+    ["മലയള", "ml-IN"],
+    ["සහල", "si-LK"],
+    ["ไทย", "th-TH"],
+    ["မနမ", "my-MM"],
+    ["ქართული", "ka-GE"],
+    ["한국어", "ko-KR"],
+    ["ខមរ", "km-KH"],
+    ["台灣", "zh-TW"],
+    ["日本語", "ja-JP"],
+    ["简体中文", "zh-CN"],
+    ["繁體中文", "zh-HK"],
+    ["繁體中文", "zh-TW"],
+    ["香港", "zh-HK"]
+  ]
+};
@@ -0,0 +1,75 @@
+import i18n from './config';
+import { patchCompiledMessages } from './compiledMessages';
+import { fillMessageTemplate } from './messageHelpers';
+
+/**
+ * Live catalog updates in development
+ * `python3 locale_daemon.py serve --live` rebuilds the catalogs whenever a
+ * source changes and sends the changed keys over server-sent events. They
+ * are merged into the loaded bundles with `i18n.addResourceBundle`, so edits
+ * show up without a reload or a refetch, and compiled into the loaded
+ * compiled catalog (compiledMessages.ts). Set VITE_I18N_LIVE_URL (e.g.
+ * http://localhost:5176/events) to connect.
+ */
+type LiveCatalogChange =
+  | { lng: string; ns: string; resources: Record<string, unknown> }
+  | { lng: string; ns: string; reload: true };
+
+type Bundle = Record<string, unknown>;
+
+// Derived namespaces are not pushed (locale_build/live.py); they are
+// refetched when their source namespace changes
+const DERIVED_NAMESPACES: Record<string, string> = { landing: 'landingVariations' };
+
+const isTemplateRef = (entry: unknown): entry is { template: string; params?: Record<string, string> } =>
+  typeof entry === 'object' && entry !== null && typeof (entry as { template?: unknown }).template === 'string';
+
+/**
+ * `resources` with template references expanded the way the compiled modules
+ * carry them, including the keys that refer to a changed template
+ */
+const expandTemplates = (lng: string, ns: string, resources: Bundle): Bundle => {
+  const bundle = (i18n.getResourceBundle(lng, ns) ?? {}) as Bundle;
+  const expanded: Bundle = { ...resources };
+  for (const [key, entry] of Object.entries(bundle)) {
+    if (!isTemplateRef(entry) || !(key in resources || entry.template in resources)) {
+      continue;
+    }
+    const variations = (bundle[entry.template] as { variations?: unknown } | undefined)?.variations;
+    expanded[key] = {
+      variations: Array.isArray(variations) ? variations.map(text => fillMessageTemplate(String(text), entry.params)) : [],
+    };
+  }
+  return expanded;
+};
+
+export function registerLiveCatalogs(): void {
+  const url: string | undefined = import.meta.env.VITE_I18N_LIVE_URL;
+  if (!import.meta.env.DEV || !url) {
+    return;
+  }
+
+  const source = new EventSource(url);
+  source.addEventListener('catalog', event => {
+    const { changes } = JSON.parse((event as MessageEvent<string>).data) as { changes: LiveCatalogChange[] };
+    for (const change of changes) {
+      // Bundles that are not loaded yet are fetched fresh when needed
+      if (!i18n.hasResourceBundle(change.lng, change.ns)) {
+        continue;
+      }
+      const { lng, ns } = change;
+      if ('reload' in change) {
+        i18n.reloadResources([lng], [ns]).then(() => {
+          patchCompiledMessages(lng, ns, expandTemplates(lng, ns, i18n.getResourceBundle(lng, ns) ?? {}), true);
+        });
+      } else {
+        i18n.addResourceBundle(lng, ns, change.resources, true, true);
+        patchCompiledMessages(lng, ns, expandTemplates(lng, ns, change.resources));
+      }
+      const derived = DERIVED_NAMESPACES[ns];
+      if (derived && i18n.hasResourceBundle(lng, derived)) {
+        i18n.reloadResources([lng], [derived]);
+      }
+    }
+  });
+}
@@ -0,0 +1,44 @@
+import i18n from './config';
+import { loadCatalogManifest } from './catalogPatches';
+
+const LINK_ID = 'locale-font';
+
+/**
+ * Swap the <link> that loads the active locale's subset font.
+ * Only locales listed under `fonts` in /locales/manifest.json have one
+ * (written by `python3 generate_locales.py --font-source <locale>=<font file>`).
+ * The @font-face rule declares 'Locale Sans' with a unicode-range limited to
+ * the glyphs the catalogs use, and index.css only puts that family in the
+ * stack while `data-locale-font` is set on <html>.
+ */
+export const applyLocaleFont = async (lng: string): Promise<void> => {
+  const href = (await loadCatalogManifest())?.fonts?.[lng];
+  const existing = document.getElementById(LINK_ID);
+
+  if (!href) {
+    existing?.remove();
+    delete document.documentElement.dataset.localeFont;
+    return;
+  }
+
+  document.documentElement.dataset.localeFont = lng;
+  if (existing?.getAttribute('href') === href) return;
+
+  const link = document.createElement('link');
+  link.id = LINK_ID;
+  link.rel = 'stylesheet';
+  link.href = href;
+  if (existing) {
+    existing.replaceWith(link);
+  } else {
+    document.head.appendChild(link);
+  }
+};
+
+/**
+ * Load the subset font for the current language and follow language changes
+ */
+export const registerLocaleFonts = (): void => {
+  applyLocaleFont(i18n.resolvedLanguage || i18n.language);
+  i18n.on('languageChanged', applyLocaleFont);
+};
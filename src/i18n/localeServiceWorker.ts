@@ -0,0 +1,34 @@
+import i18n from './config';
+import { loadCatalogManifest } from './catalogPatches';
+import { readCohort } from './routeCatalogs';
+
+/**
+ * Register public/locale-sw.js and ask it to precache the active locale's
+ * catalogs, again whenever the language changes. Later route changes into
+ * Onboarding or SmartHub then resolve namespace fetches from the cache
+ * instead of suspending on the network. The message carries the build
+ * version of /locales/manifest.json, so a worker holding an older precache
+ * list refetches it, and the cohort that picks the sampled route chunks.
+ */
+export function registerLocaleServiceWorker(): void {
+  if (!('serviceWorker' in navigator) || import.meta.env.DEV) {
+    return;
+  }
+
+  window.addEventListener('load', async () => {
+    try {
+      await navigator.serviceWorker.register('/locale-sw.js');
+      const registration = await navigator.serviceWorker.ready;
+      const version = (await loadCatalogManifest())?.version;
+
+      const precache = (lng: string) => {
+        registration.active?.postMessage({ type: 'PRECACHE_LOCALE', lng, version, cohort: readCohort() });
+      };
+
+      precache(i18n.resolvedLanguage || i18n.language);
+      i18n.on('languageChanged', precache);
+    } catch (error) {
+      console.warn('Locale service worker registration failed:', error);
+    }
+  });
+}
@@ -1,4 +1,6 @@
 import i18n from '@/i18n/config';
+import { getCompiledList, renderMessage } from './compiledMessages';
+import { pickVariation } from './keyTelemetry';
 
 /**
  * Helper function to get random message from i18n translations
@@ -11,34 +13,78 @@ export const getRandomMessage = (variations: readonly string[] | string[]): stri
   return variations[randomIndex];
 };
 
+interface MessageTemplateRef {
+  template: string;
+  params?: Record<string, string>;
+}
+
+/**
+ * Fill `{name}` placeholders of a message template; unknown names are kept
+ */
+export const fillMessageTemplate = (template: string, params: Record<string, string> = {}): string =>
+  template.replace(/\{(\w+)\}/g, (match, name: string) => params[name] ?? match);
+
+/**
+ * Get the variations of a messages key.
+ * generate_locales.py collapses keys that only differ by one word (e.g. the
+ * provider name) into a shared template such as `providerSignup`; those keys
+ * hold `{ template, params }` and are expanded here. The precompiled catalog
+ * already carries them expanded.
+ */
+export const getMessageVariations = (key: string): string[] => {
+  const compiled = getCompiledList('messages', `${key}.variations`);
+  if (compiled) {
+    return compiled.map(message => renderMessage(message));
+  }
+
+  const entry = i18n.t(`messages:${key}`, { returnObjects: true }) as
+    | { variations?: string[] }
+    | MessageTemplateRef
+    | string;
+  if (!entry || typeof entry !== 'object') {
+    return [];
+  }
+
+  if ('template' in entry) {
+    const template = i18n.t(`messages:${entry.template}.variations`, { returnObjects: true }) as string[];
+    return Array.isArray(template) ? template.map(text => fillMessageTemplate(text, entry.params)) : [];
+  }
+
+  return Array.isArray(entry.variations) ? entry.variations : [];
+};
+
+/**
+ * Random variation of a messages key, recorded as a key-usage hit
+ */
+const getRandomMessageVariation = (key: string): string => {
+  const variations = getMessageVariations(key);
+  return variations.length === 0 ? '' : variations[pickVariation('messages', `${key}.variations`, variations.length)];
+};
+
 /**
  * Get random email signup message
  */
 export const getRandomEmailSignupMessage = (): string => {
-  const variations = i18n.t('messages:emailSignup.variations', { returnObjects: true }) as string[];
-  return getRandomMessage(variations);
+  return getRandomMessageVariation('emailSignup');
 };
 
 /**
  * Get random Google signup message
  */
 export const getRandomGoogleSignupMessage = (): string => {
-  const variations = i18n.t('messages:googleSignup.variations', { returnObjects: true }) as string[];
-  return getRandomMessage(variations);
+  return getRandomMessageVariation('googleSignup');
 };
 
 /**
  * Get random Facebook signup message
  */
 export const getRandomFacebookSignupMessage = (): string => {
-  const variations = i18n.t('messages:facebookSignup.variations', { returnObjects: true }) as string[];
-  return getRandomMessage(variations);
+  return getRandomMessageVariation('facebookSignup');
 };
 
 /**
  * Get random Microsoft signup message
  */
 export const getRandomMicrosoftSignupMessage = (): string => {
-  const variations = i18n.t('messages:microsoftSignup.variations', { returnObjects: true }) as string[];
-  return getRandomMessage(variations);
+  return getRandomMessageVariation('microsoftSignup');
 };
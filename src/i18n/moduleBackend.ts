@@ -0,0 +1,71 @@
+import HttpBackend from 'i18next-http-backend';
+import type { BackendModule, InitOptions, ReadCallback, ResourceKey, Services } from 'i18next';
+import { loadCatalogManifest, loadPatchedCatalog, rememberCatalog } from './catalogPatches';
+
+/**
+ * i18next backend for catalogs emitted as ES modules
+ * `python3 generate_locales.py --modules` writes src/i18n/catalogs/<lng>/<ns>.ts.
+ * Vite hashes and code-splits those like any other chunk, and the import()
+ * starts as soon as i18next asks for a namespace. Without that output (the
+ * default build) the glob is empty and every read goes to the http backend,
+ * after trying to patch the copy kept from the last visit (catalogPatches.ts).
+ * The build manifest is loaded first, so the backend's loadPath (catalogUrl)
+ * requests the hashed URL the edge preloaded.
+ */
+type CatalogModule = { default: Record<string, unknown> };
+
+const catalogModules = import.meta.glob<CatalogModule>('./catalogs/*/*.ts');
+const routeModules = import.meta.glob<CatalogModule>('./catalogs/*/_routes/*.ts');
+
+/**
+ * Import a route chunk module, or null when --modules was not used
+ */
+export const importRouteModule = async (lng: string, file: string): Promise<Record<string, unknown> | null> => {
+  const loader = routeModules[`./catalogs/${lng}/_routes/${file}.ts`];
+  return loader ? (await loader()).default : null;
+};
+
+export default class ModuleBackend implements BackendModule {
+  static type = 'backend' as const;
+  type = 'backend' as const;
+  private http = new HttpBackend();
+
+  init(services: Services, backendOptions: object = {}, i18nextOptions: InitOptions = {}): void {
+    this.http.init(services, {
+      ...backendOptions,
+      // The body as received is what rememberCatalog hashes; the manifest
+      // may already describe a newer build than the one that answered
+      parse: (body: string, language?: string | string[], namespace?: string | string[]) => {
+        const data = JSON.parse(body) as Record<string, unknown>;
+        if (typeof language === 'string' && typeof namespace === 'string') {
+          rememberCatalog(language, namespace, data, body);
+        }
+        return data;
+      },
+    }, i18nextOptions);
+  }
+
+  read(language: string, namespace: string, callback: ReadCallback): void {
+    const loader = catalogModules[`./catalogs/${language}/${namespace}.ts`];
+    if (!loader) {
+      this.readHttp(language, namespace, callback);
+      return;
+    }
+    loader().then(
+      module => callback(null, module.default as ResourceKey),
+      () => this.readHttp(language, namespace, callback),
+    );
+  }
+
+  private readHttp(language: string, namespace: string, callback: ReadCallback): void {
+    loadCatalogManifest()
+      .then(() => loadPatchedCatalog(language, namespace))
+      .then(patched => {
+        if (patched) {
+          callback(null, patched as ResourceKey);
+          return;
+        }
+        this.http.read(language, namespace, callback);
+      });
+  }
+}
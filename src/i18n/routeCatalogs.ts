@@ -0,0 +1,190 @@
+import { useTranslation } from 'react-i18next';
+import i18n from './config';
+import { chunkFileUrl } from './catalogPatches';
+import { loadCompiledMessages } from './compiledMessages';
+import { importRouteModule } from './moduleBackend';
+import { ROUTE_CATALOGS, type RouteName } from './routeTable';
+
+/**
+ * Per-route catalog chunks
+ * generate_locales.py scans src/pages and writes
+ * /locales/<lng>/_routes/<route>.json with only the strings each page looks up.
+ * Pages call useRouteCatalog() before useTranslation(), so i18next finds the
+ * bundles already in its store and the page renders without the full
+ * namespaces. A chunk that only holds some keys of a namespace (`partial` in
+ * the route table) leaves a partial bundle, which i18next would otherwise
+ * treat as loaded; the full namespace replaces it once the page is idle.
+ * With `--modules` the chunks are bundled modules instead of fetched JSON.
+ *
+ * Namespaces the compiled modules carry in full (`compiled` in the route
+ * table) have one source: the compiled module, awaited with the chunk. The
+ * chunk only holds their keys looked up through i18next, and a route that
+ * needs nothing else has no chunk. Without a compiled module for the
+ * language they load in full through the backend instead.
+ *
+ * Routes built with a sampling profile (`--sample K --shards N`) carry
+ * `shards`: their chunk is fetched from /locales/<lng>/_sampled/<shard>/, with
+ * K variations per landing key, and the full lists (`landingVariations`) load
+ * once the page is idle. The shard comes from the `i18nCohort` cookie, which
+ * the edge reads to preload the same file. Chunk URLs carry the chunk's hash
+ * from the build manifest as `?v=`, as the edge preloads them.
+ */
+const loaded = new Set<string>();
+const pending = new Map<string, Promise<void>>();
+/** `${lng}|${ns}` bundles holding only the keys of a route chunk */
+const partial = new Set<string>();
+
+const COHORT_COOKIE = 'i18nCohort';
+const COHORTS = 1 << 16;
+const VARIATIONS_NAMESPACE = 'landingVariations';
+
+/**
+ * Cohort from the cookie, or null before one was assigned
+ */
+export const readCohort = (): number | null => {
+  const match = document.cookie.match(new RegExp(`(?:^|; )${COHORT_COOKIE}=(\\d+)`));
+  return match ? Number(match[1]) % COHORTS : null;
+};
+
+/**
+ * Stable cohort of this browser, kept in a cookie for a year
+ */
+const getCohort = (): number => {
+  const stored = readCohort();
+  if (stored !== null) {
+    return stored;
+  }
+  const cohort = Math.floor(Math.random() * COHORTS);
+  document.cookie = `${COHORT_COOKIE}=${cohort}; path=/; max-age=31536000; SameSite=Lax`;
+  return cohort;
+};
+
+const whenIdle = (callback: () => void): void => {
+  if ('requestIdleCallback' in window) {
+    window.requestIdleCallback(callback);
+  } else {
+    setTimeout(callback, 1);
+  }
+};
+
+const chunkUrl = (route: RouteName, lng: string): Promise<string> => {
+  const entry = ROUTE_CATALOGS[route];
+  const shards = (entry as { shards?: number }).shards ?? 0;
+  return chunkFileUrl(lng, shards ? `_sampled/${getCohort() % shards}/${entry.file}` : `_routes/${entry.file}`);
+};
+
+/**
+ * Replace partial bundles with the full namespaces through the backend
+ */
+const loadFullNamespaces = async (lng: string, namespaces: readonly string[]): Promise<void> => {
+  const replace = namespaces.filter(ns => partial.has(`${lng}|${ns}`));
+  if (replace.length > 0) {
+    await i18n.reloadResources([lng], replace);
+    replace.forEach(ns => partial.delete(`${lng}|${ns}`));
+  }
+  await i18n.loadNamespaces(namespaces.filter(ns => !replace.includes(ns)));
+};
+
+/**
+ * Load the compiled module of a route's compiled namespaces, or the full
+ * namespaces when there is none for the language
+ */
+const loadCompiledNamespaces = async (lng: string, namespaces: readonly string[]): Promise<void> => {
+  if (namespaces.length === 0 || (await loadCompiledMessages(lng).catch(() => false))) {
+    return;
+  }
+  // The chunk may have left a bundle with only its literal lookups
+  await i18n.reloadResources([lng], [...namespaces]);
+};
+
+const loadChunkFile = async (route: RouteName, lng: string): Promise<void> => {
+  const { file, namespaces, partial: partialNamespaces } = ROUTE_CATALOGS[route];
+  if (namespaces.length === 0) {
+    return;
+  }
+  try {
+    let chunk = (await importRouteModule(lng, file)) as Record<string, object> | null;
+    if (!chunk) {
+      const url = await chunkUrl(route, lng);
+      const response = await fetch(url);
+      if (!response.ok) {
+        throw new Error(`HTTP ${response.status}`);
+      }
+      chunk = (await response.json()) as Record<string, object>;
+      if (url.includes('/_sampled/')) {
+        whenIdle(() => {
+          i18n.loadNamespaces(VARIATIONS_NAMESPACE).catch(() => undefined);
+        });
+      }
+    }
+    for (const [ns, data] of Object.entries(chunk)) {
+      if ((partialNamespaces as readonly string[]).includes(ns) && !i18n.hasResourceBundle(lng, ns)) {
+        partial.add(`${lng}|${ns}`);
+      }
+      i18n.addResourceBundle(lng, ns, data, true, false);
+    }
+    if (partialNamespaces.length > 0) {
+      whenIdle(() => {
+        loadFullNamespaces(lng, partialNamespaces).catch(() => undefined);
+      });
+    }
+  } catch (error) {
+    // Fall back to the full namespaces through the http backend
+    console.warn(`Route catalog ${route} (${lng}) unavailable:`, error);
+    await loadFullNamespaces(lng, namespaces);
+  }
+};
+
+const loadChunk = async (route: RouteName, lng: string): Promise<void> => {
+  await Promise.all([loadChunkFile(route, lng), loadCompiledNamespaces(lng, ROUTE_CATALOGS[route].compiled)]);
+};
+
+/**
+ * Load a route's strings for a language (and the fallback language)
+ */
+export const loadRouteCatalog = (route: RouteName, lng: string): Promise<void> => {
+  const id = `${lng}|${route}`;
+  if (loaded.has(id)) {
+    return Promise.resolve();
+  }
+
+  let promise = pending.get(id);
+  if (!promise) {
+    const fallback = i18n.options.fallbackLng;
+    const languages = new Set([lng, ...(typeof fallback === 'string' ? [fallback] : [])]);
+    promise = Promise.all([...languages].map(language => loadChunk(route, language)))
+      .then(() => {
+        loaded.add(id);
+      })
+      .finally(() => {
+        // A failed load is retried by the next caller instead of being awaited forever
+        pending.delete(id);
+      });
+    pending.set(id, promise);
+  }
+  return promise;
+};
+
+/**
+ * Start loading the chunk of the route rendered at `pathname` before React
+ * mounts, in parallel with the rest of the app bundle
+ */
+export const preloadRouteCatalog = (pathname: string): void => {
+  const lng = i18n.resolvedLanguage || i18n.language;
+  for (const route of Object.keys(ROUTE_CATALOGS) as RouteName[]) {
+    if ((ROUTE_CATALOGS[route].paths as readonly string[]).includes(pathname)) {
+      loadRouteCatalog(route, lng).catch(() => undefined);
+    }
+  }
+};
+
+/**
+ * Suspend the calling page until its route chunk for the current language is loaded
+ */
+export const useRouteCatalog = (route: RouteName): void => {
+  const { i18n: instance } = useTranslation();
+  const lng = instance.resolvedLanguage || instance.language;
+  if (!loaded.has(`${lng}|${route}`)) {
+    throw loadRouteCatalog(route, lng);
+  }
+};
@@ -0,0 +1,32 @@
+// Generated by generate_locales.py from a usage scan of src/pages. Do not edit by hand.
+export const ROUTE_CATALOGS = {
+  "Landing": {
+    "file": "Landing",
+    "namespaces": [],
+    "partial": [],
+    "compiled": [
+      "landing"
+    ],
+    "paths": [
+      "/"
+    ]
+  },
+  "SignupInterface": {
+    "file": "SignupInterface",
+    "namespaces": [
+      "common",
+      "messages"
+    ],
+    "partial": [
+      "common"
+    ],
+    "compiled": [
+      "messages"
+    ],
+    "paths": [
+      "/signup-interface"
+    ]
+  }
+} as const;
+
+export type RouteName = keyof typeof ROUTE_CATALOGS;
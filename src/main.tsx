@@ -3,10 +3,21 @@ import { createRoot } from 'react-dom/client'
 import './index.css'
 import './styles/StreamAnimation.css'
 import './i18n/config' // Initialize i18n
+import { registerLocaleServiceWorker } from './i18n/localeServiceWorker'
+import { registerLocaleFonts } from './i18n/localeFonts'
+import { registerCompiledMessages } from './i18n/compiledMessages'
+import { preloadRouteCatalog } from './i18n/routeCatalogs'
+import { registerLiveCatalogs } from './i18n/liveCatalogs'
 import App from './App.tsx'
 
 console.log('main.tsx is loading...');
 
+registerLocaleServiceWorker();
+registerLocaleFonts();
+registerCompiledMessages();
+preloadRouteCatalog(window.location.pathname);
+registerLiveCatalogs();
+
 const rootElement = document.getElementById('root');
 console.log('Root element:', rootElement);
 
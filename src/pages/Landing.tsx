@@ -30,9 +30,11 @@ import {
 import { useLandingAuth } from '@/hooks/useLandingAuth';
 import { authApi } from '@/api/auth';
 import { useTranslation } from 'react-i18next';
+import { useRouteCatalog } from '@/i18n/routeCatalogs';
 
 
 export default function Landing() {
+  useRouteCatalog('Landing');
   const { i18n: i18nInstance } = useTranslation();
   
   // Use the auth hook for state management
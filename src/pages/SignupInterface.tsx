@@ -1,6 +1,7 @@
 import { useEffect, useState } from 'react';
 import { useNavigate } from 'react-router-dom';
 import { useTranslation } from 'react-i18next';
+import { useRouteCatalog } from '@/i18n/routeCatalogs';
 import { authApi } from '../api/auth';
 import { useAuthStore } from '@/store/authStore';
 import { 
@@ -14,6 +15,7 @@ import Header from '@/components/layout/Header';
 import GuardedTypewriter from '@/components/GuardedTypewriter';
 
 const SignupInterface = () => {
+  useRouteCatalog('SignupInterface');
   const navigate = useNavigate();
   const { t } = useTranslation(['messages', 'common']);
   const setAuth = useAuthStore((state) => state.setAuth);
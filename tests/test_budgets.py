@@ -0,0 +1,73 @@
+"""A budget violation must stop generate_locales.py before it writes anything.
+
+    python3 -m pytest tests
+"""
+import contextlib
+import hashlib
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import generate_locales  # noqa: E402
+from locale_build.catalog import LOCALES_DIR  # noqa: E402
+from locale_build.compile import COMPILED_DIR  # noqa: E402
+from locale_build.languages import TABLE_TS  # noqa: E402
+from locale_build.modules import MODULES_DIR  # noqa: E402
+from locale_build.routes import ROUTE_TABLE_TS  # noqa: E402
+
+
+def tree_digests(*roots):
+    """``{path: sha256}`` of every file under ``roots`` (files or directories)."""
+    digests = {}
+    for root in roots:
+        paths = [root] if os.path.isfile(root) else (
+            os.path.join(parent, name) for parent, _, names in os.walk(root) for name in names
+        )
+        for path in paths:
+            with open(path, 'rb') as f:
+                digests[path] = hashlib.sha256(f.read()).hexdigest()
+    return digests
+
+
+class BudgetGateTest(unittest.TestCase):
+    def setUp(self):
+        self.cwd = os.getcwd()
+        os.chdir(ROOT)
+        self.tmp = tempfile.mkdtemp()
+        self.locales_dir = os.path.join(self.tmp, 'locales')
+        shutil.copytree(LOCALES_DIR, self.locales_dir)
+        self.state_dir = os.path.join(self.tmp, 'state')
+        self.pseudo_dir = os.path.join(self.tmp, 'pseudo')
+        self.budgets = os.path.join(self.tmp, 'budgets.json')
+        with open(self.budgets, 'w', encoding='utf-8') as f:
+            json.dump({'budgets': {'*': {'raw': 1}}}, f)
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        shutil.rmtree(self.tmp)
+
+    def test_violation_writes_nothing(self):
+        watched = (self.locales_dir, COMPILED_DIR, MODULES_DIR, ROUTE_TABLE_TS, TABLE_TS)
+        before = tree_digests(*(path for path in watched if os.path.exists(path)))
+        argv = [
+            '--locales-dir', self.locales_dir, '--state-dir', self.state_dir, '--budgets', self.budgets,
+            '--pseudo', self.pseudo_dir, '--modules', '--sample', '2', '--baseline', '',
+        ]
+        with contextlib.redirect_stdout(io.StringIO()), self.assertRaises(SystemExit) as raised:
+            generate_locales.main(argv)
+
+        self.assertIn('budget violations, nothing written', str(raised.exception.code))
+        self.assertEqual(tree_digests(*(path for path in watched if os.path.exists(path))), before)
+        self.assertFalse(os.path.exists(self.state_dir))
+        self.assertFalse(os.path.exists(self.pseudo_dir))
+
+
+if __name__ == '__main__':
+    unittest.main()
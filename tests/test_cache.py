@@ -0,0 +1,81 @@
+"""Cache restores must not share files with the cache, and keys must not chase the snapshot.
+
+    python3 -m pytest tests
+"""
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from locale_build import cache  # noqa: E402
+from locale_build.catalog import LOCALES_DIR  # noqa: E402
+from locale_build.manifest import load_snapshot, save_snapshot  # noqa: E402
+
+
+class RestoreTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.cache_dir = os.path.join(self.tmp, 'cache')
+        self.output = os.path.join(self.tmp, 'out', 'landing.json')
+        os.makedirs(os.path.dirname(self.output))
+        with open(self.output, 'w', encoding='utf-8') as f:
+            f.write('{"title": "cached"}\n')
+        cache.store(self.cache_dir, 'k', [self.output])
+        os.remove(self.output)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def test_restored_files_are_copies(self):
+        self.assertEqual(cache.restore(self.cache_dir, 'k'), {'copied': 1, 'current': 0})
+        self.assertEqual(os.stat(self.output).st_nlink, 1)
+        self.assertFalse(os.path.exists(f'{self.output}.tmp'))
+
+    def test_rewriting_a_restored_output_leaves_the_cache_intact(self):
+        cache.restore(self.cache_dir, 'k')
+        # The next build rewrites its outputs in place.
+        with open(self.output, 'w', encoding='utf-8') as f:
+            f.write('{"title": "edited"}\n')
+
+        self.assertEqual(cache.restore(self.cache_dir, 'k'), {'copied': 1, 'current': 0})
+        with open(self.output, encoding='utf-8') as f:
+            self.assertEqual(f.read(), '{"title": "cached"}\n')
+        self.assertEqual(cache.restore(self.cache_dir, 'k'), {'copied': 0, 'current': 1})
+
+
+class CacheKeyTest(unittest.TestCase):
+    def setUp(self):
+        self.cwd = os.getcwd()
+        os.chdir(ROOT)
+        self.state_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        shutil.rmtree(self.state_dir)
+
+    def test_key_ignores_the_snapshot_a_build_writes(self):
+        mode = {'baseline': None}
+        before = cache.cache_key(LOCALES_DIR, mode)
+        save_snapshot(7, {'en': {'landing': {'title': 'x'}}}, self.state_dir)
+        self.assertEqual(load_snapshot(self.state_dir)[0], 7)
+        self.assertEqual(cache.cache_key(LOCALES_DIR, mode), before)
+
+    def test_key_covers_the_deployed_baseline(self):
+        deployed = {'version': 3, 'files': {'en': {'landing': {'hash': 'aaaaaaaaaaaa'}}}}
+        redeployed = {'version': 4, 'files': {'en': {'landing': {'hash': 'bbbbbbbbbbbb'}}}}
+        keys = {
+            cache.cache_key(LOCALES_DIR, {'baseline': cache.baseline_identity(manifest)})
+            for manifest in (None, deployed, redeployed)
+        }
+        self.assertEqual(len(keys), 3)
+        self.assertEqual(
+            cache.baseline_identity(deployed), {'version': 3, 'files': {'en/landing': 'aaaaaaaaaaaa'}}
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
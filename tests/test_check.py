@@ -0,0 +1,101 @@
+"""``generate_locales.py --check`` must pass on the committed tree and name every drift.
+
+    python3 -m pytest tests
+"""
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import generate_locales  # noqa: E402
+from locale_build.catalog import LOCALES_DIR  # noqa: E402
+from locale_build.check import compare, describe  # noqa: E402
+
+
+class CompareTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def path(self, name, payload=None):
+        path = os.path.join(self.tmp, name)
+        if payload is not None:
+            with open(path, 'wb') as f:
+                f.write(payload)
+        return path
+
+    def test_statuses(self):
+        current, changed = self.path('current.json', b'{}'), self.path('changed.json', b'{"a": 1}')
+        missing, stale = self.path('missing.json'), self.path('stale.json', b'{}')
+        problems = compare({current: b'{}', changed: b'{"a": 2}', missing: b'{}'}, [current, changed, stale])
+        self.assertEqual(
+            [(path, status) for path, status, _ in problems],
+            [(changed, 'changed'), (missing, 'missing'), (stale, 'stale')],
+        )
+        self.assertEqual(problems[0][2], b'{"a": 1}')
+
+    def test_describe_json(self):
+        expected = json.dumps({'a': 'x', 'b': {'c': 'y', 'd': 'z'}}).encode('utf-8')
+        actual = json.dumps({'a': 'X', 'b': {'c': 'y'}, 'old': 'w'}).encode('utf-8')
+        self.assertEqual(describe('x.json', expected, actual), '+ 1 (b.d); - 1 (old); ~ 1 (a)')
+        self.assertEqual(describe('x.json', b'{"a": 1}', b'{"a":1}'), 'formatting only')
+        self.assertEqual(describe('x.json', b'{}', b'{'), 'not valid JSON')
+
+    def test_describe_text(self):
+        self.assertEqual(describe('x.ts', b'a\nb\nc\n', b'a\nB\n'), '2 lines added, 1 removed')
+
+
+class CheckModeTest(unittest.TestCase):
+    def setUp(self):
+        self.cwd = os.getcwd()
+        os.chdir(ROOT)
+        self.tmp = tempfile.mkdtemp()
+        self.locales_dir = os.path.join(self.tmp, 'locales')
+        shutil.copytree(LOCALES_DIR, self.locales_dir)
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        shutil.rmtree(self.tmp)
+
+    def check(self):
+        out = io.StringIO()
+        try:
+            code = generate_locales.main(['--check', '--locales-dir', self.locales_dir], out)
+        except SystemExit as exc:
+            code = exc.code
+        return code, out.getvalue()
+
+    def test_committed_tree_is_current(self):
+        code, out = self.check()
+        self.assertEqual(code, 0)
+        self.assertIn('generated files up to date', out)
+
+    def test_drift_is_reported_and_nothing_written(self):
+        edited = os.path.join(self.locales_dir, 'de-DE', 'messages.json')
+        with open(edited, 'rb') as f:
+            original = f.read()
+        with open(edited, 'wb') as f:
+            f.write(original.replace(b'\n  ', b'\n    ', 1))
+        stale = os.path.join(self.locales_dir, 'de-DE', '_routes', 'Removed.json')
+        os.makedirs(os.path.dirname(stale), exist_ok=True)
+        with open(stale, 'wb') as f:
+            f.write(b'{}')
+
+        code, out = self.check()
+        self.assertIn('2 of', code)
+        self.assertIn('generated files are out of date', code)
+        self.assertIn(f'changed  {edited}  formatting only', out)
+        self.assertIn(f'stale    {stale}', out)
+        self.assertTrue(os.path.exists(stale))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+"""Compiled catalog modules must render every string as the catalog has it.
+
+    python3 -m pytest tests
+"""
+import os
+import sys
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from locale_build import compile as compiled  # noqa: E402
+from locale_build.catalog import LOCALES_DIR, read_tree  # noqa: E402
+from locale_build.templates import expand_templates  # noqa: E402
+
+
+def strings(value):
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, list):
+        for item in value:
+            yield from strings(item)
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from strings(item)
+
+
+class CompileTest(unittest.TestCase):
+    def test_split_message(self):
+        self.assertEqual(compiled.split_message('plain'), ['plain'])
+        self.assertEqual(compiled.split_message('Hi {name}, {{ count }} new'), ['Hi ', 'name', ', ', 'count', ' new'])
+        self.assertEqual(compiled.split_message('{a}{b}'), ['', 'a', '', 'b', ''])
+
+    def test_compile_message(self):
+        self.assertEqual(compiled.compile_message('Say "hi" 👋'), '"Say \\"hi\\" 👋"')
+        self.assertEqual(compiled.compile_message('Thank you, {provider}!'),
+                         "(p) => \"Thank you, \" + (p.provider ?? '') + \"!\"")
+        self.assertEqual(compiled.compile_message('{{count}}'), "(p) => (p.count ?? '')")
+
+    def test_render_value_quotes_keys(self):
+        rendered = compiled.render_value({'ok': 'a', 'not-ident': ['b']}, 0)
+        self.assertEqual(rendered, '{\n  ok: "a",\n  "not-ident": [\n    "b",\n  ],\n}')
+
+    def test_hot_keys_limit_the_module(self):
+        namespaces = {'landing': {'hot': 'x', 'cold': 'y'}, 'messages': {'other': 'z'}, 'common': {'skip': 'w'}}
+        module = compiled.render_locale_module('en', namespaces, {'landing': {'hot'}})
+        self.assertIn('hot: "x"', module)
+        self.assertNotIn('cold', module)
+        self.assertNotIn('other', module)
+        self.assertNotIn('skip', module)
+
+    def test_every_catalog_string_survives_compilation(self):
+        catalog = expand_templates(read_tree(LOCALES_DIR))
+        for locale, namespaces in sorted(catalog.items()):
+            module = compiled.render_locale_module(locale, namespaces)
+            with self.subTest(locale=locale):
+                self.assertNotIn('template: "', module)
+                for namespace in compiled.COMPILED_NAMESPACES:
+                    for text in strings(namespaces.get(namespace, {})):
+                        self.assertIn(compiled.compile_message(text), module)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+"""Daemon requests write to their own stream, and its scan memo stays bounded.
+
+    python3 -m pytest tests
+"""
+import contextlib
+import io
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import locale_daemon  # noqa: E402
+from locale_build import routes  # noqa: E402
+
+
+class OutputStreamTest(unittest.TestCase):
+    def setUp(self):
+        self.cwd = os.getcwd()
+        os.chdir(ROOT)
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+
+    def test_command_output_goes_to_the_request_stream(self):
+        out, console = io.StringIO(), io.StringIO()
+        with contextlib.redirect_stdout(console):
+            code = locale_daemon.run_command('validate', ['--baseline', ''], out)
+
+        self.assertEqual(code, 0)
+        self.assertIn('🔎 Validated', out.getvalue())
+        self.assertEqual(console.getvalue(), '')
+
+    def test_errors_go_to_the_request_stream(self):
+        out = io.StringIO()
+        self.assertEqual(locale_daemon.run_command('status', [], out), 1)
+        self.assertEqual(out.getvalue(), '❌ status needs the daemon\n')
+
+    def test_socket_writer_takes_export_bytes(self):
+        wfile = io.BytesIO()
+        writer = locale_daemon._SocketWriter(wfile)
+        writer.buffer.write('{"title": "日本語"}'.encode('utf-8'))
+        self.assertEqual(wfile.getvalue(), b'{"out": "{\\"title\\": \\"\\u65e5\\u672c\\u8a9e\\"}"}\n')
+
+
+class ScanMemoTest(unittest.TestCase):
+    def setUp(self):
+        self.src_dir = tempfile.mkdtemp()
+        self.pages_dir = os.path.join(self.src_dir, 'pages')
+        os.makedirs(self.pages_dir)
+        self.write('pages/Home.tsx', "import Hero from '../Hero';\nt('landing:title');\n")
+        self.write('Hero.tsx', "t('landing:hero');\n")
+
+    def tearDown(self):
+        for key in [key for key in routes._scanned if key[1] == self.src_dir]:
+            del routes._scanned[key]
+        shutil.rmtree(self.src_dir)
+
+    def write(self, name, source):
+        with open(os.path.join(self.src_dir, name), 'w', encoding='utf-8') as f:
+            f.write(source)
+
+    def memo(self):
+        return sorted(os.path.relpath(path, self.src_dir) for path, src in routes._scanned if src == self.src_dir)
+
+    def scan(self):
+        return routes.scan_routes(self.pages_dir, self.src_dir)
+
+    def test_edits_replace_the_entry(self):
+        self.assertEqual(self.scan(), {'Home': {'landing': {'title', 'hero'}}})
+        for revision in range(3):
+            self.write('Hero.tsx', f"t('landing:hero{revision}');\n" + ' ' * revision)
+            self.scan()
+        self.assertEqual(self.memo(), ['Hero.tsx', os.path.join('pages', 'Home.tsx')])
+        self.assertEqual(self.scan(), {'Home': {'landing': {'title', 'hero2'}}})
+
+    def test_unreachable_files_are_forgotten(self):
+        self.scan()
+        self.write('pages/Home.tsx', "t('landing:title');\n// no imports left\n")
+        os.remove(os.path.join(self.src_dir, 'Hero.tsx'))
+        self.assertEqual(self.scan(), {'Home': {'landing': {'title'}}})
+        self.assertEqual(self.memo(), [os.path.join('pages', 'Home.tsx')])
+
+
+if __name__ == '__main__':
+    unittest.main()
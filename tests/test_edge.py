@@ -0,0 +1,87 @@
+"""The edge must pick the locale the client's detector would pick.
+
+    python3 -m pytest tests
+"""
+import os
+import re
+import sys
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from locale_build.edge import negotiate, parse_accept_language, read_language_table  # noqa: E402
+
+CONFIG_TS = os.path.join(ROOT, 'src', 'i18n', 'config.ts')
+# What each i18next detector reads, as the edge sees the request. htmlTag
+# reads the lang the edge injects, so it never disagrees.
+EDGE_SOURCES = {
+    'localStorage': 'cookie',  # cached alongside it
+    'navigator': 'accept-language',
+    'htmlTag': None,
+    'querystring': 'query',
+    'cookie': 'cookie',
+}
+REQUEST = {
+    'cookie': {'cookie': 'i18next=ja-JP'},
+    'accept-language': {'accept_language': 'de-CH,de;q=0.9'},
+    'query': {'query_lng': 'fr-FR'},
+    'country': {'country': 'br'},
+}
+
+
+def client_order():
+    """The detector order of src/i18n/config.ts, in edge sources."""
+    with open(CONFIG_TS, encoding='utf-8') as f:
+        order = re.search(r"order:\s*\[([^\]]*)\]", f.read()).group(1)
+    sources = []
+    for detector in re.findall(r"'(\w+)'", order):
+        source = EDGE_SOURCES[detector]
+        if source and source not in sources:
+            sources.append(source)
+    return sources
+
+
+class NegotiateTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.table = read_language_table(os.path.join(ROOT, 'src', 'i18n', 'languageTable.ts'))
+
+    def negotiate(self, *sources):
+        request = {}
+        for source in sources:
+            request.update(REQUEST[source])
+        return negotiate(self.table, **request)
+
+    def test_follows_the_client_detector_order(self):
+        order = client_order()
+        self.assertEqual(order, ['cookie', 'accept-language', 'query'])
+        # Each source beats every later one, and the country comes last.
+        order.append('country')
+        for index, source in enumerate(order):
+            with self.subTest(source=source):
+                self.assertEqual(self.negotiate(*order[index:])[1], source)
+
+    def test_sources(self):
+        self.assertEqual(self.negotiate('cookie'), ('ja-JP', 'cookie'))
+        self.assertEqual(self.negotiate('accept-language'), ('de-DE', 'accept-language'))
+        self.assertEqual(self.negotiate('query'), ('fr-FR', 'query'))
+        self.assertEqual(self.negotiate('country'), ('pt-BR', 'country'))
+        self.assertEqual(self.negotiate(), ('en', 'fallback'))
+
+    def test_accept_language_skips_tags_without_catalogs(self):
+        self.assertEqual(
+            negotiate(self.table, accept_language='xx-YY, tlh;q=0.9, pt-PT;q=0.8, en;q=0.7'),
+            ('pt-PT', 'accept-language'),
+        )
+        # A tag for the fallback language itself still decides.
+        self.assertEqual(negotiate(self.table, accept_language='en-US, de;q=0.5'), ('en', 'accept-language'))
+        # Nothing usable: the next source decides.
+        self.assertEqual(negotiate(self.table, accept_language='xx, tlh', country='DE'), ('de-DE', 'country'))
+
+    def test_accept_language_quality(self):
+        self.assertEqual(parse_accept_language('fr;q=0.5, de-DE, *;q=0.1, es;q=0'), ['de-DE', 'fr'])
+
+
+if __name__ == '__main__':
+    unittest.main()
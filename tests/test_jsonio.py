@@ -0,0 +1,77 @@
+"""The orjson and stdlib backends must write catalogs byte for byte alike.
+
+    python3 -m pytest tests
+"""
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from locale_build import jsonio  # noqa: E402
+from locale_build.catalog import LOCALES_DIR, build_catalog, read_tree  # noqa: E402
+
+SAMPLES = [
+    {'emoji': '🚀 Launch', 'quote': 'Say "hi"\\n', 'control': '\x00\x1f\x7f', 'separators': '  '},
+    {'nested': [[], {}, [True, False, None]], 'ints': [0, -1, 2 ** 63 - 1, -2 ** 63, 2 ** 64 - 1]},
+    {'rtl': 'مرحبا', 'cjk': '你好，世界', 'combining': 'é', '': 'empty key'},
+]
+
+
+class BackendParityTest(unittest.TestCase):
+    def setUp(self):
+        if jsonio.orjson is None:
+            self.skipTest('orjson is not installed')
+
+    def assertSameBytes(self, data):
+        for compact in (False, True):
+            with self.subTest(compact=compact):
+                self.assertEqual(
+                    jsonio.OrjsonBackend.dumps(data, compact=compact),
+                    jsonio.StdlibBackend.dumps(data, compact=compact),
+                )
+
+    def test_samples(self):
+        for data in SAMPLES:
+            self.assertSameBytes(data)
+
+    def test_every_catalog(self):
+        for locale, namespaces in sorted(read_tree(LOCALES_DIR).items()):
+            for namespace, data in namespaces.items():
+                with self.subTest(locale=locale, namespace=namespace):
+                    self.assertSameBytes(data)
+
+    def test_floats_are_what_differs(self):
+        self.assertNotEqual(jsonio.OrjsonBackend.dumps(1e16), jsonio.StdlibBackend.dumps(1e16))
+
+
+class NonPortableTest(unittest.TestCase):
+    def test_samples_are_portable(self):
+        for data in SAMPLES:
+            self.assertEqual(list(jsonio.non_portable(data)), [])
+
+    def test_floats_and_wide_integers(self):
+        data = {'a': 1.0, 'b': [1, 1e16], 'c': {'d': 2 ** 64}, 'e': -2 ** 63 - 1, 'f': True}
+        self.assertEqual(list(jsonio.non_portable(data)), ['/a', '/b/1', '/c/d', '/e'])
+
+    def test_build_rejects_a_float_in_a_catalog(self):
+        tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp)
+        cwd = os.getcwd()
+        os.chdir(ROOT)
+        self.addCleanup(os.chdir, cwd)
+        os.makedirs(os.path.join(tmp, 'en'))
+        with open(os.path.join(tmp, 'en', 'pricing.json'), 'w', encoding='utf-8') as f:
+            json.dump({'plan': {'price': 9.99}}, f)
+
+        with self.assertRaises(SystemExit) as raised:
+            build_catalog(tmp)
+        self.assertIn('en/pricing: /plan/price is a float', str(raised.exception.code))
+
+
+if __name__ == '__main__':
+    unittest.main()
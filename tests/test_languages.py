@@ -0,0 +1,60 @@
+"""Script and region tags must resolve to the variant with their script.
+
+    python3 -m pytest tests
+"""
+import os
+import sys
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from locale_build import languages  # noqa: E402
+from locale_build.catalog import LOCALES_DIR, read_tree  # noqa: E402
+from locale_build.edge import read_language_table, resolve_language  # noqa: E402
+
+CASES = {
+    'zh-Hant-TW': 'zh-TW',
+    'zh-Hant-HK': 'zh-TW',
+    'zh-Hant': 'zh-TW',
+    'zh-MO': 'zh-TW',
+    'zh_hk': 'zh-TW',
+    'zh-Hans-CN': 'zh-CN',
+    'zh-Hans-HK': 'zh-CN',
+    'zh': 'zh-CN',
+    'es-419': 'es-MX',
+    'de-CH': 'de-DE',
+    'xx-YY': 'en',
+}
+
+
+class LanguageResolutionTest(unittest.TestCase):
+    def setUp(self):
+        self.cwd = os.getcwd()
+        os.chdir(ROOT)
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+
+    def test_resolver(self):
+        resolver = languages.Resolver(sorted(read_tree(LOCALES_DIR)))
+        for tag, locale in CASES.items():
+            with self.subTest(tag=tag):
+                self.assertEqual(resolver.tag(tag), locale)
+
+    def test_generated_table(self):
+        """The committed table, read the way resolveLanguage reads it."""
+        table = read_language_table()
+        for tag, locale in CASES.items():
+            with self.subTest(tag=tag):
+                self.assertEqual(resolve_language(table, tag), locale)
+
+    def test_every_override_is_in_the_table(self):
+        table = read_language_table()
+        for tag in languages.TAG_OVERRIDES:
+            with self.subTest(tag=tag):
+                self.assertIn(tag, table['tags'])
+
+
+if __name__ == '__main__':
+    unittest.main()
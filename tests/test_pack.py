@@ -0,0 +1,89 @@
+"""The archive must read back byte for byte, and closing it must never fail.
+
+    python3 -m pytest tests
+"""
+import os
+import pickle
+import shutil
+import sys
+import tempfile
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from locale_build.manifest import content_hash  # noqa: E402
+from locale_build.pack import PackReader, write_pack  # noqa: E402
+
+ENTRIES = {
+    'de-DE/landing': '{\n  "title": "Start"\n}'.encode('utf-8'),
+    'ja-JP/messages': '{"hello":"こんにちは"}'.encode('utf-8'),
+    'en/_routes/Landing': b'{}',
+    'en/empty': b'',
+}
+
+
+class PackTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp, 'locales.pack')
+        write_pack(self.path, ENTRIES, 7)
+        self.reader = PackReader(self.path)
+
+    def tearDown(self):
+        self.reader.close()
+        shutil.rmtree(self.tmp)
+
+    def test_entries_read_back(self):
+        self.assertEqual(self.reader.version, 7)
+        self.assertEqual(sorted(self.reader.keys()), sorted(ENTRIES))
+        for key, payload in ENTRIES.items():
+            with self.subTest(key=key):
+                self.assertEqual(bytes(self.reader.read(key)), payload)
+                self.assertEqual(self.reader.entry(key)[2], content_hash(payload))
+        self.assertEqual(bytes(self.reader.get('de-DE', 'landing')), ENTRIES['de-DE/landing'])
+        self.assertIsNone(self.reader.read('fr-FR/landing'))
+
+    def test_close_releases_handed_out_views(self):
+        view = self.reader.read('de-DE/landing')
+        self.reader.close()
+        self.assertTrue(self.reader.closed)
+        with self.assertRaises(ValueError):
+            bytes(view)
+
+    def test_close_with_a_slice_of_a_view(self):
+        view = self.reader.read('de-DE/landing')
+        tail = view[1:]
+        self.reader.close()
+
+        self.assertTrue(self.reader.closed)
+        self.assertEqual(bytes(tail), ENTRIES['de-DE/landing'][1:])
+        with self.assertRaises(ValueError):
+            self.reader.read('de-DE/landing')
+        self.reader.close()
+
+    def test_close_with_an_exported_view(self):
+        view = self.reader.read('ja-JP/messages')
+        exported = pickle.PickleBuffer(view)
+        self.reader.close()
+
+        self.assertTrue(self.reader.closed)
+        self.assertEqual(bytes(exported.raw()), ENTRIES['ja-JP/messages'])
+        exported.release()
+
+    def test_context_manager_closes(self):
+        with PackReader(self.path) as reader:
+            tail = reader.read('en/_routes/Landing')[1:]
+        self.assertTrue(reader.closed)
+        self.assertEqual(bytes(tail), b'}')
+
+    def test_rejects_other_files(self):
+        other = os.path.join(self.tmp, 'other.bin')
+        with open(other, 'wb') as f:
+            f.write(b'\0' * 64)
+        with self.assertRaises(ValueError):
+            PackReader(other)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+"""Applying ``diff(a, b)`` to ``a`` must give ``b`` for every kind of change.
+
+    python3 -m pytest tests
+"""
+import copy
+import json
+import os
+import sys
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from locale_build import patches  # noqa: E402
+from locale_build.catalog import LOCALES_DIR, read_tree  # noqa: E402
+
+
+def round_trip(old, new):
+    """Apply the patch as the client receives it: serialized through JSON."""
+    ops = json.loads(json.dumps(patches.diff(old, new)))
+    return patches.apply(old, ops)
+
+
+class PatchRoundTripTest(unittest.TestCase):
+    def assertRoundTrips(self, old, new):
+        original = copy.deepcopy(old)
+        self.assertEqual(round_trip(old, new), new)
+        self.assertEqual(old, original, 'apply() must not mutate its input')
+
+    def test_equal_documents_need_no_ops(self):
+        self.assertEqual(patches.diff({'a': [1, {'b': 'c'}]}, {'a': [1, {'b': 'c'}]}), [])
+
+    def test_object_changes(self):
+        self.assertRoundTrips(
+            {'keep': 'x', 'drop': 'y', 'nested': {'swap': 'old', 'gone': True}},
+            {'keep': 'x', 'nested': {'swap': 'new', 'added': [1, 2]}, 'fresh': {'deep': {'er': 'z'}}},
+        )
+
+    def test_list_grows_and_shrinks(self):
+        self.assertRoundTrips({'variations': ['a', 'b', 'c', 'd']}, {'variations': ['a', 'B']})
+        self.assertRoundTrips({'variations': ['a']}, {'variations': ['a', 'b', 'c']})
+        self.assertRoundTrips({'variations': [{'t': 'a'}, 'b']}, {'variations': [{'t': 'A'}, 'b', 'c']})
+
+    def test_type_changes(self):
+        self.assertRoundTrips({'k': ['a', 'b']}, {'k': 'ab'})
+        self.assertRoundTrips({'k': 'ab'}, {'k': {'template': 'providerSignup', 'params': {'provider': 'Google'}}})
+        self.assertRoundTrips(['root'], {'root': True})
+
+    def test_keys_needing_escapes(self):
+        self.assertRoundTrips(
+            {'a/b': 'slash', 'c~d': 'tilde', '~1': 'literal', '': 'empty'},
+            {'a/b': 'SLASH', 'c~d': 'TILDE', '~1': 'LITERAL', '': 'EMPTY', '/~': 'new'},
+        )
+
+    def test_every_catalog_round_trips_to_another_locale(self):
+        catalog = read_tree(LOCALES_DIR)
+        reference = catalog['en']
+        for locale, namespaces in sorted(catalog.items()):
+            for namespace, data in namespaces.items():
+                if namespace in reference:
+                    with self.subTest(locale=locale, namespace=namespace):
+                        self.assertRoundTrips(reference[namespace], data)
+                        self.assertRoundTrips(data, reference[namespace])
+
+
+if __name__ == '__main__':
+    unittest.main()
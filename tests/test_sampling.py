@@ -0,0 +1,63 @@
+"""A sampling profile must ship fewer landing bytes than the full chunks.
+
+    python3 -m pytest tests
+"""
+import os
+import sys
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from locale_build import sampling  # noqa: E402
+from locale_build.budgets import BUDGETS_FILE, check_chunk_budgets, load_budgets  # noqa: E402
+from locale_build.catalog import LOCALES_DIR, build_catalog  # noqa: E402
+from locale_build.compile import render_compiled_modules  # noqa: E402
+from locale_build.routes import ROUTES_DIR, build_route_chunks, route_entries, scan_routes  # noqa: E402
+from locale_build.templates import collapse_templates, expand_templates  # noqa: E402
+
+
+class SamplingTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cwd = os.getcwd()
+        os.chdir(ROOT)
+        try:
+            cls.expanded = expand_templates(build_catalog(LOCALES_DIR))
+            catalog = expand_templates(build_catalog(LOCALES_DIR))
+            collapse_templates(catalog)
+            cls.route_chunks = build_route_chunks(catalog, scan_routes())
+            cls.budgets = load_budgets(BUDGETS_FILE)
+        finally:
+            os.chdir(cwd)
+
+    def test_sample_indices(self):
+        kept = sampling.sample_indices('welcome', 10, 3, shard=5)
+        self.assertEqual(kept, sorted(kept))
+        self.assertEqual(len(set(kept)), 3)
+        self.assertEqual(kept, sampling.sample_indices('welcome', 10, 3, shard=5))
+        self.assertEqual(sampling.sample_indices('welcome', 2, 3, shard=5), [0, 1])
+
+    def test_compiled_modules_leave_the_sampled_namespace_out(self):
+        for locale, module in render_compiled_modules(self.expanded, skip=(sampling.SAMPLED_NAMESPACE,)):
+            with self.subTest(locale=locale):
+                self.assertNotIn(f'{sampling.SAMPLED_NAMESPACE}: {{', module)
+                self.assertIn('messages: {', module)
+
+    def test_sampled_budget_holds_and_full_chunks_break_it(self):
+        sampled = sampling.build_sampled_chunks(self.route_chunks, 2, 8)
+        violations, checked, _ = check_chunk_budgets(sampling.sampled_entries(sampled), self.budgets)
+        self.assertGreater(checked, 0)
+        self.assertEqual(violations, [])
+
+        # The same chunks with every variation, budgeted as sampled ones
+        full = {
+            key.replace(f'/{ROUTES_DIR}/', f'/{sampling.SAMPLED_DIR}/0/'): payload
+            for key, payload in route_entries(self.route_chunks).items()
+        }
+        violations, _, _ = check_chunk_budgets(full, self.budgets)
+        self.assertTrue(any(key.endswith('/Landing') for key, *_ in violations))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+"""The compiled schema validator must report what breaks rendering, and only that.
+
+    python3 -m pytest tests
+"""
+import os
+import sys
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from locale_build.catalog import LOCALES_DIR, build_catalog  # noqa: E402
+from locale_build.schema import validate_catalog, validator_names  # noqa: E402
+from locale_build.templates import expand_templates  # noqa: E402
+
+REFERENCE = {
+    'landing': {
+        'title': 'Launch',
+        'variations': ['Hi {name}', 'Hello {name}, welcome'],
+        'auth': {'sent': 'We sent a link to {{email}}', 'cta': 'Go'},
+    },
+    'odd-name.v2': {"it's": 'quoted key'},
+}
+
+
+def validate(locale_data):
+    """``(errors, warnings)`` of one locale as ``{(namespace, path): message}``."""
+    errors, warnings, _ = validate_catalog({'en': REFERENCE, 'xx': locale_data})
+    return (
+        {(ns, path): message for locale, ns, path, message in errors if locale == 'xx'},
+        {(ns, path): message for locale, ns, path, message in warnings if locale == 'xx'},
+    )
+
+
+class ValidatorTest(unittest.TestCase):
+    def test_reference_validates_against_itself(self):
+        self.assertEqual(validate(REFERENCE), ({}, {}))
+
+    def test_rendering_errors(self):
+        errors, _ = validate({
+            'landing': {
+                'title': ['Launch'],
+                'variations': [],
+                'auth': {'sent': 'Link sent to {mail}', 'cta': 'Go'},
+            },
+            'odd-name.v2': {"it's": 'ok'},
+        })
+        self.assertEqual(errors, {
+            ('landing', 'title'): 'expected a string',
+            ('landing', 'variations'): 'expected a non-empty array of strings',
+            ('landing', 'auth.sent'): 'missing placeholder {email}',
+        })
+
+    def test_variation_items(self):
+        errors, _ = validate({
+            'landing': {'title': 'T', 'variations': ['Hola {{name}}', '', 'Salut'], 'auth': REFERENCE['landing']['auth']},
+            'odd-name.v2': {"it's": 'ok'},
+        })
+        self.assertEqual(errors, {
+            ('landing', 'variations.1'): 'expected a non-empty string',
+            ('landing', 'variations.2'): 'missing placeholder {name}',
+        })
+
+    def test_object_expected(self):
+        errors, _ = validate({'landing': {**REFERENCE['landing'], 'auth': 'flat'}, 'odd-name.v2': 'flat'})
+        self.assertEqual(errors, {
+            ('landing', 'auth'): 'expected an object',
+            ('odd-name.v2', ''): 'expected an object',
+        })
+
+    def test_fallback_gaps_are_warnings(self):
+        errors, warnings = validate({'landing': {'title': 'T', 'extra': 'x', 'auth': {'cta': 'Go'}}})
+        self.assertEqual(errors, {})
+        self.assertEqual(warnings, {
+            ('landing', 'variations'): 'missing',
+            ('landing', 'auth.sent'): 'missing',
+            ('landing', 'extra'): 'not in en',
+            ('odd-name.v2', ''): 'missing namespace',
+        })
+
+    def test_validator_names_are_identifiers(self):
+        names = validator_names(['landing', 'odd-name.v2', 'odd_name_v2', '1st'])
+        self.assertEqual(len(set(names.values())), 4)
+        self.assertTrue(all(name.isidentifier() for name in names.values()))
+
+    def test_built_catalogs_have_no_errors(self):
+        cwd = os.getcwd()
+        os.chdir(ROOT)
+        self.addCleanup(os.chdir, cwd)
+        # The build validates the expanded messages, as the app renders them.
+        errors, _, _ = validate_catalog(expand_templates(build_catalog(LOCALES_DIR)))
+        self.assertEqual(errors, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+"""Namespaces streamed from the translation store must match the catalog files.
+
+    python3 -m pytest tests
+"""
+import contextlib
+import io
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from contextlib import closing
+from functools import partial
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import locale_store  # noqa: E402
+from locale_build import store  # noqa: E402
+from locale_build.catalog import (  # noqa: E402
+    DERIVED_NAMESPACES, LOCALES_DIR, build_catalog, catalog_path, iter_catalog, serialize_namespace, write_catalog,
+)
+from locale_build.templates import collapse_templates, expand_templates  # noqa: E402
+
+
+class StoreExportTest(unittest.TestCase):
+    def setUp(self):
+        self.cwd = os.getcwd()
+        os.chdir(ROOT)
+        self.state_dir = tempfile.mkdtemp()
+        self.catalog = expand_templates(build_catalog(LOCALES_DIR))
+        collapse_templates(self.catalog)
+        with closing(store.connect(self.state_dir)) as conn:
+            store.sync(conn, self.catalog, 1)
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        shutil.rmtree(self.state_dir)
+
+    def test_every_namespace_streams_byte_identical(self):
+        with closing(store.connect(self.state_dir)) as conn:
+            for locale, namespace, _ in iter_catalog(self.catalog):
+                if namespace in DERIVED_NAMESPACES:
+                    continue
+                with self.subTest(locale=locale, namespace=namespace):
+                    with open(os.path.join(LOCALES_DIR, locale, f'{namespace}.json'), 'rb') as f:
+                        written = f.read()
+                    streamed = ''.join(store.stream_namespace(conn, locale, namespace)).encode('utf-8')
+                    self.assertEqual(streamed, written)
+
+    def test_export_command_writes_the_file_bytes(self):
+        out = io.TextIOWrapper(io.BytesIO(), encoding='ascii')
+        with contextlib.redirect_stdout(out):
+            locale_store.main(['--state-dir', self.state_dir, 'export', 'ja-JP', 'landing'])
+        with open(os.path.join(LOCALES_DIR, 'ja-JP', 'landing.json'), 'rb') as f:
+            self.assertEqual(out.buffer.getvalue(), f.read())
+
+    def test_build_writes_catalogs_from_the_store(self):
+        locales_dir = os.path.join(self.state_dir, 'locales')
+        shutil.copytree(LOCALES_DIR, locales_dir)
+        # Derived namespaces are not in the store; they are written as serialized.
+        derived = DERIVED_NAMESPACES[0]
+        self.catalog['en'][derived] = {'title': {'variations': ['a', 'b']}}
+        stale = [('de-DE', 'messages'), ('en', derived), ('ja-JP', 'landing')]
+        for locale, namespace in stale:
+            with open(catalog_path(locales_dir, locale, namespace), 'w', encoding='utf-8') as f:
+                f.write('{}')
+
+        with closing(store.connect(self.state_dir)) as conn:
+            written = write_catalog(self.catalog, locales_dir, partial(store.stream_namespace, conn))
+        self.assertEqual(sorted(written), stale)
+        for locale, namespace in stale:
+            with self.subTest(locale=locale, namespace=namespace):
+                with open(catalog_path(locales_dir, locale, namespace), 'rb') as f:
+                    self.assertEqual(f.read(), serialize_namespace(namespace, self.catalog[locale][namespace]))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+"""Collapsed message templates must expand back to the original entries.
+
+    python3 -m pytest tests
+"""
+import copy
+import os
+import sys
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from locale_build import templates  # noqa: E402
+from locale_build.catalog import LOCALES_DIR, read_tree  # noqa: E402
+
+SIGNUPS = {
+    'googleSignup': {'variations': ['<h1>Thank you, Google!</h1>', '<p>Google is connected.</p>']},
+    'facebookSignup': {'variations': ['<h1>Thank you, Facebook!</h1>', '<p>Facebook is connected.</p>']},
+    'emailSignup': {'variations': ['<h1>Check your inbox</h1>', '<p>We sent a link.</p>']},
+    'greeting': 'Hello',
+}
+
+
+class TemplateTest(unittest.TestCase):
+    def test_family_collapses_into_one_template(self):
+        collapsed, report = templates.collapse(SIGNUPS)
+
+        self.assertEqual(report, [{'template': 'providerSignup', 'keys': ['facebookSignup', 'googleSignup'],
+                                   'param': 'provider'}])
+        self.assertEqual(collapsed['providerSignup'],
+                         {'variations': ['<h1>Thank you, {provider}!</h1>', '<p>{provider} is connected.</p>']})
+        self.assertEqual(collapsed['googleSignup'], {'template': 'providerSignup', 'params': {'provider': 'Google'}})
+        self.assertEqual(collapsed['emailSignup'], SIGNUPS['emailSignup'])
+        self.assertEqual(templates.expand(collapsed), SIGNUPS)
+
+    def test_hand_varied_wording_is_kept(self):
+        entries = copy.deepcopy(SIGNUPS)
+        entries['facebookSignup']['variations'][1] = '<p>Facebook is linked.</p>'
+        collapsed, report = templates.collapse(entries)
+
+        self.assertEqual(report, [])
+        self.assertEqual(collapsed, entries)
+
+    def test_exact_duplicates_need_no_params(self):
+        entries = {'aSignup': {'variations': ['Same']}, 'bSignup': {'variations': ['Same']}}
+        collapsed, _ = templates.collapse(entries)
+
+        self.assertEqual(collapsed['aSignup'], {'template': 'providerSignup'})
+        self.assertEqual(templates.expand(collapsed), entries)
+
+    def test_every_catalog_round_trips(self):
+        for locale, namespaces in sorted(read_tree(LOCALES_DIR).items()):
+            for namespace in templates.TEMPLATE_NAMESPACES:
+                if namespace not in namespaces:
+                    continue
+                with self.subTest(locale=locale, namespace=namespace):
+                    expanded = templates.expand(namespaces[namespace])
+                    self.assertFalse(any(isinstance(e, dict) and 'template' in e for e in expanded.values()))
+                    self.assertEqual(templates.collapse(expanded)[0], namespaces[namespace])
+
+
+if __name__ == '__main__':
+    unittest.main()